@@ -0,0 +1,267 @@
+"""Benchmark of the client operations against an in-process stand-in for entitycore and S3.
+
+Usage:
+    python benchmarks/bench_client.py [--repeat N] [--latency SECONDS] [--bandwidth MB/S]
+        [--only NAME ...] [--output PATH]
+
+The results are printed as JSON, with the parameters of the run and, for each benchmark, the
+best and mean time in seconds, the number of processed items, and the number of requests.
+"""
+
+import abc
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from importlib.metadata import version
+from pathlib import Path
+
+import httpx
+from standin import EntityCoreStandIn
+
+from entitysdk import Client, serdes
+from entitysdk.models import CellMorphology, Circuit, MEModel
+from entitysdk.schemas.asset import MultipartUploadTransferConfig
+from entitysdk.types import AssetLabel, ContentType
+
+API_URL = "http://entitycore.standin/api"
+DATA_DIR = Path(__file__).parent.parent / "tests/unit/models/data"
+CELL_MORPHOLOGY_TEMPLATE = DATA_DIR / "manual/one/cell_morphology.json"
+MEMODEL_TEMPLATE = DATA_DIR / "extracted/one/memodel/content_437593.json"
+
+MiB = 1024 * 1024
+
+
+def _copies(template: Path, count: int) -> list[dict]:
+    """Return copies of a json document with different ids."""
+    data = json.loads(template.read_text())
+    return [data | {"id": str(uuid.uuid4()), "name": f"{data['name']}-{i}"} for i in range(count)]
+
+
+class Benchmark(abc.ABC):
+    """Benchmark of an operation, with its own stand-in and client."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        """Initialize the stand-in and the client."""
+        self.args = args
+        self.standin = EntityCoreStandIn(
+            api_url=API_URL,
+            latency=args.latency,
+            bandwidth=args.bandwidth * MiB if args.bandwidth else None,
+        )
+        self.client = Client(
+            api_url=API_URL,
+            token_manager="token",  # noqa: S106
+            http_client=httpx.Client(transport=self.standin),
+        )
+        self.items = 0
+
+    def setup(self) -> None:  # noqa: B027
+        """Prepare the data before the measurements."""
+
+    @abc.abstractmethod
+    def run(self) -> None:
+        """Run the measured operation once."""
+
+    def teardown(self) -> None:  # noqa: B027
+        """Remove the data after the measurements."""
+
+
+class SearchEntity(Benchmark):
+    """Search and validate all the entities of a large result."""
+
+    def setup(self) -> None:
+        """Add the entities to the stand-in."""
+        self.items = self.args.search_count
+        self.standin.add_entities("cell-morphology", _copies(CELL_MORPHOLOGY_TEMPLATE, self.items))
+
+    def run(self) -> None:
+        """Consume the search results."""
+        result = self.client.search_entity(entity_type=CellMorphology).all()
+        assert len(result) == self.items
+
+
+class SearchEntityLazy(SearchEntity):
+    """Search all the entities of a large result without validating them."""
+
+    def run(self) -> None:
+        """Consume the search results."""
+        columns = self.client.search_entity(entity_type=CellMorphology, lazy=True).to_columns(
+            ["id", "brain_region.acronym"]
+        )
+        assert len(columns["id"]) == self.items
+
+
+class GetEntity(Benchmark):
+    """Retrieve deep models one at a time."""
+
+    def setup(self) -> None:
+        """Add the entities to the stand-in."""
+        self.entities = _copies(MEMODEL_TEMPLATE, self.args.get_count)
+        self.items = len(self.entities)
+        self.standin.add_entities("memodel", self.entities)
+
+    def run(self) -> None:
+        """Retrieve the entities."""
+        for entity in self.entities:
+            self.client.get_entity(entity["id"], entity_type=MEModel)
+
+
+class SerializeModel(Benchmark):
+    """Serialize deep models."""
+
+    def setup(self) -> None:
+        """Validate the models to be serialized."""
+        self.models = [
+            serdes.deserialize_model(data, MEModel)
+            for data in _copies(MEMODEL_TEMPLATE, self.args.get_count)
+        ]
+        self.items = len(self.models)
+
+    def run(self) -> None:
+        """Serialize the models."""
+        for model in self.models:
+            serdes.serialize_model(model)
+
+
+class FetchDirectory(Benchmark):
+    """Download a directory asset with many small files."""
+
+    def setup(self) -> None:
+        """Add the directory to the stand-in."""
+        self.items = self.args.directory_files
+        self.entity_id = uuid.uuid4()
+        self.asset = {
+            "id": str(uuid.uuid4()),
+            "path": "circuit",
+            "full_path": "standin/circuit",
+            "storage_type": "aws_s3_internal",
+            "is_directory": True,
+            "content_type": "application/vnd.directory",
+            "label": "sonata_circuit",
+            "size": -1,
+            "status": "created",
+        }
+        files = {f"nodes/file_{i}.h5": self.args.directory_file_size for i in range(self.items)}
+        self.standin.add_directory(self.asset, files)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def run(self) -> None:
+        """Download the directory."""
+        paths = self.client.download_directory(
+            entity_id=self.entity_id,
+            entity_type=Circuit,
+            asset_id=self.asset["id"],
+            output_path=Path(self.tmp_dir.name),
+            max_concurrent=self.args.max_concurrent,
+        )
+        assert len(paths) == self.items
+
+    def teardown(self) -> None:
+        """Remove the downloaded files."""
+        self.tmp_dir.cleanup()
+
+
+class UploadFile(Benchmark):
+    """Upload a large sparse file, in parts if larger than the multipart threshold."""
+
+    def setup(self) -> None:
+        """Create the sparse file."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name, "large.h5")
+        with self.path.open("wb") as f:
+            f.truncate(self.args.upload_size * MiB)
+        self.items = self.args.upload_size * MiB
+
+    def run(self) -> None:
+        """Upload the file."""
+        self.client.upload_file(
+            entity_id=uuid.uuid4(),
+            entity_type=Circuit,
+            file_path=self.path,
+            file_content_type=ContentType.application_x_hdf5,
+            asset_label=AssetLabel.sonata_circuit,
+            transfer_config=MultipartUploadTransferConfig(max_concurrency=self.args.max_concurrent),
+        )
+
+    def teardown(self) -> None:
+        """Remove the sparse file."""
+        self.tmp_dir.cleanup()
+
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], Benchmark]] = {
+    "search_entity": SearchEntity,
+    "search_entity_lazy": SearchEntityLazy,
+    "get_entity": GetEntity,
+    "serialize_model": SerializeModel,
+    "fetch_directory": FetchDirectory,
+    "upload_file": UploadFile,
+}
+
+
+def _measure(benchmark: Benchmark, repeat: int) -> dict:
+    benchmark.setup()
+    try:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            benchmark.run()
+            times.append(time.perf_counter() - start)
+    finally:
+        benchmark.teardown()
+    return {
+        "best": min(times),
+        "mean": statistics.mean(times),
+        "items": benchmark.items,
+        "requests": benchmark.standin.requests // repeat,
+    }
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run the selected benchmarks and return the results."""
+    names = args.only or list(BENCHMARKS)
+    return {
+        "parameters": vars(args) | {"only": names},
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "entitysdk": version("entitysdk"),
+            "httpx": version("httpx"),
+            "pydantic": version("pydantic"),
+        },
+        "results": {name: _measure(BENCHMARKS[name](args), args.repeat) for name in names},
+    }
+
+
+def main() -> None:
+    """Run the benchmarks and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds per request")
+    parser.add_argument("--bandwidth", type=float, default=None, help="MiB per second")
+    parser.add_argument("--search-count", type=int, default=10_000)
+    parser.add_argument("--get-count", type=int, default=200)
+    parser.add_argument("--directory-files", type=int, default=2_000)
+    parser.add_argument("--directory-file-size", type=int, default=4096, help="bytes")
+    parser.add_argument("--upload-size", type=int, default=2048, help="MiB")
+    parser.add_argument("--max-concurrent", type=int, default=8)
+    parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS))
+    parser.add_argument("--output", type=Path, help="write the results to a file too")
+    args = parser.parse_args()
+
+    output = args.output
+    args.output = str(output) if output else None
+    results = run(args)
+    json.dump(results, sys.stdout, indent=2)
+    print()
+    if output:
+        output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark of the JSON backends on large search pages and simulation configs.
+
+Usage:
+    python benchmarks/bench_json_codec.py [--repeat N]
+
+The results are printed as JSON, with the best time in seconds of each operation and backend.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import uuid
+from functools import partial
+
+from entitysdk.exception import DependencyError
+from entitysdk.utils import json_codec
+
+
+def _search_page(size: int = 1000) -> dict:
+    """Return a search page similar to the ones returned by entitycore."""
+    return {
+        "data": [
+            {
+                "id": str(uuid.uuid4()),
+                "name": f"entity-{i}",
+                "description": "A reconstructed cell morphology " * 4,
+                "type": "cell_morphology",
+                "creation_date": "2025-01-01T00:00:00Z",
+                "update_date": "2025-01-02T00:00:00Z",
+                "brain_region": {
+                    "id": str(uuid.uuid4()),
+                    "name": "Somatosensory areas",
+                    "acronym": "SS",
+                    "annotation_value": 322,
+                },
+                "assets": [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "path": f"morphology-{i}.swc",
+                        "size": 123456,
+                        "meta": {},
+                    }
+                ],
+                "location": {"x": i * 0.5, "y": i * 1.5, "z": i * 2.5},
+            }
+            for i in range(size)
+        ],
+        "pagination": {"page": 1, "page_size": size, "total_items": 100 * size},
+        "facets": None,
+    }
+
+
+def _simulation_config(size: int = 5000) -> dict:
+    """Return a large SONATA simulation config."""
+    return {
+        "run": {"tstop": 1000.0, "dt": 0.025, "random_seed": 1},
+        "inputs": {
+            f"stimulus_{i}": {
+                "module": "linear",
+                "input_type": "current_clamp",
+                "delay": float(i),
+                "duration": 100.0,
+                "amp_start": 0.1 * i,
+                "node_set": f"node_set_{i % 100}",
+            }
+            for i in range(size)
+        },
+        "reports": {
+            f"report_{i}": {"type": "compartment", "variable_name": "v", "cells": "All"}
+            for i in range(size // 10)
+        },
+    }
+
+
+def _best_time(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def run(repeat: int) -> dict:
+    """Run the benchmarks and return the results."""
+    documents = {"search_page": _search_page(), "simulation_config": _simulation_config()}
+    results = {}
+    for backend in ["stdlib", "orjson", "msgspec"]:
+        try:
+            codec = json_codec.get_codec(backend)
+        except DependencyError:
+            continue
+        for name, document in documents.items():
+            encoded = codec.dumps(document)
+            results[f"{backend}.{name}.dumps"] = _best_time(partial(codec.dumps, document), repeat)
+            results[f"{backend}.{name}.loads"] = _best_time(partial(codec.loads, encoded), repeat)
+    return results
+
+
+def main() -> None:
+    """Run the benchmarks and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    json.dump(run(args.repeat), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
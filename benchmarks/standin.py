@@ -0,0 +1,217 @@
+"""In-process stand-in for entitycore and the S3 presigned URLs, used by the benchmarks.
+
+The stand-in is an httpx transport, so that the clients can be benchmarked without any network
+access, while still going through the whole httpx stack. A fixed latency can be added to each
+request, and the transfers of the bodies can be limited to a given bandwidth.
+"""
+
+import hashlib
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from email.parser import BytesParser
+
+import httpx
+
+from entitysdk.utils import json_codec
+
+S3_URL = "http://s3.standin"
+
+# size of the chunks of the response bodies streamed from S3
+CHUNK_SIZE = 1024 * 1024
+
+
+class _ThrottledStream(httpx.SyncByteStream):
+    """Stream of zeros, delivered at the given bandwidth."""
+
+    def __init__(self, size: int, bandwidth: float | None) -> None:
+        self._size = size
+        self._bandwidth = bandwidth
+
+    def __iter__(self) -> Iterator[bytes]:
+        remaining = self._size
+        chunk = bytes(CHUNK_SIZE)
+        while remaining > 0:
+            data = chunk[: min(remaining, CHUNK_SIZE)]
+            if self._bandwidth:
+                time.sleep(len(data) / self._bandwidth)
+            remaining -= len(data)
+            yield data
+
+
+class EntityCoreStandIn(httpx.BaseTransport):
+    """Transport answering the requests to entitycore and S3 from in-memory data.
+
+    Only the endpoints used by the benchmarks are implemented: search, get, asset metadata,
+    directory listing, download, and single request and multipart upload.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_url: str,
+        latency: float = 0.0,
+        bandwidth: float | None = None,
+    ) -> None:
+        """Initialize the stand-in.
+
+        Args:
+            api_url: Base url of the entitycore api.
+            latency: Time in seconds added to each request.
+            bandwidth: Maximum transfer rate of the request and response bodies in bytes per
+                second, or None to disable the limit.
+        """
+        self.api_url = api_url
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.requests = 0
+        self.bytes_uploaded = 0
+        self._entities: dict[str, dict[str, bytes]] = {}
+        self._assets: dict[str, dict] = {}
+        self._directories: dict[str, dict[str, int]] = {}
+
+    def add_entities(self, route: str, entities: list[dict]) -> None:
+        """Add the json of some entities, retrieved in the same order when searched."""
+        route_entities = self._entities.setdefault(route, {})
+        for entity in entities:
+            route_entities[entity["id"]] = json_codec.dumps(entity)
+
+    def add_directory(self, asset: dict, files: dict[str, int]) -> None:
+        """Add a directory asset, with the sizes of its files."""
+        self._assets[asset["id"]] = asset
+        self._directories[asset["id"]] = files
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Return the response to a request."""
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        url = str(request.url.copy_with(query=None))
+        if url.startswith(S3_URL):
+            return self._handle_s3(request, url[len(S3_URL) :].strip("/").split("/"))
+        path = url[len(self.api_url) :].strip("/").split("/")
+        return self._handle_api(request, path)
+
+    def _handle_api(self, request: httpx.Request, path: list[str]) -> httpx.Response:
+        route, rest = path[0], path[1:]
+        match request.method, rest:
+            case "GET", []:
+                return self._search(route, request.url.params)
+            case "GET", [entity_id]:
+                return self._json_bytes(self._entities[route][entity_id])
+            case "GET", [_, "assets", asset_id]:
+                return self._json(self._assets[asset_id])
+            case "GET", [_, "assets", asset_id, "list"]:
+                return self._list_directory(asset_id)
+            case "GET", [_, "assets", asset_id, "download"]:
+                asset_path = request.url.params.get("asset_path", "")
+                return httpx.Response(
+                    307, headers={"Location": f"{S3_URL}/download/{asset_id}/{asset_path}"}
+                )
+            case "POST", [_, "assets"]:
+                return self._upload(request)
+            case "POST", [_, "assets", "multipart-upload", "initiate"]:
+                return self._initiate_upload(json_codec.loads(request.read()))
+            case "POST", [_, "assets", asset_id, "multipart-upload", "complete"]:
+                asset = self._assets[asset_id] | {"status": "created"}
+                asset.pop("upload_meta")
+                return self._json(asset)
+        return httpx.Response(404, json={"message": f"Not found: {request.url}"})
+
+    def _handle_s3(self, request: httpx.Request, path: list[str]) -> httpx.Response:
+        match request.method, path:
+            case "GET", ["download", asset_id, *file_path]:
+                size = self._directories[asset_id]["/".join(file_path)]
+                return httpx.Response(200, stream=_ThrottledStream(size, self.bandwidth))
+            case "PUT", ["upload", _, _]:
+                for chunk in request.stream:  # type: ignore[union-attr]
+                    self.bytes_uploaded += len(chunk)
+                    if self.bandwidth:
+                        time.sleep(len(chunk) / self.bandwidth)
+                return httpx.Response(200, headers={"ETag": uuid.uuid4().hex})
+        return httpx.Response(404)
+
+    def _search(self, route: str, params: httpx.QueryParams) -> httpx.Response:
+        entities = list(self._entities.get(route, {}).values())
+        page, page_size = int(params.get("page", 1)), int(params.get("page_size", 100))
+        data = entities[(page - 1) * page_size : page * page_size]
+        pagination = json_codec.dumps(
+            {"page": page, "page_size": page_size, "total_items": len(entities)}
+        )
+        content = b'{"data":[' + b",".join(data) + b'],"pagination":' + pagination + b"}"
+        return self._json_bytes(content)
+
+    def _list_directory(self, asset_id: str) -> httpx.Response:
+        last_modified = datetime.now(timezone.utc).isoformat()
+        files = {
+            path: {"name": path.rsplit("/", 1)[-1], "size": size, "last_modified": last_modified}
+            for path, size in self._directories[asset_id].items()
+        }
+        return self._json({"files": files})
+
+    def _upload(self, request: httpx.Request) -> httpx.Response:
+        content = b""
+        for chunk in request.stream:  # type: ignore[union-attr]
+            content += chunk
+            if self.bandwidth:
+                time.sleep(len(chunk) / self.bandwidth)
+        # parse the multipart form with the file and the label
+        header = f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode()
+        form = BytesParser().parsebytes(header + content)
+        fields = {
+            part.get_param("name", header="content-disposition"): part for part in form.walk()
+        }
+        file, label = fields["file"], fields.get("label")
+        data = file.get_payload(decode=True)
+        self.bytes_uploaded += len(data)
+        asset_id = str(uuid.uuid4())
+        asset = {
+            "id": asset_id,
+            "path": file.get_filename(),
+            "full_path": f"standin/{asset_id}/{file.get_filename()}",
+            "storage_type": "aws_s3_internal",
+            "is_directory": False,
+            "content_type": file.get_content_type(),
+            "label": label.get_payload(decode=True).decode() if label else None,
+            "size": len(data),
+            "sha256_digest": hashlib.sha256(data).hexdigest(),
+            "status": "created",
+        }
+        self._assets[asset_id] = asset
+        return self._json(asset)
+
+    def _initiate_upload(self, payload: dict) -> httpx.Response:
+        asset_id = str(uuid.uuid4())
+        part_count = max(1, payload["preferred_part_count"])
+        part_size = max(1, -(-payload["filesize"] // part_count))
+        part_count = max(1, -(-payload["filesize"] // part_size))
+        asset = {
+            "id": asset_id,
+            "path": payload["filename"],
+            "full_path": f"standin/{asset_id}/{payload['filename']}",
+            "storage_type": "aws_s3_internal",
+            "is_directory": False,
+            "content_type": payload["content_type"],
+            "label": payload["label"],
+            "size": payload["filesize"],
+            "sha256_digest": payload["sha256_digest"],
+            "status": "uploading",
+            "upload_meta": {
+                "part_size": part_size,
+                "parts": [
+                    {"part_number": n, "url": f"{S3_URL}/upload/{asset_id}/{n}"}
+                    for n in range(1, part_count + 1)
+                ],
+            },
+        }
+        self._assets[asset_id] = asset
+        return self._json(asset)
+
+    @staticmethod
+    def _json(data: dict) -> httpx.Response:
+        return EntityCoreStandIn._json_bytes(json_codec.dumps(data))
+
+    @staticmethod
+    def _json_bytes(content: bytes) -> httpx.Response:
+        return httpx.Response(200, content=content, headers={"Content-Type": "application/json"})
@@ -1,19 +1,36 @@
 """entitysdk."""
 
+from entitysdk.async_client import AsyncClient
 from entitysdk.client import Client
 from entitysdk.common import ProjectContext
 from entitysdk.exception import EntitySDKError
 from entitysdk.schemas.asset import (
+    DownloadTransferConfig,
     MultipartDirectoryUploadTransferConfig,
     MultipartUploadTransferConfig,
 )
+from entitysdk.utils.cache import ContentCache, DigestCache, EntityCache, MetadataCache
+from entitysdk.utils.instrumentation import Instrumentation, MetricsRegistry
+from entitysdk.utils.rate_limit import AdaptiveLimiter, RateLimiter
 from entitysdk.utils.store import LocalAssetStore
+from entitysdk.utils.transfer import TransferStats
 
 __all__ = [
+    "AdaptiveLimiter",
+    "AsyncClient",
     "Client",
+    "ContentCache",
+    "DigestCache",
+    "DownloadTransferConfig",
+    "EntityCache",
     "EntitySDKError",
+    "Instrumentation",
     "LocalAssetStore",
+    "MetadataCache",
+    "MetricsRegistry",
     "MultipartUploadTransferConfig",
     "MultipartDirectoryUploadTransferConfig",
     "ProjectContext",
+    "RateLimiter",
+    "TransferStats",
 ]
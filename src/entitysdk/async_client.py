@@ -0,0 +1,1551 @@
+"""Asynchronous identifiable SDK client."""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Annotated, Any, Literal, overload
+
+import httpx
+from pydantic import AfterValidator, Field, InstanceOf, validate_call
+
+from entitysdk import async_core
+from entitysdk.client import _BaseClient
+from entitysdk.common import ProjectContext, parse_vlab_url
+from entitysdk.compat import Self
+from entitysdk.exception import EntitySDKError
+from entitysdk.models.asset import (
+    Asset,
+    DetailedFileList,
+    ExistingAssetMetadata,
+    LocalAssetMetadata,
+)
+from entitysdk.models.core import Identifiable
+from entitysdk.models.entity import Entity
+from entitysdk.models.lazy import LazyModel
+from entitysdk.models.projection import Projection
+from entitysdk.models.types import (
+    RegisteredAssetOrId,
+    RegisteredEntity,
+    TIdentifiable,
+    ensure_id_is_none,
+)
+from entitysdk.result import AsyncIteratorResult, IteratorResult
+from entitysdk.schemas.asset import (
+    DownloadedAssetFile,
+    DownloadTransferConfig,
+    MultipartDirectoryUploadTransferConfig,
+    MultipartUploadTransferConfig,
+)
+from entitysdk.schemas.version import APIVersion
+from entitysdk.token_manager import TokenManager
+from entitysdk.types import (
+    ID,
+    AssetLabel,
+    AssetStatus,
+    BytesOrStream,
+    ContentType,
+    DeploymentEnvironment,
+    DerivationType,
+    FetchContentStrategy,
+    FetchFileStrategy,
+    StorageType,
+    StrOrPath,
+    Token,
+)
+from entitysdk.utils.asset import filter_assets, filter_directory_files
+from entitysdk.utils.batch import sort_by_ids
+from entitysdk.utils.cache import ContentCache, DigestCache, EntityCache, MetadataCache
+from entitysdk.utils.instrumentation import AsyncInstrumentedTransport, Instrumentation
+from entitysdk.utils.io import AsyncChunkReader
+from entitysdk.utils.rate_limit import AsyncRateLimitedTransport, RateLimiter
+from entitysdk.utils.store import LocalAssetStore
+from entitysdk.utils.transfer import TransferStats, is_synced, remove_extraneous, set_modified
+
+
+class AsyncClient(_BaseClient):
+    """Asynchronous client for entitysdk.
+
+    It exposes the same operations as ``entitysdk.Client``, but the methods performing requests
+    are coroutines, so that many of them can run concurrently on the same event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_url: str | None = None,
+        project_context: ProjectContext | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        token_manager: TokenManager | Token,
+        environment: DeploymentEnvironment | str | None = None,
+        local_store: LocalAssetStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        digest_cache: DigestCache | None = None,
+        content_cache: ContentCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """Initialize client.
+
+        Args:
+            api_url: The API URL to entitycore service.
+            project_context: Project context.
+            http_client: Optional asynchronous HTTP client to use.
+            token_manager: Token manager or token to be used for authentication.
+            environment: Deployment environent.
+            local_store: LocalAssetStore object for using a local store. It needs to be specified
+                to be able to access local assets, or they will be always downloaded.
+            rate_limiter: Optional limiter of the requests made by the client. It cannot be used
+                together with http_client, because it's installed in the transport of the
+                HTTP client created by the client.
+            entity_cache: Optional cache of the entities retrieved with get_entity. The cached
+                entities are invalidated when they, or their assets, are modified by the client.
+            metadata_cache: Optional persistent cache of the metadata of the entities, assets
+                and directory listings. It's invalidated like the entity cache, and the changes
+                made by other clients are seen only after its ttl expires.
+            digest_cache: Optional persistent cache of the sha256 digests of the local files,
+                used to skip the unchanged files without hashing them again.
+            content_cache: Optional persistent cache of the downloaded files, shared by the
+                clients and processes using the same directory, to download each file once.
+                The files are materialized by reflink or copy, unless the cache is created
+                with ``hardlink=True``.
+            instrumentation: Optional hooks called for each request and entity cache lookup.
+                Like rate_limiter, it cannot be used together with http_client.
+        """
+        super().__init__(
+            api_url=api_url,
+            project_context=project_context,
+            token_manager=token_manager,
+            environment=environment,
+            local_store=local_store,
+            entity_cache=entity_cache,
+            metadata_cache=metadata_cache,
+            digest_cache=digest_cache,
+            content_cache=content_cache,
+            instrumentation=instrumentation,
+        )
+        if rate_limiter is not None or instrumentation is not None:
+            if http_client is not None:
+                option = "rate_limiter" if rate_limiter is not None else "instrumentation"
+                raise EntitySDKError(f"Either http_client or {option} can be specified, not both.")
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport()
+            if rate_limiter is not None:
+                transport = AsyncRateLimitedTransport(
+                    transport, rate_limiter=rate_limiter, api_url=self.api_url
+                )
+            if instrumentation is not None:
+                # outermost, so that the time spent waiting for the rate limiter is reported
+                transport = AsyncInstrumentedTransport(
+                    transport, instrumentation=instrumentation, api_url=self.api_url
+                )
+            http_client = httpx.AsyncClient(transport=transport)
+        self._http_client = http_client or httpx.AsyncClient()
+
+    @classmethod
+    def from_vlab_url(
+        cls,
+        vlab_url: str,
+        *,
+        api_url: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        token_manager: TokenManager | Token,
+        local_store: LocalAssetStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        digest_cache: DigestCache | None = None,
+        content_cache: ContentCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> Self:
+        """Initialize client from a platform url containing the virtual lab and project."""
+        project_context, environment = parse_vlab_url(vlab_url)
+        return cls(
+            api_url=api_url,
+            project_context=project_context,
+            http_client=http_client,
+            token_manager=token_manager,
+            environment=environment,
+            local_store=local_store,
+            rate_limiter=rate_limiter,
+            entity_cache=entity_cache,
+            metadata_cache=metadata_cache,
+            digest_cache=digest_cache,
+            content_cache=content_cache,
+            instrumentation=instrumentation,
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Enter the asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit the asynchronous context manager, closing the HTTP client."""
+        await self.aclose()
+
+    @asynccontextmanager
+    async def _async_invalidating(self, entity_id: ID) -> AsyncIterator[None]:
+        """Remove the entity from the caches once the wrapped operation has modified it.
+
+        Like ``_invalidating``, with the persistent cache updated in a worker thread.
+        """
+        try:
+            yield
+        finally:
+            if self._entity_cache is not None:
+                self._entity_cache.invalidate(entity_id)
+            if self._metadata_cache is not None:
+                await asyncio.to_thread(self._metadata_cache.invalidate, entity_id)
+
+    async def get_api_version(self) -> APIVersion:
+        """Return the entitycore version."""
+        return await async_core.get_api_version(
+            api_url=self.api_url,
+            token_manager=self._token_manager,
+            http_client=self._http_client,
+        )
+
+    @validate_call
+    async def get_entity(
+        self,
+        entity_id: ID,
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None = None,
+        options: dict | None = None,
+        admin: bool = False,
+    ) -> TIdentifiable:
+        """Get entity from resource id.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            project_context: Optional project context.
+            options: Optional dict with options to be passed.
+            admin: Whether to use the admin endpoint or not.
+
+        Returns:
+            entity_type instantiated by deserializing the response, with an assigned id.
+        """
+        context = self._optional_user_context(project_context, admin)
+        # the entities retrieved with custom options are not cached
+        cache = self._entity_cache if options is None else None
+        if cache is not None:
+            entity = self._get_cached_entity(
+                entity_id, entity_type=entity_type, project_context=context, admin=admin
+            )
+            if entity is not None:
+                return entity
+        entity = await async_core.get_entity(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            options=options,
+            entity_type=entity_type,
+            project_context=context,
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+        )
+        if cache is not None:
+            cache.put(entity, entity_type=entity_type, project_context=context, admin=admin)
+        return entity
+
+    @validate_call
+    async def get_entities(
+        self,
+        entity_ids: list[ID],
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None = None,
+        chunk_size: Annotated[int, Field(ge=1)] = 100,
+        max_concurrent: Annotated[int, Field(ge=1)] = 4,
+        missing_ok: bool = False,
+        admin: bool = False,
+    ) -> list[TIdentifiable]:
+        """Get several entities from their resource ids.
+
+        The ids are split into chunks retrieved concurrently, each one with a single request.
+
+        Args:
+            entity_ids: Resource ids of the entities.
+            entity_type: Type of the entities.
+            project_context: Optional project context.
+            chunk_size: Maximum number of ids requested with a single request.
+            max_concurrent: Maximum number of chunks requested concurrently.
+            missing_ok: If True, the entities not found are skipped instead of raising an error.
+            admin: Whether to use the admin endpoint or not.
+
+        Returns:
+            The entities in the same order as the ids, each with an assigned id.
+
+        Raises:
+            EntitiesNotFoundError: If some entities are not found and missing_ok is False.
+                The ids of the missing entities are available in its ``missing_ids`` attribute.
+        """
+        context = self._optional_user_context(project_context, admin)
+        cache_kwargs = {"entity_type": entity_type, "project_context": context, "admin": admin}
+        cached, uncached_ids = self._get_cached_entities(entity_ids, **cache_kwargs)
+        entities = await async_core.get_entities(
+            api_url=self.api_url,
+            entity_ids=uncached_ids,
+            entity_type=entity_type,
+            chunk_size=chunk_size,
+            max_concurrent=max_concurrent,
+            missing_ok=True,
+            project_context=context,
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            admin=admin,
+        )
+        self._put_cached_entities(entities, **cache_kwargs)
+        return sort_by_ids(entity_ids, cached + entities, missing_ok=missing_ok)
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: None = None,
+        lazy: Literal[False] = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[TIdentifiable]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: None = None,
+        lazy: Literal[True],
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[LazyModel[TIdentifiable]]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str],
+        lazy: Literal[False] = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[Projection]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str],
+        lazy: Literal[True],
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[LazyModel[Projection]]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str] | None = None,
+        lazy: bool = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[Any]: ...
+
+    @validate_call
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str] | None = None,
+        lazy: bool = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[Any]:
+        """Search for entities.
+
+        Args:
+            entity_type: Type of the entity.
+            query: Query parameters.
+            limit: Optional limit of the number of entities to yield. Default is None.
+            prefetch: Optional number of pages to request concurrently ahead of the consumer.
+                If None, ``settings.page_prefetch`` is used. If 0, pages are requested one by one.
+            fields: Optional names of the fields to deserialize, e.g. ``["id", "name"]``.
+                If given, lightweight read-only ``Projection`` records with only these fields
+                are yielded instead of the full entities.
+            lazy: If True, ``LazyModel`` proxies keeping the raw json are yielded, and the
+                entities are validated only when a nested attribute is accessed, or when
+                ``materialize()`` is called. This is cheaper when most items are discarded.
+            project_context: Optional project context.
+            admin: Use admin endpoints if True
+
+        Returns:
+            An asynchronous iterator over matching entities, each with an assigned id.
+        """
+        return async_core.search_entities(
+            api_url=self.api_url,
+            entity_type=entity_type,
+            query=query,
+            limit=limit,
+            prefetch=prefetch,
+            fields=fields,
+            lazy=lazy,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            admin=admin,
+        )
+
+    @validate_call
+    async def get_entity_derivations(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        derivation_type: DerivationType,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[Entity]:
+        """Get all derivations for an entity.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            derivation_type: Derivation type to filter by.
+            project_context: Optional project context.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            An iterator over derivation entities, each with an assigned id.
+        """
+        return await async_core.get_entity_derivations(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            derivation_type=derivation_type,
+            project_context=self._optional_user_context(
+                override_context=project_context, admin=admin
+            ),
+            token_manager=self._token_manager,
+            http_client=self._http_client,
+            admin=admin,
+        )
+
+    @validate_call
+    async def register_entity(
+        self,
+        entity: Annotated[TIdentifiable, AfterValidator(ensure_id_is_none)],
+        *,
+        project_context: ProjectContext | None = None,
+    ) -> TIdentifiable:
+        """Register entity.
+
+        Args:
+            entity: Identifiable to register. Its ``id`` must be ``None``.
+            project_context: Optional project context.
+
+        Returns:
+            Registered entity with an assigned id.
+        """
+        return await async_core.register_entity(
+            api_url=self.api_url,
+            entity=entity,
+            project_context=self._required_user_context(project_context),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+        )
+
+    @validate_call
+    async def get_entity_assets(
+        self,
+        entity_id: ID,
+        *,
+        entity_type: type[Entity],
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[Asset]:
+        """Get all assets of an entity.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            project_context: Optional project context.
+            admin: Whether to use the admin endpoint or not.
+
+        Returns:
+            An iterator over assets, each with an assigned id.
+        """
+        return await async_core.get_entity_assets(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            admin=admin,
+        )
+
+    @validate_call
+    async def update_entity(
+        self,
+        entity_id: ID,
+        entity_type: type[TIdentifiable],
+        attrs_or_entity: dict | Identifiable,
+        *,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> TIdentifiable:
+        """Update an entity.
+
+        Args:
+            entity_id: Id of the entity to update.
+            entity_type: Type of the entity.
+            attrs_or_entity: Attributes or entity to update.
+            project_context: Optional project context.
+            admin: whether to use the admin endpoint or not.
+        """
+        async with self._async_invalidating(entity_id):
+            return await async_core.update_entity(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                project_context=self._optional_user_context(project_context, admin),
+                entity_type=entity_type,
+                attrs_or_entity=attrs_or_entity,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
+
+    @validate_call
+    async def delete_entity(
+        self,
+        entity_id: ID,
+        entity_type: type[Identifiable],
+        *,
+        admin: bool = False,
+    ) -> None:
+        """Delete an entity.
+
+        Args:
+            entity_id: Resource id of the entity to delete.
+            entity_type: Type of the entity.
+            admin: Whether to use the admin endpoint or not.
+        """
+        async with self._async_invalidating(entity_id):
+            await async_core.delete_entity(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
+
+    @validate_call
+    async def upload_file(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        file_path: os.PathLike,
+        file_content_type: ContentType,
+        file_name: str | None = None,
+        file_metadata: dict | None = None,
+        asset_label: AssetLabel,
+        project_context: ProjectContext | None = None,
+        transfer_config: MultipartUploadTransferConfig | None = None,
+        admin: bool = False,
+    ) -> Asset:
+        """Upload a file to an entity.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            file_path: Path to the local file to upload.
+            file_content_type: MIME content type for the uploaded file.
+            file_name: Optional override for the uploaded filename.
+            file_metadata: Optional extra metadata to attach to the asset.
+            asset_label: Label for the asset.
+            project_context: Optional project context.
+            transfer_config: Optional multipart upload configuration. If not specified,
+                uses the defaults specified in ``MultipartUploadTransferConfig``.
+            admin: Whether to use admin endpoints.
+
+        Returns:
+            The created Asset.
+        """
+        context = self._optional_user_context(project_context, admin)
+
+        asset_path = Path(file_path)
+
+        asset_metadata = LocalAssetMetadata(
+            file_name=file_name or asset_path.name,
+            content_type=file_content_type,
+            metadata=file_metadata,
+            label=asset_label,
+        )
+        async with self._async_invalidating(entity_id):
+            return await async_core.upload_asset_file(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_path=asset_path,
+                asset_metadata=asset_metadata,
+                http_client=self._http_client,
+                project_context=context,
+                token_manager=self._token_manager,
+                transfer_config=transfer_config,
+                admin=admin,
+            )
+
+    async def upload_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        file_content: BytesOrStream,
+        file_name: str,
+        file_content_type: ContentType,
+        file_metadata: dict | None = None,
+        asset_label: AssetLabel,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> Asset:
+        """Upload file-like content to an entity.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            file_content: File-like object containing binary content.
+            file_name: Filename to report to the backend.
+            file_content_type: MIME content type for the uploaded content.
+            file_metadata: Optional extra metadata to attach to the asset.
+            asset_label: Label for the asset.
+            project_context: Optional project context.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            The created Asset.
+        """
+        asset_metadata = LocalAssetMetadata(
+            file_name=file_name,
+            content_type=file_content_type,
+            metadata=file_metadata or {},
+            label=asset_label,
+        )
+        context = self._optional_user_context(override_context=project_context, admin=admin)
+        async with self._async_invalidating(entity_id):
+            return await async_core.upload_asset_content(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                project_context=context,
+                asset_content=file_content,
+                asset_metadata=asset_metadata,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
+
+    @validate_call
+    async def upload_directory(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        name: str,
+        paths: dict[os.PathLike, os.PathLike],
+        metadata: dict | None = None,
+        label: AssetLabel,
+        project_context: ProjectContext | None = None,
+        transfer_config: MultipartDirectoryUploadTransferConfig | None = None,
+        admin: bool = False,
+    ) -> Asset:
+        """Attach a local directory to an entity.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            name: Directory name to attach.
+            paths: Mapping of relative paths to local paths.
+            metadata: Optional extra metadata to attach to the directory asset.
+            label: Label for the asset.
+            project_context: Optional project context.
+            transfer_config: Optional multipart upload configuration. If not specified,
+                uses the defaults from ``MultipartDirectoryUploadTransferConfig``.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            The created directory Asset.
+        """
+        context = self._optional_user_context(override_context=project_context, admin=admin)
+
+        paths_dict = {Path(k): Path(v) for k, v in paths.items()}
+
+        async with self._async_invalidating(entity_id):
+            return await async_core.upload_asset_directory(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                name=name,
+                paths=paths_dict,
+                metadata=metadata,
+                label=label,
+                project_context=context,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                transfer_config=transfer_config,
+                admin=admin,
+            )
+
+    @validate_call
+    async def list_directory(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: ID,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> DetailedFileList:
+        """List files in a directory asset.
+
+        Args:
+            entity_id: Resource id of the entity.
+            entity_type: Type of the entity.
+            asset_id: Directory asset id.
+            project_context: Optional project context.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            A `DetailedFileList` describing the directory contents.
+        """
+        context = self._optional_user_context(override_context=project_context, admin=admin)
+        return await async_core.list_directory(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            project_context=context,
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+        )
+
+    @validate_call
+    async def fetch_directory(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: RegisteredAssetOrId,
+        output_path: Path,
+        project_context: ProjectContext | None = None,
+        ignore_directory_name: bool = False,
+        max_concurrent: int = 1,
+        strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
+        admin: bool = False,
+        sync: bool = False,
+        delete_extraneous: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_file_size: int | None = None,
+    ) -> list[Path]:
+        """Fetch a directory asset to a local output directory.
+
+        Args:
+            entity_id: Resource id of the entity owning the directory.
+            entity_type: Entity type.
+            asset_id: Directory asset id, or an `Asset` object.
+            output_path: Local output base path to write files to.
+            project_context: Optional project context.
+            ignore_directory_name: If `True`, do not create an extra nested
+                folder for the directory name.
+            max_concurrent: Maximum number of concurrent downloads.
+            strategy: Strategy controlling how files are materialized.
+            admin: Whether to use the admin endpoints.
+            sync: If `True`, only transfer the files that are new or changed since a previous
+                sync, according to their size and modification date. The modification date of
+                the transferred files is set to the remote one, to compare them next time.
+            delete_extraneous: If `True`, remove the local files under the output directory
+                that are no longer in the directory asset. It can't be combined with
+                `ignore_directory_name`, since the output directory may contain other files.
+            stats: Optional counters of the transferred, skipped and removed files.
+            include: Optional glob patterns of the files to fetch, matched with fnmatch against
+                their paths relative to the directory, so that `*` also matches `/`.
+            exclude: Optional glob patterns of the files not to fetch, even if included.
+            max_file_size: Optional maximum size in bytes of the files to fetch.
+
+        Returns:
+            List of output file paths that were created, in the order of the directory listing.
+
+        Raises:
+            EntitySDKError: If `output_path` exists and is a file, or if `delete_extraneous`
+                is combined with `ignore_directory_name`.
+        """
+        return [
+            path
+            async for _, path in await self.iter_directory(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_id=asset_id,
+                output_path=output_path,
+                project_context=project_context,
+                ignore_directory_name=ignore_directory_name,
+                max_concurrent=max_concurrent,
+                ordered=True,
+                strategy=strategy,
+                admin=admin,
+                sync=sync,
+                delete_extraneous=delete_extraneous,
+                stats=stats,
+                include=include,
+                exclude=exclude,
+                max_file_size=max_file_size,
+            )
+        ]
+
+    @validate_call
+    async def iter_directory(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: RegisteredAssetOrId,  # pyright: ignore[reportRedeclaration]
+        output_path: Path,
+        project_context: ProjectContext | None = None,
+        ignore_directory_name: bool = False,
+        max_concurrent: int = 1,
+        ordered: bool = False,
+        strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
+        admin: bool = False,
+        sync: bool = False,
+        delete_extraneous: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_file_size: int | None = None,
+    ) -> AsyncIteratorResult[tuple[Path, Path]]:
+        """Fetch a directory asset to a local output directory, yielding the files as fetched.
+
+        Asynchronous counterpart of `Client.iter_directory`. The directory is listed when
+        awaited, and the files are fetched while iterating.
+
+        Returns:
+            An asynchronous iterator yielding the path of each file relative to the directory,
+            and the path of the local file.
+
+        Raises:
+            EntitySDKError: If `output_path` exists and is a file, or if `delete_extraneous`
+                is combined with `ignore_directory_name`.
+        """
+        if delete_extraneous and ignore_directory_name:
+            raise EntitySDKError(
+                "delete_extraneous can't be combined with ignore_directory_name, "
+                "since the output directory may contain other files"
+            )
+        if output_path.is_file():
+            raise EntitySDKError(f"{output_path} exists and is a file")
+
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        context = self._optional_user_context(override_context=project_context, admin=admin)
+
+        if isinstance(asset_id, Asset):
+            asset = asset_id
+            asset_id: ID = asset.id  # pyright: ignore[reportRedeclaration, reportAssignmentType]
+        else:
+            asset = None
+
+        if not ignore_directory_name:
+            if asset is None:
+                asset = await async_core.get_entity_asset(
+                    api_url=self.api_url,
+                    entity_id=entity_id,
+                    asset_id=asset_id,
+                    entity_type=entity_type,
+                    project_context=context,
+                    http_client=self._http_client,
+                    token_manager=self._token_manager,
+                    admin=admin,
+                    metadata_cache=self._metadata_cache,
+                )
+
+            output_path /= asset.path
+
+        contents = await self.list_directory(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            project_context=project_context,
+            admin=admin,
+        )
+
+        files = filter_directory_files(
+            contents.files, include=include, exclude=exclude, max_file_size=max_file_size
+        )
+
+        async def _fetch(path: Path) -> tuple[Path, Path]:
+            file_info = files[path]
+            target_path = output_path / path
+            if sync and await asyncio.to_thread(
+                is_synced, target_path, size=file_info.size, last_modified=file_info.last_modified
+            ):
+                if stats is not None:
+                    stats.add_skipped(file_info.size)
+                return path, target_path
+            target_path = await async_core.fetch_asset_file(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_or_id=asset or asset_id,
+                project_context=context,
+                asset_path=path,
+                output_path=output_path / path,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                local_store=self._local_store,
+                strategy=strategy,
+                admin=admin,
+                metadata_cache=self._metadata_cache,
+                content_cache=self._content_cache,
+                file_info=file_info,
+                stats=stats,
+            )
+            if sync:
+                set_modified(target_path, file_info.last_modified)
+            return path, target_path
+
+        async def _paths() -> AsyncIterator[Path]:
+            for path in files:
+                yield path
+
+        async def _results() -> AsyncIterator[tuple[Path, Path]]:
+            async for result in AsyncIteratorResult(_paths()).map_concurrent(
+                _fetch, max_workers=max(1, max_concurrent), ordered=ordered
+            ):
+                yield result
+            if delete_extraneous:
+                await asyncio.to_thread(remove_extraneous, output_path, contents.files, stats=stats)
+
+        return AsyncIteratorResult(_results())
+
+    @validate_call
+    async def download_directory(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: RegisteredAssetOrId,
+        output_path: os.PathLike,
+        project_context: ProjectContext | None = None,
+        ignore_directory_name: bool = False,
+        max_concurrent: int = 1,
+        admin: bool = False,
+        sync: bool = False,
+        delete_extraneous: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_file_size: int | None = None,
+    ) -> list[Path]:
+        """Download a directory asset to local disk.
+
+        Args:
+            entity_id: Resource id of the entity owning the directory.
+            entity_type: Entity type.
+            asset_id: Directory asset id, or an `Asset` object.
+            output_path: Local output base path to write files to.
+            project_context: Optional project context.
+            ignore_directory_name: If `True`, do not create an extra nested
+                folder for the directory name.
+            max_concurrent: Maximum number of concurrent downloads.
+            admin: Whether to use the admin endpoints.
+            sync: If `True`, only download the files that are new or changed since a previous
+                sync, according to their size and modification date.
+            delete_extraneous: If `True`, remove the local files under the output directory
+                that are no longer in the directory asset. It can't be combined with
+                `ignore_directory_name`, since the output directory may contain other files.
+            stats: Optional counters of the transferred, skipped and removed files.
+            include: Optional glob patterns of the files to download, matched with fnmatch
+                against their paths relative to the directory, so that `*` also matches `/`.
+            exclude: Optional glob patterns of the files not to download, even if included.
+            max_file_size: Optional maximum size in bytes of the files to download.
+
+        Returns:
+            List of output file paths that were created.
+        """
+        return await self.fetch_directory(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            output_path=Path(output_path),
+            project_context=project_context,
+            ignore_directory_name=ignore_directory_name,
+            max_concurrent=max_concurrent,
+            strategy=FetchFileStrategy.download_only,
+            admin=admin,
+            sync=sync,
+            delete_extraneous=delete_extraneous,
+            stats=stats,
+            include=include,
+            exclude=exclude,
+            max_file_size=max_file_size,
+        )
+
+    @validate_call
+    async def fetch_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+    ) -> bytes:
+        """Retrieve the binary content of an asset associated with an entity.
+
+        Args:
+            entity_id: Identifier of the entity that owns the asset.
+            entity_type: The entity class/type implementing ``Identifiable``.
+            asset_or_id: Identifier of the asset to retrieve.
+            asset_path: For asset directories, the path within the directory for the file.
+            project_context: Optional project context
+            strategy: Strategy controlling how the asset file content is materialized
+                (for example copying from a local store or downloading from the
+                remote service).
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            The asset content as raw bytes.
+        """
+        return await async_core.fetch_asset_content(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            local_store=self._local_store,
+            strategy=strategy,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+        )
+
+    @validate_call
+    async def open_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+    ) -> AsyncChunkReader:
+        """Open the content of an asset as a binary stream, without loading it in memory.
+
+        The content is streamed from the remote service, unless found in the local store.
+        The stream should be used as an asynchronous context manager, or closed after use
+        with ``aclose``, to release the connection.
+
+        Args:
+            entity_id: Identifier of the entity that owns the asset.
+            entity_type: The entity class/type implementing ``Identifiable``.
+            asset_or_id: Identifier of the asset to retrieve.
+            asset_path: For asset directories, the path within the directory for the file.
+            project_context: Optional project context
+            strategy: Strategy controlling whether the file is read from the local store or
+                streamed from the remote service.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            A readable asynchronous binary stream.
+        """
+        return await async_core.open_asset_content(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            local_store=self._local_store,
+            strategy=strategy,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+        )
+
+    @validate_call
+    async def fetch_content_into(
+        self,
+        buffer: InstanceOf[bytearray] | InstanceOf[memoryview],
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+    ) -> int:
+        """Fetch the content of an asset into a caller-provided buffer, without copying it.
+
+        The buffer can be allocated once from `Asset.size`, and reused for several assets.
+
+        Args:
+            buffer: Writable buffer, at least as large as the content.
+            entity_id: Identifier of the entity that owns the asset.
+            entity_type: The entity class/type implementing ``Identifiable``.
+            asset_or_id: Identifier of the asset to retrieve.
+            asset_path: For asset directories, the path within the directory for the file.
+            project_context: Optional project context
+            strategy: Strategy controlling whether the file is read from the local store or
+                downloaded from the remote service.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            The number of bytes written at the start of the buffer.
+
+        Raises:
+            EntitySDKError: If the buffer is read-only or too small for the content.
+        """
+        return await async_core.fetch_asset_content_into(
+            buffer,
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            local_store=self._local_store,
+            strategy=strategy,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+        )
+
+    @validate_call
+    async def download_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: ID,
+        asset_path: StrOrPath | None = None,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> bytes:
+        """Download asset content.
+
+        Args:
+            entity_id: Id of the entity.
+            entity_type: Type of the entity.
+            asset_id: Id of the asset.
+            asset_path: for asset directories, the path within the directory to the file.
+            project_context: Optional project context.
+            admin: Whether to use admin endpoints.
+
+        Returns:
+            Asset content in bytes.
+        """
+        return await self.fetch_content(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_id,
+            asset_path=Path(asset_path) if asset_path else None,
+            project_context=project_context,
+            strategy=FetchContentStrategy.download_only,
+            admin=admin,
+        )
+
+    @validate_call
+    async def fetch_file(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: RegisteredAssetOrId,
+        output_path: Path,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
+        admin: bool = False,
+        transfer_config: DownloadTransferConfig | None = None,
+        skip_unchanged: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+    ) -> Path:
+        """Fetch a file asset to a local output path.
+
+        Args:
+            entity_id: Resource id of the entity owning the asset.
+            entity_type: Entity type.
+            asset_id: File asset id, or an `Asset` object.
+            output_path: Local output path (file or directory) to write to.
+            asset_path: For directory assets, path within the directory to the file.
+            project_context: Optional project context.
+            strategy: Strategy controlling how the asset file is materialized.
+            admin: Whether to use admin endpoints.
+            transfer_config: Optional configuration of the concurrent range requests used for the
+                large files. If not specified, the default values are used.
+            skip_unchanged: Whether to skip the download if the output file already has the
+                size and the sha256 digest of the asset.
+            stats: Optional counters of the transferred and skipped files.
+
+        Returns:
+            The path of the created local file.
+        """
+        return await async_core.fetch_asset_file(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_id,
+            project_context=self._optional_user_context(project_context, admin),
+            asset_path=asset_path,
+            output_path=output_path,
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            local_store=self._local_store,
+            strategy=strategy,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+            transfer_config=transfer_config,
+            skip_unchanged=skip_unchanged,
+            digest_cache=self._digest_cache,
+            stats=stats,
+            content_cache=self._content_cache,
+        )
+
+    @validate_call
+    async def download_file(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: RegisteredAssetOrId,
+        output_path: os.PathLike,
+        asset_path: os.PathLike | None = None,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+        transfer_config: DownloadTransferConfig | None = None,
+        skip_unchanged: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+    ) -> Path:
+        """Download asset file to a file path.
+
+        Args:
+            entity_id: Id of the entity.
+            entity_type: Type of the entity.
+            asset_id: Id of the asset.
+            output_path: Either be a file path to write the file to or an output directory.
+            asset_path: for asset directories, the path within the directory to the file.
+            project_context: Optional project context.
+            admin: Whether to use admin endpoints.
+            transfer_config: Optional configuration of the concurrent range requests used for the
+                large files. If not specified, the default values are used.
+            skip_unchanged: Whether to skip the download if the output file already has the
+                size and the sha256 digest of the asset.
+            stats: Optional counters of the transferred and skipped files.
+
+        Returns:
+            Output file path.
+        """
+        return await self.fetch_file(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            output_path=Path(output_path),
+            project_context=project_context,
+            asset_path=Path(asset_path) if asset_path else None,
+            strategy=FetchFileStrategy.download_only,
+            admin=admin,
+            transfer_config=transfer_config,
+            skip_unchanged=skip_unchanged,
+            stats=stats,
+        )
+
+    @staticmethod
+    @validate_call
+    def select_assets(entity: RegisteredEntity, selection: dict) -> IteratorResult[Asset]:
+        """Select assets from an entity based on a selection dict.
+
+        Args:
+            entity: Entity whose assets should be filtered. Must have an assigned id.
+            selection: Selection/filter criteria.
+
+        Returns:
+            An iterator over matching assets, each with an assigned id.
+        """
+        return IteratorResult(filter_assets(entity.assets, selection))
+
+    @validate_call
+    async def fetch_assets(
+        self,
+        entity_or_id: RegisteredEntity | tuple[ID, type[Entity]],
+        *,
+        selection: dict[str, Any] | None = None,
+        output_path: Path,
+        project_context: ProjectContext | None = None,
+        strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[DownloadedAssetFile]:
+        """Fetch assets belonging to an entity.
+
+        Args:
+            entity_or_id: Either an `Entity` object or a tuple of
+                (`entity_id`, `entity_type`).
+            selection: Optional selection/filter dict.
+            output_path: Local output directory base path.
+            project_context: Optional project context.
+            strategy: Strategy controlling how each file is materialized.
+            admin: Whether to use admin endpoints.
+
+        Returns:
+            An asynchronous iterator yielding `DownloadedAssetFile` objects.
+        """
+        context = self._optional_user_context(project_context, admin)
+        if isinstance(entity_or_id, tuple):
+            entity_id, entity_type = entity_or_id
+            entity = await self.get_entity(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                project_context=context,
+                admin=admin,
+            )
+        else:
+            entity = entity_or_id
+
+        if not issubclass(type(entity), Entity):
+            raise EntitySDKError(f"Type {type(entity)} has no assets.")
+
+        if not entity.assets:
+            raise EntitySDKError(f"Entity {entity.id} ({entity.name}) has no assets.")
+
+        assets = filter_assets(entity.assets, selection) if selection else entity.assets
+
+        if not all(asset.status == AssetStatus.created for asset in assets):
+            raise EntitySDKError(
+                f"Entity {entity.id} has assets that are uploading and cannot be downloaded."
+            )
+
+        async def _fetch_entity_assets():
+            for asset in assets:
+                if asset.is_directory:
+                    raise NotImplementedError("Downloading asset directories is not supported yet.")
+                path = await self.fetch_file(
+                    entity_id=entity.id,
+                    entity_type=type(entity),
+                    asset_id=asset.id,
+                    output_path=output_path,
+                    project_context=context,
+                    strategy=strategy,
+                    admin=admin,
+                )
+                yield DownloadedAssetFile(asset=asset, path=path)
+
+        return AsyncIteratorResult(_fetch_entity_assets())
+
+    @validate_call
+    async def download_assets(
+        self,
+        entity_or_id: RegisteredEntity | tuple[ID, type[Entity]],
+        *,
+        selection: dict[str, Any] | None = None,
+        output_path: Path,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> AsyncIteratorResult[DownloadedAssetFile]:
+        """Download assets belonging to an entity.
+
+        Args:
+            entity_or_id: Either an `Entity` object or a tuple of (`entity_id`, `entity_type`).
+            selection: Optional selection/filter dict.
+            output_path: Local output directory base path.
+            project_context: Optional project context.
+            admin: Whether to use admin endpoints.
+
+        Returns:
+            An asynchronous iterator yielding `DownloadedAssetFile` objects.
+        """
+        return await self.fetch_assets(
+            entity_or_id=entity_or_id,
+            selection=selection,
+            output_path=output_path,
+            project_context=project_context,
+            strategy=FetchFileStrategy.download_only,
+            admin=admin,
+        )
+
+    @validate_call
+    async def delete_asset(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: ID,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> Asset:
+        """Delete an entity's asset.
+
+        Args:
+            entity_id: Resource id of the entity owning the asset.
+            entity_type: Entity type.
+            asset_id: Asset id to delete.
+            project_context: Optional project context.
+            admin: Whether to use the admin endpoint or not.
+
+        Returns:
+            The deleted Asset (as returned by the backend).
+        """
+        async with self._async_invalidating(entity_id):
+            return await async_core.delete_asset(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_id=asset_id,
+                project_context=self._optional_user_context(project_context, admin),
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
+
+    @validate_call
+    async def update_asset_file(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: ID,
+        file_path: os.PathLike,
+        file_content_type: ContentType,
+        file_name: str | None = None,
+        file_metadata: dict | None = None,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> Asset:
+        """Update an entity's asset file.
+
+        Note: This operation is not atomic. Deletion can succeed and upload can fail.
+
+        Args:
+            entity_id: Resource id of the entity owning the asset.
+            entity_type: Entity type.
+            asset_id: Asset id to update.
+            file_path: Path to the local file to upload.
+            file_content_type: MIME content type for the uploaded file.
+            file_name: Optional override for the uploaded filename.
+            file_metadata: Optional extra metadata to attach to the asset.
+            project_context: Optional project context.
+            admin: Whether to use admin endpoints.
+
+        Returns:
+            The updated Asset (as created by re-uploading).
+        """
+        deleted_asset = await self.delete_asset(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            project_context=project_context,
+            admin=admin,
+        )
+        return await self.upload_file(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            file_path=file_path,
+            file_content_type=file_content_type,
+            file_name=file_name,
+            file_metadata=file_metadata,
+            project_context=project_context,
+            asset_label=deleted_asset.label,
+            admin=admin,
+        )
+
+    @validate_call
+    async def register_asset(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        name: str,
+        storage_path: str,
+        storage_type: StorageType,
+        is_directory: bool,
+        content_type: ContentType,
+        asset_label: AssetLabel,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> Asset:
+        """Register a file or directory already existing.
+
+        Args:
+            entity_id: Resource id of the entity owning the asset.
+            entity_type: Entity type.
+            name: Asset name/path relative to the entity.
+            storage_path: Full storage path (backend-specific).
+            storage_type: Backend storage type.
+            is_directory: Whether the asset represents a directory.
+            content_type: MIME content type.
+            asset_label: Label for the asset.
+            project_context: Optional project context.
+            admin: Whether to use admin endpoints.
+
+        Returns:
+            The registered Asset.
+        """
+        asset_metadata = ExistingAssetMetadata(
+            path=name,
+            full_path=storage_path,
+            storage_type=storage_type,
+            is_directory=is_directory,
+            content_type=content_type,
+            label=asset_label,
+        )
+        context = self._optional_user_context(project_context, admin)
+        async with self._async_invalidating(entity_id):
+            return await async_core.register_asset(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                project_context=context,
+                asset_metadata=asset_metadata,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
@@ -0,0 +1,1282 @@
+"""Asynchronous core SDK operations.
+
+The functions in this module mirror the ones in ``entitysdk.core``, but they rely on an
+``httpx.AsyncClient`` and must be awaited.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import Any, Literal, TypeVar, overload
+
+import httpx
+
+from entitysdk import serdes
+from entitysdk.async_multipart_upload import (
+    multipart_upload_asset_directory,
+    multipart_upload_asset_file,
+)
+from entitysdk.async_ranged_download import download_file_ranges, resume_file_stream
+from entitysdk.common import ProjectContext
+from entitysdk.config import settings
+from entitysdk.exception import EntitySDKError
+from entitysdk.models.asset import (
+    Asset,
+    DetailedFile,
+    DetailedFileList,
+    ExistingAssetMetadata,
+    LocalAssetMetadata,
+)
+from entitysdk.models.base import BaseModel
+from entitysdk.models.core import Identifiable
+from entitysdk.models.entity import Entity
+from entitysdk.models.lazy import LazyModel
+from entitysdk.models.projection import Projection, projection_model
+from entitysdk.multipart_upload import calculate_part_count
+from entitysdk.result import AsyncIteratorResult, IteratorResult
+from entitysdk.route import (
+    get_assets_endpoint,
+    get_entities_endpoint,
+    get_entity_derivations_endpoint,
+    get_version_endpoint,
+)
+from entitysdk.schemas.asset import (
+    DownloadTransferConfig,
+    MultipartDirectoryFileRequest,
+    MultipartDirectoryUploadRequest,
+    MultipartDirectoryUploadTransferConfig,
+    MultipartUploadTransferConfig,
+)
+from entitysdk.schemas.version import APIVersion
+from entitysdk.token_manager import TokenManager
+from entitysdk.types import (
+    ID,
+    AssetLabel,
+    BytesOrStream,
+    DerivationType,
+    FetchContentStrategy,
+    FetchFileStrategy,
+)
+from entitysdk.utils import json_codec
+from entitysdk.utils.asset import resolve_asset_path
+from entitysdk.utils.batch import chunked, id_filter, sort_by_ids
+from entitysdk.utils.cache import ContentCache, DigestCache, MetadataCache, content_key
+from entitysdk.utils.checkpoint import DownloadCheckpoint
+from entitysdk.utils.filesystem import (
+    create_dir,
+    get_filesize,
+    validate_filename_extension_consistency,
+)
+from entitysdk.utils.http import (
+    async_count_paginated_request,
+    async_make_db_api_request,
+    async_stream_paginated_request,
+    async_stream_response,
+    build_request_headers,
+)
+from entitysdk.utils.io import AsyncChunkReader, aiter_file, calculate_sha256_digest
+from entitysdk.utils.store import LocalAssetStore
+from entitysdk.utils.transfer import TransferStats, is_unchanged
+
+L = logging.getLogger(__name__)
+
+TIdentifiable = TypeVar("TIdentifiable", bound=Identifiable)
+
+
+async def get_api_version(
+    *,
+    api_url: str,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+) -> APIVersion:
+    """Return the entitycore version."""
+    url = get_version_endpoint(api_url=api_url)
+    response = await async_make_db_api_request(
+        url=url,
+        method="GET",
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return APIVersion.model_validate(json_codec.loads(response.content))
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: None = None,
+    lazy: Literal[False] = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> AsyncIteratorResult[TIdentifiable]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: None = None,
+    lazy: Literal[True],
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> AsyncIteratorResult[LazyModel[TIdentifiable]]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str],
+    lazy: Literal[False] = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> AsyncIteratorResult[Projection]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str],
+    lazy: Literal[True],
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> AsyncIteratorResult[LazyModel[Projection]]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str] | None = None,
+    lazy: bool = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> AsyncIteratorResult[Any]: ...
+
+
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str] | None = None,
+    lazy: bool = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> AsyncIteratorResult[Any]:
+    """Search for entities.
+
+    No request is made until the returned result is iterated.
+
+    Args:
+        api_url: the api url to entitycore service.
+        entity_type: Type of the entity.
+        query: Query parameters
+        limit: Limit of the number of entities to yield or None.
+        page_size: Number of entities requested per page, or None to use the default.
+        prefetch: Number of pages to request concurrently ahead of the consumer,
+            or None to use the default from the settings.
+        fields: Names of the fields to deserialize, or None to deserialize the full entities.
+            If given, the items are read-only ``Projection`` records with only these fields.
+        lazy: If True, the items are ``LazyModel`` proxies validated only when needed.
+        project_context: Project context.
+        token_manager: Token manager to issue tokens.
+        http_client: Asynchronous HTTP client.
+        admin: Use admin endpoint if True
+
+    Returns:
+        Asynchronous iterator of entities.
+    """
+    item_type = entity_type if fields is None else projection_model(entity_type, fields)
+    url = get_entities_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        admin=admin,
+    )
+    items = async_stream_paginated_request(
+        url=url,
+        method="GET",
+        parameters=query,
+        limit=limit,
+        page_size=page_size,
+        prefetch=prefetch,
+        item_type=None if lazy else item_type,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    iterator: AsyncIterator[Any] = _lazy_models(item_type, items) if lazy else items
+
+    async def count() -> int:
+        return await async_count_paginated_request(
+            url=url,
+            method="GET",
+            parameters=query,
+            limit=limit,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+        )
+
+    return AsyncIteratorResult(iterator, count=count)
+
+
+async def _lazy_models(
+    model: type[BaseModel], items: AsyncIterator[dict[str, Any]]
+) -> AsyncIterator[Any]:
+    async for data in items:
+        yield LazyModel(model, data)
+
+
+async def get_entity(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[TIdentifiable],
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    options: dict | None = None,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> TIdentifiable:
+    """Instantiate entity with model ``entity_type`` from resource id.
+
+    If a metadata cache is given, it's used unless options are specified.
+    """
+    url = get_entities_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        admin=admin,
+    )
+    if options is not None:
+        metadata_cache = None
+    if metadata_cache is not None and (
+        payload := await asyncio.to_thread(metadata_cache.get, url, project_context=project_context)
+    ):
+        return serdes.deserialize_model_json(payload, entity_type)
+    response = await async_make_db_api_request(
+        url=url,
+        method="GET",
+        json=None,
+        parameters=options,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    json_data = json_codec.loads(response.content)
+    if metadata_cache is not None:
+        await asyncio.to_thread(
+            metadata_cache.put_response,
+            url,
+            response,
+            json_data,
+            project_context=project_context,
+            entity_id=entity_id,
+        )
+    return serdes.deserialize_model(json_data, entity_type)
+
+
+async def get_entities(
+    *,
+    api_url: str,
+    entity_ids: Sequence[ID],
+    entity_type: type[TIdentifiable],
+    chunk_size: int,
+    max_concurrent: int,
+    missing_ok: bool,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> list[TIdentifiable]:
+    """Instantiate the entities with model ``entity_type`` from their resource ids.
+
+    See ``entitysdk.core.get_entities`` for the description of the arguments.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def fetch_chunk(chunk: Sequence[ID]) -> list[TIdentifiable]:
+        async with semaphore:
+            return await search_entities(
+                api_url=api_url,
+                entity_type=entity_type,
+                query=id_filter(chunk),
+                page_size=len(chunk),
+                limit=None,
+                prefetch=0,
+                project_context=project_context,
+                token_manager=token_manager,
+                http_client=http_client,
+                admin=admin,
+            ).all()
+
+    unique_ids = list(dict.fromkeys(entity_ids))
+    results = await asyncio.gather(
+        *(fetch_chunk(chunk) for chunk in chunked(unique_ids, chunk_size))
+    )
+    return sort_by_ids(
+        entity_ids,
+        (entity for result in results for entity in result),
+        missing_ok=missing_ok,
+    )
+
+
+async def get_entity_derivations(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    project_context: ProjectContext | None,
+    derivation_type: DerivationType,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> IteratorResult[Entity]:
+    """Get derivations for entity."""
+    url = get_entity_derivations_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        admin=admin,
+    )
+
+    params = {"derivation_type": DerivationType(derivation_type)}
+
+    response = await async_make_db_api_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+        parameters=params,
+    )
+    return IteratorResult(
+        serdes.deserialize_model(json_data, Entity)
+        for json_data in json_codec.loads(response.content)["data"]
+    )
+
+
+async def get_entity_asset(
+    *,
+    api_url: str,
+    entity_id: ID,
+    asset_id: ID,
+    entity_type: type[Entity],
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool = False,
+    metadata_cache: MetadataCache | None = None,
+) -> Asset:
+    """Get an entity's asset metadata."""
+    url = get_assets_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        asset_id=asset_id,
+        admin=admin,
+    )
+    if metadata_cache is not None and (
+        payload := await asyncio.to_thread(metadata_cache.get, url, project_context=project_context)
+    ):
+        return serdes.deserialize_model_json(payload, Asset)
+    response = await async_make_db_api_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    json_data = json_codec.loads(response.content)
+    if metadata_cache is not None:
+        await asyncio.to_thread(
+            metadata_cache.put_response,
+            url,
+            response,
+            json_data,
+            project_context=project_context,
+            entity_id=entity_id,
+        )
+    return serdes.deserialize_model(json_data, Asset)
+
+
+async def get_entity_assets(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool = False,
+) -> IteratorResult[Asset]:
+    """Get all assets of an entity."""
+    url = get_assets_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        asset_id=None,
+        admin=admin,
+    )
+    response = await async_make_db_api_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return IteratorResult(
+        serdes.deserialize_model(json_data, Asset)
+        for json_data in json_codec.loads(response.content)["data"]
+    )
+
+
+async def register_entity(
+    *,
+    api_url: str,
+    entity: TIdentifiable,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+) -> TIdentifiable:
+    """Register entity."""
+    url = get_entities_endpoint(api_url=api_url, entity_type=type(entity))
+
+    json_data = serdes.serialize_model(entity)
+
+    response = await async_make_db_api_request(
+        url=url,
+        method="POST",
+        json=json_data,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return serdes.deserialize_model(json_codec.loads(response.content), type(entity))
+
+
+async def update_entity(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[TIdentifiable],
+    attrs_or_entity: dict | Identifiable,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> TIdentifiable:
+    """Update entity."""
+    if isinstance(attrs_or_entity, dict):
+        json_data = serdes.serialize_dict(attrs_or_entity)
+    else:
+        json_data = serdes.serialize_model(attrs_or_entity)
+
+    url = get_entities_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        admin=admin,
+    )
+
+    response = await async_make_db_api_request(
+        url=url,
+        method="PATCH",
+        json=json_data,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return serdes.deserialize_model(json_codec.loads(response.content), entity_type)
+
+
+async def delete_entity(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Identifiable],
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> None:
+    """Delete entity."""
+    url = get_entities_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        admin=admin,
+    )
+    await async_make_db_api_request(
+        url=url,
+        method="DELETE",
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+
+async def upload_asset_file(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_path: Path,
+    asset_metadata: LocalAssetMetadata,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    transfer_config: MultipartUploadTransferConfig | None = None,
+    admin: bool,
+) -> Asset:
+    """Upload asset to an existing entity's endpoint from a file path."""
+    transfer_config = transfer_config or MultipartUploadTransferConfig()
+
+    if get_filesize(asset_path) > transfer_config.threshold:
+        L.info("File is being uploaded using multipart upload")
+        return await multipart_upload_asset_file(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_path=asset_path,
+            asset_metadata=asset_metadata,
+            project_context=project_context,
+            token_manager=token_manager,
+            transfer_config=transfer_config,
+            http_client=http_client,
+            admin=admin,
+        )
+    with open(asset_path, "rb") as file_content:
+        return await upload_asset_content(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_content=file_content,
+            asset_metadata=asset_metadata,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            admin=admin,
+        )
+
+
+async def upload_asset_content(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_content: BytesOrStream,
+    asset_metadata: LocalAssetMetadata,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> Asset:
+    """Upload asset to an existing entity's endpoint from a file-like object."""
+    files = {
+        "file": (
+            asset_metadata.file_name,
+            asset_content,
+            asset_metadata.content_type,
+        )
+    }
+    url = get_assets_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        asset_id=None,
+        admin=admin,
+    )
+    response = await async_make_db_api_request(
+        url=url,
+        method="POST",
+        files=files,
+        data={"label": asset_metadata.label} if asset_metadata.label else None,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
+
+
+async def upload_asset_directory(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    name: str,
+    paths: dict[Path, Path],
+    metadata: dict | None = None,
+    label: AssetLabel,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    transfer_config: MultipartDirectoryUploadTransferConfig | None = None,
+    admin: bool,
+) -> Asset:
+    """Upload a group of files to a directory using multipart-upload."""
+    transfer_config = transfer_config or MultipartDirectoryUploadTransferConfig()
+
+    # hashing is CPU and disk bound, so it's done in worker threads to keep the loop responsive
+    digests = await asyncio.gather(
+        *(asyncio.to_thread(calculate_sha256_digest, path) for path in paths.values())
+    )
+    files = []
+    for (relative_path, local_path), sha256_digest in zip(paths.items(), digests, strict=True):
+        filesize = get_filesize(local_path)
+        files.append(
+            MultipartDirectoryFileRequest(
+                filename=str(relative_path),
+                filesize=filesize,
+                sha256_digest=sha256_digest,
+                preferred_part_count=calculate_part_count(filesize),
+            )
+        )
+
+    upload_request = MultipartDirectoryUploadRequest(
+        directory_name=name,
+        label=label,
+        meta=metadata,
+        files=files,
+    )
+
+    return await multipart_upload_asset_directory(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        project_context=project_context,
+        http_client=http_client,
+        token_manager=token_manager,
+        transfer_config=transfer_config,
+        upload_request=upload_request,
+        paths=paths,
+        admin=admin,
+    )
+
+
+async def list_directory(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_id: ID,
+    token_manager: TokenManager,
+    project_context: ProjectContext | None = None,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> DetailedFileList:
+    """List all files within an asset directory."""
+    url = (
+        get_assets_endpoint(
+            api_url=api_url,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            asset_id=asset_id,
+            admin=admin,
+        )
+        + "/list"
+    )
+    if metadata_cache is not None and (
+        payload := await asyncio.to_thread(metadata_cache.get, url, project_context=project_context)
+    ):
+        return serdes.deserialize_model_json(payload, DetailedFileList)
+    response = await async_make_db_api_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    json_data = json_codec.loads(response.content)
+    if metadata_cache is not None:
+        await asyncio.to_thread(
+            metadata_cache.put_response,
+            url,
+            response,
+            json_data,
+            project_context=project_context,
+            entity_id=entity_id,
+        )
+    return serdes.deserialize_model(json_data, DetailedFileList)
+
+
+async def fetch_asset_file(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    output_path: Path,
+    asset_path: Path | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    local_store: LocalAssetStore | None = None,
+    strategy: FetchFileStrategy,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+    transfer_config: DownloadTransferConfig | None = None,
+    skip_unchanged: bool = False,
+    digest_cache: DigestCache | None = None,
+    stats: TransferStats | None = None,
+    content_cache: ContentCache | None = None,
+    file_info: DetailedFile | None = None,
+) -> Path:
+    """Fetch asset file.
+
+    With ``skip_unchanged``, the download of a file asset is skipped if ``output_path`` already
+    holds a file with the size and the sha256 digest of the asset. The digests of the local
+    files are taken from ``digest_cache`` when given, and the downloaded and skipped files are
+    counted in ``stats``.
+
+    With ``content_cache``, the file is materialized from the cache when present, and added to
+    it after the download. The files of a directory asset are cached only if their ``file_info``
+    is given, since they're identified by their size and modification date.
+    """
+    if isinstance(asset_or_id, ID):
+        asset = await get_entity_asset(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_or_id,
+            project_context=project_context,
+            http_client=http_client,
+            token_manager=token_manager,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+    else:
+        asset = asset_or_id
+
+    source_path = resolve_asset_path(asset, directory_file=asset_path)
+    target_path = Path(output_path)
+
+    if not asset.is_directory:
+        target_path = (
+            target_path / asset.path
+            if target_path.is_dir()
+            else validate_filename_extension_consistency(target_path, Path(asset.path).suffix)
+        )
+
+    create_dir(target_path.parent)
+    key = content_key(asset, asset_path=asset_path, file_info=file_info)
+
+    async def download_file() -> Path:
+        if (
+            skip_unchanged
+            and not asset.is_directory
+            and await asyncio.to_thread(
+                is_unchanged,
+                target_path,
+                size=asset.size,
+                sha256_digest=asset.sha256_digest,
+                digest_cache=digest_cache,
+            )
+        ):
+            L.debug("Skipping the download of the unchanged file %s", target_path)
+            if stats is not None:
+                stats.add_skipped(asset.size)
+            return target_path
+        if (
+            key is not None
+            and content_cache is not None
+            and await asyncio.to_thread(content_cache.materialize, key, target_path)
+        ):
+            L.debug("Materialized %s from the content cache", target_path)
+            if stats is not None:
+                stats.add_cached(target_path.stat().st_size)
+            return target_path
+        path = await download_asset_file(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset.id,
+            target_path=target_path,
+            token_manager=token_manager,
+            project_context=project_context,
+            http_client=http_client,
+            asset_path=asset_path,
+            admin=admin,
+            asset_size=None if asset.is_directory else asset.size,
+            sha256_digest=None if asset.is_directory else asset.sha256_digest,
+            transfer_config=transfer_config,
+            digest_cache=digest_cache,
+        )
+        if stats is not None:
+            stats.add_transferred(path.stat().st_size)
+        if key is not None and content_cache is not None:
+            # the digest was verified when the download was committed
+            await asyncio.to_thread(
+                content_cache.put,
+                key,
+                path,
+                sha256_digest=None if asset.is_directory else asset.sha256_digest,
+                verified=True,
+            )
+        return path
+
+    def try_copy_path() -> Path | None:
+        if local_store is None:
+            return None
+
+        if local_store.path_exists(source_path):
+            return local_store.copy_path(path=source_path, target_path=target_path)
+
+        return None
+
+    def try_link_path() -> Path | None:
+        if local_store is None:
+            return None
+
+        if local_store.path_exists(source_path):
+            return local_store.link_path(path=source_path, target_path=target_path)
+
+        return None
+
+    match strategy:
+        case FetchFileStrategy.copy_only:
+            if path := try_copy_path():
+                return path
+            raise EntitySDKError("copy strategy failed: Asset path not found in store")
+        case FetchFileStrategy.copy_or_download:
+            if path := try_copy_path():
+                return path
+            return await download_file()
+        case FetchFileStrategy.link_only:
+            if path := try_link_path():
+                return path
+            raise EntitySDKError("link strategy failed: Asset path not found in store")
+        case FetchFileStrategy.link_or_download:
+            if path := try_link_path():
+                return path
+            return await download_file()
+        case FetchFileStrategy.download_only:
+            return await download_file()
+        case _:
+            raise EntitySDKError(f"{strategy} strategy failed: Unsupported strategy")
+
+
+async def download_asset_file(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_id: ID,
+    target_path: Path,
+    token_manager: TokenManager,
+    project_context: ProjectContext | None = None,
+    http_client: httpx.AsyncClient,
+    asset_path: Path | None = None,
+    admin: bool,
+    asset_size: int | None = None,
+    sha256_digest: str | None = None,
+    transfer_config: DownloadTransferConfig | None = None,
+    digest_cache: DigestCache | None = None,
+) -> Path:
+    """Download an asset from the entitycore download endpoint to a local file.
+
+    Streams the HTTP response body to ``target_path`` without loading the full
+    payload into memory. The digest of the file is stored in ``digest_cache`` if it was
+    computed during the download or to verify it.
+
+    Returns:
+        ``target_path`` after the download completes.
+    """
+    asset_endpoint = get_assets_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        asset_id=asset_id,
+        admin=admin,
+    )
+    headers = build_request_headers(token_manager=token_manager, project_context=project_context)
+    parameters = {"asset_path": str(asset_path)} if asset_path else {}
+    url = f"{asset_endpoint}/download"
+    transfer_config = transfer_config or DownloadTransferConfig()
+    checkpoint = DownloadCheckpoint(target_path, size=asset_size, sha256_digest=sha256_digest)
+    if checkpoint.is_complete:
+        L.info("Download of %s already complete, verifying it", target_path)
+    elif asset_path is None and asset_size and asset_size >= transfer_config.threshold:
+        await download_file_ranges(
+            url=url,
+            checkpoint=checkpoint,
+            headers=headers,
+            parameters=parameters,
+            http_client=http_client,
+            transfer_config=transfer_config,
+        )
+    elif checkpoint.offset:
+        await resume_file_stream(
+            url=url,
+            checkpoint=checkpoint,
+            headers=headers,
+            parameters=parameters,
+            http_client=http_client,
+        )
+    else:
+        with checkpoint.open_stream() as writer:
+            async for chunk in async_stream_response(
+                url=url,
+                method="GET",
+                headers=headers,
+                parameters=parameters,
+                http_client=http_client,
+            ):
+                if chunk:
+                    writer.write(chunk)
+    path = await asyncio.to_thread(checkpoint.commit)
+    if digest_cache is not None and checkpoint.digest:
+        await asyncio.to_thread(digest_cache.put, path, checkpoint.digest)
+    return path
+
+
+async def _find_in_store(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    local_store: LocalAssetStore | None,
+    admin: bool,
+    metadata_cache: MetadataCache | None,
+) -> Path | None:
+    """Return the path of an asset file in the local store, or None if not found."""
+    if local_store is None:
+        return None
+
+    if isinstance(asset_or_id, ID):
+        asset = await get_entity_asset(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_or_id,
+            project_context=project_context,
+            http_client=http_client,
+            token_manager=token_manager,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+    else:
+        asset = asset_or_id
+
+    source_path: Path = resolve_asset_path(asset, directory_file=asset_path)
+
+    if local_store.path_exists(source_path):
+        return source_path
+
+    return None
+
+
+async def fetch_asset_content(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    local_store: LocalAssetStore | None = None,
+    strategy: FetchContentStrategy,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> bytes:
+    """Fetch asset content.
+
+    Returns:
+        Asset content in bytes.
+    """
+    asset_id = asset_or_id.id if isinstance(asset_or_id, Asset) else asset_or_id
+
+    async def try_read_from_store() -> bytes | None:
+        source_path = await _find_in_store(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            local_store=local_store,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+        if source_path is None or local_store is None:
+            return None
+        return local_store.read_bytes(source_path)
+
+    async def download_content() -> bytes:
+        asset_endpoint = get_assets_endpoint(
+            api_url=api_url,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            asset_id=asset_id,
+            admin=admin,
+        )
+        response = await async_make_db_api_request(
+            url=f"{asset_endpoint}/download",
+            method="GET",
+            parameters={"asset_path": str(asset_path)} if asset_path else {},
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+        )
+        return response.content
+
+    match strategy:
+        case FetchContentStrategy.local_only:
+            if content := await try_read_from_store():
+                return content
+            raise EntitySDKError("copy strategy failed: No asset path found in store.")
+        case FetchContentStrategy.local_or_download:
+            if content := await try_read_from_store():
+                return content
+            return await download_content()
+        case FetchContentStrategy.download_only:
+            return await download_content()
+        case _:
+            raise EntitySDKError(f"{strategy} failed: Unsupported strategy")
+
+
+async def open_asset_content(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    local_store: LocalAssetStore | None = None,
+    strategy: FetchContentStrategy,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> AsyncChunkReader:
+    """Open asset content as a binary stream, streamed from the service unless in the local store.
+
+    See ``fetch_asset_content`` for the description of the arguments. The returned reader must
+    be closed, to release the connection of a streamed response or the file in the local store.
+    """
+    asset_id = asset_or_id.id if isinstance(asset_or_id, Asset) else asset_or_id
+
+    async def try_open_from_store() -> AsyncChunkReader | None:
+        source_path = await _find_in_store(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            local_store=local_store,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+        if source_path is None or local_store is None:
+            return None
+        f = await asyncio.to_thread(local_store.open, source_path)
+        chunks = aiter_file(f, settings.download_stream_data_buffer_size)
+        return await AsyncChunkReader.create(chunks)
+
+    async def open_stream() -> AsyncChunkReader:
+        asset_endpoint = get_assets_endpoint(
+            api_url=api_url,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            asset_id=asset_id,
+            admin=admin,
+        )
+        chunks = async_stream_response(
+            url=f"{asset_endpoint}/download",
+            method="GET",
+            headers=build_request_headers(
+                token_manager=token_manager, project_context=project_context
+            ),
+            parameters={"asset_path": str(asset_path)} if asset_path else {},
+            http_client=http_client,
+        )
+        return await AsyncChunkReader.create(chunks)
+
+    match strategy:
+        case FetchContentStrategy.local_only:
+            if f := await try_open_from_store():
+                return f
+            raise EntitySDKError("copy strategy failed: No asset path found in store.")
+        case FetchContentStrategy.local_or_download:
+            if f := await try_open_from_store():
+                return f
+            return await open_stream()
+        case FetchContentStrategy.download_only:
+            return await open_stream()
+        case _:
+            raise EntitySDKError(f"{strategy} failed: Unsupported strategy")
+
+
+async def fetch_asset_content_into(
+    buffer: bytearray | memoryview,
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    local_store: LocalAssetStore | None = None,
+    strategy: FetchContentStrategy,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> int:
+    """Fetch asset content into a writable buffer, and return the number of bytes written.
+
+    See ``fetch_asset_content`` for the description of the other arguments.
+
+    Raises:
+        EntitySDKError: If the buffer is read-only or too small for the content.
+    """
+    view = memoryview(buffer).cast("B")
+    if view.readonly:
+        raise EntitySDKError("The buffer is read-only")
+    if (
+        isinstance(asset_or_id, Asset)
+        and not asset_or_id.is_directory
+        and asset_or_id.size > len(view)
+    ):
+        raise EntitySDKError(
+            f"The buffer of {len(view)} bytes is too small for {asset_or_id.size} bytes"
+        )
+    reader = await open_asset_content(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=asset_or_id,
+        asset_path=asset_path,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+        local_store=local_store,
+        strategy=strategy,
+        admin=admin,
+        metadata_cache=metadata_cache,
+    )
+    async with reader:
+        written = 0
+        while written < len(view) and (size := await reader.readinto(view[written:])):
+            written += size
+        if await reader.read(1):
+            raise EntitySDKError(f"The buffer of {len(view)} bytes is too small for the content")
+    return written
+
+
+async def delete_asset(
+    *,
+    api_url: str,
+    entity_id: ID,
+    asset_id: ID,
+    entity_type: type[Entity],
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> Asset:
+    """Delete asset."""
+    url = get_assets_endpoint(
+        api_url=api_url,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        asset_id=asset_id,
+        admin=admin,
+    )
+    response = await async_make_db_api_request(
+        url=url,
+        method="DELETE",
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
+
+
+async def register_asset(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_metadata: ExistingAssetMetadata,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> Asset:
+    """Register a file or directory already existing."""
+    url = (
+        get_assets_endpoint(
+            api_url=api_url,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            asset_id=None,
+            admin=admin,
+        )
+        + "/register"
+    )
+    response = await async_make_db_api_request(
+        url=url,
+        method="POST",
+        json=asset_metadata.model_dump(),
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
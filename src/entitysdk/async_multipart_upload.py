@@ -0,0 +1,351 @@
+"""Asynchronous multipart upload functionality for large assets."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+
+from entitysdk import serdes
+from entitysdk.common import ProjectContext
+from entitysdk.exception import EntitySDKError
+from entitysdk.models.asset import Asset, AssetWithUploadMeta, LocalAssetMetadata
+from entitysdk.models.entity import Entity
+from entitysdk.multipart_upload import (
+    BACKOFF_BASE,
+    MAX_RETRIES,
+    RETRIABLE_EXCEPTIONS,
+    STREAM_DATA_BUFFER_SIZE,
+    TIMEOUT,
+)
+from entitysdk.route import (
+    multipart_upload_complete_endpoint,
+    multipart_upload_complete_endpoint_directory,
+    multipart_upload_initiate_endpoint,
+    multipart_upload_initiate_endpoint_directory,
+)
+from entitysdk.schemas.asset import (
+    MultipartDirectoryUploadRequest,
+    MultipartDirectoryUploadResponse,
+    MultipartDirectoryUploadTransferConfig,
+    MultipartUploadTransferConfig,
+    PartUpload,
+)
+from entitysdk.token_manager import TokenManager
+from entitysdk.types import ID
+from entitysdk.utils import json_codec
+from entitysdk.utils.execution import async_execute_with_retry
+from entitysdk.utils.filesystem import get_filesize
+from entitysdk.utils.http import async_make_db_api_request
+from entitysdk.utils.instrumentation import PART_EXTENSION
+from entitysdk.utils.io import aiter_file, calculate_sha256_digest
+
+L = logging.getLogger(__name__)
+
+
+async def multipart_upload_asset_file(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_path: Path,
+    asset_metadata: LocalAssetMetadata,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    transfer_config: MultipartUploadTransferConfig,
+    admin: bool,
+) -> Asset:
+    """Upload a local asset file in multiple parts using presigned URLs.
+
+    Asynchronous counterpart of ``entitysdk.multipart_upload.multipart_upload_asset_file``.
+    Parts are uploaded concurrently on the event loop, up to ``transfer_config.max_concurrency``.
+    """
+    asset_id, parts = await _initiate_upload(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_path=asset_path,
+        asset_metadata=asset_metadata,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+        preferred_part_count=transfer_config.preferred_part_count,
+        admin=admin,
+    )
+    await _upload_parts(
+        parts=parts,
+        http_client=http_client,
+        transfer_config=transfer_config,
+    )
+    return await _complete_upload(
+        url=multipart_upload_complete_endpoint(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            admin=admin,
+        ),
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+
+async def _initiate_upload(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_path: Path,
+    asset_metadata: LocalAssetMetadata,
+    project_context: ProjectContext | None,
+    preferred_part_count: int,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    admin: bool,
+) -> tuple[ID, list[PartUpload]]:
+    """Initiate a multipart upload with the backend and prepare part metadata."""
+    url = multipart_upload_initiate_endpoint(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        admin=admin,
+    )
+    filesize = get_filesize(asset_path)
+    sha256_digest = await asyncio.to_thread(calculate_sha256_digest, asset_path)
+    response = await async_make_db_api_request(
+        url=url,
+        method="POST",
+        json={
+            "filename": asset_metadata.file_name,
+            "filesize": filesize,
+            "sha256_digest": sha256_digest,
+            "content_type": asset_metadata.content_type,
+            "label": asset_metadata.label,
+            "preferred_part_count": preferred_part_count,
+        },
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+    asset = AssetWithUploadMeta.model_validate(json_codec.loads(response.content))
+    part_size = asset.upload_meta.part_size
+
+    parts = [
+        PartUpload(
+            file_path=asset_path,
+            part_number=part.part_number,
+            offset=(part.part_number - 1) * part_size,
+            size=min(part_size, filesize - (part.part_number - 1) * part_size),
+            url=part.url,
+        )
+        for part in asset.upload_meta.parts
+    ]
+
+    return asset.id, parts
+
+
+async def _upload_parts(
+    parts: list[PartUpload],
+    http_client: httpx.AsyncClient,
+    transfer_config: MultipartUploadTransferConfig | MultipartDirectoryUploadTransferConfig,
+) -> None:
+    """Upload file parts concurrently, with at most ``max_concurrency`` parts in flight."""
+    semaphore = asyncio.Semaphore(max(1, transfer_config.max_concurrency))
+
+    async def _task(part: PartUpload) -> None:
+        async with semaphore:
+            await _upload_part_with_retry(part, http_client)
+
+    await asyncio.gather(*(_task(part) for part in parts))
+
+
+async def _upload_part_with_retry(part: PartUpload, http_client: httpx.AsyncClient) -> None:
+    """Upload a single file part to its presigned URL, retrying transient failures."""
+    try:
+        await async_execute_with_retry(
+            lambda: _upload_part(
+                file_path=part.file_path,
+                offset=part.offset,
+                size=part.size,
+                url=part.url,
+                http_client=http_client,
+                part_number=part.part_number,
+            ),
+            max_retries=MAX_RETRIES,
+            backoff_base=BACKOFF_BASE,
+            retry_on=RETRIABLE_EXCEPTIONS,
+        )
+    except httpx.RequestError as e:
+        msg = (
+            f"Failed to upload part {part.part_number} of file {part.file_path}\n"
+            f"Request exception: {e!r}"
+        )
+        raise EntitySDKError(msg) from e
+    except httpx.HTTPStatusError as e:
+        message = (
+            f"Failed to upload part {part.part_number} of file {part.file_path}\n"
+            f"HTTP error {e.response.status_code} for {e.request.method} {e.request.url}\n"
+            f"response: {e.response.text}"
+        )
+        raise EntitySDKError(message) from e
+
+    L.debug("Uploaded part %d (offset=%d, size=%d)", part.part_number, part.offset, part.size)
+
+
+async def _aiter_bytes_chunk(path: Path, offset: int, size: int) -> AsyncIterator[bytes]:
+    # the file is opened and read in worker threads, to not block the concurrent uploads
+    f = await asyncio.to_thread(path.open, "rb")
+    f.seek(offset)
+    async for data in aiter_file(f, STREAM_DATA_BUFFER_SIZE, size=size):
+        yield data
+
+
+async def _upload_part(
+    file_path: Path,
+    offset: int,
+    size: int,
+    url: str,
+    http_client: httpx.AsyncClient,
+    part_number: int | None = None,
+) -> None:
+    """Upload a single part to the presigned URL.
+
+    Raises:
+        httpx.HTTPStatusError: If the PUT request fails.
+        httpx.RequestError: For network-related errors.
+    """
+    response = await http_client.put(
+        url=url,
+        content=_aiter_bytes_chunk(file_path, offset, size),
+        timeout=TIMEOUT,
+        headers={"Content-Length": str(size)},
+        extensions={PART_EXTENSION: part_number},
+    )
+    response.raise_for_status()
+
+
+async def _complete_upload(
+    *,
+    url: str,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+) -> Asset:
+    """Finalize a multipart upload (file or directory) and return the created asset."""
+    response = await async_make_db_api_request(
+        url=url,
+        method="POST",
+        token_manager=token_manager,
+        http_client=http_client,
+        project_context=project_context,
+    )
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
+
+
+async def multipart_upload_asset_directory(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    transfer_config: MultipartDirectoryUploadTransferConfig,
+    upload_request: MultipartDirectoryUploadRequest,
+    paths: dict[Path, Path],
+    admin: bool,
+) -> Asset:
+    """Upload files in a local directory in multiple parts using presigned URLs.
+
+    Asynchronous counterpart of
+    ``entitysdk.multipart_upload.multipart_upload_asset_directory``.
+    """
+    asset_id, parts = await _initiate_directory_upload(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+        upload_request=upload_request,
+        paths=paths,
+        admin=admin,
+    )
+    await _upload_parts(
+        parts=parts,
+        http_client=http_client,
+        transfer_config=transfer_config,
+    )
+    return await _complete_upload(
+        url=multipart_upload_complete_endpoint_directory(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_id,
+            admin=admin,
+        ),
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+
+async def _initiate_directory_upload(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    upload_request: MultipartDirectoryUploadRequest,
+    paths: dict[Path, Path],
+    admin: bool,
+) -> tuple[ID, list[PartUpload]]:
+    """Initiate a multipart directory upload with the backend and prepare part metadata."""
+    url = multipart_upload_initiate_endpoint_directory(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        admin=admin,
+    )
+    response = await async_make_db_api_request(
+        url=url,
+        method="POST",
+        json=upload_request.model_dump(mode="json"),
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+    upload_response = MultipartDirectoryUploadResponse.model_validate(
+        json_codec.loads(response.content)
+    )
+    if len(upload_response.files) != len(paths):
+        msg = (
+            f"Backend returned {len(upload_response.files)} files, but {len(paths)} were expected."
+        )
+        raise EntitySDKError(msg)
+
+    directory_asset = upload_response.asset
+    parts = []
+    for asset in upload_response.files:
+        part_size = asset.upload_meta.part_size
+        # strip the directory name from the returned file path and retrieve the local path
+        local_path = paths[Path(asset.path).relative_to(upload_request.directory_name)]
+        parts += [
+            PartUpload(
+                file_path=local_path,
+                part_number=part.part_number,
+                offset=(part.part_number - 1) * part_size,
+                size=min(part_size, asset.size - (part.part_number - 1) * part_size),
+                url=part.url,
+            )
+            for part in asset.upload_meta.parts
+        ]
+
+    return directory_asset.id, parts
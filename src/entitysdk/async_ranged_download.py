@@ -0,0 +1,211 @@
+"""Asynchronous parallel and resumable download of large files with HTTP range requests."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+
+from entitysdk.config import settings
+from entitysdk.exception import EntitySDKError
+from entitysdk.ranged_download import (
+    BACKOFF_BASE,
+    MAX_RETRIES,
+    RETRIABLE_EXCEPTIONS,
+    check_range,
+    check_written,
+    parse_content_range,
+    range_header,
+    ranges_request,
+)
+from entitysdk.schemas.asset import DownloadTransferConfig
+from entitysdk.utils.checkpoint import DownloadCheckpoint
+from entitysdk.utils.execution import async_execute_with_retry
+from entitysdk.utils.http import default_timeout
+from entitysdk.utils.instrumentation import PART_EXTENSION
+
+L = logging.getLogger(__name__)
+
+
+async def write_at(path: Path, offset: int, chunks: AsyncIterator[bytes]) -> int:
+    """Write the chunks to an existing file at the given offset, and return the written size."""
+    written = 0
+    with path.open("r+b") as f:
+        f.seek(offset)
+        async for chunk in chunks:
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+async def download_file_ranges(
+    *,
+    url: str,
+    checkpoint: DownloadCheckpoint,
+    headers: dict[str, str],
+    parameters: dict | None,
+    http_client: httpx.AsyncClient,
+    transfer_config: DownloadTransferConfig,
+) -> None:
+    """Download the missing ranges of a file with concurrent range requests.
+
+    Asynchronous counterpart of ``entitysdk.ranged_download.download_file_ranges``.
+    """
+    if not (ranges := checkpoint.missing_ranges(transfer_config.part_size)):
+        return
+    (start, end), other_ranges = ranges[0], ranges[1:]
+    try:
+        async with http_client.stream(
+            "GET",
+            url=url,
+            headers=headers | range_header(start, end),
+            params=parameters,
+            follow_redirects=True,
+            timeout=default_timeout(),
+            extensions={PART_EXTENSION: 1},
+        ) as response:
+            response.raise_for_status()
+            chunks = response.aiter_bytes(chunk_size=settings.download_stream_data_buffer_size)
+            if (content_range := parse_content_range(response)) is None:
+                L.info("Range requests not supported for %s, using a single stream", url)
+                with checkpoint.open_stream() as writer:
+                    async for chunk in chunks:
+                        writer.write(chunk)
+                return
+
+            check_range(content_range, start=start, end=end, size=checkpoint.expected_size, url=url)
+            checkpoint.preallocate()
+            ranges_url, ranges_headers = ranges_request(response, headers)
+            semaphore = asyncio.Semaphore(transfer_config.max_concurrency)
+
+            async def _task(range_start: int, range_end: int, part_number: int) -> None:
+                async with semaphore:
+                    await _download_range_with_retry(
+                        url=ranges_url,
+                        headers=ranges_headers,
+                        start=range_start,
+                        end=range_end,
+                        part_number=part_number,
+                        checkpoint=checkpoint,
+                        http_client=http_client,
+                    )
+
+            async def _first_range() -> None:
+                written = await write_at(checkpoint.part_path, start, chunks)
+                check_written(written, start=start, end=end, url=url)
+                checkpoint.add(start, end)
+
+            await asyncio.gather(
+                _first_range(),
+                *(
+                    _task(range_start, range_end, part_number)
+                    for part_number, (range_start, range_end) in enumerate(other_ranges, start=2)
+                ),
+            )
+    except httpx.RequestError as e:
+        raise EntitySDKError(f"Request error: {e}") from e
+    except httpx.HTTPStatusError as e:
+        raise EntitySDKError(f"HTTP error {e.response.status_code} for GET {url}") from e
+    L.debug("Downloaded %s with %d range requests", checkpoint.part_path, len(ranges))
+
+
+async def resume_file_stream(
+    *,
+    url: str,
+    checkpoint: DownloadCheckpoint,
+    headers: dict[str, str],
+    parameters: dict | None,
+    http_client: httpx.AsyncClient,
+) -> None:
+    """Stream the end of a file, starting after the bytes already fetched.
+
+    Asynchronous counterpart of ``entitysdk.ranged_download.resume_file_stream``.
+    """
+    offset = checkpoint.offset
+    try:
+        async with http_client.stream(
+            "GET",
+            url=url,
+            headers=headers | {"Range": f"bytes={offset}-"},
+            params=parameters,
+            follow_redirects=True,
+            timeout=default_timeout(),
+        ) as response:
+            response.raise_for_status()
+            if (content_range := parse_content_range(response)) is None:
+                L.info("Range requests not supported for %s, restarting the download", url)
+                offset = 0
+            else:
+                size = checkpoint.expected_size
+                check_range(content_range, start=offset, end=size - 1, size=size, url=url)
+            with checkpoint.open_stream(offset) as writer:
+                async for chunk in response.aiter_bytes(
+                    chunk_size=settings.download_stream_data_buffer_size
+                ):
+                    writer.write(chunk)
+    except httpx.RequestError as e:
+        raise EntitySDKError(f"Request error: {e}") from e
+    except httpx.HTTPStatusError as e:
+        raise EntitySDKError(f"HTTP error {e.response.status_code} for GET {url}") from e
+
+
+async def _download_range_with_retry(
+    *,
+    url: str,
+    headers: dict[str, str],
+    start: int,
+    end: int,
+    part_number: int,
+    checkpoint: DownloadCheckpoint,
+    http_client: httpx.AsyncClient,
+) -> None:
+    await async_execute_with_retry(
+        lambda: _download_range(
+            url=url,
+            headers=headers,
+            start=start,
+            end=end,
+            part_number=part_number,
+            checkpoint=checkpoint,
+            http_client=http_client,
+        ),
+        max_retries=MAX_RETRIES,
+        backoff_base=BACKOFF_BASE,
+        retry_on=RETRIABLE_EXCEPTIONS,
+    )
+
+
+async def _download_range(
+    *,
+    url: str,
+    headers: dict[str, str],
+    start: int,
+    end: int,
+    part_number: int,
+    checkpoint: DownloadCheckpoint,
+    http_client: httpx.AsyncClient,
+) -> None:
+    """Download a single range, write it at its offset in the file, and record it."""
+    async with http_client.stream(
+        "GET",
+        url=url,
+        headers=headers | range_header(start, end),
+        timeout=default_timeout(),
+        extensions={PART_EXTENSION: part_number},
+    ) as response:
+        response.raise_for_status()
+        check_range(
+            parse_content_range(response),
+            start=start,
+            end=end,
+            size=checkpoint.expected_size,
+            url=url,
+        )
+        written = await write_at(
+            checkpoint.part_path,
+            start,
+            response.aiter_bytes(chunk_size=settings.download_stream_data_buffer_size),
+        )
+        check_written(written, start=start, end=end, url=url)
+    checkpoint.add(start, end)
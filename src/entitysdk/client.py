@@ -1,12 +1,13 @@
 """Identifiable SDK client."""
 
-import concurrent.futures
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, BinaryIO, Literal, overload
 
 import httpx
-from pydantic import AfterValidator, validate_call
+from pydantic import AfterValidator, Field, InstanceOf, validate_call
 
 from entitysdk import core
 from entitysdk.common import ProjectContext, parse_vlab_url
@@ -20,6 +21,8 @@ from entitysdk.models.asset import (
 )
 from entitysdk.models.core import Identifiable
 from entitysdk.models.entity import Entity
+from entitysdk.models.lazy import LazyModel
+from entitysdk.models.projection import Projection
 from entitysdk.models.types import (
     RegisteredAssetOrId,
     RegisteredEntity,
@@ -29,6 +32,7 @@ from entitysdk.models.types import (
 from entitysdk.result import IteratorResult
 from entitysdk.schemas.asset import (
     DownloadedAssetFile,
+    DownloadTransferConfig,
     MultipartDirectoryUploadTransferConfig,
     MultipartUploadTransferConfig,
 )
@@ -48,37 +52,41 @@ from entitysdk.types import (
     StrOrPath,
     Token,
 )
-from entitysdk.utils.asset import filter_assets
+from entitysdk.utils.asset import filter_assets, filter_directory_files
+from entitysdk.utils.batch import sort_by_ids
+from entitysdk.utils.cache import ContentCache, DigestCache, EntityCache, MetadataCache
+from entitysdk.utils.instrumentation import (
+    CacheEvent,
+    Instrumentation,
+    InstrumentationEvent,
+    InstrumentedTransport,
+    route_of_type,
+)
+from entitysdk.utils.rate_limit import RateLimitedTransport, RateLimiter
 from entitysdk.utils.store import LocalAssetStore
+from entitysdk.utils.transfer import TransferStats, is_synced, remove_extraneous, set_modified
 from entitysdk.utils.url import (
     build_api_url,
 )
 
 
-class Client:
-    """Client for entitysdk."""
+class _BaseClient:
+    """Functionality shared by the synchronous and asynchronous clients."""
 
     def __init__(
         self,
         *,
-        api_url: str | None = None,
-        project_context: ProjectContext | None = None,
-        http_client: httpx.Client | None = None,
+        api_url: str | None,
+        project_context: ProjectContext | None,
         token_manager: TokenManager | Token,
-        environment: DeploymentEnvironment | str | None = None,
-        local_store: LocalAssetStore | None = None,
+        environment: DeploymentEnvironment | str | None,
+        local_store: LocalAssetStore | None,
+        entity_cache: EntityCache | None,
+        metadata_cache: MetadataCache | None,
+        digest_cache: DigestCache | None,
+        content_cache: ContentCache | None,
+        instrumentation: Instrumentation | None,
     ) -> None:
-        """Initialize client.
-
-        Args:
-            api_url: The API URL to entitycore service.
-            project_context: Project context.
-            http_client: Optional HTTP client to use.
-            token_manager: Token manager or token to be used for authentication.
-            environment: Deployment environent.
-            local_store: LocalAssetStore object for using a local store. It needs to be specified
-                to be able to access local assets, or they will be always downloaded.
-        """
         try:
             environment = DeploymentEnvironment(environment) if environment else None
         except ValueError:
@@ -92,32 +100,15 @@ class Client:
             environment=environment,
         )
         self.project_context = project_context
-        self._http_client = http_client or httpx.Client()
         self._token_manager = (
             TokenFromValue(token_manager) if isinstance(token_manager, Token) else token_manager
         )
         self._local_store = local_store
-
-    @classmethod
-    def from_vlab_url(
-        cls,
-        vlab_url: str,
-        *,
-        api_url: str | None = None,
-        http_client: httpx.Client | None = None,
-        token_manager: TokenManager | Token,
-        local_store: LocalAssetStore | None = None,
-    ) -> Self:
-        """Initialize client from a platform url containing the virtual lab and project."""
-        project_context, environment = parse_vlab_url(vlab_url)
-        return cls(
-            api_url=api_url,
-            project_context=project_context,
-            http_client=http_client,
-            token_manager=token_manager,
-            environment=environment,
-            local_store=local_store,
-        )
+        self._entity_cache = entity_cache
+        self._metadata_cache = metadata_cache
+        self._digest_cache = digest_cache
+        self._content_cache = content_cache
+        self._instrumentation = instrumentation
 
     @staticmethod
     def _handle_api_url(api_url: str | None, environment: DeploymentEnvironment | None) -> str:
@@ -149,6 +140,192 @@ class Client:
             raise EntitySDKError("A project context is mandatory for this operation.")
         return context
 
+    @contextmanager
+    def _invalidating(self, entity_id: ID) -> Iterator[None]:
+        """Remove the entity from the cache once the wrapped operation has modified it.
+
+        The entity is removed even if the operation fails, since it may have been partially
+        applied by the server.
+        """
+        try:
+            yield
+        finally:
+            if self._entity_cache is not None:
+                self._entity_cache.invalidate(entity_id)
+            if self._metadata_cache is not None:
+                self._metadata_cache.invalidate(entity_id)
+
+    def _get_cached_entity(
+        self,
+        entity_id: ID,
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None,
+        admin: bool,
+    ) -> TIdentifiable | None:
+        """Return the cached entity or None, reporting the lookup to the instrumentation."""
+        if self._entity_cache is None:
+            return None
+        entity = self._entity_cache.get(
+            entity_id, entity_type=entity_type, project_context=project_context, admin=admin
+        )
+        if self._instrumentation is not None:
+            event = (
+                InstrumentationEvent.CACHE_MISS
+                if entity is None
+                else InstrumentationEvent.CACHE_HIT
+            )
+            self._instrumentation.emit(
+                event, CacheEvent(route=route_of_type(entity_type), entity_id=str(entity_id))
+            )
+        return entity
+
+    def _get_cached_entities(
+        self,
+        entity_ids: list[ID],
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None,
+        admin: bool,
+    ) -> tuple[list[TIdentifiable], list[ID]]:
+        """Return the cached entities, and the ids of the entities to be retrieved."""
+        if self._entity_cache is None:
+            return [], entity_ids
+        cached, uncached_ids = [], []
+        for entity_id in dict.fromkeys(entity_ids):
+            entity = self._get_cached_entity(
+                entity_id, entity_type=entity_type, project_context=project_context, admin=admin
+            )
+            if entity is None:
+                uncached_ids.append(entity_id)
+            else:
+                cached.append(entity)
+        return cached, uncached_ids
+
+    def _put_cached_entities(
+        self,
+        entities: list[TIdentifiable],
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None,
+        admin: bool,
+    ) -> None:
+        """Add the retrieved entities to the cache."""
+        if self._entity_cache is not None:
+            for entity in entities:
+                self._entity_cache.put(
+                    entity, entity_type=entity_type, project_context=project_context, admin=admin
+                )
+
+
+class Client(_BaseClient):
+    """Client for entitysdk."""
+
+    def __init__(
+        self,
+        *,
+        api_url: str | None = None,
+        project_context: ProjectContext | None = None,
+        http_client: httpx.Client | None = None,
+        token_manager: TokenManager | Token,
+        environment: DeploymentEnvironment | str | None = None,
+        local_store: LocalAssetStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        digest_cache: DigestCache | None = None,
+        content_cache: ContentCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """Initialize client.
+
+        Args:
+            api_url: The API URL to entitycore service.
+            project_context: Project context.
+            http_client: Optional HTTP client to use.
+            token_manager: Token manager or token to be used for authentication.
+            environment: Deployment environent.
+            local_store: LocalAssetStore object for using a local store. It needs to be specified
+                to be able to access local assets, or they will be always downloaded.
+            rate_limiter: Optional limiter of the requests made by the client. It cannot be used
+                together with http_client, because it's installed in the transport of the
+                HTTP client created by the client.
+            entity_cache: Optional cache of the entities retrieved with get_entity. The cached
+                entities are invalidated when they, or their assets, are modified by the client.
+            metadata_cache: Optional persistent cache of the metadata of the entities, assets
+                and directory listings. It's invalidated like the entity cache, and the changes
+                made by other clients are seen only after its ttl expires.
+            digest_cache: Optional persistent cache of the sha256 digests of the local files,
+                used to skip the unchanged files without hashing them again.
+            content_cache: Optional persistent cache of the downloaded files, shared by the
+                clients and processes using the same directory, to download each file once.
+                The files are materialized by reflink or copy, unless the cache is created
+                with ``hardlink=True``.
+            instrumentation: Optional hooks called for each request and entity cache lookup.
+                Like rate_limiter, it cannot be used together with http_client.
+        """
+        super().__init__(
+            api_url=api_url,
+            project_context=project_context,
+            token_manager=token_manager,
+            environment=environment,
+            local_store=local_store,
+            entity_cache=entity_cache,
+            metadata_cache=metadata_cache,
+            digest_cache=digest_cache,
+            content_cache=content_cache,
+            instrumentation=instrumentation,
+        )
+        if rate_limiter is not None or instrumentation is not None:
+            if http_client is not None:
+                option = "rate_limiter" if rate_limiter is not None else "instrumentation"
+                raise EntitySDKError(f"Either http_client or {option} can be specified, not both.")
+            transport: httpx.BaseTransport = httpx.HTTPTransport()
+            if rate_limiter is not None:
+                transport = RateLimitedTransport(
+                    transport, rate_limiter=rate_limiter, api_url=self.api_url
+                )
+            if instrumentation is not None:
+                # outermost, so that the time spent waiting for the rate limiter is reported
+                transport = InstrumentedTransport(
+                    transport, instrumentation=instrumentation, api_url=self.api_url
+                )
+            http_client = httpx.Client(transport=transport)
+        self._http_client = http_client or httpx.Client()
+
+    @classmethod
+    def from_vlab_url(
+        cls,
+        vlab_url: str,
+        *,
+        api_url: str | None = None,
+        http_client: httpx.Client | None = None,
+        token_manager: TokenManager | Token,
+        local_store: LocalAssetStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        entity_cache: EntityCache | None = None,
+        metadata_cache: MetadataCache | None = None,
+        digest_cache: DigestCache | None = None,
+        content_cache: ContentCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> Self:
+        """Initialize client from a platform url containing the virtual lab and project."""
+        project_context, environment = parse_vlab_url(vlab_url)
+        return cls(
+            api_url=api_url,
+            project_context=project_context,
+            http_client=http_client,
+            token_manager=token_manager,
+            environment=environment,
+            local_store=local_store,
+            rate_limiter=rate_limiter,
+            entity_cache=entity_cache,
+            metadata_cache=metadata_cache,
+            digest_cache=digest_cache,
+            content_cache=content_cache,
+            instrumentation=instrumentation,
+        )
+
     def get_api_version(self) -> APIVersion:
         """Return the entitycore version."""
         return core.get_api_version(
@@ -179,33 +356,177 @@ class Client:
         Returns:
             entity_type instantiated by deserializing the response, with an assigned id.
         """
-        return core.get_entity(
+        context = self._optional_user_context(project_context, admin)
+        # the entities retrieved with custom options are not cached
+        cache = self._entity_cache if options is None else None
+        if cache is not None:
+            entity = self._get_cached_entity(
+                entity_id, entity_type=entity_type, project_context=context, admin=admin
+            )
+            if entity is not None:
+                return entity
+        entity = core.get_entity(
             api_url=self.api_url,
             entity_id=entity_id,
             options=options,
             entity_type=entity_type,
-            project_context=self._optional_user_context(project_context, admin),
+            project_context=context,
             http_client=self._http_client,
             token_manager=self._token_manager,
             admin=admin,
+            metadata_cache=self._metadata_cache,
         )
+        if cache is not None:
+            cache.put(entity, entity_type=entity_type, project_context=context, admin=admin)
+        return entity
 
     @validate_call
+    def get_entities(
+        self,
+        entity_ids: list[ID],
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None = None,
+        chunk_size: Annotated[int, Field(ge=1)] = 100,
+        max_concurrent: Annotated[int, Field(ge=1)] = 4,
+        missing_ok: bool = False,
+        admin: bool = False,
+    ) -> list[TIdentifiable]:
+        """Get several entities from their resource ids.
+
+        The ids are split into chunks retrieved concurrently, each one with a single request.
+
+        Args:
+            entity_ids: Resource ids of the entities.
+            entity_type: Type of the entities.
+            project_context: Optional project context.
+            chunk_size: Maximum number of ids requested with a single request.
+            max_concurrent: Maximum number of chunks requested concurrently.
+            missing_ok: If True, the entities not found are skipped instead of raising an error.
+            admin: Whether to use the admin endpoint or not.
+
+        Returns:
+            The entities in the same order as the ids, each with an assigned id.
+
+        Raises:
+            EntitiesNotFoundError: If some entities are not found and missing_ok is False.
+                The ids of the missing entities are available in its ``missing_ids`` attribute.
+        """
+        context = self._optional_user_context(project_context, admin)
+        cache_kwargs = {"entity_type": entity_type, "project_context": context, "admin": admin}
+        cached, uncached_ids = self._get_cached_entities(entity_ids, **cache_kwargs)
+        entities = core.get_entities(
+            api_url=self.api_url,
+            entity_ids=uncached_ids,
+            entity_type=entity_type,
+            chunk_size=chunk_size,
+            max_concurrent=max_concurrent,
+            missing_ok=True,
+            project_context=context,
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            admin=admin,
+        )
+        self._put_cached_entities(entities, **cache_kwargs)
+        return sort_by_ids(entity_ids, cached + entities, missing_ok=missing_ok)
+
+    @overload
     def search_entity(
         self,
         *,
         entity_type: type[TIdentifiable],
         query: dict | None = None,
         limit: int | None = None,
+        prefetch: int | None = None,
+        fields: None = None,
+        lazy: Literal[False] = False,
         project_context: ProjectContext | None = None,
         admin: bool = False,
-    ) -> IteratorResult[TIdentifiable]:
+    ) -> IteratorResult[TIdentifiable]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: None = None,
+        lazy: Literal[True],
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[LazyModel[TIdentifiable]]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str],
+        lazy: Literal[False] = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[Projection]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str],
+        lazy: Literal[True],
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[LazyModel[Projection]]: ...
+
+    @overload
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str] | None = None,
+        lazy: bool = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[Any]: ...
+
+    @validate_call
+    def search_entity(
+        self,
+        *,
+        entity_type: type[TIdentifiable],
+        query: dict | None = None,
+        limit: int | None = None,
+        prefetch: int | None = None,
+        fields: list[str] | None = None,
+        lazy: bool = False,
+        project_context: ProjectContext | None = None,
+        admin: bool = False,
+    ) -> IteratorResult[Any]:
         """Search for entities.
 
         Args:
             entity_type: Type of the entity.
             query: Query parameters.
             limit: Optional limit of the number of entities to yield. Default is None.
+            prefetch: Optional number of pages to request concurrently ahead of the consumer.
+                If None, ``settings.page_prefetch`` is used. If 0, pages are requested one by one.
+            fields: Optional names of the fields to deserialize, e.g. ``["id", "name"]``.
+                If given, lightweight read-only ``Projection`` records with only these fields
+                are yielded instead of the full entities.
+            lazy: If True, ``LazyModel`` proxies keeping the raw json are yielded, and the
+                entities are validated only when a nested attribute is accessed, or when
+                ``materialize()`` is called. This is cheaper when most items are discarded.
             project_context: Optional project context.
             admin: Use admin endpoints if True
 
@@ -217,6 +538,9 @@ class Client:
             entity_type=entity_type,
             query=query,
             limit=limit,
+            prefetch=prefetch,
+            fields=fields,
+            lazy=lazy,
             project_context=self._optional_user_context(project_context, admin),
             http_client=self._http_client,
             token_manager=self._token_manager,
@@ -331,16 +655,17 @@ class Client:
             project_context: Optional project context.
             admin: whether to use the admin endpoint or not.
         """
-        return core.update_entity(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            project_context=self._optional_user_context(project_context, admin),
-            entity_type=entity_type,
-            attrs_or_entity=attrs_or_entity,
-            http_client=self._http_client,
-            token_manager=self._token_manager,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            return core.update_entity(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                project_context=self._optional_user_context(project_context, admin),
+                entity_type=entity_type,
+                attrs_or_entity=attrs_or_entity,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
 
     @validate_call
     def delete_entity(
@@ -357,14 +682,15 @@ class Client:
             entity_type: Type of the entity.
             admin: Whether to use the admin endpoint or not.
         """
-        core.delete_entity(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            http_client=self._http_client,
-            token_manager=self._token_manager,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            core.delete_entity(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
 
     @validate_call
     def upload_file(
@@ -409,18 +735,19 @@ class Client:
             metadata=file_metadata,
             label=asset_label,
         )
-        return core.upload_asset_file(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            asset_path=asset_path,
-            asset_metadata=asset_metadata,
-            http_client=self._http_client,
-            project_context=context,
-            token_manager=self._token_manager,
-            transfer_config=transfer_config,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            return core.upload_asset_file(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_path=asset_path,
+                asset_metadata=asset_metadata,
+                http_client=self._http_client,
+                project_context=context,
+                token_manager=self._token_manager,
+                transfer_config=transfer_config,
+                admin=admin,
+            )
 
     def upload_content(
         self,
@@ -458,17 +785,18 @@ class Client:
             label=asset_label,
         )
         context = self._optional_user_context(override_context=project_context, admin=admin)
-        return core.upload_asset_content(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            project_context=context,
-            asset_content=file_content,
-            asset_metadata=asset_metadata,
-            http_client=self._http_client,
-            token_manager=self._token_manager,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            return core.upload_asset_content(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                project_context=context,
+                asset_content=file_content,
+                asset_metadata=asset_metadata,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
 
     @validate_call
     def upload_directory(
@@ -505,20 +833,21 @@ class Client:
 
         paths_dict = {Path(k): Path(v) for k, v in paths.items()}
 
-        return core.upload_asset_directory(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            name=name,
-            paths=paths_dict,
-            metadata=metadata,
-            label=label,
-            project_context=context,
-            http_client=self._http_client,
-            token_manager=self._token_manager,
-            transfer_config=transfer_config,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            return core.upload_asset_directory(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                name=name,
+                paths=paths_dict,
+                metadata=metadata,
+                label=label,
+                project_context=context,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                transfer_config=transfer_config,
+                admin=admin,
+            )
 
     @validate_call
     def list_directory(
@@ -552,6 +881,7 @@ class Client:
             http_client=self._http_client,
             token_manager=self._token_manager,
             admin=admin,
+            metadata_cache=self._metadata_cache,
         )
 
     @validate_call
@@ -560,13 +890,19 @@ class Client:
         *,
         entity_id: ID,
         entity_type: type[Entity],
-        asset_id: RegisteredAssetOrId,  # pyright: ignore[reportRedeclaration]
+        asset_id: RegisteredAssetOrId,
         output_path: Path,
         project_context: ProjectContext | None = None,
         ignore_directory_name: bool = False,
         max_concurrent: int = 1,
         strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
         admin: bool = False,
+        sync: bool = False,
+        delete_extraneous: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_file_size: int | None = None,
     ) -> list[Path]:
         """Fetch a directory asset to a local output directory.
 
@@ -581,13 +917,107 @@ class Client:
             max_concurrent: Maximum number of concurrent downloads.
             strategy: Strategy controlling how files are materialized.
             admin: Whether to use the admin endpoints.
+            sync: If `True`, only transfer the files that are new or changed since a previous
+                sync, according to their size and modification date. The modification date of
+                the transferred files is set to the remote one, to compare them next time.
+            delete_extraneous: If `True`, remove the local files under the output directory
+                that are no longer in the directory asset. It can't be combined with
+                `ignore_directory_name`, since the output directory may contain other files.
+            stats: Optional counters of the transferred, skipped and removed files.
+            include: Optional glob patterns of the files to fetch, matched with fnmatch against
+                their paths relative to the directory, so that `*` also matches `/`.
+            exclude: Optional glob patterns of the files not to fetch, even if included.
+            max_file_size: Optional maximum size in bytes of the files to fetch.
 
         Returns:
             List of output file paths that were created.
 
         Raises:
-            EntitySDKError: If `output_path` exists and is a file.
+            EntitySDKError: If `output_path` exists and is a file, or if `delete_extraneous`
+                is combined with `ignore_directory_name`.
+        """
+        return [
+            path
+            for _, path in self.iter_directory(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_id=asset_id,
+                output_path=output_path,
+                project_context=project_context,
+                ignore_directory_name=ignore_directory_name,
+                max_concurrent=max_concurrent,
+                strategy=strategy,
+                admin=admin,
+                sync=sync,
+                delete_extraneous=delete_extraneous,
+                stats=stats,
+                include=include,
+                exclude=exclude,
+                max_file_size=max_file_size,
+            )
+        ]
+
+    @validate_call
+    def iter_directory(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_id: RegisteredAssetOrId,  # pyright: ignore[reportRedeclaration]
+        output_path: Path,
+        project_context: ProjectContext | None = None,
+        ignore_directory_name: bool = False,
+        max_concurrent: int = 1,
+        ordered: bool = False,
+        strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
+        admin: bool = False,
+        sync: bool = False,
+        delete_extraneous: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_file_size: int | None = None,
+    ) -> IteratorResult[tuple[Path, Path]]:
+        """Fetch a directory asset to a local output directory, yielding the files as fetched.
+
+        The directory is listed when called, and the files are fetched while iterating, with
+        at most ``max_concurrent`` transfers in flight, so that the files can be processed while
+        the others are being fetched, and the memory usage doesn't grow with their number.
+
+        Args:
+            entity_id: Resource id of the entity owning the directory.
+            entity_type: Entity type.
+            asset_id: Directory asset id, or an `Asset` object.
+            output_path: Local output base path to write files to.
+            project_context: Optional project context.
+            ignore_directory_name: If `True`, do not create an extra nested
+                folder for the directory name.
+            max_concurrent: Maximum number of concurrent downloads.
+            ordered: If `True`, yield the files in the order of the directory listing,
+                otherwise as soon as they're fetched.
+            strategy: Strategy controlling how files are materialized.
+            admin: Whether to use the admin endpoints.
+            sync: See `fetch_directory`.
+            delete_extraneous: See `fetch_directory`. The files are removed once all the
+                files have been fetched, only if the iterator is exhausted.
+            stats: Optional counters of the transferred, skipped and removed files.
+            include: See `fetch_directory`.
+            exclude: See `fetch_directory`.
+            max_file_size: See `fetch_directory`.
+
+        Returns:
+            An iterator yielding the path of each file relative to the directory, and the path
+            of the local file.
+
+        Raises:
+            EntitySDKError: If `output_path` exists and is a file, or if `delete_extraneous`
+                is combined with `ignore_directory_name`.
         """
+        if delete_extraneous and ignore_directory_name:
+            raise EntitySDKError(
+                "delete_extraneous can't be combined with ignore_directory_name, "
+                "since the output directory may contain other files"
+            )
         if output_path.is_file():
             raise EntitySDKError(f"{output_path} exists and is a file")
 
@@ -612,6 +1042,7 @@ class Client:
                     http_client=self._http_client,
                     token_manager=self._token_manager,
                     admin=admin,
+                    metadata_cache=self._metadata_cache,
                 )
 
             output_path /= asset.path
@@ -624,40 +1055,52 @@ class Client:
             admin=admin,
         )
 
-        if max_concurrent == 1:
-            paths = [
-                self.fetch_file(
-                    entity_id=entity_id,
-                    entity_type=entity_type,
-                    asset_id=asset or asset_id,
-                    output_path=output_path / path,
-                    asset_path=path,
-                    project_context=context,
-                    strategy=strategy,
-                    admin=admin,
+        files = filter_directory_files(
+            contents.files, include=include, exclude=exclude, max_file_size=max_file_size
+        )
+
+        def _fetch(path: Path) -> tuple[Path, Path]:
+            file_info = files[path]
+            target_path = output_path / path
+            if sync and is_synced(
+                target_path, size=file_info.size, last_modified=file_info.last_modified
+            ):
+                if stats is not None:
+                    stats.add_skipped(file_info.size)
+                return path, target_path
+            target_path = core.fetch_asset_file(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_or_id=asset or asset_id,
+                project_context=context,
+                asset_path=path,
+                output_path=output_path / path,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                local_store=self._local_store,
+                strategy=strategy,
+                admin=admin,
+                metadata_cache=self._metadata_cache,
+                content_cache=self._content_cache,
+                file_info=file_info,
+                stats=stats,
+            )
+            if sync:
+                set_modified(target_path, file_info.last_modified)
+            return path, target_path
+
+        def _results() -> Iterator[tuple[Path, Path]]:
+            if max_concurrent == 1:
+                yield from map(_fetch, files)
+            else:
+                yield from IteratorResult(files).map_concurrent(
+                    _fetch, max_workers=max_concurrent, ordered=ordered
                 )
-                for path in contents.files
-            ]
-        else:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-                futures = [
-                    executor.submit(
-                        self.fetch_file,
-                        entity_id=entity_id,
-                        entity_type=entity_type,
-                        asset_id=asset or asset_id,
-                        output_path=output_path / path,
-                        asset_path=path,
-                        project_context=context,
-                        strategy=strategy,
-                        admin=admin,
-                    )
-                    for path in contents.files
-                ]
-                result = concurrent.futures.wait(futures)
-                paths = [res.result() for res in result.done]
-
-        return paths
+            if delete_extraneous:
+                remove_extraneous(output_path, contents.files, stats=stats)
+
+        return IteratorResult(_results())
 
     @validate_call
     def download_directory(
@@ -671,6 +1114,12 @@ class Client:
         ignore_directory_name: bool = False,
         max_concurrent: int = 1,
         admin: bool = False,
+        sync: bool = False,
+        delete_extraneous: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        max_file_size: int | None = None,
     ) -> list[Path]:
         """Download a directory asset to local disk.
 
@@ -684,6 +1133,16 @@ class Client:
                 folder for the directory name.
             max_concurrent: Maximum number of concurrent downloads.
             admin: Whether to use the admin endpoints.
+            sync: If `True`, only download the files that are new or changed since a previous
+                sync, according to their size and modification date.
+            delete_extraneous: If `True`, remove the local files under the output directory
+                that are no longer in the directory asset. It can't be combined with
+                `ignore_directory_name`, since the output directory may contain other files.
+            stats: Optional counters of the transferred, skipped and removed files.
+            include: Optional glob patterns of the files to download, matched with fnmatch
+                against their paths relative to the directory, so that `*` also matches `/`.
+            exclude: Optional glob patterns of the files not to download, even if included.
+            max_file_size: Optional maximum size in bytes of the files to download.
 
         Returns:
             List of output file paths that were created.
@@ -698,8 +1157,42 @@ class Client:
             max_concurrent=max_concurrent,
             strategy=FetchFileStrategy.download_only,
             admin=admin,
+            sync=sync,
+            delete_extraneous=delete_extraneous,
+            stats=stats,
+            include=include,
+            exclude=exclude,
+            max_file_size=max_file_size,
         )
 
+    @overload
+    def fetch_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+        memory_map: Literal[False] = False,
+    ) -> bytes: ...
+
+    @overload
+    def fetch_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+        memory_map: bool,
+    ) -> bytes | memoryview: ...
+
     @validate_call
     def fetch_content(
         self,
@@ -711,7 +1204,8 @@ class Client:
         project_context: ProjectContext | None = None,
         strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
         admin: bool = False,
-    ) -> bytes:
+        memory_map: bool = False,
+    ) -> bytes | memoryview:
         """Retrieve the binary content of an asset associated with an entity.
 
         Args:
@@ -724,9 +1218,11 @@ class Client:
                 (for example copying from a local store or downloading from the
                 remote service).
             admin: Whether to use the admin endpoints.
+            memory_map: If `True`, return a read-only memory-mapped view of the files found
+                in the local store, instead of copying them into bytes.
 
         Returns:
-            The asset content as raw bytes.
+            The asset content as raw bytes, or as a memoryview if memory_map is `True`.
         """
         return core.fetch_asset_content(
             api_url=self.api_url,
@@ -740,6 +1236,104 @@ class Client:
             local_store=self._local_store,
             strategy=strategy,
             admin=admin,
+            metadata_cache=self._metadata_cache,
+            memory_map=memory_map,
+        )
+
+    @validate_call
+    def open_content(
+        self,
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+    ) -> BinaryIO:
+        """Open the content of an asset as a binary file, without loading it in memory.
+
+        The content is streamed from the remote service, unless found in the local store.
+        The file should be used as a context manager, or closed after use, to release the
+        connection.
+
+        Args:
+            entity_id: Identifier of the entity that owns the asset.
+            entity_type: The entity class/type implementing ``Identifiable``.
+            asset_or_id: Identifier of the asset to retrieve.
+            asset_path: For asset directories, the path within the directory for the file.
+            project_context: Optional project context
+            strategy: Strategy controlling whether the file is read from the local store or
+                streamed from the remote service.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            A readable binary file.
+        """
+        return core.open_asset_content(
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            local_store=self._local_store,
+            strategy=strategy,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
+        )
+
+    @validate_call
+    def fetch_content_into(
+        self,
+        buffer: InstanceOf[bytearray] | InstanceOf[memoryview],
+        *,
+        entity_id: ID,
+        entity_type: type[Entity],
+        asset_or_id: RegisteredAssetOrId,
+        asset_path: Path | None = None,
+        project_context: ProjectContext | None = None,
+        strategy: FetchContentStrategy = FetchContentStrategy.local_or_download,
+        admin: bool = False,
+    ) -> int:
+        """Fetch the content of an asset into a caller-provided buffer, without copying it.
+
+        The buffer can be allocated once from `Asset.size`, and reused for several assets.
+
+        Args:
+            buffer: Writable buffer, at least as large as the content.
+            entity_id: Identifier of the entity that owns the asset.
+            entity_type: The entity class/type implementing ``Identifiable``.
+            asset_or_id: Identifier of the asset to retrieve.
+            asset_path: For asset directories, the path within the directory for the file.
+            project_context: Optional project context
+            strategy: Strategy controlling whether the file is read from the local store or
+                downloaded from the remote service.
+            admin: Whether to use the admin endpoints.
+
+        Returns:
+            The number of bytes written at the start of the buffer.
+
+        Raises:
+            EntitySDKError: If the buffer is read-only or too small for the content.
+        """
+        return core.fetch_asset_content_into(
+            buffer,
+            api_url=self.api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=self._optional_user_context(project_context, admin),
+            http_client=self._http_client,
+            token_manager=self._token_manager,
+            local_store=self._local_store,
+            strategy=strategy,
+            admin=admin,
+            metadata_cache=self._metadata_cache,
         )
 
     @validate_call
@@ -788,6 +1382,9 @@ class Client:
         project_context: ProjectContext | None = None,
         strategy: FetchFileStrategy = FetchFileStrategy.link_or_download,
         admin: bool = False,
+        transfer_config: DownloadTransferConfig | None = None,
+        skip_unchanged: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
     ) -> Path:
         """Fetch a file asset to a local output path.
 
@@ -800,6 +1397,11 @@ class Client:
             project_context: Optional project context.
             strategy: Strategy controlling how the asset file is materialized.
             admin: Whether to use admin endpoints.
+            transfer_config: Optional configuration of the concurrent range requests used for the
+                large files. If not specified, the default values are used.
+            skip_unchanged: Whether to skip the download if the output file already has the
+                size and the sha256 digest of the asset.
+            stats: Optional counters of the transferred and skipped files.
 
         Returns:
             The path of the created local file.
@@ -817,6 +1419,12 @@ class Client:
             local_store=self._local_store,
             strategy=strategy,
             admin=admin,
+            metadata_cache=self._metadata_cache,
+            transfer_config=transfer_config,
+            skip_unchanged=skip_unchanged,
+            digest_cache=self._digest_cache,
+            stats=stats,
+            content_cache=self._content_cache,
         )
 
     @validate_call
@@ -830,6 +1438,9 @@ class Client:
         asset_path: os.PathLike | None = None,
         project_context: ProjectContext | None = None,
         admin: bool = False,
+        transfer_config: DownloadTransferConfig | None = None,
+        skip_unchanged: bool = False,
+        stats: InstanceOf[TransferStats] | None = None,
     ) -> Path:
         """Download asset file to a file path.
 
@@ -841,6 +1452,11 @@ class Client:
             asset_path: for asset directories, the path within the directory to the file.
             project_context: Optional project context.
             admin: Whether to use admin endpoints.
+            transfer_config: Optional configuration of the concurrent range requests used for the
+                large files. If not specified, the default values are used.
+            skip_unchanged: Whether to skip the download if the output file already has the
+                size and the sha256 digest of the asset.
+            stats: Optional counters of the transferred and skipped files.
 
         Returns:
             Output file path.
@@ -854,6 +1470,9 @@ class Client:
             asset_path=Path(asset_path) if asset_path else None,
             strategy=FetchFileStrategy.download_only,
             admin=admin,
+            transfer_config=transfer_config,
+            skip_unchanged=skip_unchanged,
+            stats=stats,
         )
 
     @staticmethod
@@ -996,16 +1615,17 @@ class Client:
         Returns:
             The deleted Asset (as returned by the backend).
         """
-        return core.delete_asset(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            asset_id=asset_id,
-            project_context=self._optional_user_context(project_context, admin),
-            http_client=self._http_client,
-            token_manager=self._token_manager,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            return core.delete_asset(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                asset_id=asset_id,
+                project_context=self._optional_user_context(project_context, admin),
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
 
     @validate_call
     def update_asset_file(
@@ -1099,13 +1719,14 @@ class Client:
             label=asset_label,
         )
         context = self._optional_user_context(project_context, admin)
-        return core.register_asset(
-            api_url=self.api_url,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            project_context=context,
-            asset_metadata=asset_metadata,
-            http_client=self._http_client,
-            token_manager=self._token_manager,
-            admin=admin,
-        )
+        with self._invalidating(entity_id):
+            return core.register_asset(
+                api_url=self.api_url,
+                entity_id=entity_id,
+                entity_type=entity_type,
+                project_context=context,
+                asset_metadata=asset_metadata,
+                http_client=self._http_client,
+                token_manager=self._token_manager,
+                admin=admin,
+            )
@@ -19,6 +19,16 @@ class Settings(BaseSettings):
             description="Default pagination page size, or None to use server default.",
         ),
     ] = None
+    page_prefetch: Annotated[
+        int,
+        Field(
+            description=(
+                "Default number of pages requested concurrently ahead of the consumer "
+                "when paginating, or 0 to request the pages sequentially."
+            ),
+            ge=0,
+        ),
+    ] = 0
     local_api_url: Annotated[
         str,
         Field(
@@ -61,6 +71,45 @@ class Settings(BaseSettings):
             description="Maximum time to acquire a connection from the pool, in seconds.",
         ),
     ] = 5
+    max_retries: Annotated[
+        int,
+        Field(
+            description="Maximum number of times a failed request to entitycore is retried.",
+            ge=0,
+        ),
+    ] = 3
+    retry_backoff_base: Annotated[
+        float,
+        Field(
+            description="Base delay of the exponential backoff between retries, in seconds.",
+            ge=0,
+        ),
+    ] = 0.5
+    retry_backoff_max: Annotated[
+        float,
+        Field(
+            description="Maximum delay between retries, in seconds.",
+            ge=0,
+        ),
+    ] = 30
+    coalesce_requests: Annotated[
+        bool,
+        Field(
+            description=(
+                "Whether concurrent identical GET requests to entitycore share a single "
+                "request in flight."
+            ),
+        ),
+    ] = True
+    json_backend: Annotated[
+        Literal["auto", "orjson", "msgspec", "stdlib"],
+        Field(
+            description=(
+                "Library used to encode and decode JSON. In auto mode, orjson or msgspec are "
+                "used when installed, and the standard library otherwise."
+            ),
+        ),
+    ] = "auto"
     deserialize_model_extra: Annotated[
         Literal["ignore", "forbid"],
         Field(
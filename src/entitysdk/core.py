@@ -1,9 +1,11 @@
 """Core SDK operations."""
 
+import io
 import logging
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TypeVar
+from typing import Any, Literal, TypeVar, overload
 
 import httpx
 
@@ -12,17 +14,22 @@ from entitysdk.common import ProjectContext
 from entitysdk.exception import EntitySDKError
 from entitysdk.models.asset import (
     Asset,
+    DetailedFile,
     DetailedFileList,
     ExistingAssetMetadata,
     LocalAssetMetadata,
 )
+from entitysdk.models.base import BaseModel
 from entitysdk.models.core import Identifiable
 from entitysdk.models.entity import Entity
+from entitysdk.models.lazy import LazyModel
+from entitysdk.models.projection import Projection, projection_model
 from entitysdk.multipart_upload import (
     calculate_part_count,
     multipart_upload_asset_directory,
     multipart_upload_asset_file,
 )
+from entitysdk.ranged_download import download_file_ranges, resume_file_stream
 from entitysdk.result import IteratorResult
 from entitysdk.route import (
     get_assets_endpoint,
@@ -31,6 +38,7 @@ from entitysdk.route import (
     get_version_endpoint,
 )
 from entitysdk.schemas.asset import (
+    DownloadTransferConfig,
     MultipartDirectoryFileRequest,
     MultipartDirectoryUploadRequest,
     MultipartDirectoryUploadTransferConfig,
@@ -46,15 +54,26 @@ from entitysdk.types import (
     FetchContentStrategy,
     FetchFileStrategy,
 )
+from entitysdk.utils import json_codec
 from entitysdk.utils.asset import resolve_asset_path
+from entitysdk.utils.batch import chunked, id_filter, sort_by_ids
+from entitysdk.utils.cache import ContentCache, DigestCache, MetadataCache, content_key
+from entitysdk.utils.checkpoint import DownloadCheckpoint
 from entitysdk.utils.filesystem import (
     create_dir,
     get_filesize,
     validate_filename_extension_consistency,
 )
-from entitysdk.utils.http import make_db_api_request, stream_paginated_request, stream_response
-from entitysdk.utils.io import calculate_sha256_digest
+from entitysdk.utils.http import (
+    build_request_headers,
+    count_paginated_request,
+    make_db_api_request,
+    stream_paginated_request,
+    stream_response,
+)
+from entitysdk.utils.io import ChunkReader, calculate_sha256_digest
 from entitysdk.utils.store import LocalAssetStore
+from entitysdk.utils.transfer import TransferStats, is_unchanged
 
 L = logging.getLogger(__name__)
 
@@ -75,20 +94,114 @@ def get_api_version(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return APIVersion.model_validate(response.json())
+    return APIVersion.model_validate(json_codec.loads(response.content))
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: None = None,
+    lazy: Literal[False] = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    admin: bool,
+) -> IteratorResult[TIdentifiable]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: None = None,
+    lazy: Literal[True],
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    admin: bool,
+) -> IteratorResult[LazyModel[TIdentifiable]]: ...
 
 
+@overload
 def search_entities(
     *,
     api_url: str,
     entity_type: type[TIdentifiable],
     query: dict | None = None,
     limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str],
+    lazy: Literal[False] = False,
     project_context: ProjectContext | None = None,
     token_manager: TokenManager,
     http_client: httpx.Client,
     admin: bool,
-) -> IteratorResult[TIdentifiable]:
+) -> IteratorResult[Projection]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str],
+    lazy: Literal[True],
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    admin: bool,
+) -> IteratorResult[LazyModel[Projection]]: ...
+
+
+@overload
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str] | None = None,
+    lazy: bool = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    admin: bool,
+) -> IteratorResult[Any]: ...
+
+
+def search_entities(
+    *,
+    api_url: str,
+    entity_type: type[TIdentifiable],
+    query: dict | None = None,
+    limit: int | None,
+    page_size: int | None = None,
+    prefetch: int | None = None,
+    fields: Sequence[str] | None = None,
+    lazy: bool = False,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    admin: bool,
+) -> IteratorResult[Any]:
     """Search for entities.
 
     Args:
@@ -96,6 +209,12 @@ def search_entities(
         entity_type: Type of the entity.
         query: Query parameters
         limit: Limit of the number of entities to yield or None.
+        page_size: Number of entities requested per page, or None to use the default.
+        prefetch: Number of pages to request concurrently ahead of the consumer,
+            or None to use the default from the settings.
+        fields: Names of the fields to deserialize, or None to deserialize the full entities.
+            If given, the items are read-only ``Projection`` records with only these fields.
+        lazy: If True, the items are ``LazyModel`` proxies validated only when needed.
         project_context: Project context.
         token_manager: Token manager to issue tokens.
         http_client: HTTP client.
@@ -104,23 +223,43 @@ def search_entities(
     Returns:
         List of entities.
     """
+    item_type = entity_type if fields is None else projection_model(entity_type, fields)
     url = get_entities_endpoint(
         api_url=api_url,
         entity_type=entity_type,
         admin=admin,
     )
-    iterator: Iterator[dict] = stream_paginated_request(
+    items = stream_paginated_request(
         url=url,
         method="GET",
         parameters=query,
         limit=limit,
+        page_size=page_size,
+        prefetch=prefetch,
+        item_type=None if lazy else item_type,
         project_context=project_context,
         token_manager=token_manager,
         http_client=http_client,
     )
-    return IteratorResult(
-        serdes.deserialize_model(json_data, entity_type) for json_data in iterator
-    )
+    iterator: Iterator[Any] = _lazy_models(item_type, items) if lazy else items
+
+    def count() -> int:
+        return count_paginated_request(
+            url=url,
+            method="GET",
+            parameters=query,
+            limit=limit,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+        )
+
+    return IteratorResult(iterator, count=count)
+
+
+def _lazy_models(model: type[BaseModel], items: Iterator[dict[str, Any]]) -> Iterator[Any]:
+    for data in items:
+        yield LazyModel(model, data)
 
 
 def get_entity(
@@ -133,14 +272,24 @@ def get_entity(
     options: dict | None = None,
     http_client: httpx.Client,
     admin: bool,
+    metadata_cache: MetadataCache | None = None,
 ) -> TIdentifiable:
-    """Instantiate entity with model ``entity_type`` from resource id."""
+    """Instantiate entity with model ``entity_type`` from resource id.
+
+    If a metadata cache is given, it's used unless options are specified.
+    """
     url = get_entities_endpoint(
         api_url=api_url,
         entity_type=entity_type,
         entity_id=entity_id,
         admin=admin,
     )
+    if options is not None:
+        metadata_cache = None
+    if metadata_cache is not None and (
+        payload := metadata_cache.get(url, project_context=project_context)
+    ):
+        return serdes.deserialize_model_json(payload, entity_type)
     response = make_db_api_request(
         url=url,
         method="GET",
@@ -150,7 +299,76 @@ def get_entity(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), entity_type)
+    json_data = json_codec.loads(response.content)
+    if metadata_cache is not None:
+        metadata_cache.put_response(
+            url, response, json_data, project_context=project_context, entity_id=entity_id
+        )
+    return serdes.deserialize_model(json_data, entity_type)
+
+
+def get_entities(
+    *,
+    api_url: str,
+    entity_ids: Sequence[ID],
+    entity_type: type[TIdentifiable],
+    chunk_size: int,
+    max_concurrent: int,
+    missing_ok: bool,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    admin: bool,
+) -> list[TIdentifiable]:
+    """Instantiate the entities with model ``entity_type`` from their resource ids.
+
+    The ids are split into chunks, and each chunk is retrieved with a single search request.
+
+    Args:
+        api_url: the api url to entitycore service.
+        entity_ids: Resource ids of the entities.
+        entity_type: Type of the entities.
+        chunk_size: Maximum number of ids requested with a single request.
+        max_concurrent: Maximum number of chunks requested concurrently.
+        missing_ok: If True, the entities not found are skipped instead of raising an error.
+        project_context: Project context.
+        token_manager: Token manager to issue tokens.
+        http_client: HTTP client.
+        admin: Use admin endpoint if True
+
+    Returns:
+        The entities in the same order as the ids.
+
+    Raises:
+        EntitiesNotFoundError: If some entities are not found and missing_ok is False.
+    """
+    unique_ids = list(dict.fromkeys(entity_ids))
+
+    def fetch_chunk(chunk: Sequence[ID]) -> list[TIdentifiable]:
+        return search_entities(
+            api_url=api_url,
+            entity_type=entity_type,
+            query=id_filter(chunk),
+            page_size=len(chunk),
+            limit=None,
+            prefetch=0,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            admin=admin,
+        ).all()
+
+    chunks = list(chunked(unique_ids, chunk_size))
+    if max_concurrent == 1 or len(chunks) <= 1:
+        results = [fetch_chunk(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            results = list(executor.map(fetch_chunk, chunks))
+    return sort_by_ids(
+        entity_ids,
+        (entity for result in results for entity in result),
+        missing_ok=missing_ok,
+    )
 
 
 def get_entity_derivations(
@@ -183,7 +401,8 @@ def get_entity_derivations(
         parameters=params,
     )
     return IteratorResult(
-        serdes.deserialize_model(json_data, Entity) for json_data in response.json()["data"]
+        serdes.deserialize_model(json_data, Entity)
+        for json_data in json_codec.loads(response.content)["data"]
     )
 
 
@@ -197,6 +416,7 @@ def get_entity_asset(
     token_manager: TokenManager,
     http_client: httpx.Client,
     admin: bool = False,
+    metadata_cache: MetadataCache | None = None,
 ) -> Asset:
     """Get an entity's asset metadata."""
     url = get_assets_endpoint(
@@ -206,6 +426,10 @@ def get_entity_asset(
         asset_id=asset_id,
         admin=admin,
     )
+    if metadata_cache is not None and (
+        payload := metadata_cache.get(url, project_context=project_context)
+    ):
+        return serdes.deserialize_model_json(payload, Asset)
     response = make_db_api_request(
         url=url,
         method="GET",
@@ -213,7 +437,12 @@ def get_entity_asset(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), Asset)
+    json_data = json_codec.loads(response.content)
+    if metadata_cache is not None:
+        metadata_cache.put_response(
+            url, response, json_data, project_context=project_context, entity_id=entity_id
+        )
+    return serdes.deserialize_model(json_data, Asset)
 
 
 def get_entity_assets(
@@ -242,7 +471,8 @@ def get_entity_assets(
         http_client=http_client,
     )
     return IteratorResult(
-        serdes.deserialize_model(json_data, Asset) for json_data in response.json()["data"]
+        serdes.deserialize_model(json_data, Asset)
+        for json_data in json_codec.loads(response.content)["data"]
     )
 
 
@@ -267,7 +497,7 @@ def register_entity(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), type(entity))
+    return serdes.deserialize_model(json_codec.loads(response.content), type(entity))
 
 
 def update_entity(
@@ -303,7 +533,7 @@ def update_entity(
         http_client=http_client,
     )
 
-    json_data = response.json()
+    json_data = json_codec.loads(response.content)
 
     return serdes.deserialize_model(json_data, entity_type)
 
@@ -412,7 +642,7 @@ def upload_asset_content(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), Asset)
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
 
 
 def upload_asset_directory(
@@ -476,6 +706,7 @@ def list_directory(
     project_context: ProjectContext | None = None,
     http_client: httpx.Client,
     admin: bool,
+    metadata_cache: MetadataCache | None = None,
 ) -> DetailedFileList:
     """List all files within an asset directory."""
     url = (
@@ -488,6 +719,10 @@ def list_directory(
         )
         + "/list"
     )
+    if metadata_cache is not None and (
+        payload := metadata_cache.get(url, project_context=project_context)
+    ):
+        return serdes.deserialize_model_json(payload, DetailedFileList)
     response = make_db_api_request(
         url=url,
         method="GET",
@@ -495,7 +730,12 @@ def list_directory(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), DetailedFileList)
+    json_data = json_codec.loads(response.content)
+    if metadata_cache is not None:
+        metadata_cache.put_response(
+            url, response, json_data, project_context=project_context, entity_id=entity_id
+        )
+    return serdes.deserialize_model(json_data, DetailedFileList)
 
 
 def fetch_asset_file(
@@ -512,8 +752,25 @@ def fetch_asset_file(
     local_store: LocalAssetStore | None = None,
     strategy: FetchFileStrategy,
     admin: bool,
+    metadata_cache: MetadataCache | None = None,
+    transfer_config: DownloadTransferConfig | None = None,
+    skip_unchanged: bool = False,
+    digest_cache: DigestCache | None = None,
+    stats: TransferStats | None = None,
+    content_cache: ContentCache | None = None,
+    file_info: DetailedFile | None = None,
 ) -> Path:
-    """Fetch asset file."""
+    """Fetch asset file.
+
+    With ``skip_unchanged``, the download of a file asset is skipped if ``output_path`` already
+    holds a file with the size and the sha256 digest of the asset. The digests of the local
+    files are taken from ``digest_cache`` when given, and the downloaded and skipped files are
+    counted in ``stats``.
+
+    With ``content_cache``, the file is materialized from the cache when present, and added to
+    it after the download. The files of a directory asset are cached only if their ``file_info``
+    is given, since they're identified by their size and modification date.
+    """
     if isinstance(asset_or_id, ID):
         asset = get_entity_asset(
             api_url=api_url,
@@ -524,6 +781,7 @@ def fetch_asset_file(
             http_client=http_client,
             token_manager=token_manager,
             admin=admin,
+            metadata_cache=metadata_cache,
         )
     else:
         asset = asset_or_id
@@ -539,9 +797,33 @@ def fetch_asset_file(
         )
 
     create_dir(target_path.parent)
-
-    def download_file():
-        return download_asset_file(
+    key = content_key(asset, asset_path=asset_path, file_info=file_info)
+
+    def download_file() -> Path:
+        if (
+            skip_unchanged
+            and not asset.is_directory
+            and is_unchanged(
+                target_path,
+                size=asset.size,
+                sha256_digest=asset.sha256_digest,
+                digest_cache=digest_cache,
+            )
+        ):
+            L.debug("Skipping the download of the unchanged file %s", target_path)
+            if stats is not None:
+                stats.add_skipped(asset.size)
+            return target_path
+        if (
+            key is not None
+            and content_cache is not None
+            and content_cache.materialize(key, target_path)
+        ):
+            L.debug("Materialized %s from the content cache", target_path)
+            if stats is not None:
+                stats.add_cached(target_path.stat().st_size)
+            return target_path
+        path = download_asset_file(
             api_url=api_url,
             entity_id=entity_id,
             entity_type=entity_type,
@@ -552,7 +834,22 @@ def fetch_asset_file(
             http_client=http_client,
             asset_path=asset_path,
             admin=admin,
+            asset_size=None if asset.is_directory else asset.size,
+            sha256_digest=None if asset.is_directory else asset.sha256_digest,
+            transfer_config=transfer_config,
+            digest_cache=digest_cache,
         )
+        if stats is not None:
+            stats.add_transferred(path.stat().st_size)
+        if key is not None and content_cache is not None:
+            # the digest was verified when the download was committed
+            content_cache.put(
+                key,
+                path,
+                sha256_digest=None if asset.is_directory else asset.sha256_digest,
+                verified=True,
+            )
+        return path
 
     def try_copy_path() -> Path | None:
         if local_store is None:
@@ -607,11 +904,17 @@ def download_asset_file(
     http_client: httpx.Client,
     asset_path: Path | None = None,
     admin: bool,
+    asset_size: int | None = None,
+    sha256_digest: str | None = None,
+    transfer_config: DownloadTransferConfig | None = None,
+    digest_cache: DigestCache | None = None,
 ) -> Path:
     """Download an asset from the entitycore download endpoint to a local file.
 
     Streams the HTTP response body to ``target_path`` without loading the full
-    payload into memory.
+    payload into memory. The bytes are written to ``<target_path>.part``, renamed to
+    ``target_path`` once verified. If the size of the file is known, an interrupted download
+    is resumed from the bytes already fetched, recorded in ``<target_path>.part.json``.
 
     Args:
         api_url: the api url to entitycore service.
@@ -624,6 +927,12 @@ def download_asset_file(
         http_client: HTTP client used for the streaming request.
         asset_path: For directory assets, path within the directory to the file.
         admin: Whether to use admin endpoints.
+        asset_size: Size of the asset file, if known. Files of at least
+            ``transfer_config.threshold`` bytes are downloaded with concurrent range requests.
+        sha256_digest: Expected sha256 digest of the asset file, if known.
+        transfer_config: Configuration of the range requests.
+        digest_cache: Optional cache where the digest of the file is stored, if it was computed
+            during the download or to verify it.
 
     Returns:
         ``target_path`` after the download completes.
@@ -635,25 +944,86 @@ def download_asset_file(
         asset_id=asset_id,
         admin=admin,
     )
-    token = token_manager.get_token()
-    headers = {"Authorization": f"Bearer {token}"}
-    if project_context:
-        headers["project-id"] = str(project_context.project_id)
-        if vlab_id := project_context.virtual_lab_id:
-            headers["virtual-lab-id"] = str(vlab_id)
-
+    headers = build_request_headers(token_manager=token_manager, project_context=project_context)
     parameters = {"asset_path": str(asset_path)} if asset_path else {}
-    with target_path.open("wb") as f:
-        for chunk in stream_response(
-            url=f"{asset_endpoint}/download",
-            method="GET",
+    url = f"{asset_endpoint}/download"
+    transfer_config = transfer_config or DownloadTransferConfig()
+    checkpoint = DownloadCheckpoint(target_path, size=asset_size, sha256_digest=sha256_digest)
+    if checkpoint.is_complete:
+        L.info("Download of %s already complete, verifying it", target_path)
+    elif asset_path is None and asset_size and asset_size >= transfer_config.threshold:
+        download_file_ranges(
+            url=url,
+            checkpoint=checkpoint,
             headers=headers,
             parameters=parameters,
             http_client=http_client,
-        ):
-            if chunk:
-                f.write(chunk)
-    return target_path
+            transfer_config=transfer_config,
+        )
+    elif checkpoint.offset:
+        resume_file_stream(
+            url=url,
+            checkpoint=checkpoint,
+            headers=headers,
+            parameters=parameters,
+            http_client=http_client,
+        )
+    else:
+        with checkpoint.open_stream() as writer:
+            for chunk in stream_response(
+                url=url,
+                method="GET",
+                headers=headers,
+                parameters=parameters,
+                http_client=http_client,
+            ):
+                if chunk:
+                    writer.write(chunk)
+    path = checkpoint.commit()
+    if digest_cache is not None and checkpoint.digest:
+        digest_cache.put(path, checkpoint.digest)
+    return path
+
+
+def _find_in_store(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    local_store: LocalAssetStore | None,
+    admin: bool,
+    metadata_cache: MetadataCache | None,
+) -> Path | None:
+    """Return the path of an asset file in the local store, or None if not found."""
+    if local_store is None:
+        return None
+
+    if isinstance(asset_or_id, ID):
+        asset = get_entity_asset(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_id=asset_or_id,
+            project_context=project_context,
+            http_client=http_client,
+            token_manager=token_manager,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+    else:
+        asset = asset_or_id
+
+    source_path: Path = resolve_asset_path(asset, directory_file=asset_path)
+
+    if local_store.path_exists(source_path):
+        return source_path
+
+    return None
 
 
 def fetch_asset_content(
@@ -669,7 +1039,9 @@ def fetch_asset_content(
     local_store: LocalAssetStore | None = None,
     strategy: FetchContentStrategy,
     admin: bool,
-) -> bytes:
+    metadata_cache: MetadataCache | None = None,
+    memory_map: bool = False,
+) -> bytes | memoryview:
     """Fetch asset content.
 
     Args:
@@ -684,37 +1056,34 @@ def fetch_asset_content(
         local_store: LocalAssetStore for using a local store.
         strategy: Output strategy to fetch the asset content.
         admin: Whether to use admin endpoints.
+        metadata_cache: Optional cache of the asset metadata.
+        memory_map: Whether to return a read-only memory-mapped view of the files found in the
+            local store, instead of copying them into bytes.
 
     Returns:
-        Asset content in bytes.
+        Asset content in bytes, or a memoryview of the local file if memory_map is True.
     """
     asset_id = asset_or_id.id if isinstance(asset_or_id, Asset) else asset_or_id
 
-    def try_read_from_store() -> bytes | None:
-
-        if local_store is None:
+    def try_read_from_store() -> bytes | memoryview | None:
+        source_path = _find_in_store(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            local_store=local_store,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+        if source_path is None or local_store is None:
             return None
-
-        if isinstance(asset_or_id, ID):
-            asset = get_entity_asset(
-                api_url=api_url,
-                entity_id=entity_id,
-                entity_type=entity_type,
-                asset_id=asset_id,
-                project_context=project_context,
-                http_client=http_client,
-                token_manager=token_manager,
-                admin=admin,
-            )
-        else:
-            asset = asset_or_id
-
-        source_path: Path = resolve_asset_path(asset, directory_file=asset_path)
-
-        if local_store.path_exists(source_path):
-            return local_store.read_bytes(source_path)
-
-        return None
+        if memory_map:
+            return local_store.map_bytes(source_path)
+        return local_store.read_bytes(source_path)
 
     def download_content():
         asset_endpoint = get_assets_endpoint(
@@ -748,6 +1117,136 @@ def fetch_asset_content(
             raise EntitySDKError(f"{strategy} failed: Unsupported strategy")
 
 
+def open_asset_content(
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    local_store: LocalAssetStore | None = None,
+    strategy: FetchContentStrategy,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> io.BufferedReader:
+    """Open asset content as a binary file, streamed from the service unless in the local store.
+
+    See ``fetch_asset_content`` for the description of the arguments. The returned file must be
+    closed, to release the connection of a streamed response.
+    """
+    asset_id = asset_or_id.id if isinstance(asset_or_id, Asset) else asset_or_id
+
+    def try_open_from_store() -> io.BufferedReader | None:
+        source_path = _find_in_store(
+            api_url=api_url,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=asset_or_id,
+            asset_path=asset_path,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            local_store=local_store,
+            admin=admin,
+            metadata_cache=metadata_cache,
+        )
+        if source_path is None or local_store is None:
+            return None
+        return local_store.open(source_path)
+
+    def open_stream() -> io.BufferedReader:
+        asset_endpoint = get_assets_endpoint(
+            api_url=api_url,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            asset_id=asset_id,
+            admin=admin,
+        )
+        chunks = stream_response(
+            url=f"{asset_endpoint}/download",
+            method="GET",
+            headers=build_request_headers(
+                token_manager=token_manager, project_context=project_context
+            ),
+            parameters={"asset_path": str(asset_path)} if asset_path else {},
+            http_client=http_client,
+        )
+        return io.BufferedReader(ChunkReader(chunks))
+
+    match strategy:
+        case FetchContentStrategy.local_only:
+            if f := try_open_from_store():
+                return f
+            raise EntitySDKError("copy strategy failed: No asset path found in store.")
+        case FetchContentStrategy.local_or_download:
+            if f := try_open_from_store():
+                return f
+            return open_stream()
+        case FetchContentStrategy.download_only:
+            return open_stream()
+        case _:
+            raise EntitySDKError(f"{strategy} failed: Unsupported strategy")
+
+
+def fetch_asset_content_into(
+    buffer: bytearray | memoryview,
+    *,
+    api_url: str,
+    entity_id: ID,
+    entity_type: type[Entity],
+    asset_or_id: ID | Asset,
+    asset_path: Path | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    local_store: LocalAssetStore | None = None,
+    strategy: FetchContentStrategy,
+    admin: bool,
+    metadata_cache: MetadataCache | None = None,
+) -> int:
+    """Fetch asset content into a writable buffer, and return the number of bytes written.
+
+    See ``fetch_asset_content`` for the description of the other arguments.
+
+    Raises:
+        EntitySDKError: If the buffer is read-only or too small for the content.
+    """
+    view = memoryview(buffer).cast("B")
+    if view.readonly:
+        raise EntitySDKError("The buffer is read-only")
+    if (
+        isinstance(asset_or_id, Asset)
+        and not asset_or_id.is_directory
+        and asset_or_id.size > len(view)
+    ):
+        raise EntitySDKError(
+            f"The buffer of {len(view)} bytes is too small for {asset_or_id.size} bytes"
+        )
+    with open_asset_content(
+        api_url=api_url,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=asset_or_id,
+        asset_path=asset_path,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+        local_store=local_store,
+        strategy=strategy,
+        admin=admin,
+        metadata_cache=metadata_cache,
+    ) as f:
+        written = 0
+        while written < len(view) and (size := f.readinto(view[written:])):
+            written += size
+        if f.read(1):
+            raise EntitySDKError(f"The buffer of {len(view)} bytes is too small for the content")
+    return written
+
+
 def delete_asset(
     *,
     api_url: str,
@@ -774,7 +1273,7 @@ def delete_asset(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), Asset)
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
 
 
 def register_asset(
@@ -807,4 +1306,4 @@ def register_asset(
         token_manager=token_manager,
         http_client=http_client,
     )
-    return serdes.deserialize_model(response.json(), Asset)
+    return serdes.deserialize_model(json_codec.loads(response.content), Asset)
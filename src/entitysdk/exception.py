@@ -19,3 +19,14 @@ class DependencyError(EntitySDKError):
 
 class StagingError(EntitySDKError):
     """Raised when a staging operation has failed."""
+
+
+class EntitiesNotFoundError(EntitySDKError):
+    """Raised when some of the requested entities are not found."""
+
+    def __init__(self, missing_ids: list) -> None:
+        """Initialize the exception with the ids of the entities not found."""
+        self.missing_ids = missing_ids
+        super().__init__(
+            f"{len(missing_ids)} entities not found: {', '.join(map(str, missing_ids))}"
+        )
@@ -23,7 +23,7 @@ from entitysdk.client import Client
 from entitysdk.migration.settings import CommonSettings
 from entitysdk.migration.tracking import ExecutionSummary
 from entitysdk.schemas.version import APIVersion
-from entitysdk.token_manager import TokenFromFunction, TokenManager
+from entitysdk.token_manager import CachingTokenManager, TokenFromFunction, TokenManager
 from entitysdk.types import DeploymentEnvironment, Token
 
 # filename for logs and manifest, without extension
@@ -141,11 +141,13 @@ def init_client(settings: CommonSettings) -> Client:
     if settings.environment == DeploymentEnvironment.local:
         token_manager = "DISABLED"  # noqa: S105
     else:
-        token_manager = TokenFromFunction(
-            partial(
-                get_token,
-                environment=AuthEnvironment(settings.environment),
-            ),
+        token_manager = CachingTokenManager(
+            TokenFromFunction(
+                partial(
+                    get_token,
+                    environment=AuthEnvironment(settings.environment),
+                ),
+            )
         )
     return Client(
         environment=settings.environment,
@@ -0,0 +1,110 @@
+"""Lazily validated models."""
+
+from functools import cache
+from typing import Annotated, Any, Generic, TypeVar
+
+from pydantic import TypeAdapter
+
+from entitysdk import serdes
+from entitysdk.models.base import BaseModel
+
+TBaseModel = TypeVar("TBaseModel", bound=BaseModel)
+
+# raw json values that can be validated without building nested models
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+@cache
+def _field_adapter(model: type[BaseModel], name: str) -> TypeAdapter | None:
+    """Return the adapter validating a single field, or None if the model must be validated.
+
+    The fields of models with custom validators, or with validation aliases, can't be
+    validated separately from the rest of the model, nor can the fields without annotation.
+    """
+    decorators = model.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return None
+    field = model.model_fields[name]
+    if field.annotation is None:
+        return None
+    if field.validation_alias is not None or field.alias is not None:
+        return None
+    if not field.metadata:
+        return TypeAdapter(field.annotation)
+    return TypeAdapter(Annotated[(field.annotation, *field.metadata)])  # type: ignore[valid-type]
+
+
+class LazyModel(Generic[TBaseModel]):
+    """Read-only proxy of a model, keeping the raw json until the model is needed.
+
+    The top-level fields with scalar values are validated separately on first access, while
+    accessing any other attribute validates the full model, as ``materialize()`` does.
+    """
+
+    __slots__ = ("_data", "_instance", "_model", "_values")
+
+    def __init__(self, model: type[TBaseModel], data: dict[str, Any]) -> None:
+        """Initialize the proxy.
+
+        Args:
+            model: The model used to validate the data.
+            data: The raw json data returned by entitycore.
+        """
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_values", {})
+        object.__setattr__(self, "_instance", None)
+
+    @property
+    def model(self) -> type[TBaseModel]:
+        """Return the model of the proxy."""
+        return self._model
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """Return the raw json data."""
+        return self._data
+
+    @property
+    def is_materialized(self) -> bool:
+        """Return True if the full model has been validated."""
+        return self._instance is not None
+
+    def materialize(self) -> TBaseModel:
+        """Validate and return the full model."""
+        if self._instance is None:
+            object.__setattr__(self, "_instance", serdes.deserialize_model(self._data, self._model))
+        return self._instance  # type: ignore[return-value]
+
+    def __getattr__(self, name: str) -> Any:
+        """Return the validated value of an attribute of the model."""
+        if name.startswith("__"):
+            # special attributes looked up by copy, pickle, etc. aren't proxied
+            raise AttributeError(name)
+        if self._instance is not None:
+            return getattr(self._instance, name)
+        if name in self._values:
+            return self._values[name]
+        if name in self._model.model_fields and (adapter := _field_adapter(self._model, name)):
+            if name in self._data:
+                raw_value = self._data[name]
+                if isinstance(raw_value, _SCALAR_TYPES):
+                    value = self._values[name] = adapter.validate_python(raw_value)
+                    return value
+            elif not (field := self._model.model_fields[name]).is_required():
+                value = self._values[name] = field.get_default(call_default_factory=True)
+                return value
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent the modification of the proxy."""
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self) -> tuple:
+        """Support copy and pickle, recreating the proxy from the raw json."""
+        return type(self), (self._model, self._data)
+
+    def __repr__(self) -> str:
+        """Return the representation of the proxy."""
+        state = "materialized" if self.is_materialized else "lazy"
+        return f"{type(self).__name__}[{self._model.__name__}]({state}, id={self._data.get('id')})"
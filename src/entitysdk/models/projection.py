@@ -0,0 +1,51 @@
+"""Projections of models, limited to a subset of their fields."""
+
+from collections.abc import Sequence
+from functools import cache
+from typing import Any
+
+from pydantic import ConfigDict, create_model
+
+from entitysdk.exception import EntitySDKError
+from entitysdk.models.base import BaseModel
+
+
+class Projection(BaseModel):
+    """Read-only record with a subset of the fields of a model.
+
+    The fields not selected in the projection are ignored during the deserialization.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+
+def projection_model(model: type[BaseModel], fields: Sequence[str]) -> type[Projection]:
+    """Return the projection of a model limited to the given fields.
+
+    The projections are cached, so the same class is returned for the same model and fields.
+
+    Args:
+        model: The projected model.
+        fields: Names of the fields to keep, validated as in the projected model.
+
+    Returns:
+        A subclass of ``Projection`` named after the projected model.
+    """
+    return _projection_model(model, tuple(dict.fromkeys(fields)))
+
+
+@cache
+def _projection_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[Projection]:
+    if not fields:
+        raise EntitySDKError("At least one field must be selected")
+    if unknown := [name for name in fields if name not in model.model_fields]:
+        raise EntitySDKError(f"Unknown fields for {model.__name__}: {', '.join(unknown)}")
+    definitions: dict[str, Any] = {
+        name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields
+    }
+    return create_model(
+        f"{model.__name__}Projection",
+        __base__=Projection,
+        __module__=__name__,
+        **definitions,
+    )
@@ -1,9 +1,11 @@
 """Response models."""
 
-from typing import Annotated
+from typing import Annotated, Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
 
+T = TypeVar("T")
+
 
 class PaginationResponse(BaseModel):
     """Pagination details returned by the entitycore service."""
@@ -13,8 +15,13 @@ class PaginationResponse(BaseModel):
     total_items: Annotated[int, Field(ge=0)]
 
 
-class ListResponse(BaseModel):
-    """Response returned by the entitycore service."""
+class ListResponse(BaseModel, Generic[T]):
+    """Response returned by the entitycore service.
+
+    The model can be parametrized with the type of the items, e.g. ``ListResponse[Entity]``,
+    to validate them directly. Otherwise, the items are left as they are.
+    """
 
-    data: list
+    data: list[T]
     pagination: PaginationResponse
+    facets: dict[str, Any] | None = None
@@ -30,6 +30,7 @@ from entitysdk.types import ID
 from entitysdk.utils.execution import execute_with_retry
 from entitysdk.utils.filesystem import get_filesize
 from entitysdk.utils.http import make_db_api_request
+from entitysdk.utils.instrumentation import PART_EXTENSION
 from entitysdk.utils.io import calculate_sha256_digest, iter_bytes_chunk
 
 L = logging.getLogger(__name__)
@@ -313,6 +314,7 @@ def _upload_part_with_retry(part: PartUpload, http_client: httpx.Client) -> None
                 size=part.size,
                 url=part.url,
                 http_client=http_client,
+                part_number=part.part_number,
             ),
             max_retries=MAX_RETRIES,
             backoff_base=BACKOFF_BASE,
@@ -336,7 +338,12 @@ def _upload_part_with_retry(part: PartUpload, http_client: httpx.Client) -> None
 
 
 def _upload_part(
-    file_path: Path, offset: int, size: int, url: str, http_client: httpx.Client
+    file_path: Path,
+    offset: int,
+    size: int,
+    url: str,
+    http_client: httpx.Client,
+    part_number: int | None = None,
 ) -> None:
     """Upload a single part to the presigned URL.
 
@@ -351,7 +358,11 @@ def _upload_part(
         buffer_size=STREAM_DATA_BUFFER_SIZE,
     )
     response = http_client.put(
-        url=url, content=data_iterator, timeout=TIMEOUT, headers={"Content-Length": str(size)}
+        url=url,
+        content=data_iterator,
+        timeout=TIMEOUT,
+        headers={"Content-Length": str(size)},
+        extensions={PART_EXTENSION: part_number},
     )
     response.raise_for_status()
 
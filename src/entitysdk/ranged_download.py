@@ -0,0 +1,292 @@
+"""Parallel and resumable download of large files with HTTP range requests."""
+
+import logging
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+from entitysdk.config import settings
+from entitysdk.exception import EntitySDKError
+from entitysdk.schemas.asset import DownloadTransferConfig
+from entitysdk.utils.checkpoint import DownloadCheckpoint
+from entitysdk.utils.execution import execute_with_retry
+from entitysdk.utils.http import default_timeout
+from entitysdk.utils.instrumentation import PART_EXTENSION
+
+L = logging.getLogger(__name__)
+
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.25
+RETRIABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ReadTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+def range_header(start: int, end: int) -> dict[str, str]:
+    """Return the header requesting the inclusive byte range [start, end]."""
+    return {"Range": f"bytes={start}-{end}"}
+
+
+def parse_content_range(response: httpx.Response) -> tuple[int, int, int] | None:
+    """Return the start, end and total size of a partial response, or None if not partial.
+
+    Raises:
+        EntitySDKError: If the response is partial, but its Content-Range header is invalid.
+    """
+    if response.status_code != httpx.codes.PARTIAL_CONTENT:
+        return None
+    value = response.headers.get("Content-Range", "")
+    if not (match := _CONTENT_RANGE.fullmatch(value.strip())):
+        raise EntitySDKError(f"Invalid Content-Range header {value!r} for {response.url}")
+    start, end, total = map(int, match.groups())
+    return start, end, total
+
+
+def ranges_request(response: httpx.Response, headers: dict[str, str]) -> tuple[str, dict]:
+    """Return the url and the headers of the range requests following a first response.
+
+    The ranges are requested directly from the final url of the first response, skipping the
+    redirects. The headers, like the authorization, are only sent to the original server.
+    """
+    original_url = response.history[0].request.url if response.history else response.url
+    final_url = response.url
+    same_origin = (original_url.scheme, original_url.host, original_url.port) == (
+        final_url.scheme,
+        final_url.host,
+        final_url.port,
+    )
+    return str(final_url), headers if same_origin else {}
+
+
+def write_at(path: Path, offset: int, chunks: Iterable[bytes]) -> int:
+    """Write the chunks to an existing file at the given offset, and return the written size."""
+    written = 0
+    with path.open("r+b") as f:
+        f.seek(offset)
+        for chunk in chunks:
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def check_range(
+    content_range: tuple[int, int, int] | None, *, start: int, end: int, size: int, url: str
+) -> None:
+    """Check that a response is the inclusive byte range [start, end] of a file of known size.
+
+    Raises:
+        EntitySDKError: If the response isn't the requested range.
+    """
+    if content_range != (start, end, size):
+        raise EntitySDKError(
+            f"Unexpected response to the range request bytes={start}-{end}/{size} for {url}: "
+            f"Content-Range={content_range}"
+        )
+
+
+def check_written(written: int, *, start: int, end: int, url: str) -> None:
+    """Check that the full range [start, end] has been received.
+
+    Raises:
+        EntitySDKError: If the received size doesn't match the range.
+    """
+    if written != end - start + 1:
+        raise EntitySDKError(
+            f"Incomplete response to the range request bytes={start}-{end} for {url}: "
+            f"received {written} bytes"
+        )
+
+
+def download_file_ranges(
+    *,
+    url: str,
+    checkpoint: DownloadCheckpoint,
+    headers: dict[str, str],
+    parameters: dict | None,
+    http_client: httpx.Client,
+    transfer_config: DownloadTransferConfig,
+) -> None:
+    """Download the missing ranges of a file with concurrent range requests.
+
+    The first missing range is requested from ``url``, following the redirects. If the server
+    doesn't support the range requests, the full response is streamed to the file instead.
+    Otherwise, the other ranges are requested concurrently from the final url, while the first
+    range is written to the file. Each range is recorded in the checkpoint once written, and its
+    request is tagged with its part number for the instrumentation, starting from 1.
+
+    Args:
+        url: The url to download.
+        checkpoint: Checkpoint of the partial file, with the expected size of the file.
+        headers: Headers of the request to ``url``.
+        parameters: Query parameters of the request to ``url``.
+        http_client: HTTP client to use.
+        transfer_config: Size and concurrency of the range requests.
+    """
+    if not (ranges := checkpoint.missing_ranges(transfer_config.part_size)):
+        return
+    (start, end), other_ranges = ranges[0], ranges[1:]
+    try:
+        with http_client.stream(
+            "GET",
+            url=url,
+            headers=headers | range_header(start, end),
+            params=parameters,
+            follow_redirects=True,
+            timeout=default_timeout(),
+            extensions={PART_EXTENSION: 1},
+        ) as response:
+            response.raise_for_status()
+            chunks = response.iter_bytes(chunk_size=settings.download_stream_data_buffer_size)
+            if (content_range := parse_content_range(response)) is None:
+                L.info("Range requests not supported for %s, using a single stream", url)
+                with checkpoint.open_stream() as writer:
+                    for chunk in chunks:
+                        writer.write(chunk)
+                return
+
+            check_range(content_range, start=start, end=end, size=checkpoint.expected_size, url=url)
+            checkpoint.preallocate()
+            ranges_url, ranges_headers = ranges_request(response, headers)
+            executor = ThreadPoolExecutor(max_workers=transfer_config.max_concurrency)
+            try:
+                futures = [
+                    executor.submit(
+                        _download_range_with_retry,
+                        url=ranges_url,
+                        headers=ranges_headers,
+                        start=range_start,
+                        end=range_end,
+                        part_number=part_number,
+                        checkpoint=checkpoint,
+                        http_client=http_client,
+                    )
+                    for part_number, (range_start, range_end) in enumerate(other_ranges, start=2)
+                ]
+                written = write_at(checkpoint.part_path, start, chunks)
+                check_written(written, start=start, end=end, url=url)
+                checkpoint.add(start, end)
+                for future in futures:
+                    future.result()
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+    except httpx.RequestError as e:
+        raise EntitySDKError(f"Request error: {e}") from e
+    except httpx.HTTPStatusError as e:
+        raise EntitySDKError(f"HTTP error {e.response.status_code} for GET {url}") from e
+    L.debug("Downloaded %s with %d range requests", checkpoint.part_path, len(ranges))
+
+
+def resume_file_stream(
+    *,
+    url: str,
+    checkpoint: DownloadCheckpoint,
+    headers: dict[str, str],
+    parameters: dict | None,
+    http_client: httpx.Client,
+) -> None:
+    """Stream the end of a file, starting after the bytes already fetched.
+
+    If the server doesn't support the range requests, the full file is streamed again.
+
+    Args:
+        url: The url to download.
+        checkpoint: Checkpoint of the partial file, with the expected size of the file.
+        headers: Headers of the request to ``url``.
+        parameters: Query parameters of the request to ``url``.
+        http_client: HTTP client to use.
+    """
+    offset = checkpoint.offset
+    try:
+        with http_client.stream(
+            "GET",
+            url=url,
+            headers=headers | {"Range": f"bytes={offset}-"},
+            params=parameters,
+            follow_redirects=True,
+            timeout=default_timeout(),
+        ) as response:
+            response.raise_for_status()
+            if (content_range := parse_content_range(response)) is None:
+                L.info("Range requests not supported for %s, restarting the download", url)
+                offset = 0
+            else:
+                size = checkpoint.expected_size
+                check_range(content_range, start=offset, end=size - 1, size=size, url=url)
+            with checkpoint.open_stream(offset) as writer:
+                for chunk in response.iter_bytes(
+                    chunk_size=settings.download_stream_data_buffer_size
+                ):
+                    writer.write(chunk)
+    except httpx.RequestError as e:
+        raise EntitySDKError(f"Request error: {e}") from e
+    except httpx.HTTPStatusError as e:
+        raise EntitySDKError(f"HTTP error {e.response.status_code} for GET {url}") from e
+
+
+def _download_range_with_retry(
+    *,
+    url: str,
+    headers: dict[str, str],
+    start: int,
+    end: int,
+    part_number: int,
+    checkpoint: DownloadCheckpoint,
+    http_client: httpx.Client,
+) -> None:
+    execute_with_retry(
+        lambda: _download_range(
+            url=url,
+            headers=headers,
+            start=start,
+            end=end,
+            part_number=part_number,
+            checkpoint=checkpoint,
+            http_client=http_client,
+        ),
+        max_retries=MAX_RETRIES,
+        backoff_base=BACKOFF_BASE,
+        retry_on=RETRIABLE_EXCEPTIONS,
+    )
+
+
+def _download_range(
+    *,
+    url: str,
+    headers: dict[str, str],
+    start: int,
+    end: int,
+    part_number: int,
+    checkpoint: DownloadCheckpoint,
+    http_client: httpx.Client,
+) -> None:
+    """Download a single range, write it at its offset in the file, and record it."""
+    with http_client.stream(
+        "GET",
+        url=url,
+        headers=headers | range_header(start, end),
+        timeout=default_timeout(),
+        extensions={PART_EXTENSION: part_number},
+    ) as response:
+        response.raise_for_status()
+        check_range(
+            parse_content_range(response),
+            start=start,
+            end=end,
+            size=checkpoint.expected_size,
+            url=url,
+        )
+        written = write_at(
+            checkpoint.part_path,
+            start,
+            response.iter_bytes(chunk_size=settings.download_stream_data_buffer_size),
+        )
+        check_written(written, start=start, end=end, url=url)
+    checkpoint.add(start, end)
@@ -1,20 +1,51 @@
-"""Iterator wrapper for iterable results."""
+"""Iterator wrappers for iterable results."""
 
-from collections.abc import Iterable, Iterator
-from typing import TypeVar
+import asyncio
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, TypeVar
 
 from entitysdk.compat import Self
 from entitysdk.exception import IteratorResultError
+from entitysdk.utils import columns
 
 ResultType = TypeVar("ResultType")
+MappedType = TypeVar("MappedType")
+
+
+def _check_positive(name: str, value: int) -> None:
+    if value < 1:
+        raise IteratorResultError(f"{name} must be strictly positive.")
 
 
 class IteratorResult(Iterator[ResultType]):
     """A result of an iterator."""
 
-    def __init__(self, iterable: Iterable[ResultType]) -> None:
-        """Initialize the iterator result."""
+    def __init__(
+        self,
+        iterable: Iterable[ResultType],
+        *,
+        count: Callable[[], int] | None = None,
+    ) -> None:
+        """Initialize the iterator result.
+
+        Args:
+            iterable: The wrapped iterable.
+            count: Optional function returning the total number of items, without consuming
+                the iterable, e.g. from the pagination details returned by the server.
+        """
         self._iterable = iter(iterable)
+        self._count = count
 
     def __iter__(self) -> Self:
         """Return the iterator."""
@@ -46,3 +77,226 @@ class IteratorResult(Iterator[ResultType]):
     def all(self) -> list[ResultType]:
         """Return all items from the iterable."""
         return list(self._iterable)
+
+    def count(self) -> int:
+        """Return the total number of items, without consuming the iterable.
+
+        The count includes the items already consumed.
+        """
+        if self._count is None:
+            raise IteratorResultError("The total number of items is not available.")
+        return self._count()
+
+    def batched(self, n: int) -> "IteratorResult[list[ResultType]]":
+        """Return an iterator over lists of at most n consecutive items."""
+        _check_positive("n", n)
+
+        def _batches() -> Iterator[list[ResultType]]:
+            while batch := list(islice(self._iterable, n)):
+                yield batch
+
+        return IteratorResult(_batches())
+
+    def map_concurrent(
+        self, fn: Callable[[ResultType], MappedType], *, max_workers: int, ordered: bool = True
+    ) -> "IteratorResult[MappedType]":
+        """Return an iterator over the results of fn applied to each item, in the same order.
+
+        The function is called in a pool of threads, and at most ``max_workers`` items are
+        consumed ahead of the results yielded, so that the memory usage is bounded.
+        If ``ordered`` is False, the results are yielded as soon as they're available instead,
+        so that a slow item doesn't delay the others.
+        """
+        _check_positive("max_workers", max_workers)
+
+        def _unordered_results() -> Iterator[MappedType]:
+            pending: set[Future[MappedType]] = set()
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                for item in self._iterable:
+                    pending.add(executor.submit(fn, item))
+                    if len(pending) >= max_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from (future.result() for future in done)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (future.result() for future in done)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        if not ordered:
+            return IteratorResult(_unordered_results())
+
+        def _results() -> Iterator[MappedType]:
+            pending: deque[Future[MappedType]] = deque()
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                for item in self._iterable:
+                    pending.append(executor.submit(fn, item))
+                    if len(pending) >= max_workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # don't wait for the results that the consumer won't need anymore
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return IteratorResult(_results())
+
+    def to_columns(self, fields: Sequence[str]) -> dict[str, list]:
+        """Consume the items and return the values of the given fields as columns.
+
+        Args:
+            fields: Names of the fields, possibly nested like ``subject.species.name``.
+                The missing values are None, and the values of the nested lists are lists.
+
+        Returns:
+            A dict with the list of values of each field, in the same order as the items.
+            The values of lazy models are read from the raw json, without validating the
+            models, and have the same types as the values of the validated models.
+        """
+        return columns.to_columns(self._iterable, fields)
+
+    def to_arrow(self, fields: Sequence[str]) -> Any:
+        """Consume the items and return the values of the given fields as a ``pyarrow.Table``.
+
+        The items are converted in batches, and pyarrow must be installed.
+        See ``to_columns`` for the description of the arguments.
+        """
+        return columns.to_arrow(self._iterable, fields)
+
+
+class AsyncIteratorResult(AsyncIterator[ResultType]):
+    """A result of an asynchronous iterator."""
+
+    def __init__(
+        self,
+        iterable: AsyncIterable[ResultType],
+        *,
+        count: Callable[[], Awaitable[int]] | None = None,
+    ) -> None:
+        """Initialize the asynchronous iterator result.
+
+        See ``IteratorResult`` for the description of the arguments.
+        """
+        self._iterable = aiter(iterable)
+        self._count = count
+
+    def __aiter__(self) -> Self:
+        """Return the asynchronous iterator."""
+        return self
+
+    async def __anext__(self) -> ResultType:
+        """Return the next element of the asynchronous iterable."""
+        return await anext(self._iterable)
+
+    async def first(self) -> ResultType | None:
+        """Return the first element of the iterable or None if empty."""
+        return await anext(self, None)
+
+    async def one(self) -> ResultType:
+        """Return exactly one item from the iterable or raise an error if not exactly one item."""
+        if (first_item := await self.first()) is None:
+            raise IteratorResultError("Iterable is empty.")
+        if await anext(self, None) is None:
+            return first_item
+        raise IteratorResultError("There are more than one items.")
+
+    async def one_or_none(self) -> ResultType | None:
+        """Return exactly one item from the iterable or None if empty."""
+        first_item = await self.first()
+        if await anext(self, None) is None:
+            return first_item
+        raise IteratorResultError("There are more than one items.")
+
+    async def all(self) -> list[ResultType]:
+        """Return all items from the iterable."""
+        return [item async for item in self._iterable]
+
+    async def count(self) -> int:
+        """Return the total number of items, without consuming the iterable."""
+        if self._count is None:
+            raise IteratorResultError("The total number of items is not available.")
+        return await self._count()
+
+    def batched(self, n: int) -> "AsyncIteratorResult[list[ResultType]]":
+        """Return an asynchronous iterator over lists of at most n consecutive items."""
+        _check_positive("n", n)
+
+        async def _batches() -> AsyncIterator[list[ResultType]]:
+            batch: list[ResultType] = []
+            async for item in self._iterable:
+                batch.append(item)
+                if len(batch) == n:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        return AsyncIteratorResult(_batches())
+
+    def map_concurrent(
+        self,
+        fn: Callable[[ResultType], Awaitable[MappedType]],
+        *,
+        max_workers: int,
+        ordered: bool = True,
+    ) -> "AsyncIteratorResult[MappedType]":
+        """Return an asynchronous iterator over the results of fn applied to each item.
+
+        The results are yielded in the same order as the items, or as soon as they're available
+        if ``ordered`` is False, and at most ``max_workers`` coroutines are running at the same
+        time.
+        """
+        _check_positive("max_workers", max_workers)
+
+        async def _unordered_results() -> AsyncIterator[MappedType]:
+            pending: set[asyncio.Future[MappedType]] = set()
+            try:
+                async for item in self._iterable:
+                    pending.add(asyncio.ensure_future(fn(item)))
+                    if len(pending) >= max_workers:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            yield task.result()
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        if not ordered:
+            return AsyncIteratorResult(_unordered_results())
+
+        async def _results() -> AsyncIterator[MappedType]:
+            pending: deque[asyncio.Task[MappedType]] = deque()
+            try:
+                async for item in self._iterable:
+                    pending.append(asyncio.ensure_future(fn(item)))
+                    if len(pending) >= max_workers:
+                        yield await pending.popleft()
+                while pending:
+                    yield await pending.popleft()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        return AsyncIteratorResult(_results())
+
+    async def to_columns(self, fields: Sequence[str]) -> dict[str, list]:
+        """Consume the items and return the values of the given fields as columns.
+
+        See ``IteratorResult.to_columns`` for the description of the arguments.
+        """
+        return await columns.async_to_columns(self._iterable, fields)
+
+    async def to_arrow(self, fields: Sequence[str]) -> Any:
+        """Consume the items and return the values of the given fields as a ``pyarrow.Table``.
+
+        See ``IteratorResult.to_columns`` for the description of the arguments.
+        """
+        return columns.columns_to_arrow(await self.to_columns(fields))
@@ -46,6 +46,20 @@ class MultipartDirectoryUploadTransferConfig(Schema):
     ] = 10
 
 
+class DownloadTransferConfig(Schema):
+    """Configuration for ranged downloads (file)."""
+
+    threshold: Annotated[
+        int, Field(description="Minimum size (in bytes) for ranged download.", ge=1)
+    ] = 64 * 1024**2
+    part_size: Annotated[
+        int, Field(description="Size (in bytes) of the range fetched by each request.", ge=1)
+    ] = 16 * 1024**2
+    max_concurrency: Annotated[
+        int, Field(description="Maximum number of ranges fetched concurrently.", ge=1)
+    ] = 8
+
+
 class PartUpload(Schema):
     """Multipart upload part."""
 
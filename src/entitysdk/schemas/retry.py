@@ -0,0 +1,48 @@
+"""Retry related schemas."""
+
+from typing import Annotated
+
+from pydantic import Field
+
+from entitysdk.config import settings
+from entitysdk.schemas.base import Schema
+
+
+class RetryPolicy(Schema):
+    """Policy for retrying the failed requests to entitycore.
+
+    The default values of the numeric fields are taken from the settings.
+    """
+
+    max_retries: Annotated[
+        int,
+        Field(
+            description="Maximum number of times a failed request is retried.",
+            ge=0,
+        ),
+    ] = Field(default_factory=lambda: settings.max_retries)
+    backoff_base: Annotated[
+        float,
+        Field(
+            description="Base delay of the exponential backoff between retries, in seconds.",
+            ge=0,
+        ),
+    ] = Field(default_factory=lambda: settings.retry_backoff_base)
+    backoff_max: Annotated[
+        float,
+        Field(
+            description=(
+                "Maximum delay between retries, in seconds. "
+                "It caps the delay requested by the server with Retry-After too."
+            ),
+            ge=0,
+        ),
+    ] = Field(default_factory=lambda: settings.retry_backoff_max)
+    retry_statuses: Annotated[
+        frozenset[int],
+        Field(description="HTTP status codes of the responses that can be retried."),
+    ] = frozenset({429, 502, 503, 504})
+    idempotent_methods: Annotated[
+        frozenset[str],
+        Field(description="HTTP methods that are retried unless the caller says otherwise."),
+    ] = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
@@ -1,12 +1,15 @@
 """Serialization and deserialization of entities."""
 
-from typing import TypeVar
+from functools import cache
+from typing import Literal, TypeVar
 
 from pydantic import TypeAdapter
 
 from entitysdk.config import settings
 from entitysdk.models.activity import Activity
 from entitysdk.models.base import BaseModel
+from entitysdk.models.projection import Projection
+from entitysdk.models.response import ListResponse
 
 SERIALIZATION_EXCLUDE_KEYS = {
     "assets",
@@ -25,8 +28,36 @@ def deserialize_model(json_data: dict, entity_type: type[TBaseModel]) -> TBaseMo
 
     The presence of extra fields can be tolerated only during the deserialization
     and not in the model itself, accordingly to settings.deserialize_model_extra.
+    The fields not selected in projections are always ignored.
     """
-    return entity_type.model_validate(json_data, extra=settings.deserialize_model_extra)
+    return entity_type.model_validate(json_data, extra=_extra(entity_type))
+
+
+def deserialize_model_json(json_data: str | bytes, entity_type: type[TBaseModel]) -> TBaseModel:
+    """Deserialize raw json into entity, handling the extra fields as in deserialize_model."""
+    return entity_type.model_validate_json(json_data, extra=_extra(entity_type))
+
+
+def deserialize_list_response_json(
+    json_data: str | bytes, entity_type: type[TBaseModel]
+) -> ListResponse[TBaseModel]:
+    """Deserialize a json page returned by entitycore, validating the items into entity_type.
+
+    The raw json is validated in a single pass, without building the intermediate dicts.
+    Extra fields are handled as in ``deserialize_model``.
+    """
+    return _list_response_adapter(entity_type).validate_json(json_data, extra=_extra(entity_type))
+
+
+def _extra(entity_type: type[BaseModel]) -> Literal["ignore", "forbid"]:
+    if issubclass(entity_type, Projection):
+        return "ignore"
+    return settings.deserialize_model_extra
+
+
+@cache
+def _list_response_adapter(entity_type: type[TBaseModel]) -> TypeAdapter[ListResponse[TBaseModel]]:
+    return TypeAdapter(ListResponse[entity_type])  # type: ignore[valid-type]
 
 
 def serialize_model(model: BaseModel) -> dict:
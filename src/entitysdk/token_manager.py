@@ -1,12 +1,20 @@
 """Token manager module."""
 
+import base64
+import json
+import logging
+import math
 import os
+import threading
+import time
 from collections.abc import Callable
 from typing import Protocol
 
 from entitysdk.exception import EntitySDKError
 from entitysdk.types import Token
 
+L = logging.getLogger(__name__)
+
 
 class TokenManager(Protocol):
     """Protocol for token managers."""
@@ -55,3 +63,114 @@ class TokenFromFunction:
     def get_token(self) -> Token:
         """Get the token by calling the function."""
         return self._function()
+
+
+def _jwt_expiration(token: Token) -> float | None:
+    """Return the expiration timestamp of a JWT, or None if it can't be determined.
+
+    The signature isn't verified, since the token is only forwarded to the server.
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, ValueError, KeyError, TypeError):
+        return None
+
+
+class CachingTokenManager:
+    """Token manager that caches the tokens of another token manager until they expire.
+
+    The expiration is read from the ``exp`` claim of the JWT. The token is refreshed
+    ``refresh_margin`` seconds before it expires, by a single thread at a time, while the other
+    threads wait for the new token.
+
+    If ``pre_refresh`` is given, the token is refreshed in a background thread ``pre_refresh``
+    seconds before it needs to be refreshed, and the cached token is returned in the meantime,
+    so that the requests don't need to wait for the authentication.
+    """
+
+    def __init__(
+        self,
+        token_manager: TokenManager,
+        *,
+        refresh_margin: float = 60,
+        pre_refresh: float | None = None,
+        fallback_ttl: float = 60,
+    ) -> None:
+        """Initialize token manager.
+
+        Args:
+            token_manager: Token manager issuing the tokens.
+            refresh_margin: Time in seconds before the expiration when the token is refreshed.
+            pre_refresh: Time in seconds before the refresh when the token is refreshed in a
+                background thread, or None to disable the background refresh.
+            fallback_ttl: Time in seconds during which a token without expiration is cached.
+        """
+        self._token_manager = token_manager
+        self._refresh_margin = refresh_margin
+        self._pre_refresh = pre_refresh
+        self._fallback_ttl = fallback_ttl
+        self._lock = threading.Lock()
+        self._background_lock = threading.Lock()
+        self._token: Token | None = None
+        self._refresh_at = -math.inf
+        self._pre_refresh_at = -math.inf
+        self._background: threading.Thread | None = None
+        self.refreshes = 0
+
+    def get_token(self) -> Token:
+        """Return the cached token, refreshing it if needed."""
+        token, now = self._token, time.time()
+        if token is not None and now < self._refresh_at:
+            if now >= self._pre_refresh_at:
+                self._start_background_refresh()
+            return token
+        with self._lock:
+            # the token may have been refreshed by another thread while waiting for the lock
+            if self._token is None or time.time() >= self._refresh_at:
+                self._refresh()
+            return self._token  # type: ignore[return-value]
+
+    def invalidate(self) -> None:
+        """Discard the cached token, so that it's refreshed at the next request."""
+        with self._lock:
+            self._token = None
+
+    def _refresh(self) -> None:
+        """Get a new token. Must be called with the lock held."""
+        token = self._token_manager.get_token()
+        now = time.time()
+        expires_at = _jwt_expiration(token)
+        if expires_at is None:
+            self._refresh_at = now + self._fallback_ttl
+        else:
+            self._refresh_at = expires_at - self._refresh_margin
+        self._pre_refresh_at = (
+            math.inf if self._pre_refresh is None else self._refresh_at - self._pre_refresh
+        )
+        self._token = token
+        self.refreshes += 1
+
+    def _start_background_refresh(self) -> None:
+        """Start a background thread refreshing the token, unless it's already running."""
+        # a different lock is used, to avoid waiting for the refresh in progress
+        with self._background_lock:
+            if self._background is not None or time.time() < self._pre_refresh_at:
+                return
+            self._background = threading.Thread(
+                target=self._background_refresh, name="token-refresh", daemon=True
+            )
+            self._background.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                self._refresh()
+        except Exception:
+            # the token will be refreshed by the next request needing it
+            L.warning("Failed to refresh the token in the background", exc_info=True)
+            with self._lock:
+                self._pre_refresh_at = math.inf
+        finally:
+            self._background = None
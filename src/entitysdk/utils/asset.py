@@ -1,10 +1,12 @@
 """Asset related utitilies."""
 
+from collections.abc import Sequence
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import Any
 
 from entitysdk.exception import EntitySDKError
-from entitysdk.models.asset import Asset
+from entitysdk.models.asset import Asset, DetailedFile
 
 
 def filter_assets(assets: list[Asset], selection: dict[str, Any]) -> list[Asset]:
@@ -32,6 +34,41 @@ def filter_assets(assets: list[Asset], selection: dict[str, Any]) -> list[Asset]
     return [asset for asset in assets if _selection_predicate(asset)]
 
 
+def filter_directory_files(
+    files: dict[Path, DetailedFile],
+    *,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] | None = None,
+    max_file_size: int | None = None,
+) -> dict[Path, DetailedFile]:
+    """Filter the files of a directory listing by glob patterns and size.
+
+    The patterns are matched with fnmatch against the paths relative to the directory, written
+    with forward slashes, so ``*`` also matches ``/``: ``*.json`` selects the json files at any
+    depth, and ``edges/*`` everything under ``edges``.
+
+    Args:
+        files: Mapping of the paths in the directory to their details.
+        include: If given, keep only the files matching at least one of these patterns.
+        exclude: Remove the files matching any of these patterns, even if included.
+        max_file_size: If given, remove the files larger than this size in bytes.
+
+    Returns:
+        The selected files, in the order of the listing.
+    """
+
+    def _matches(path: str, patterns: Sequence[str]) -> bool:
+        return any(fnmatchcase(path, pattern) for pattern in patterns)
+
+    return {
+        path: file
+        for path, file in files.items()
+        if (include is None or _matches(path.as_posix(), include))
+        and not (exclude and _matches(path.as_posix(), exclude))
+        and (max_file_size is None or file.size <= max_file_size)
+    }
+
+
 def resolve_asset_path(asset: Asset, directory_file: Path | None = None) -> Path:
     """Resolve asset path."""
     file_path = Path(asset.storage_type, asset.full_path)
@@ -0,0 +1,43 @@
+"""Helpers for the requests of batches of entities."""
+
+from collections.abc import Iterable, Iterator, Sequence
+
+from entitysdk.exception import EntitiesNotFoundError
+from entitysdk.models.types import TIdentifiable
+from entitysdk.types import ID
+
+
+def chunked(items: Sequence[ID], size: int) -> Iterator[Sequence[ID]]:
+    """Split the items into chunks of at most the given size."""
+    if size < 1:
+        raise ValueError("size must be strictly positive")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def id_filter(entity_ids: Iterable[ID]) -> dict[str, str]:
+    """Return the query parameters selecting the entities with the given ids."""
+    return {"id__in": ",".join(map(str, entity_ids))}
+
+
+def sort_by_ids(
+    entity_ids: Sequence[ID],
+    entities: Iterable[TIdentifiable],
+    *,
+    missing_ok: bool,
+) -> list[TIdentifiable]:
+    """Return the entities in the same order as the given ids.
+
+    Args:
+        entity_ids: Requested ids, possibly repeated.
+        entities: Retrieved entities, in any order.
+        missing_ok: If True, the entities not found are skipped.
+
+    Raises:
+        EntitiesNotFoundError: If some entities are not found and missing_ok is False.
+    """
+    entities_by_id = {entity.id: entity for entity in entities}
+    missing_ids = list(dict.fromkeys(i for i in entity_ids if i not in entities_by_id))
+    if missing_ids and not missing_ok:
+        raise EntitiesNotFoundError(missing_ids)
+    return [entities_by_id[i] for i in entity_ids if i in entities_by_id]
@@ -0,0 +1,603 @@
+"""Caching of entities, metadata and downloaded files."""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+import httpx
+
+from entitysdk.common import ProjectContext
+from entitysdk.models.asset import Asset, DetailedFile
+from entitysdk.models.core import Identifiable
+from entitysdk.models.types import TIdentifiable
+from entitysdk.types import StrOrPath
+from entitysdk.utils.io import calculate_sha256_digest
+
+L = logging.getLogger(__name__)
+
+# ioctl request cloning a file on Linux, see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
+# entity type, entity id, project id and admin flag
+_CacheKey = tuple[type[Identifiable], UUID, UUID | None, bool]
+
+
+def _cache_key(
+    entity_type: type[Identifiable],
+    entity_id: UUID,
+    project_context: ProjectContext | None,
+    admin: bool,
+) -> _CacheKey:
+    # the virtual lab is determined by the project, so it's not needed in the key
+    project_id = project_context.project_id if project_context else None
+    return entity_type, entity_id, project_id, admin
+
+
+class EntityCache:
+    """Thread safe LRU cache of entities, with an optional time to live.
+
+    The entities are keyed by type, id, project context and admin flag, because the same id
+    can be retrieved with different models and the visibility depends on the context.
+    """
+
+    def __init__(self, *, max_size: int = 1024, ttl: float | None = 300) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entities kept in the cache.
+            ttl: Time to live of the entities in seconds, or None to keep them until evicted.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be strictly positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[_CacheKey, tuple[float, Identifiable]] = OrderedDict()
+        self._keys_by_id: dict[UUID, set[_CacheKey]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached entities, including the expired ones not evicted yet."""
+        return len(self._entries)
+
+    def get(
+        self,
+        entity_id: UUID,
+        *,
+        entity_type: type[TIdentifiable],
+        project_context: ProjectContext | None,
+        admin: bool,
+    ) -> TIdentifiable | None:
+        """Return the cached entity, or None if it's missing or expired."""
+        key = _cache_key(entity_type, entity_id, project_context, admin)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, entity = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entity  # type: ignore[return-value]
+
+    def put(
+        self,
+        entity: Identifiable,
+        *,
+        entity_type: type[Identifiable],
+        project_context: ProjectContext | None,
+        admin: bool,
+    ) -> None:
+        """Add an entity to the cache, evicting the least recently used ones if needed."""
+        if entity.id is None:
+            return
+        key = _cache_key(entity_type, entity.id, project_context, admin)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, entity)
+            self._entries.move_to_end(key)
+            self._keys_by_id.setdefault(entity.id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, entity_id: UUID) -> None:
+        """Remove the entity from the cache, for any type and context."""
+        with self._lock:
+            for key in self._keys_by_id.get(entity_id, set()).copy():
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all the entities from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def _remove(self, key: _CacheKey) -> None:
+        """Remove a key from the cache. Must be called with the lock held."""
+        self._entries.pop(key)
+        entity_id = key[1]
+        keys = self._keys_by_id[entity_id]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_id[entity_id]
+
+
+class MetadataCache:
+    """Persistent cache of the raw metadata returned by entitycore, stored in SQLite.
+
+    The payloads are keyed by url and project, and stamped with their ``update_date`` when
+    available, so that a payload is never replaced by an older version of the same resource.
+    The least recently used payloads are evicted when the size caps are exceeded.
+
+    The payloads aren't revalidated with the service, so the changes made by other clients are
+    only visible after the ``ttl`` expires, while the changes made through the same client
+    invalidate the cached payloads of the entity immediately.
+
+    The database can be shared by several threads and processes.
+    """
+
+    def __init__(
+        self,
+        path: StrOrPath,
+        *,
+        max_entries: int = 100_000,
+        max_bytes: int = 256 * 1024**2,
+        ttl: float | None = 300,
+        timeout: float = 30,
+    ) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file.
+            max_entries: Maximum number of payloads kept in the cache.
+            max_bytes: Maximum total size in bytes of the payloads kept in the cache.
+            ttl: Time to live of the payloads in seconds, or None to keep them until evicted.
+                It's the maximum time during which the changes of other clients are not seen.
+            timeout: Time in seconds to wait for a lock held by another connection.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be strictly positive")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "key TEXT PRIMARY KEY, "
+                "entity_id TEXT NOT NULL, "
+                "payload BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "update_date TEXT, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS metadata_entity_id ON metadata(entity_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS metadata_accessed_at ON metadata(accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection, committing the transaction on exit."""
+        with closing(sqlite3.connect(self.path, timeout=self.timeout)) as conn:
+            with conn:
+                yield conn
+
+    @staticmethod
+    def _key(url: str, project_context: ProjectContext | None) -> str:
+        project_id = project_context.project_id if project_context else ""
+        return f"{url}#{project_id}"
+
+    def get(self, url: str, *, project_context: ProjectContext | None) -> bytes | None:
+        """Return the cached payload, or None if it's missing or expired."""
+        key = self._key(url, project_context)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, created_at FROM metadata WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (self.ttl is not None and row[1] + self.ttl < now):
+                self.misses += 1
+                return None
+            conn.execute("UPDATE metadata SET accessed_at = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return row[0]
+
+    def put(
+        self,
+        url: str,
+        payload: bytes,
+        *,
+        project_context: ProjectContext | None,
+        entity_id: UUID,
+        update_date: str | None = None,
+    ) -> None:
+        """Store a payload, unless a more recent version is already cached."""
+        key = self._key(url, project_context)
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "payload = excluded.payload, size = excluded.size, "
+                "update_date = excluded.update_date, "
+                "created_at = excluded.created_at, accessed_at = excluded.accessed_at "
+                "WHERE excluded.update_date IS NULL OR metadata.update_date IS NULL "
+                "OR excluded.update_date >= metadata.update_date",
+                (key, str(entity_id), payload, len(payload), update_date, now, now),
+            )
+            self._evict(conn)
+
+    def put_response(
+        self,
+        url: str,
+        response: httpx.Response,
+        json_data: Any,
+        *,
+        project_context: ProjectContext | None,
+        entity_id: UUID,
+    ) -> None:
+        """Store the payload of a response, stamped with its update_date if any.
+
+        ``json_data`` is the payload already decoded by the caller, used to read the update_date.
+        """
+        update_date = json_data.get("update_date") if isinstance(json_data, dict) else None
+        self.put(
+            url,
+            response.content,
+            project_context=project_context,
+            entity_id=entity_id,
+            update_date=update_date,
+        )
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Evict the least recently used payloads exceeding the size caps."""
+        conn.execute(
+            "DELETE FROM metadata WHERE key IN ("
+            "SELECT key FROM ("
+            "SELECT key, "
+            "ROW_NUMBER() OVER (ORDER BY accessed_at DESC) AS number, "
+            "SUM(size) OVER (ORDER BY accessed_at DESC ROWS UNBOUNDED PRECEDING) AS total "
+            "FROM metadata) "
+            "WHERE number > ? OR total > ?)",
+            (self.max_entries, self.max_bytes),
+        )
+
+    def invalidate(self, entity_id: UUID) -> None:
+        """Remove the payloads of an entity, including the ones of its assets."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM metadata WHERE entity_id = ?", (str(entity_id),))
+
+    def clear(self) -> None:
+        """Remove all the payloads from the cache."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM metadata")
+
+    def __len__(self) -> int:
+        """Return the number of cached payloads, including the expired ones."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+
+
+class DigestCache:
+    """Persistent cache of the sha256 digests of local files, stored in SQLite.
+
+    The digests are keyed by the absolute path of the files, and are valid as long as the size
+    and the modification time of the files are unchanged, so that the unchanged files are not
+    hashed again.
+
+    The database can be shared by several threads and processes.
+    """
+
+    def __init__(self, path: StrOrPath, *, timeout: float = 30) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file.
+            timeout: Time in seconds to wait for a lock held by another connection.
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS digests ("
+                "path TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, "
+                "sha256_digest TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection, committing the transaction on exit."""
+        with closing(sqlite3.connect(self.path, timeout=self.timeout)) as conn:
+            with conn:
+                yield conn
+
+    def get(self, file_path: StrOrPath) -> str | None:
+        """Return the cached digest of a file, or None if it's missing or the file changed."""
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT sha256_digest FROM digests WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (str(path), stat.st_size, stat.st_mtime_ns),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, file_path: StrOrPath, sha256_digest: str) -> None:
+        """Store the digest of a file, with its current size and modification time."""
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?)",
+                (str(path), stat.st_size, stat.st_mtime_ns, sha256_digest),
+            )
+
+    def digest(self, file_path: StrOrPath) -> str:
+        """Return the digest of a file, calculating and storing it if not cached."""
+        if (sha256_digest := self.get(file_path)) is None:
+            sha256_digest = calculate_sha256_digest(Path(file_path))
+            self.put(file_path, sha256_digest)
+        return sha256_digest
+
+    def clear(self) -> None:
+        """Remove all the digests from the cache."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM digests")
+
+    def __len__(self) -> int:
+        """Return the number of cached digests."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM digests").fetchone()[0]
+
+
+def content_key(
+    asset: Asset, *, asset_path: Path | None = None, file_info: DetailedFile | None = None
+) -> str | None:
+    """Return the key of the content of an asset file in the content cache, if any.
+
+    The key of a file asset is its sha256 digest. The files of a directory asset have no digest,
+    so their key is derived from their storage path, size and modification date instead.
+    """
+    if not asset.is_directory:
+        return asset.sha256_digest
+    if asset_path is None or file_info is None:
+        return None
+    identity = f"{asset.full_path}/{asset_path}\0{file_info.size}\0{file_info.last_modified}"
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+class ContentCache:
+    """Persistent content-addressed cache of downloaded files, with a size cap and LRU eviction.
+
+    The files are stored under ``<path>/objects`` by key, usually the sha256 digest of their
+    content, and indexed in SQLite with their size and last access time. A file is written to a
+    temporary file and renamed into place before being indexed, so an interrupted write never
+    leaves a partial file in the cache. The files are materialized with a copy-on-write reflink
+    when the filesystem supports it, or copied otherwise. Hard links can be enabled to avoid the
+    copies, in which case the materialized files share the read-only cached files.
+
+    The cache can be shared by several threads and processes.
+    """
+
+    def __init__(
+        self,
+        path: StrOrPath,
+        *,
+        max_bytes: int = 10 * 1024**3,
+        hardlink: bool = False,
+        timeout: float = 30,
+    ) -> None:
+        """Initialize the cache, creating the directory and the database if needed.
+
+        Args:
+            path: Path to the cache directory.
+            max_bytes: Maximum total size in bytes of the cached files.
+            hardlink: Whether to materialize the files by hard link when possible, instead of
+                cloning them with a reflink or copying them. The hard links are read-only, and
+                removing the file from the cache doesn't free its space while they exist.
+            timeout: Time in seconds to wait for a lock held by another connection.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be strictly positive")
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hardlink = hardlink
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        (self.path / "objects").mkdir(parents=True, exist_ok=True)
+        (self.path / "tmp").mkdir(exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS contents ("
+                "key TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS contents_accessed_at ON contents(accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection, committing the transaction on exit."""
+        with closing(sqlite3.connect(self.path / "index.db", timeout=self.timeout)) as conn:
+            with conn:
+                yield conn
+
+    def _object_path(self, key: str) -> Path:
+        return self.path / "objects" / key[:2] / key
+
+    def get(self, key: str) -> Path | None:
+        """Return the path of a cached file, or None if it's missing."""
+        object_path = self._object_path(key)
+        with self._connect() as conn:
+            row = conn.execute("SELECT size FROM contents WHERE key = ?", (key,)).fetchone()
+            if row is not None and object_path.exists():
+                conn.execute(
+                    "UPDATE contents SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+            elif row is not None:
+                conn.execute("DELETE FROM contents WHERE key = ?", (key,))
+                row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return object_path
+
+    def materialize(self, key: str, target_path: Path) -> Path | None:
+        """Create ``target_path`` from a cached file, and return it, or None if not cached."""
+        if (object_path := self.get(key)) is None:
+            return None
+        tmp_path = target_path.with_name(f".{target_path.name}.{uuid4().hex}.tmp")
+        try:
+            if not (self.hardlink and _hardlink(object_path, tmp_path)):
+                _reflink_or_copy(object_path, tmp_path)
+            os.replace(tmp_path, target_path)
+        except FileNotFoundError:
+            # evicted concurrently
+            tmp_path.unlink(missing_ok=True)
+            return None
+        return target_path
+
+    def put(
+        self,
+        key: str,
+        source_path: Path,
+        *,
+        sha256_digest: str | None = None,
+        verified: bool = False,
+    ) -> Path | None:
+        """Store a copy of a file, and return its path in the cache.
+
+        The file isn't stored if it's larger than the cache, or if it doesn't have the given
+        sha256 digest, and None is returned. If ``verified`` is True, the digest has already
+        been verified by the caller, e.g. while downloading the file, and it isn't computed again.
+        """
+        size = source_path.stat().st_size
+        if size > self.max_bytes:
+            return None
+        if (
+            sha256_digest is not None
+            and not verified
+            and calculate_sha256_digest(source_path) != sha256_digest
+        ):
+            L.warning("Not caching %s, because its sha256 digest is unexpected", source_path)
+            return None
+        object_path = self._object_path(key)
+        object_path.parent.mkdir(exist_ok=True)
+        tmp_path = self.path / "tmp" / f"{key}.{uuid4().hex}"
+        try:
+            _reflink_or_copy(source_path, tmp_path)
+            tmp_path.chmod(0o444)
+            os.replace(tmp_path, object_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO contents VALUES (?, ?, ?)", (key, size, time.time())
+            )
+            self._evict(conn)
+        return object_path
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Evict the least recently used files exceeding the size cap."""
+        keys = [
+            key
+            for (key,) in conn.execute(
+                "SELECT key FROM ("
+                "SELECT key, "
+                "SUM(size) OVER (ORDER BY accessed_at DESC ROWS UNBOUNDED PRECEDING) AS total "
+                "FROM contents) "
+                "WHERE total > ?",
+                (self.max_bytes,),
+            )
+        ]
+        for key in keys:
+            conn.execute("DELETE FROM contents WHERE key = ?", (key,))
+            self._object_path(key).unlink(missing_ok=True)
+        self.evictions += len(keys)
+
+    @property
+    def size(self) -> int:
+        """Return the total size in bytes of the cached files."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM contents").fetchone()[0]
+
+    def stats(self) -> dict[str, int]:
+        """Return the number and size of the cached files, and the counters of this instance."""
+        return {
+            "entries": len(self),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Remove all the files from the cache."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM contents")
+        shutil.rmtree(self.path / "objects", ignore_errors=True)
+        (self.path / "objects").mkdir(exist_ok=True)
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM contents").fetchone()[0]
+
+
+def _hardlink(source: Path, target: Path) -> bool:
+    """Create a hard link, and return whether it's been possible."""
+    try:
+        os.link(source, target)
+    except OSError:
+        return False
+    return True
+
+
+def _reflink_or_copy(source: Path, target: Path) -> None:
+    """Clone a file with a copy-on-write reflink if supported, or copy it otherwise."""
+    if sys.platform == "linux":
+        import fcntl
+
+        with source.open("rb") as src, target.open("wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                return
+            except OSError:
+                pass
+    shutil.copyfile(source, target)
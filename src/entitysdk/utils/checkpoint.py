@@ -0,0 +1,241 @@
+"""Checkpoints of partial downloads, to resume them after an interruption."""
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+from entitysdk.exception import EntitySDKError
+from entitysdk.utils.io import calculate_sha256_digest, load_json, write_json
+
+L = logging.getLogger(__name__)
+
+PART_SUFFIX = ".part"
+SIDECAR_SUFFIX = ".part.json"
+
+# number of bytes streamed between two saves of the checkpoint
+CHECKPOINT_INTERVAL = 16 * 1024 * 1024
+
+
+class DownloadCheckpoint:
+    """Partial download of a file, with a sidecar recording the byte ranges already fetched.
+
+    The bytes are written to ``<target>.part``, and the fetched ranges to ``<target>.part.json``,
+    together with the expected size and sha256 digest of the file. A checkpoint left by an
+    interrupted download is resumed only if the expected size is known and both the size and the
+    digest are unchanged, otherwise the download starts over.
+
+    The file is renamed atomically to the target path once complete, after verifying its size
+    and, if known, its digest. The digest of a file streamed from the start is computed while
+    writing it, otherwise the file is read again.
+    """
+
+    def __init__(self, target_path: Path, *, size: int | None, sha256_digest: str | None) -> None:
+        """Initialize the checkpoint, loading the sidecar of a previous download if any.
+
+        Args:
+            target_path: Final path of the downloaded file.
+            size: Expected size of the file in bytes, if known.
+            sha256_digest: Expected sha256 digest of the file, if known.
+        """
+        self.target_path = target_path
+        self.part_path = target_path.with_name(target_path.name + PART_SUFFIX)
+        self.sidecar_path = target_path.with_name(target_path.name + SIDECAR_SUFFIX)
+        self.size = size
+        self.sha256_digest = sha256_digest
+        self.completed: list[tuple[int, int]] = []
+        self.resumed = False
+        # digest of the committed file, if computed while writing it or to verify it
+        self.digest: str | None = None
+        self._streamed_digest: str | None = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.sidecar_path.exists():
+            return
+        completed: list[tuple[int, int]] = []
+        try:
+            state = load_json(self.sidecar_path)
+            completed = [(int(start), int(end)) for start, end in state["completed"]]
+            resumable = (
+                self.size is not None
+                and self.part_path.exists()
+                and (state["size"], state["sha256_digest"]) == (self.size, self.sha256_digest)
+            )
+        except (ValueError, TypeError, KeyError) as e:
+            L.warning("Ignoring the invalid download checkpoint %s: %s", self.sidecar_path, e)
+            resumable = False
+        if not resumable:
+            self.discard()
+            return
+        self.completed = _merge(completed)
+        self.resumed = bool(self.completed)
+        L.info("Resuming the download of %s from %d bytes", self.target_path, self.fetched)
+
+    @property
+    def fetched(self) -> int:
+        """Number of bytes already fetched."""
+        return sum(end - start + 1 for start, end in self.completed)
+
+    @property
+    def offset(self) -> int:
+        """Number of bytes already fetched at the start of the file."""
+        if self.completed and self.completed[0][0] == 0:
+            return self.completed[0][1] + 1
+        return 0
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether all the bytes of a file of known size have been fetched."""
+        return self.size is not None and self.part_path.exists() and self.offset == self.size
+
+    @property
+    def expected_size(self) -> int:
+        """Expected size of the file, required to resume the download.
+
+        Raises:
+            EntitySDKError: If the expected size is unknown.
+        """
+        if self.size is None:
+            raise EntitySDKError(f"The expected size of {self.target_path} is unknown")
+        return self.size
+
+    def missing_ranges(self, part_size: int) -> list[tuple[int, int]]:
+        """Return the inclusive byte ranges of at most ``part_size`` bytes not fetched yet."""
+        size = self.expected_size
+        ranges = []
+        position = 0
+        for start, end in [*self.completed, (size, size)]:
+            ranges.extend(
+                (offset, min(offset + part_size, start) - 1)
+                for offset in range(position, start, part_size)
+            )
+            position = end + 1
+        return ranges
+
+    def preallocate(self) -> None:
+        """Create the partial file with the expected size, keeping the bytes already fetched."""
+        size = self.expected_size
+        self._streamed_digest = None
+        self.part_path.touch()
+        os.truncate(self.part_path, size)
+
+    def add(self, start: int, end: int) -> None:
+        """Record the inclusive byte range [start, end] as fetched."""
+        with self._lock:
+            self.completed = _merge([*self.completed, (start, end)])
+            self._save()
+
+    @contextmanager
+    def open_stream(self, offset: int = 0) -> Iterator["_StreamWriter"]:
+        """Open the partial file for sequential writes from ``offset``.
+
+        The bytes after ``offset`` are discarded, and the progress is saved periodically, and
+        when the context exits, even on error.
+        """
+        with self._lock:
+            self.completed = [(0, offset - 1)] if offset else []
+            self.resumed = self.resumed and bool(offset)
+            self._streamed_digest = None
+            self._save()
+        with self.part_path.open("r+b" if offset else "wb") as f:
+            f.truncate(offset)
+            f.seek(offset)
+            writer = _StreamWriter(self, f, offset)
+            try:
+                yield writer
+            finally:
+                writer.save()
+        self._streamed_digest = writer.digest
+
+    def commit(self) -> Path:
+        """Verify the downloaded file, and rename it atomically to the target path.
+
+        Raises:
+            EntitySDKError: If the size or the digest of the file doesn't match the expected one.
+        """
+        self.part_path.touch()
+        self._verify()
+        os.replace(self.part_path, self.target_path)
+        self.sidecar_path.unlink(missing_ok=True)
+        return self.target_path
+
+    def _verify(self) -> None:
+        if self.size is not None and (size := self.part_path.stat().st_size) != self.size:
+            self.discard()
+            raise EntitySDKError(
+                f"Downloaded {size} bytes for {self.target_path}, expected {self.size} bytes"
+            )
+        digest = self._streamed_digest
+        if self.sha256_digest:
+            digest = digest or calculate_sha256_digest(self.part_path)
+            if digest != self.sha256_digest:
+                self.discard()
+                raise EntitySDKError(
+                    f"Downloaded {self.target_path} with an unexpected sha256 digest"
+                )
+        self.digest = digest
+
+    def discard(self) -> None:
+        """Remove the partial file and its sidecar."""
+        self.completed = []
+        self.part_path.unlink(missing_ok=True)
+        self.sidecar_path.unlink(missing_ok=True)
+
+    def _save(self) -> None:
+        if self.size is None:
+            # without the expected size, the download can't be resumed
+            return
+        tmp_path = self.sidecar_path.with_name(self.sidecar_path.name + ".tmp")
+        write_json(
+            {"size": self.size, "sha256_digest": self.sha256_digest, "completed": self.completed},
+            tmp_path,
+        )
+        os.replace(tmp_path, self.sidecar_path)
+
+
+class _StreamWriter:
+    """Sequential writer of a partial file, saving the progress of the checkpoint periodically."""
+
+    def __init__(self, checkpoint: DownloadCheckpoint, f: BinaryIO, offset: int) -> None:
+        self._checkpoint = checkpoint
+        self._file = f
+        self._position = offset
+        self._saved = offset
+        # the digest can be computed while writing only if all the bytes are written
+        self._hash = hashlib.sha256() if offset == 0 else None
+
+    @property
+    def digest(self) -> str | None:
+        """Return the sha256 digest of the bytes written from the start, or None."""
+        return None if self._hash is None else self._hash.hexdigest()
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+        self._position += len(chunk)
+        if self._position - self._saved >= CHECKPOINT_INTERVAL:
+            self.save()
+
+    def save(self) -> None:
+        if self._position > self._saved:
+            self._file.flush()
+            self._checkpoint.add(self._saved, self._position - 1)
+            self._saved = self._position
+
+
+def _merge(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return the sorted union of inclusive byte ranges."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
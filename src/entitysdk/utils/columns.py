@@ -0,0 +1,145 @@
+"""Columnar export of entities."""
+
+from collections.abc import AsyncIterable, Iterable, Sequence
+from functools import cache
+from itertools import islice
+from typing import Any, get_args
+
+from pydantic import BaseModel, TypeAdapter
+
+from entitysdk.exception import DependencyError
+from entitysdk.models.lazy import LazyModel, _field_adapter
+
+# number of rows converted at once to an arrow record batch
+ARROW_BATCH_SIZE = 10_000
+
+
+def get_path(item: Any, path: str) -> Any:
+    """Return the value of a dotted path, like ``brain_region.acronym``, or None if missing.
+
+    The raw json of lazy models is read without validating the models, and only the values
+    found are validated with the type of their field, so that they are the same as the values
+    of the validated models.
+    When a list is traversed, the list of the values of its elements is returned.
+    """
+    if isinstance(item, LazyModel):
+        return _get_raw_path(item.raw, path.split("."), (item.model,))
+    value = item
+    for key in path.split("."):
+        value = _get_key(value, key)
+    return value
+
+
+def _get_raw_path(value: Any, keys: list[str], models: tuple[type[BaseModel], ...]) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [_get_raw_path(element, keys, models) for element in value]
+    if not isinstance(value, dict):
+        return None
+    key, *keys = keys
+    value = value.get(key)
+    if keys:
+        return _get_raw_path(value, keys, _field_models(models, key))
+    if value is None or (adapter := _leaf_adapter(models, key)) is None:
+        return value
+    return adapter.validate_python(value)
+
+
+@cache
+def _field_models(models: tuple[type[BaseModel], ...], name: str) -> tuple[type[BaseModel], ...]:
+    """Return the models of a field, unwrapping the optional, union and list types."""
+    result: dict[type[BaseModel], None] = {}
+    annotations = [m.model_fields[name].annotation for m in models if name in m.model_fields]
+    while annotations:
+        annotation = annotations.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            result[annotation] = None
+        else:
+            annotations.extend(get_args(annotation))
+    return tuple(result)
+
+
+@cache
+def _leaf_adapter(models: tuple[type[BaseModel], ...], name: str) -> TypeAdapter | None:
+    """Return the adapter of a field, or None if the type of the field isn't known.
+
+    With a union of models, the field must have the same type in all of them.
+    """
+    fields = [m.model_fields[name] for m in models if name in m.model_fields]
+    if not fields or any(
+        (f.annotation, f.metadata) != (fields[0].annotation, fields[0].metadata) for f in fields
+    ):
+        return None
+    return _field_adapter(next(m for m in models if name in m.model_fields), name)
+
+
+def _get_key(value: Any, key: str) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [_get_key(element, key) for element in value]
+    if isinstance(value, dict):
+        return value.get(key)
+    if isinstance(value, BaseModel | LazyModel):
+        return getattr(value, key, None)
+    return None
+
+
+def _rows_to_columns(rows: Iterable[Any], fields: Sequence[str]) -> dict[str, list]:
+    columns: dict[str, list] = {field: [] for field in fields}
+    for row in rows:
+        for field, column in columns.items():
+            column.append(get_path(row, field))
+    return columns
+
+
+def to_columns(items: Iterable[Any], fields: Sequence[str]) -> dict[str, list]:
+    """Return the values of the given fields of the items, as a dict of columns."""
+    return _rows_to_columns(items, fields)
+
+
+def columns_to_arrow(columns: dict[str, list]) -> Any:
+    """Return a ``pyarrow.Table`` from a dict of columns.
+
+    Raises:
+        DependencyError: If pyarrow is not installed.
+    """
+    return _import_pyarrow().table(columns)
+
+
+async def async_to_columns(items: AsyncIterable[Any], fields: Sequence[str]) -> dict[str, list]:
+    """Return the values of the given fields of the asynchronous items, as a dict of columns."""
+    columns: dict[str, list] = {field: [] for field in fields}
+    async for item in items:
+        for field, column in columns.items():
+            column.append(get_path(item, field))
+    return columns
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # pyright: ignore[reportMissingImports]
+    except ImportError as e:
+        raise DependencyError(
+            "pyarrow is required to export the results to arrow, install entitysdk[arrow]"
+        ) from e
+    return pyarrow
+
+
+def to_arrow(items: Iterable[Any], fields: Sequence[str]) -> Any:
+    """Return the values of the given fields of the items, as a ``pyarrow.Table``.
+
+    The items are converted in batches of ``ARROW_BATCH_SIZE`` rows, so that only one batch of
+    python values is kept in memory at the same time.
+
+    Raises:
+        DependencyError: If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+    iterator = iter(items)
+    tables = [pa.table({field: [] for field in fields})]
+    while rows := list(islice(iterator, ARROW_BATCH_SIZE)):
+        tables.append(pa.table(_rows_to_columns(rows, fields)))
+    # the types inferred from different batches are unified, e.g. when a batch has only nulls
+    return pa.concat_tables(tables, promote_options="default")
@@ -1,7 +1,8 @@
 """Execution module."""
 
+import asyncio
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
 T = TypeVar("T")  # Generic return type
@@ -42,3 +43,30 @@ def execute_with_retry(
 
     assert last_exception is not None
     raise last_exception
+
+
+async def async_execute_with_retry(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    max_retries: int = 3,
+    backoff_base: float = 0.5,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+) -> T:
+    """Await a coroutine function with retries and exponential backoff.
+
+    Asynchronous counterpart of ``execute_with_retry``.
+    """
+    if max_retries < 0:
+        raise ValueError("max_retries must be >= 0")
+    last_exception: BaseException | None = None
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            return await fn()
+        except retry_on as exc:
+            last_exception = exc
+            delay = backoff_base * (2 ** (attempt - 1))
+            await asyncio.sleep(delay)
+
+    assert last_exception is not None
+    raise last_exception
@@ -1,31 +1,56 @@
 """Utility functions."""
 
+import asyncio
+import logging
+import math
+import random
 import sys
-from collections.abc import Iterator
+import time
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from json import dumps
+from typing import Any
 
 import httpx
 
+from entitysdk import serdes
 from entitysdk.common import ProjectContext
 from entitysdk.config import settings
 from entitysdk.exception import EntitySDKError
+from entitysdk.models.base import BaseModel
 from entitysdk.models.response import ListResponse
+from entitysdk.schemas.retry import RetryPolicy
 from entitysdk.token_manager import TokenManager
+from entitysdk.utils import json_codec
+from entitysdk.utils.instrumentation import RETRY_EXTENSION
+from entitysdk.utils.single_flight import AsyncSingleFlight, SingleFlight
 
+L = logging.getLogger(__name__)
 
-def make_db_api_request(
-    url: str,
+# registries of the GET requests in flight, shared by all the clients
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+# errors raised before the request reaches the server, that can be retried for any method
+CONNECTION_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def build_request_headers(
     *,
-    method: str,
-    json: dict | None = None,
-    data: dict | None = None,
-    parameters: dict | None = None,
-    files: dict | None = None,
-    project_context: ProjectContext | None = None,
     token_manager: TokenManager,
-    http_client: httpx.Client,
-) -> httpx.Response:
-    """Make a request to entitycore api."""
+    project_context: ProjectContext | None = None,
+) -> dict[str, str]:
+    """Return the authorization and project context headers for entitycore."""
     token = token_manager.get_token()
     headers = {"Authorization": f"Bearer {token}"}
 
@@ -37,37 +62,487 @@ def make_db_api_request(
         if vlab_id := project_context.virtual_lab_id:
             headers["virtual-lab-id"] = str(vlab_id)
 
-    try:
-        response = http_client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            files=files,
-            data=data,
-            params=parameters,
-            follow_redirects=True,
-            timeout=httpx.Timeout(
-                connect=settings.connect_timeout,
-                read=settings.read_timeout,
-                write=settings.write_timeout,
-                pool=settings.pool_timeout,
-            ),
-        )
-    except httpx.RequestError as e:
-        raise EntitySDKError(f"Request error: {e}") from e
+    return headers
+
 
+def default_timeout() -> httpx.Timeout:
+    """Return the timeouts of the requests, from the settings."""
+    return httpx.Timeout(
+        connect=settings.connect_timeout,
+        read=settings.read_timeout,
+        write=settings.write_timeout,
+        pool=settings.pool_timeout,
+    )
+
+
+def _raise_for_status(
+    response: httpx.Response,
+    *,
+    method: str,
+    url: str,
+    json: dict | None,
+    data: dict | None,
+    parameters: dict | None,
+    retries: int = 0,
+) -> None:
     try:
         response.raise_for_status()
     except httpx.HTTPStatusError as e:
         message = (
-            f"HTTP error {response.status_code} for {method} {url}\n"
+            f"HTTP error {response.status_code} for {method} {url}{_retries_note(retries)}\n"
             f"data       : {data}\n"
             f"json       : {dumps(json, indent=2)}\n"
             f"params     : {parameters}\n"
             f"response   : {response.text}"
         )
         raise EntitySDKError(message) from e
+
+
+def _retries_note(retries: int) -> str:
+    return f" after {retries} retries" if retries else ""
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Return the delay in seconds requested by the Retry-After header, if any."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(
+    retry_policy: RetryPolicy,
+    *,
+    retries: int,
+    idempotent: bool,
+    response: httpx.Response | None = None,
+    error: httpx.RequestError | None = None,
+) -> float | None:
+    """Return the delay before retrying the request, or None if it must not be retried.
+
+    Only transport errors and responses with a retriable status are retried, and only if the
+    request is idempotent, unless the error happened before the request was sent.
+    """
+    if retries >= retry_policy.max_retries:
+        return None
+    if error is not None:
+        if not isinstance(error, httpx.TransportError):
+            return None
+        if not idempotent and not isinstance(error, CONNECTION_ERRORS):
+            return None
+    elif response is not None:
+        if not idempotent or response.status_code not in retry_policy.retry_statuses:
+            return None
+        if (retry_after := _retry_after(response)) is not None:
+            return min(retry_after, retry_policy.backoff_max)
+    # exponential backoff with full jitter
+    backoff = min(retry_policy.backoff_max, retry_policy.backoff_base * 2**retries)
+    return random.uniform(0, backoff)  # noqa: S311
+
+
+def _check_pagination_arguments(
+    limit: int | None, page_size: int | None, prefetch: int | None
+) -> None:
+    if limit is not None and limit <= 0:
+        raise EntitySDKError("limit must be either None or strictly positive.")
+    if page_size is not None and page_size <= 0:
+        raise EntitySDKError("page_size must be either None or strictly positive.")
+    if prefetch is not None and prefetch < 0:
+        raise EntitySDKError("prefetch must be either None or positive.")
+
+
+def _last_page(first_page: ListResponse, limit: int) -> int:
+    """Return the last page needed to yield ``limit`` items, knowing the first page."""
+    number_of_items = min(first_page.pagination.total_items, limit)
+    return math.ceil(number_of_items / first_page.pagination.page_size)
+
+
+def _iter_sequential_pages(
+    fetch_page: Callable[[int], ListResponse],
+) -> Generator[ListResponse, None, None]:
+    """Yield the pages one after the other, requesting each of them only when needed."""
+    page = 1
+    while True:
+        yield fetch_page(page)
+        page += 1
+
+
+def _iter_prefetched_pages(
+    fetch_page: Callable[[int], ListResponse], *, limit: int, prefetch: int
+) -> Generator[ListResponse, None, None]:
+    """Yield the pages in order, while the following ones are requested concurrently.
+
+    The first page is used to know the number of pages to request, and at most ``prefetch``
+    pages are requested ahead of the consumer.
+    """
+    first_page = fetch_page(1)
+    yield first_page
+
+    last_page = _last_page(first_page, limit)
+    next_page = 2
+    pending: deque[Future[ListResponse]] = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    try:
+        while pending or next_page <= last_page:
+            while next_page <= last_page and len(pending) < prefetch:
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+            yield pending.popleft().result()
+    finally:
+        # don't wait for the pages that the consumer won't need anymore
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiter_sequential_pages(
+    fetch_page: Callable[[int], Awaitable[ListResponse]],
+) -> AsyncGenerator[ListResponse, None]:
+    page = 1
+    while True:
+        yield await fetch_page(page)
+        page += 1
+
+
+async def _aiter_prefetched_pages(
+    fetch_page: Callable[[int], Awaitable[ListResponse]], *, limit: int, prefetch: int
+) -> AsyncGenerator[ListResponse, None]:
+    first_page = await fetch_page(1)
+    yield first_page
+
+    last_page = _last_page(first_page, limit)
+    next_page = 2
+    pending: deque[asyncio.Task[ListResponse]] = deque()
+    try:
+        while pending or next_page <= last_page:
+            while next_page <= last_page and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+            yield await pending.popleft()
+    finally:
+        # don't wait for the pages that the consumer won't need anymore, but wait for the
+        # cancellations to complete, so that the tasks and their exceptions are retrieved
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _parse_page(
+    response: httpx.Response,
+    *,
+    page: int,
+    page_size: int | None,
+    item_type: type[BaseModel] | None,
+) -> ListResponse:
+    if item_type is None:
+        payload = ListResponse.model_validate_json(response.content)
+    else:
+        payload = serdes.deserialize_list_response_json(response.content, item_type)
+    if payload.pagination.page != page:
+        raise EntitySDKError(
+            f"Unexpected response: {payload.pagination.page=} but it should be {page}"
+        )
+    if page_size and payload.pagination.page_size != page_size:
+        raise EntitySDKError(
+            f"Unexpected response: {payload.pagination.page_size=} but it should be {page_size}"
+        )
+    return payload
+
+
+def _coalescing_key(
+    url: str,
+    *,
+    method: str,
+    json: dict | None,
+    data: dict | None,
+    parameters: dict | None,
+    files: dict | None,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.Client | httpx.AsyncClient,
+) -> tuple | None:
+    """Return the key identifying identical requests, or None if the request can't be shared."""
+    if (
+        not settings.coalesce_requests
+        or method.upper() != "GET"
+        or json is not None
+        or data is not None
+        or files is not None
+    ):
+        return None
+    return (
+        id(http_client),
+        id(token_manager),
+        url,
+        tuple(sorted(httpx.QueryParams(parameters).multi_items(), key=lambda item: item[0])),
+        project_context.project_id if project_context else None,
+        project_context.virtual_lab_id if project_context else None,
+    )
+
+
+def make_db_api_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None = None,
+    data: dict | None = None,
+    parameters: dict | None = None,
+    files: dict | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    retry_policy: RetryPolicy | None = None,
+    idempotent: bool | None = None,
+) -> httpx.Response:
+    """Make a request to entitycore api.
+
+    Failed requests are retried according to ``retry_policy``, and the number of retries is
+    stored in ``response.extensions["retries"]``.
+
+    Args:
+        url: The url to request.
+        method: The method to use.
+        json: The json to send.
+        data: The form data to send.
+        parameters: The parameters to send.
+        files: The files to send.
+        project_context: The project context.
+        token_manager: The token_manager to issue tokens.
+        http_client: The http client to use.
+        retry_policy: The retry policy, or None to use the default from the settings.
+        idempotent: Whether the request can be safely retried, or None to decide from the method.
+
+    Concurrent identical GET requests made with the same http client share a single request in
+    flight, and receive the same response, unless ``settings.coalesce_requests`` is False.
+
+    Returns:
+        The successful response.
+    """
+    key = _coalescing_key(
+        url,
+        method=method,
+        json=json,
+        data=data,
+        parameters=parameters,
+        files=files,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+    def request() -> httpx.Response:
+        return _make_db_api_request(
+            url,
+            method=method,
+            json=json,
+            data=data,
+            parameters=parameters,
+            files=files,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+
+    return request() if key is None else _single_flight.do(key, request)
+
+
+def _make_db_api_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None,
+    data: dict | None,
+    parameters: dict | None,
+    files: dict | None,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.Client,
+    retry_policy: RetryPolicy | None,
+    idempotent: bool | None,
+) -> httpx.Response:
+    retry_policy = retry_policy or RetryPolicy()
+    if idempotent is None:
+        idempotent = method.upper() in retry_policy.idempotent_methods
+
+    # the body is encoded once with the configured backend, instead of httpx stdlib json
+    content = json_codec.dumps(json) if json is not None else None
+
+    retries = 0
+    while True:
+        headers = build_request_headers(
+            token_manager=token_manager, project_context=project_context
+        )
+        if content is not None:
+            headers["Content-Type"] = "application/json"
+        try:
+            response = http_client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                content=content,
+                files=files,
+                data=data,
+                params=parameters,
+                follow_redirects=True,
+                timeout=default_timeout(),
+                extensions={RETRY_EXTENSION: retries},
+            )
+        except httpx.RequestError as e:
+            delay = _retry_delay(retry_policy, retries=retries, idempotent=idempotent, error=e)
+            if delay is None:
+                raise EntitySDKError(f"Request error: {e}{_retries_note(retries)}") from e
+            reason = repr(e)
+        else:
+            delay = _retry_delay(
+                retry_policy, retries=retries, idempotent=idempotent, response=response
+            )
+            if delay is None:
+                break
+            reason = f"HTTP error {response.status_code}"
+        retries += 1
+        L.info("Retrying %s %s in %.2fs (%s, retry %d)", method, url, delay, reason, retries)
+        time.sleep(delay)
+
+    response.extensions["retries"] = retries
+    _raise_for_status(
+        response,
+        method=method,
+        url=url,
+        json=json,
+        data=data,
+        parameters=parameters,
+        retries=retries,
+    )
+    return response
+
+
+async def async_make_db_api_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None = None,
+    data: dict | None = None,
+    parameters: dict | None = None,
+    files: dict | None = None,
+    project_context: ProjectContext | None = None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    retry_policy: RetryPolicy | None = None,
+    idempotent: bool | None = None,
+) -> httpx.Response:
+    """Make an asynchronous request to entitycore api.
+
+    See ``make_db_api_request`` for the description of the arguments.
+    """
+    key = _coalescing_key(
+        url,
+        method=method,
+        json=json,
+        data=data,
+        parameters=parameters,
+        files=files,
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+
+    async def request() -> httpx.Response:
+        return await _async_make_db_api_request(
+            url,
+            method=method,
+            json=json,
+            data=data,
+            parameters=parameters,
+            files=files,
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+        )
+
+    if key is None:
+        return await request()
+    return await _async_single_flight.do(key, request)
+
+
+async def _async_make_db_api_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None,
+    data: dict | None,
+    parameters: dict | None,
+    files: dict | None,
+    project_context: ProjectContext | None,
+    token_manager: TokenManager,
+    http_client: httpx.AsyncClient,
+    retry_policy: RetryPolicy | None,
+    idempotent: bool | None,
+) -> httpx.Response:
+    retry_policy = retry_policy or RetryPolicy()
+    if idempotent is None:
+        idempotent = method.upper() in retry_policy.idempotent_methods
+
+    # the body is encoded once with the configured backend, instead of httpx stdlib json
+    content = json_codec.dumps(json) if json is not None else None
+
+    retries = 0
+    while True:
+        headers = build_request_headers(
+            token_manager=token_manager, project_context=project_context
+        )
+        if content is not None:
+            headers["Content-Type"] = "application/json"
+        try:
+            response = await http_client.request(
+                method=method,
+                url=url,
+                headers=headers,
+                content=content,
+                files=files,
+                data=data,
+                params=parameters,
+                follow_redirects=True,
+                timeout=default_timeout(),
+                extensions={RETRY_EXTENSION: retries},
+            )
+        except httpx.RequestError as e:
+            delay = _retry_delay(retry_policy, retries=retries, idempotent=idempotent, error=e)
+            if delay is None:
+                raise EntitySDKError(f"Request error: {e}{_retries_note(retries)}") from e
+            reason = repr(e)
+        else:
+            delay = _retry_delay(
+                retry_policy, retries=retries, idempotent=idempotent, response=response
+            )
+            if delay is None:
+                break
+            reason = f"HTTP error {response.status_code}"
+        retries += 1
+        L.info("Retrying %s %s in %.2fs (%s, retry %d)", method, url, delay, reason, retries)
+        await asyncio.sleep(delay)
+
+    response.extensions["retries"] = retries
+    _raise_for_status(
+        response,
+        method=method,
+        url=url,
+        json=json,
+        data=data,
+        parameters=parameters,
+        retries=retries,
+    )
     return response
 
 
@@ -81,8 +556,10 @@ def stream_paginated_request(
     http_client: httpx.Client,
     page_size: int | None = None,
     limit: int | None = None,
+    prefetch: int | None = None,
+    item_type: type[BaseModel] | None = None,
     token_manager: TokenManager,
-) -> Iterator[dict]:
+) -> Iterator[Any]:
     """Paginate a request to entitycore api.
 
     Args:
@@ -94,23 +571,25 @@ def stream_paginated_request(
         http_client: The http client to use.
         page_size: The page size to use, or None to use server default.
         limit: Limit the number of entities to return. Default is None.
+        prefetch: Maximum number of pages requested concurrently ahead of the consumer,
+            or None to use the default from the settings. If 0, the pages are requested
+            sequentially, only when the previous page has been consumed.
+        item_type: Optional model used to validate the items directly from the raw pages.
+            If None, the items are yielded as dicts.
         token_manager: The token_manager to issue tokens.
 
     Returns:
-        An iterator of dicts.
+        An iterator of dicts, or of item_type instances if item_type is given.
     """
-    if limit is not None and limit <= 0:
-        raise EntitySDKError("limit must be either None or strictly positive.")
-    if page_size is not None and page_size <= 0:
-        raise EntitySDKError("page_size must be either None or strictly positive.")
+    _check_pagination_arguments(limit, page_size, prefetch)
 
-    page = 1
-    number_of_items = 0
     limit = limit or sys.maxsize
+    prefetch = settings.page_prefetch if prefetch is None else prefetch
     parameters = parameters or {}
     if page_size := page_size or settings.page_size:
         parameters = parameters | {"page_size": page_size}
-    while True:
+
+    def fetch_page(page: int) -> ListResponse:
         response = make_db_api_request(
             url=url,
             method=method,
@@ -120,24 +599,156 @@ def stream_paginated_request(
             token_manager=token_manager,
             http_client=http_client,
         )
-        payload = ListResponse.model_validate_json(response.text)
-        if payload.pagination.page != page:
-            raise EntitySDKError(
-                f"Unexpected response: {payload.pagination.page=} but it should be {page}"
-            )
-        if page_size and payload.pagination.page_size != page_size:
-            raise EntitySDKError(
-                f"Unexpected response: {payload.pagination.page_size=} but it should be {page_size}"
-            )
-        if not payload.data:
-            return
-        limit = min(payload.pagination.total_items, limit)
-        for data in payload.data:
-            yield data
-            number_of_items += 1
-            if number_of_items >= limit:
+        return _parse_page(response, page=page, page_size=page_size, item_type=item_type)
+
+    pages: Generator[ListResponse, None, None] = (
+        _iter_prefetched_pages(fetch_page, limit=limit, prefetch=prefetch)
+        if prefetch
+        else _iter_sequential_pages(fetch_page)
+    )
+    number_of_items = 0
+    try:
+        for payload in pages:
+            if not payload.data:
                 return
-        page += 1
+            limit = min(payload.pagination.total_items, limit)
+            for data in payload.data:
+                yield data
+                number_of_items += 1
+                if number_of_items >= limit:
+                    return
+    finally:
+        pages.close()
+
+
+async def async_stream_paginated_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None = None,
+    parameters: dict | None = None,
+    project_context: ProjectContext | None = None,
+    http_client: httpx.AsyncClient,
+    page_size: int | None = None,
+    limit: int | None = None,
+    prefetch: int | None = None,
+    item_type: type[BaseModel] | None = None,
+    token_manager: TokenManager,
+) -> AsyncIterator[Any]:
+    """Paginate an asynchronous request to entitycore api.
+
+    See ``stream_paginated_request`` for the description of the arguments.
+
+    Returns:
+        An asynchronous iterator of dicts, or of item_type instances if item_type is given.
+    """
+    _check_pagination_arguments(limit, page_size, prefetch)
+
+    limit = limit or sys.maxsize
+    prefetch = settings.page_prefetch if prefetch is None else prefetch
+    parameters = parameters or {}
+    if page_size := page_size or settings.page_size:
+        parameters = parameters | {"page_size": page_size}
+
+    async def fetch_page(page: int) -> ListResponse:
+        response = await async_make_db_api_request(
+            url=url,
+            method=method,
+            json=json,
+            parameters=parameters | {"page": page},
+            project_context=project_context,
+            token_manager=token_manager,
+            http_client=http_client,
+        )
+        return _parse_page(response, page=page, page_size=page_size, item_type=item_type)
+
+    pages: AsyncGenerator[ListResponse, None] = (
+        _aiter_prefetched_pages(fetch_page, limit=limit, prefetch=prefetch)
+        if prefetch
+        else _aiter_sequential_pages(fetch_page)
+    )
+    number_of_items = 0
+    try:
+        async for payload in pages:
+            if not payload.data:
+                return
+            limit = min(payload.pagination.total_items, limit)
+            for data in payload.data:
+                yield data
+                number_of_items += 1
+                if number_of_items >= limit:
+                    return
+    finally:
+        await pages.aclose()
+
+
+def count_paginated_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None = None,
+    parameters: dict | None = None,
+    project_context: ProjectContext | None = None,
+    http_client: httpx.Client,
+    limit: int | None = None,
+    token_manager: TokenManager,
+) -> int:
+    """Return the number of items of a paginated request, without retrieving them.
+
+    A single page with one item is requested, to read the total number of items.
+
+    Args:
+        url: The url to request.
+        method: The method to use.
+        json: The json to send.
+        parameters: The parameters to send.
+        project_context: The project context.
+        http_client: The http client to use.
+        limit: Limit of the number of items, as in ``stream_paginated_request``.
+        token_manager: The token_manager to issue tokens.
+
+    Returns:
+        The number of items that the paginated request would yield.
+    """
+    response = make_db_api_request(
+        url=url,
+        method=method,
+        json=json,
+        parameters=(parameters or {}) | {"page": 1, "page_size": 1},
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    pagination = _parse_page(response, page=1, page_size=None, item_type=None).pagination
+    return min(pagination.total_items, limit or sys.maxsize)
+
+
+async def async_count_paginated_request(
+    url: str,
+    *,
+    method: str,
+    json: dict | None = None,
+    parameters: dict | None = None,
+    project_context: ProjectContext | None = None,
+    http_client: httpx.AsyncClient,
+    limit: int | None = None,
+    token_manager: TokenManager,
+) -> int:
+    """Return the number of items of an asynchronous paginated request, without retrieving them.
+
+    See ``count_paginated_request`` for the description of the arguments.
+    """
+    response = await async_make_db_api_request(
+        url=url,
+        method=method,
+        json=json,
+        parameters=(parameters or {}) | {"page": 1, "page_size": 1},
+        project_context=project_context,
+        token_manager=token_manager,
+        http_client=http_client,
+    )
+    pagination = _parse_page(response, page=1, page_size=None, item_type=None).pagination
+    return min(pagination.total_items, limit or sys.maxsize)
 
 
 def stream_response(
@@ -167,12 +778,7 @@ def stream_response(
             headers=headers,
             params=parameters,
             follow_redirects=True,
-            timeout=httpx.Timeout(
-                connect=settings.connect_timeout,
-                read=settings.read_timeout,
-                write=settings.write_timeout,
-                pool=settings.pool_timeout,
-            ),
+            timeout=default_timeout(),
         ) as response:
             response.raise_for_status()
             yield from response.iter_bytes(chunk_size=settings.download_stream_data_buffer_size)
@@ -180,3 +786,38 @@ def stream_response(
         raise EntitySDKError(f"Request error: {e}") from e
     except httpx.HTTPStatusError as e:
         raise EntitySDKError(f"HTTP error {e.response.status_code} for {method} {url}") from e
+
+
+async def async_stream_response(
+    *,
+    url: str,
+    method: str,
+    headers: dict[str, str] | None = None,
+    parameters: dict | None = None,
+    http_client: httpx.AsyncClient,
+) -> AsyncIterator[bytes]:
+    """Stream an HTTP response body asynchronously.
+
+    See ``stream_response`` for the description of the arguments.
+
+    Returns:
+        An asynchronous iterator over response bytes chunks.
+    """
+    try:
+        async with http_client.stream(
+            method,
+            url=url,
+            headers=headers,
+            params=parameters,
+            follow_redirects=True,
+            timeout=default_timeout(),
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(
+                chunk_size=settings.download_stream_data_buffer_size
+            ):
+                yield chunk
+    except httpx.RequestError as e:
+        raise EntitySDKError(f"Request error: {e}") from e
+    except httpx.HTTPStatusError as e:
+        raise EntitySDKError(f"HTTP error {e.response.status_code} for {method} {url}") from e
@@ -0,0 +1,477 @@
+"""Instrumentation hooks and metrics of the HTTP requests made by the clients.
+
+The requests are observed by ``InstrumentedTransport``, installed in the HTTP client created by
+the clients when an ``Instrumentation`` is given, while the cache lookups are reported by the
+clients themselves.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, NamedTuple
+
+import httpx
+
+from entitysdk.compat import StrEnum
+from entitysdk.route import _ROUTES
+from entitysdk.utils import json_codec
+
+L = logging.getLogger(__name__)
+
+# request extensions set by the sdk to describe the requests to the transport
+RETRY_EXTENSION = "entitysdk.retry"
+PART_EXTENSION = "entitysdk.part_number"
+
+# route of the requests to any url outside the entitycore api, like the presigned urls
+TRANSFER_ROUTE = "transfer"
+# route of the requests to the entitycore api not matching any known route
+OTHER_ROUTE = "other"
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_ROUTE_NAMES = frozenset(_ROUTES.values())
+
+
+class InstrumentationEvent(StrEnum):
+    """Events reported to the hooks."""
+
+    BEFORE_REQUEST = "before_request"
+    AFTER_REQUEST = "after_request"
+    RETRY = "retry"
+    CACHE_HIT = "cache_hit"
+    CACHE_MISS = "cache_miss"
+    PART_TRANSFER = "part_transfer"
+
+
+class RequestEvent(NamedTuple):
+    """Details of a request, passed to the request, retry and part transfer hooks.
+
+    The status code, elapsed time, received bytes and error are set only after the request.
+    The elapsed time includes the time needed to receive the full body of the response.
+    """
+
+    method: str
+    url: str
+    route: str
+    retry: int = 0
+    part_number: int | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    status_code: int | None = None
+    elapsed: float | None = None
+    error: BaseException | None = None
+
+
+class CacheEvent(NamedTuple):
+    """Details of a lookup in the entity cache, passed to the cache hooks."""
+
+    route: str
+    entity_id: str
+
+
+Hook = Callable[[Any], None]
+
+
+def route_of_url(url: httpx.URL | str, api_url: str) -> str:
+    """Return the entitycore route of a url, used to aggregate the metrics.
+
+    The admin routes are aggregated with the corresponding routes.
+    """
+    url = httpx.URL(url)
+    base_url = str(url.copy_with(query=None, fragment=None))
+    if not base_url.startswith(api_url):
+        return TRANSFER_ROUTE
+    segments = [s for s in base_url[len(api_url) :].split("/") if s]
+    if segments and segments[0] == "admin":
+        segments = segments[1:]
+    if segments and segments[0] in _ROUTE_NAMES:
+        return segments[0]
+    return OTHER_ROUTE
+
+
+def route_of_type(entity_type: type) -> str:
+    """Return the entitycore route of an entity type, used to aggregate the metrics."""
+    return _ROUTES.get(entity_type.__name__, OTHER_ROUTE)
+
+
+def _labels_key(labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> dict[str, int]:
+        result, total = {}, 0
+        for bound, count in zip(self.buckets, self.counts, strict=True):
+            total += count
+            result[_format_bound(bound)] = total
+        return result
+
+
+class MetricsRegistry:
+    """Thread safe registry of counters and latency histograms, labelled by route.
+
+    The registry records the events of an ``Instrumentation``, and can be dumped as json or in
+    the text format of Prometheus.
+    """
+
+    # name, type and description of the metrics recorded from the events
+    METRICS = {
+        "requests_total": ("counter", "Number of HTTP requests."),
+        "request_duration_seconds": ("histogram", "Duration of the HTTP requests."),
+        "request_bytes_sent_total": ("counter", "Number of bytes sent in the request bodies."),
+        "request_bytes_received_total": (
+            "counter",
+            "Number of bytes received in the response bodies.",
+        ),
+        "retries_total": ("counter", "Number of retried requests."),
+        "cache_hits_total": ("counter", "Number of entities found in the entity cache."),
+        "cache_misses_total": ("counter", "Number of entities not found in the entity cache."),
+        "part_duration_seconds": ("histogram", "Duration of the transfers of the file parts."),
+    }
+
+    def __init__(
+        self,
+        *,
+        prefix: str = "entitysdk",
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            prefix: Prefix of the names of the metrics in the Prometheus format.
+            buckets: Upper bounds in seconds of the buckets of the histograms.
+        """
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets)) + (() if math.inf in buckets else (math.inf,))
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._histograms: dict[str, dict[tuple, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """Increment a counter."""
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add a value to a histogram."""
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if (histogram := series.get(key)) is None:
+                histogram = series[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Return the value of a counter, or 0 if it has never been incremented."""
+        with self._lock:
+            return self._counters.get(name, {}).get(_labels_key(labels), 0)
+
+    def record(self, event: InstrumentationEvent, payload: Any) -> None:
+        """Update the metrics from an event of the instrumentation."""
+        match event:
+            case InstrumentationEvent.AFTER_REQUEST:
+                status = "error" if payload.status_code is None else str(payload.status_code)
+                self.inc(
+                    "requests_total", route=payload.route, method=payload.method, status=status
+                )
+                self.observe(
+                    "request_duration_seconds",
+                    payload.elapsed,
+                    route=payload.route,
+                    method=payload.method,
+                )
+                self.inc("request_bytes_sent_total", payload.bytes_sent, route=payload.route)
+                self.inc(
+                    "request_bytes_received_total", payload.bytes_received, route=payload.route
+                )
+            case InstrumentationEvent.RETRY:
+                self.inc("retries_total", route=payload.route, method=payload.method)
+            case InstrumentationEvent.CACHE_HIT:
+                self.inc("cache_hits_total", route=payload.route)
+            case InstrumentationEvent.CACHE_MISS:
+                self.inc("cache_misses_total", route=payload.route)
+            case InstrumentationEvent.PART_TRANSFER:
+                self.observe("part_duration_seconds", payload.elapsed, method=payload.method)
+
+    def reset(self) -> None:
+        """Remove all the recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the recorded values, with the cumulative counts of the histogram buckets."""
+        with self._lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "histograms": {
+                    name: [
+                        {
+                            "labels": dict(key),
+                            "count": histogram.count,
+                            "sum": histogram.sum,
+                            "buckets": histogram.cumulative(),
+                        }
+                        for key, histogram in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def to_json(self, *, indent: int | None = None) -> str:
+        """Return the recorded values as json."""
+        return json_codec.dumps(self.to_dict(), indent=indent).decode()
+
+    def to_prometheus(self) -> str:
+        """Return the recorded values in the text exposition format of Prometheus."""
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                self._add_header(lines, name, "counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{self.prefix}_{name}{_format_labels(key)} {value:g}")
+            for name, histograms in sorted(self._histograms.items()):
+                self._add_header(lines, name, "histogram")
+                for key, histogram in sorted(histograms.items()):
+                    for bound, count in histogram.cumulative().items():
+                        labels = _format_labels((*key, ("le", bound)))
+                        lines.append(f"{self.prefix}_{name}_bucket{labels} {count}")
+                    labels = _format_labels(key)
+                    lines.append(f"{self.prefix}_{name}_sum{labels} {histogram.sum:g}")
+                    lines.append(f"{self.prefix}_{name}_count{labels} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _add_header(self, lines: list[str], name: str, metric_type: str) -> None:
+        if name in self.METRICS:
+            lines.append(f"# HELP {self.prefix}_{name} {self.METRICS[name][1]}")
+        lines.append(f"# TYPE {self.prefix}_{name} {metric_type}")
+
+
+class Instrumentation:
+    """Registry of the hooks called when the clients make requests or look up their caches.
+
+    The hooks are called synchronously in the thread, or event loop, making the request, so
+    they should return quickly. The exceptions raised by the hooks are logged and ignored.
+    """
+
+    def __init__(self, *, metrics: MetricsRegistry | None = None) -> None:
+        """Initialize the instrumentation.
+
+        Args:
+            metrics: Optional registry updated with all the events.
+        """
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._hooks: dict[InstrumentationEvent, tuple[Hook, ...]] = {}
+
+    def add_hook(self, event: InstrumentationEvent | str, hook: Hook) -> None:
+        """Register a hook called with the ``RequestEvent`` or ``CacheEvent`` of an event."""
+        event = InstrumentationEvent(event)
+        with self._lock:
+            self._hooks[event] = (*self._hooks.get(event, ()), hook)
+
+    def remove_hook(self, event: InstrumentationEvent | str, hook: Hook) -> None:
+        """Unregister a hook."""
+        event = InstrumentationEvent(event)
+        with self._lock:
+            self._hooks[event] = tuple(h for h in self._hooks.get(event, ()) if h is not hook)
+
+    def emit(self, event: InstrumentationEvent, payload: Any) -> None:
+        """Call the hooks registered for an event."""
+        if self.metrics is not None:
+            self.metrics.record(event, payload)
+        for hook in self._hooks.get(event, ()):
+            try:
+                hook(payload)
+            except Exception:  # noqa: BLE001
+                L.exception("Instrumentation hook failed for event %s", event)
+
+
+class _RequestTracker:
+    """Emit the events of a single request."""
+
+    def __init__(self, instrumentation: Instrumentation, request: httpx.Request, api_url: str):
+        self._instrumentation = instrumentation
+        self._event = RequestEvent(
+            method=request.method,
+            url=str(request.url),
+            route=route_of_url(request.url, api_url),
+            retry=request.extensions.get(RETRY_EXTENSION) or 0,
+            part_number=request.extensions.get(PART_EXTENSION),
+            bytes_sent=int(request.headers.get("Content-Length", 0)),
+        )
+        self._start = time.perf_counter()
+        self._finished = False
+        self.bytes_received = 0
+        instrumentation.emit(InstrumentationEvent.BEFORE_REQUEST, self._event)
+        if self._event.retry:
+            instrumentation.emit(InstrumentationEvent.RETRY, self._event)
+
+    def finish(self, *, status_code: int | None, error: BaseException | None = None) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        event = self._event._replace(
+            status_code=status_code,
+            elapsed=time.perf_counter() - self._start,
+            bytes_received=self.bytes_received,
+            error=error,
+        )
+        self._instrumentation.emit(InstrumentationEvent.AFTER_REQUEST, event)
+        if event.part_number is not None:
+            self._instrumentation.emit(InstrumentationEvent.PART_TRANSFER, event)
+
+
+class _TrackedStream(httpx.SyncByteStream):
+    """Response stream counting the received bytes, and finishing the request when closed."""
+
+    def __init__(
+        self, stream: httpx.SyncByteStream, tracker: _RequestTracker, status_code: int
+    ) -> None:
+        self._stream = stream
+        self._tracker = tracker
+        self._status_code = status_code
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._stream:
+                self._tracker.bytes_received += len(chunk)
+                yield chunk
+        except Exception as e:
+            self._tracker.finish(status_code=self._status_code, error=e)
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._tracker.finish(status_code=self._status_code)
+
+
+class _AsyncTrackedStream(httpx.AsyncByteStream):
+    """Asynchronous response stream counting the received bytes."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, tracker: _RequestTracker, status_code: int
+    ) -> None:
+        self._stream = stream
+        self._tracker = tracker
+        self._status_code = status_code
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._stream:
+                self._tracker.bytes_received += len(chunk)
+                yield chunk
+        except Exception as e:
+            self._tracker.finish(status_code=self._status_code, error=e)
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._tracker.finish(status_code=self._status_code)
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """Transport reporting the requests sent through the wrapped transport."""
+
+    def __init__(
+        self, transport: httpx.BaseTransport, *, instrumentation: Instrumentation, api_url: str
+    ) -> None:
+        """Initialize the transport."""
+        self._transport = transport
+        self._instrumentation = instrumentation
+        self._api_url = api_url
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, and report it when the response has been consumed or closed."""
+        tracker = _RequestTracker(self._instrumentation, request, self._api_url)
+        try:
+            response = self._transport.handle_request(request)
+        except Exception as e:
+            tracker.finish(status_code=None, error=e)
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # the body is already in memory
+            tracker.bytes_received = sum(len(chunk) for chunk in response.stream)  # type: ignore[union-attr]
+            tracker.finish(status_code=response.status_code)
+        else:
+            response.stream = _TrackedStream(response.stream, tracker, response.status_code)  # type: ignore[arg-type]
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport reporting the requests sent through the wrapped transport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        instrumentation: Instrumentation,
+        api_url: str,
+    ) -> None:
+        """Initialize the transport."""
+        self._transport = transport
+        self._instrumentation = instrumentation
+        self._api_url = api_url
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, and report it when the response has been consumed or closed."""
+        tracker = _RequestTracker(self._instrumentation, request, self._api_url)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception as e:
+            tracker.finish(status_code=None, error=e)
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # the body is already in memory
+            tracker.bytes_received = sum(len(chunk) for chunk in response.stream)  # type: ignore[union-attr]
+            tracker.finish(status_code=response.status_code)
+        else:
+            response.stream = _AsyncTrackedStream(response.stream, tracker, response.status_code)  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
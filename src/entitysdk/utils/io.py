@@ -1,23 +1,34 @@
 """IO utilities."""
 
+import asyncio
 import hashlib
+import io
 import json
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from entitysdk.compat import Self
 from entitysdk.types import StrOrPath
+from entitysdk.utils import json_codec
+
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
 
 READ_FILE_CHUNK = 64 * 1024
 
 
 def write_json(data: dict, path: StrOrPath, **json_kwargs) -> None:
-    """Write dictionary to file as JSON."""
+    """Write dictionary to file as JSON.
+
+    The standard library is always used, so that the output doesn't depend on the JSON backend.
+    """
     Path(path).write_text(json.dumps(data, **json_kwargs))
 
 
 def load_json(path: StrOrPath) -> dict:
     """Load JSON file to dict."""
-    return json.loads(Path(path).read_bytes())
+    return json_codec.loads(Path(path).read_bytes())
 
 
 def calculate_sha256_digest(path: Path) -> str:
@@ -53,3 +64,125 @@ def iter_bytes_chunk(path: Path, offset: int, size: int, buffer_size: int) -> It
 
             yield data
             remaining -= read_size
+
+
+class ChunkReader(io.RawIOBase):
+    """Read-only binary stream over an iterator of bytes chunks, like a streamed response.
+
+    The first chunk is read when the reader is created, so that the errors of a request are
+    raised immediately, and the iterator is closed with the reader.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        """Initialize the reader, reading the first chunk."""
+        super().__init__()
+        self._chunks = chunks
+        self._pending = memoryview(next(chunks, b""))
+
+    def readable(self) -> bool:
+        """Return True, since the stream is readable."""
+        return True
+
+    def readinto(self, buffer: "WriteableBuffer") -> int:
+        """Read bytes into a writable buffer, and return the number of bytes read."""
+        while not self._pending:
+            if (chunk := next(self._chunks, None)) is None:
+                return 0
+            self._pending = memoryview(chunk)
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), len(self._pending))
+        view[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        """Close the reader and the iterator."""
+        if not self.closed and hasattr(self._chunks, "close"):
+            self._chunks.close()  # pyright: ignore[reportAttributeAccessIssue]
+        super().close()
+
+
+class AsyncChunkReader:
+    """Read-only asynchronous binary stream over an asynchronous iterator of bytes chunks.
+
+    It's the asynchronous counterpart of ``ChunkReader``, and it should be used as an
+    asynchronous context manager, or closed with ``aclose``, to close the iterator.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        """Initialize the reader, without reading the first chunk. See ``create``."""
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+        self.closed = False
+
+    @classmethod
+    async def create(cls, chunks: AsyncIterator[bytes]) -> Self:
+        """Return a reader, reading the first chunk so that the errors of a request are raised."""
+        reader = cls(chunks)
+        await reader._fill()
+        return reader
+
+    async def _fill(self) -> bool:
+        """Read the next non-empty chunk if needed, and return False at the end of the stream."""
+        while not self._pending:
+            if (chunk := await anext(self._chunks, None)) is None:
+                return False
+            self._pending = memoryview(chunk)
+        return True
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read and return at most ``size`` bytes, or all the remaining bytes if negative."""
+        if size < 0:
+            data = bytes(self._pending)
+            self._pending = memoryview(b"")
+            return data + b"".join([chunk async for chunk in self._chunks])
+        if not await self._fill():
+            return b""
+        data = bytes(self._pending[:size])
+        self._pending = self._pending[size:]
+        return data
+
+    async def readinto(self, buffer: "WriteableBuffer") -> int:
+        """Read bytes into a writable buffer, and return the number of bytes read."""
+        if not await self._fill():
+            return 0
+        view = memoryview(buffer).cast("B")
+        size = min(len(view), len(self._pending))
+        view[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    async def aclose(self) -> None:
+        """Close the reader and the iterator."""
+        if not self.closed:
+            self.closed = True
+            if hasattr(self._chunks, "aclose"):
+                await self._chunks.aclose()  # pyright: ignore[reportAttributeAccessIssue]
+
+    async def __aenter__(self) -> Self:
+        """Enter the asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Exit the asynchronous context manager, closing the reader."""
+        await self.aclose()
+
+
+async def aiter_file(
+    f: io.BufferedIOBase, chunk_size: int, size: int | None = None
+) -> AsyncIterator[bytes]:
+    """Iterate over the chunks of an open file, read in a worker thread, and close it.
+
+    If ``size`` is given, at most ``size`` bytes are read from the current position.
+    """
+    remaining = size
+    try:
+        while remaining is None or remaining > 0:
+            read_size = chunk_size if remaining is None else min(chunk_size, remaining)
+            if not (chunk := await asyncio.to_thread(f.read, read_size)):
+                break
+            yield chunk
+            if remaining is not None:
+                remaining -= len(chunk)
+    finally:
+        f.close()
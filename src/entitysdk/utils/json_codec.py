@@ -0,0 +1,147 @@
+"""Pluggable JSON encoding and decoding.
+
+The backend is selected with ``settings.json_backend``. In ``auto`` mode, orjson or msgspec are
+used when installed, falling back to the standard library otherwise.
+
+All the backends behave like the standard library with ``allow_nan=False`` when encoding, so
+NaN and infinite values are rejected instead of being encoded as ``null``, and they accept the
+``NaN`` and ``Infinity`` literals when decoding, like ``json.loads``.
+"""
+
+import json
+import math
+from collections.abc import Callable
+from functools import cache
+from typing import Any, NamedTuple
+
+from entitysdk.config import settings
+from entitysdk.exception import DependencyError
+
+# backends tried in auto mode, in order of preference
+AUTO_BACKENDS = ("orjson", "msgspec", "stdlib")
+
+
+class JsonCodec(NamedTuple):
+    """JSON encoder and decoder of a backend."""
+
+    name: str
+    dumps: Callable[..., bytes]
+    loads: Callable[[bytes | str], Any]
+
+
+def _check_finite(obj: Any) -> None:
+    """Raise ValueError if the object contains NaN or infinite floats, like the stdlib encoder."""
+    if isinstance(obj, float):
+        if not math.isfinite(obj):
+            raise ValueError(f"Out of range float values are not JSON compliant: {obj!r}")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+    elif isinstance(obj, list | tuple):
+        for value in obj:
+            _check_finite(value)
+
+
+def _encode_finite(encode: Callable[[Any], bytes], obj: Any) -> bytes:
+    """Encode an object, rejecting the non-finite floats that the backend encodes as null."""
+    data = encode(obj)
+    if b"null" in data:
+        # the object is traversed only when it may contain non-finite floats
+        _check_finite(obj)
+    return data
+
+
+def _decode_fallback(
+    decode: Callable[[bytes | str], Any], errors: tuple[type[Exception], ...]
+) -> Callable[[bytes | str], Any]:
+    """Return a decoder falling back to the stdlib on the literals rejected by the backend."""
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decode(data)
+        except errors:
+            # NaN and Infinity are accepted by the stdlib, and other errors are raised again
+            return json.loads(data)
+
+    return loads
+
+
+def _stdlib_codec() -> JsonCodec:
+    def dumps(obj: Any, *, indent: int | None = None) -> bytes:
+        # same options used by httpx to encode the request bodies
+        separators = None if indent else (",", ":")
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, indent=indent, separators=separators
+        ).encode()
+
+    return JsonCodec(name="stdlib", dumps=dumps, loads=json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any, *, indent: int | None = None) -> bytes:
+        if indent not in (None, 0, 2):
+            # only the indentation with 2 spaces is supported by orjson
+            return _stdlib_codec().dumps(obj, indent=indent)
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return _encode_finite(lambda o: orjson.dumps(o, option=option), obj)
+
+    loads = _decode_fallback(orjson.loads, (orjson.JSONDecodeError,))
+    return JsonCodec(name="orjson", dumps=dumps, loads=loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec  # pyright: ignore[reportMissingImports]
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any, *, indent: int | None = None) -> bytes:
+        data = _encode_finite(encoder.encode, obj)
+        return msgspec.json.format(data, indent=indent) if indent else data
+
+    loads = _decode_fallback(decoder.decode, (msgspec.DecodeError,))
+    return JsonCodec(name="msgspec", dumps=dumps, loads=loads)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "stdlib": _stdlib_codec,
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+}
+
+
+def get_codec(backend: str | None = None) -> JsonCodec:
+    """Return the codec of the given backend, or of the backend selected in the settings.
+
+    Raises:
+        DependencyError: If the requested backend isn't installed.
+    """
+    return _load_codec(backend or settings.json_backend)
+
+
+@cache
+def _load_codec(backend: str) -> JsonCodec:
+    if backend == "auto":
+        for name in AUTO_BACKENDS:
+            try:
+                return _FACTORIES[name]()
+            except ImportError:
+                continue
+    if backend not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    try:
+        return _FACTORIES[backend]()
+    except ImportError as e:
+        raise DependencyError(f"The JSON backend {backend} is not installed") from e
+
+
+def dumps(obj: Any, *, indent: int | None = None) -> bytes:
+    """Encode an object to JSON bytes with the configured backend."""
+    return get_codec().dumps(obj, indent=indent)
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON bytes or string with the configured backend."""
+    return get_codec().loads(data)
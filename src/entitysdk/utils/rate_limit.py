@@ -0,0 +1,300 @@
+"""Client side rate limiting of the HTTP requests."""
+
+import asyncio
+import math
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import httpx
+
+
+class AdaptiveLimiter:
+    """Token bucket and concurrency limiter, adapting its limits to throttling responses.
+
+    The limits are adapted with an AIMD strategy: they are decreased multiplicatively when a
+    throttling response is received, and increased additively (by one unit for each window of
+    successful responses) until the configured maximum values are reached again.
+
+    The limiter is thread safe, and it can be shared by synchronous and asynchronous clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        max_rate: float | None = None,
+        min_concurrency: int = 1,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        throttle_statuses: frozenset[int] = frozenset({429, 503}),
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight.
+            max_rate: Maximum number of requests started per second, or None for no rate limit.
+            min_concurrency: Lower bound of the concurrency when throttled.
+            min_rate: Lower bound of the rate when throttled.
+            decrease_factor: Factor applied to the limits when a throttling response is received.
+            cooldown: Minimum time in seconds between two decreases, so that the responses to
+                the requests that were already in flight don't decrease the limits again.
+            throttle_statuses: HTTP status codes considered as throttling responses.
+        """
+        if max_concurrency < 1 or min_concurrency < 1 or min_concurrency > max_concurrency:
+            raise ValueError("Invalid concurrency limits")
+        if max_rate is not None and (min_rate <= 0 or min_rate > max_rate):
+            raise ValueError("Invalid rate limits")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.max_concurrency = max_concurrency
+        self.max_rate = max_rate
+        self.min_concurrency = min_concurrency
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.throttle_statuses = throttle_statuses
+
+        self._condition = threading.Condition()
+        self._concurrency = float(max_concurrency)
+        self._rate = max_rate
+        self._tokens = max_rate or 0.0
+        self._updated_at = time.monotonic()
+        self._decreased_at = -math.inf
+        self._in_flight = 0
+        # futures of the coroutines waiting for a released slot, possibly in different loops
+        self._async_waiters: set[asyncio.Future[None]] = set()
+        self.throttled = 0
+
+    @property
+    def concurrency(self) -> int:
+        """Return the current maximum number of requests in flight."""
+        return int(self._concurrency)
+
+    @property
+    def rate(self) -> float | None:
+        """Return the current maximum number of requests per second."""
+        return self._rate
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests in flight."""
+        return self._in_flight
+
+    def _try_acquire(self) -> float | None:
+        """Acquire a slot if possible, and return 0.
+
+        Otherwise, return the time to wait for a token, or None to wait for a released slot.
+        Must be called with the lock held.
+        """
+        if self._in_flight >= self.concurrency:
+            return None
+        if self._rate is not None:
+            now = time.monotonic()
+            burst = max(1.0, self._rate)
+            self._tokens = min(burst, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                return (1 - self._tokens) / self._rate
+            self._tokens -= 1
+        self._in_flight += 1
+        return 0
+
+    def acquire(self) -> None:
+        """Block until a request can be started."""
+        with self._condition:
+            while (wait := self._try_acquire()) != 0:
+                self._condition.wait(wait)
+
+    async def async_acquire(self) -> None:
+        """Wait without blocking the event loop until a request can be started."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                wait = self._try_acquire()
+                if wait == 0:
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.add(waiter)
+            try:
+                # woken up when a slot is released or the limits change, or when a token is due
+                await asyncio.wait({waiter}, timeout=wait)
+            finally:
+                with self._condition:
+                    self._async_waiters.discard(waiter)
+                waiter.cancel()
+
+    def _notify_all(self) -> None:
+        """Wake up all the waiters. Must be called with the lock held."""
+        self._condition.notify_all()
+        for waiter in self._async_waiters:
+            waiter.get_loop().call_soon_threadsafe(_set_done, waiter)
+        self._async_waiters.clear()
+
+    def release(self) -> None:
+        """Release the slot of a finished request."""
+        with self._condition:
+            self._in_flight -= 1
+            self._notify_all()
+
+    def record(self, status_code: int) -> None:
+        """Adapt the limits to the status code of a response."""
+        with self._condition:
+            if status_code in self.throttle_statuses:
+                self.throttled += 1
+                now = time.monotonic()
+                if now - self._decreased_at < self.cooldown:
+                    return
+                self._decreased_at = now
+                self._concurrency = max(
+                    self.min_concurrency, self._concurrency * self.decrease_factor
+                )
+                if self._rate is not None:
+                    self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                    self._tokens = min(self._tokens, self._rate)
+            else:
+                self._concurrency = min(
+                    self.max_concurrency, self._concurrency + 1 / self._concurrency
+                )
+                if self._rate is not None and self.max_rate is not None:
+                    self._rate = min(self.max_rate, self._rate + 1 / self._rate)
+            self._notify_all()
+
+
+def _set_done(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """Limiter of the requests made by a client.
+
+    The requests to the entitycore API and the data transfers to and from the presigned URLs
+    use separate budgets, so that large transfers don't starve the API calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        api: AdaptiveLimiter | None = None,
+        transfer: AdaptiveLimiter | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            api: Limiter of the requests to the entitycore API.
+            transfer: Limiter of the requests to any other URL, like the presigned URLs.
+        """
+        self.api = api or AdaptiveLimiter(max_concurrency=16, max_rate=50)
+        self.transfer = transfer or AdaptiveLimiter(max_concurrency=32)
+
+    def select(self, url: httpx.URL, api_url: str) -> AdaptiveLimiter:
+        """Return the limiter to be used for the given url."""
+        return self.api if str(url).startswith(api_url) else self.transfer
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response stream releasing the limiter slot when it's closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Asynchronous response stream releasing the limiter slot when it's closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release:
+                self._release()
+                self._release = None
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Transport limiting the requests sent through the wrapped transport."""
+
+    def __init__(
+        self, transport: httpx.BaseTransport, *, rate_limiter: RateLimiter, api_url: str
+    ) -> None:
+        """Initialize the transport."""
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._api_url = api_url
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request once the limiter allows it."""
+        limiter = self._rate_limiter.select(request.url, self._api_url)
+        limiter.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            limiter.release()
+            raise
+        limiter.record(response.status_code)
+        if isinstance(response.stream, httpx.ByteStream):
+            # the body is already in memory
+            limiter.release()
+        else:
+            # the slot is released only when the body has been consumed or the response closed
+            response.stream = _ReleasingStream(response.stream, limiter.release)  # type: ignore[arg-type]
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Asynchronous transport limiting the requests sent through the wrapped transport."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, *, rate_limiter: RateLimiter, api_url: str
+    ) -> None:
+        """Initialize the transport."""
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._api_url = api_url
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request once the limiter allows it."""
+        limiter = self._rate_limiter.select(request.url, self._api_url)
+        await limiter.async_acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            limiter.release()
+            raise
+        limiter.record(response.status_code)
+        if isinstance(response.stream, httpx.ByteStream):
+            limiter.release()
+        else:
+            response.stream = _AsyncReleasingStream(response.stream, limiter.release)  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
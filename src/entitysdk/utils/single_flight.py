@@ -0,0 +1,78 @@
+"""Coalescing of concurrent identical calls."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+
+class SingleFlight:
+    """Registry of the calls in flight, shared by concurrent threads.
+
+    The first thread calling ``do`` with a given key executes the function, while the other
+    threads calling ``do`` with the same key before it returns wait and receive the same
+    result, or the same exception.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Execute the function, unless an identical call is already in flight."""
+        with self._lock:
+            future = self._calls.get(key)
+            is_leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not is_leader:
+            return future.result()
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Registry of the calls in flight, shared by concurrent tasks.
+
+    The first caller starts a task executing the function, and all the callers with the same
+    key await the same task. Cancelling a caller doesn't cancel the shared task.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Execute the function, unless an identical call is already in flight."""
+        # the tasks are bound to the event loop
+        key = (id(asyncio.get_running_loop()), key)
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
@@ -1,5 +1,7 @@
 """Local asset store module."""
 
+import io
+import mmap
 import shutil
 from pathlib import Path
 
@@ -34,3 +36,15 @@ class LocalAssetStore(BaseModel):
     def read_bytes(self, path: Path) -> bytes:
         """Read file from local store."""
         return self._local_path(path).read_bytes()
+
+    def open(self, path: Path) -> io.BufferedReader:
+        """Open file from local store for reading."""
+        return self._local_path(path).open("rb")
+
+    def map_bytes(self, path: Path) -> memoryview:
+        """Return a read-only view of a file from local store, memory-mapped without copying."""
+        with self.open(path) as f:
+            if not self._local_path(path).stat().st_size:
+                # empty files can't be mapped
+                return memoryview(b"")
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
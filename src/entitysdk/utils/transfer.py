@@ -0,0 +1,141 @@
+"""Incremental transfers of files, skipping the unchanged ones."""
+
+import datetime
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from entitysdk.utils.cache import DigestCache
+from entitysdk.utils.io import calculate_sha256_digest
+
+
+class TransferStats:
+    """Thread safe counters of the files transferred, skipped, cached and removed."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.files_transferred = 0
+        self.bytes_transferred = 0
+        self.files_skipped = 0
+        self.bytes_skipped = 0
+        self.files_cached = 0
+        self.bytes_cached = 0
+        self.files_removed = 0
+        self.bytes_removed = 0
+        self._lock = threading.Lock()
+
+    def add_transferred(self, size: int) -> None:
+        """Count a transferred file."""
+        with self._lock:
+            self.files_transferred += 1
+            self.bytes_transferred += size
+
+    def add_skipped(self, size: int) -> None:
+        """Count a file skipped because unchanged."""
+        with self._lock:
+            self.files_skipped += 1
+            self.bytes_skipped += size
+
+    def add_cached(self, size: int) -> None:
+        """Count a file materialized from the content cache."""
+        with self._lock:
+            self.files_cached += 1
+            self.bytes_cached += size
+
+    def add_removed(self, size: int) -> None:
+        """Count a local file removed because no longer in the directory asset."""
+        with self._lock:
+            self.files_removed += 1
+            self.bytes_removed += size
+
+    def to_dict(self) -> dict[str, int]:
+        """Return the counters as a dict."""
+        return {
+            "files_transferred": self.files_transferred,
+            "bytes_transferred": self.bytes_transferred,
+            "files_skipped": self.files_skipped,
+            "bytes_skipped": self.bytes_skipped,
+            "files_cached": self.files_cached,
+            "bytes_cached": self.bytes_cached,
+            "files_removed": self.files_removed,
+            "bytes_removed": self.bytes_removed,
+        }
+
+    def __repr__(self) -> str:
+        """Return the representation of the counters."""
+        counters = ", ".join(f"{name}={value}" for name, value in self.to_dict().items())
+        return f"{type(self).__name__}({counters})"
+
+
+def is_unchanged(
+    path: Path,
+    *,
+    size: int,
+    sha256_digest: str | None,
+    digest_cache: DigestCache | None = None,
+) -> bool:
+    """Return whether a local file has the expected size and sha256 digest.
+
+    The digest is only calculated if the size matches, and it's taken from the cache when the
+    file hasn't been modified since it was hashed. Without an expected digest, the file is
+    considered changed.
+    """
+    if sha256_digest is None or not path.is_file() or path.stat().st_size != size:
+        return False
+    if digest_cache is not None:
+        return digest_cache.digest(path) == sha256_digest
+    return calculate_sha256_digest(path) == sha256_digest
+
+
+def is_synced(path: Path, *, size: int, last_modified: datetime.datetime) -> bool:
+    """Return whether a local file has the size and modification date of a remote file.
+
+    The modification date is compared to the second, since it's set by ``set_modified`` after
+    the download, and not all filesystems store it more precisely.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return False
+    return stat.st_size == size and int(path.lstat().st_mtime) == int(last_modified.timestamp())
+
+
+def set_modified(path: Path, last_modified: datetime.datetime) -> None:
+    """Set the modification date of a local file to the one of the remote file.
+
+    The date of a symbolic link is set on the link, to leave the linked file unchanged.
+    """
+    timestamp = last_modified.timestamp()
+    os.utime(path, (timestamp, timestamp), follow_symlinks=False)
+
+
+def remove_extraneous(
+    root: Path, paths: Iterable[Path], *, stats: TransferStats | None = None
+) -> list[Path]:
+    """Remove the files under ``root`` not in ``paths``, and the directories left empty.
+
+    Args:
+        root: Local directory to clean up.
+        paths: Paths to keep, relative to ``root``.
+        stats: Optional counters of the removed files.
+
+    Returns:
+        The removed files.
+    """
+    keep = {root / path for path in paths}
+    removed = []
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        directory = Path(dirpath)
+        for filename in filenames:
+            if (path := directory / filename) not in keep:
+                size = path.lstat().st_size
+                path.unlink()
+                removed.append(path)
+                if stats is not None:
+                    stats.add_removed(size)
+        for dirname in dirnames:
+            subdirectory = directory / dirname
+            if not subdirectory.is_symlink() and not any(subdirectory.iterdir()):
+                subdirectory.rmdir()
+    return removed
@@ -21,6 +21,12 @@ def _deserialize_model_extra_forbid(monkeypatch):
     monkeypatch.setattr(settings, "deserialize_model_extra", "forbid")
 
 
+@pytest.fixture(autouse=True)
+def _no_retries(monkeypatch):
+    # fail fast during tests, the retries are tested explicitly
+    monkeypatch.setattr(settings, "max_retries", 0)
+
+
 @pytest.fixture(scope="session")
 def api_url():
     return "http://mock-host:8000"
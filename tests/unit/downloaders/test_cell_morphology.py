@@ -1,3 +1,4 @@
+import hashlib
 import uuid
 
 import pytest
@@ -8,6 +9,8 @@ from entitysdk.models.cell_morphology import CellMorphology
 from entitysdk.models.cell_morphology_protocol import CellMorphologyProtocol
 from entitysdk.types import CellMorphologyGenerationType
 
+CONTENT = b"foo"
+
 
 def _mock_asset_response(asset_id):
     return {
@@ -17,10 +20,10 @@ def _mock_asset_response(asset_id):
         "is_directory": False,
         "content_type": "application/asc",
         "label": "morphology",
-        "size": 100,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -46,7 +49,7 @@ def test_download_morphology(
         method="GET",
         url=f"{api_url}/cell-morphology/{morph_id}/assets/{asset_id}/download",
         match_headers=request_headers,
-        content="foo",
+        content=CONTENT,
     )
 
     cell_morphology_protocol = CellMorphologyProtocol(
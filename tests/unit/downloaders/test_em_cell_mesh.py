@@ -1,9 +1,12 @@
+import hashlib
 import uuid
 
 from entitysdk.downloaders.em_cell_mesh import download_mesh_file
 from entitysdk.models.em_cell_mesh import EMCellMesh
 from entitysdk.types import ContentType
 
+CONTENT = b"mesh data"
+
 
 def _mock_asset_response(asset_id):
     return {
@@ -12,10 +15,10 @@ def _mock_asset_response(asset_id):
         "full_path": "mesh.obj",
         "is_directory": False,
         "content_type": "application/obj",
-        "size": 1000,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "label": "cell_surface_mesh",
         "storage_type": "aws_s3_internal",
     }
@@ -42,7 +45,7 @@ def test_download_mesh_file(
         method="GET",
         url=f"{api_url}/em-cell-mesh/{mesh_id}/assets/{asset_id}/download",
         match_headers=request_headers,
-        content="mesh data",
+        content=CONTENT,
     )
 
     em_cell_mesh = EMCellMesh(
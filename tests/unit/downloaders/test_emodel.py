@@ -1,9 +1,12 @@
+import hashlib
 import uuid
 
 from entitysdk.downloaders.emodel import download_hoc
 from entitysdk.models.emodel import EModel
 from entitysdk.types import AssetLabel, ContentType
 
+CONTENT = b"foo"
+
 
 def _mock_asset_response(asset_id):
     return {
@@ -13,10 +16,10 @@ def _mock_asset_response(asset_id):
         "is_directory": False,
         "label": AssetLabel.neuron_hoc,
         "content_type": ContentType.application_hoc,
-        "size": 100,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -43,7 +46,7 @@ def test_download_hoc(
         method="GET",
         url=f"{api_url}/emodel/{emodel_id}/assets/{asset_id}/download",
         match_headers=request_headers,
-        content="foo",
+        content=CONTENT,
     )
 
     emodel = EModel(
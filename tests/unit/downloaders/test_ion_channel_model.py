@@ -1,9 +1,12 @@
+import hashlib
 import uuid
 
 from entitysdk import models, types
 from entitysdk.downloaders.ion_channel_model import download_ion_channel_mechanism
 from entitysdk.models.ion_channel_model import IonChannelModel, NeuronBlock
 
+CONTENT = b"foo"
+
 
 def _mock_asset_response(asset_id):
     return {
@@ -13,10 +16,10 @@ def _mock_asset_response(asset_id):
         "is_directory": False,
         "content_type": types.ContentType.application_mod,
         "label": types.AssetLabel.neuron_mechanisms,
-        "size": 100,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -43,7 +46,7 @@ def test_download_ion_channel_model(
         method="GET",
         url=f"{api_url}/ion-channel-model/{model_id}/assets/{asset_id}/download",
         match_headers=request_headers,
-        content="foo",
+        content=CONTENT,
     )
 
     ic_model = IonChannelModel(
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import uuid
 
@@ -11,6 +12,8 @@ from entitysdk.models.emodel import EModel
 from entitysdk.models.memodel import MEModel
 from entitysdk.types import AssetLabel, CellMorphologyGenerationType, ContentType, ValidationStatus
 
+CONTENT = b"foo"
+
 
 def _mock_morph_asset_response(asset_id):
     """Mock response for morphology asset."""
@@ -21,10 +24,10 @@ def _mock_morph_asset_response(asset_id):
         "is_directory": False,
         "label": AssetLabel.morphology,
         "content_type": ContentType.application_asc,
-        "size": 100,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -38,10 +41,10 @@ def _mock_ic_asset_response(asset_id):
         "is_directory": False,
         "label": AssetLabel.neuron_mechanisms,
         "content_type": ContentType.application_mod,
-        "size": 100,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -55,10 +58,10 @@ def _mock_emodel_asset_response(asset_id):
         "is_directory": False,
         "label": AssetLabel.neuron_hoc,
         "content_type": ContentType.application_hoc,
-        "size": 100,
+        "size": len(CONTENT),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(CONTENT).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -92,7 +95,7 @@ def test_download_memodel(
         method="GET",
         url=f"{api_url}/cell-morphology/{morph_id}/assets/{morph_asset_id}/download",
         match_headers=request_headers,
-        content="foo",
+        content=CONTENT,
     )
     httpx_mock.add_response(
         method="GET",
@@ -104,7 +107,7 @@ def test_download_memodel(
         method="GET",
         url=f"{api_url}/emodel/{emodel_id}/assets/{emodel_asset_id}/download",
         match_headers=request_headers,
-        content="foo",
+        content=CONTENT,
     )
     httpx_mock.add_response(
         method="GET",
@@ -116,7 +119,7 @@ def test_download_memodel(
         method="GET",
         url=f"{api_url}/ion-channel-model/{ic_model_id}/assets/{ic_asset_id}/download",
         match_headers=request_headers,
-        content="foo",
+        content=CONTENT,
     )
 
     httpx_mock.add_response(
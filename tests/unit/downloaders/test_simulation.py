@@ -1,3 +1,4 @@
+import hashlib
 import json
 import uuid
 
@@ -9,7 +10,7 @@ from entitysdk.models import Simulation
 from entitysdk.types import AssetLabel, ContentType
 
 
-def _mock_asset_response(asset_id, content_type, label):
+def _mock_asset_response(asset_id, content_type, label, content=b'{"foo": "bar"}'):
     return {
         "id": str(asset_id),
         "path": "content.json",
@@ -17,10 +18,10 @@ def _mock_asset_response(asset_id, content_type, label):
         "is_directory": False,
         "content_type": str(content_type),
         "label": str(label),
-        "size": 100,
+        "size": len(content),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(content).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
@@ -162,7 +163,9 @@ def test_download_spike_replay_files(
     res = test_module.download_spike_replay_files(client, model=model, output_dir=tmp_path)
     assert res == []
 
-    asset = _mock_asset_response(asset_id, ContentType.application_x_hdf5, AssetLabel.replay_spikes)
+    asset = _mock_asset_response(
+        asset_id, ContentType.application_x_hdf5, AssetLabel.replay_spikes, content=b"asdf"
+    )
     model = _mock_simulation(simulation_id, assets=[asset])
     httpx_mock.add_response(
         method="GET",
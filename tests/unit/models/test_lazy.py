@@ -0,0 +1,67 @@
+import copy
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError, field_validator
+
+from entitysdk.models import lazy as test_module
+from entitysdk.models.base import BaseModel
+from entitysdk.models.cell_morphology import CellMorphology
+from entitysdk.models.projection import projection_model
+
+ENTITY_ID = uuid.uuid4()
+DATA = {
+    "id": str(ENTITY_ID),
+    "name": "foo",
+    "creation_date": "2025-01-01T00:00:00Z",
+    "brain_region": {"name": "bar"},
+}
+
+
+def test_lazy_model():
+    proxy = test_module.LazyModel(CellMorphology, DATA)
+
+    assert proxy.model is CellMorphology
+    assert proxy.raw is DATA
+    assert proxy.id == ENTITY_ID
+    assert proxy.name == "foo"
+    assert proxy.creation_date == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert proxy.description is None
+    # the scalar fields are validated separately
+    assert not proxy.is_materialized
+    assert "lazy" in repr(proxy)
+
+    with pytest.raises(AttributeError, match="read-only"):
+        proxy.name = "bar"
+
+    # the nested fields require the validation of the full model, which is invalid here
+    with pytest.raises(ValidationError):
+        _ = proxy.brain_region
+    assert not proxy.is_materialized
+
+
+def test_lazy_model__materialize():
+    data = {"id": str(ENTITY_ID), "name": "foo", "assets": [], "description": None}
+    proxy = test_module.LazyModel(projection_model(CellMorphology, ["id", "name", "assets"]), data)
+
+    assert proxy.assets == []
+    assert proxy.is_materialized
+    assert proxy.materialize() is proxy.materialize()
+    assert proxy.materialize().name == "foo"
+    assert "materialized" in repr(proxy)
+    assert copy.copy(proxy).name == "foo"
+
+
+def test_lazy_model__validators():
+    class Model(BaseModel):
+        name: str
+
+        @field_validator("name")
+        @classmethod
+        def _upper(cls, value):
+            return value.upper()
+
+    proxy = test_module.LazyModel(Model, {"name": "foo"})
+    assert proxy.name == "FOO"
+    assert proxy.is_materialized
@@ -0,0 +1,35 @@
+import uuid
+
+import pytest
+from pydantic import ValidationError
+
+from entitysdk.exception import EntitySDKError
+from entitysdk.models import projection as test_module
+from entitysdk.models.cell_morphology import CellMorphology
+
+
+def test_projection_model():
+    model = test_module.projection_model(CellMorphology, ["id", "name", "id"])
+
+    assert issubclass(model, test_module.Projection)
+    assert model.__name__ == "CellMorphologyProjection"
+    assert list(model.model_fields) == ["id", "name"]
+    assert test_module.projection_model(CellMorphology, ("id", "name")) is model
+
+    entity_id = uuid.uuid4()
+    record = model.model_validate_json(
+        f'{{"id": "{entity_id}", "name": "foo", "brain_region": {{"name": "bar"}}}}'
+    )
+    assert record.id == entity_id
+    assert record.name == "foo"
+    assert not hasattr(record, "brain_region")
+
+    with pytest.raises(ValidationError, match="frozen"):
+        record.name = "bar"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_projection_model__errors():
+    with pytest.raises(EntitySDKError, match="At least one field must be selected"):
+        test_module.projection_model(CellMorphology, [])
+    with pytest.raises(EntitySDKError, match="Unknown fields for CellMorphology: foo, bar"):
+        test_module.projection_model(CellMorphology, ["id", "foo", "bar"])
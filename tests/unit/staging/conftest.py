@@ -30,6 +30,14 @@ def _download_url(api_url, route, entity_id, asset_id):
     return f"{api_url}/{route}/{entity_id}/assets/{asset_id}/download"
 
 
+def _json_bytes(data):
+    return json.dumps(data).encode()
+
+
+def _file_size(name):
+    return Path(DATA_DIR, name).stat().st_size
+
+
 @pytest.fixture
 def species():
     return Species(
@@ -122,7 +130,7 @@ def circuit_httpx_mocks(api_url, circuit, httpx_mock, circuit_files):
             "files": {
                 asset_path: {
                     "name": Path(asset_path).name,
-                    "size": 0,
+                    "size": circuit_files[asset_path].stat().st_size,
                     "last_modified": "2025-01-01T00:00:00Z",
                 }
                 for asset_path in circuit_files
@@ -158,7 +166,7 @@ def spike_replays():
 
 
 @pytest.fixture
-def simulation(circuit):
+def simulation(circuit, simulation_config, node_sets, compartment_sets, spike_replays):
     return Simulation(
         id=uuid.uuid4(),
         name="my-simulation",
@@ -174,7 +182,7 @@ def simulation(circuit):
                 label="sonata_simulation_config",
                 path="foo.json",
                 full_path="/foo.json",
-                size=0,
+                size=len(_json_bytes(simulation_config)),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -184,7 +192,7 @@ def simulation(circuit):
                 label="custom_node_sets",
                 path="bar.json",
                 full_path="/bar.json",
-                size=0,
+                size=len(_json_bytes(node_sets)),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -194,7 +202,7 @@ def simulation(circuit):
                 label="replay_spikes",
                 path="PoissonInputStimulus_spikes_1.h5",
                 full_path="/PoissonInputStimulus_spikes_1.h5",
-                size=0,
+                size=len(spike_replays),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -204,7 +212,7 @@ def simulation(circuit):
                 label="replay_spikes",
                 path="PoissonInputStimulus_spikes_2.h5",
                 full_path="/PoissonInputStimulus_spikes_2.h5",
-                size=0,
+                size=len(spike_replays),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -214,7 +222,7 @@ def simulation(circuit):
                 label="compartment_sets",
                 path="compartment_sets.json",
                 full_path="/compartment_sets.json",
-                size=0,
+                size=len(_json_bytes(compartment_sets)),
                 is_directory=False,
                 status=types.AssetStatus.created,
                 storage_type=types.StorageType.aws_s3_internal,
@@ -236,12 +244,12 @@ def simulation_httpx_mocks(
     httpx_mock.add_response(
         method="GET",
         url=f"{api_url}/simulation/{simulation.id}/assets/{simulation.assets[0].id}/download",
-        json=simulation_config,
+        content=_json_bytes(simulation_config),
     )
     httpx_mock.add_response(
         method="GET",
         url=f"{api_url}/simulation/{simulation.id}/assets/{simulation.assets[1].id}/download",
-        json=node_sets,
+        content=_json_bytes(node_sets),
         is_optional=True,
     )
     httpx_mock.add_response(
@@ -263,7 +271,7 @@ def simulation_httpx_mocks(
     httpx_mock.add_response(
         method="GET",
         url=f"{api_url}/simulation/{simulation.id}/assets/{simulation.assets[4].id}/download",
-        json=compartment_sets,
+        content=_json_bytes(compartment_sets),
         is_optional=True,
     )
 
@@ -284,7 +292,7 @@ def spike_report():
 
 
 @pytest.fixture
-def simulation_result(simulation):
+def simulation_result(simulation, voltage_report_1, voltage_report_2, spike_report):
     return SimulationResult(
         id=uuid.uuid4(),
         name="my-sim-result",
@@ -297,7 +305,7 @@ def simulation_result(simulation):
                 label="voltage_report",
                 path="SomaVoltRec 1.h5",
                 full_path="/soma_voltage1.h5",
-                size=0,
+                size=len(voltage_report_1),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -307,7 +315,7 @@ def simulation_result(simulation):
                 label="voltage_report",
                 path="SomaVoltRec 2.h5",
                 full_path="/soma_voltage2.h5",
-                size=0,
+                size=len(voltage_report_2),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -317,7 +325,7 @@ def simulation_result(simulation):
                 label="spike_report",
                 path="out.h5",
                 full_path="/out.h5",
-                size=0,
+                size=len(spike_report),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
             ),
@@ -373,7 +381,7 @@ def cell_morphology(brain_region, subject, mtype, cell_morphology_protocol):
                 label="morphology",
                 path="morph.swc",
                 full_path="/morph.swc",
-                size=0,
+                size=_file_size("morph.swc"),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
                 status="created",
@@ -384,7 +392,7 @@ def cell_morphology(brain_region, subject, mtype, cell_morphology_protocol):
                 label="morphology",
                 path="morph.asc",
                 full_path="/morph.asc",
-                size=0,
+                size=_file_size("morph.asc"),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
                 status="created",
@@ -395,7 +403,7 @@ def cell_morphology(brain_region, subject, mtype, cell_morphology_protocol):
                 label="morphology",
                 path="morph.h5",
                 full_path="/morph.h5",
-                size=0,
+                size=_file_size("morph.h5"),
                 is_directory=False,
                 storage_type=types.StorageType.aws_s3_internal,
                 status="created",
@@ -468,7 +476,7 @@ def emodel(brain_region, etype, species):
         assets=[
             Asset(
                 id=uuid.uuid4(),
-                size=0,
+                size=_file_size("emodel_optimization_output.json"),
                 content_type="application/json",
                 label="emodel_optimization_output",
                 path="emodel_optimization_output.json",
@@ -479,7 +487,7 @@ def emodel(brain_region, etype, species):
             ),
             Asset(
                 id=uuid.uuid4(),
-                size=0,
+                size=_file_size("neuron_hoc.hoc"),
                 content_type="application/hoc",
                 label="neuron_hoc",
                 path="neuron_hoc.hoc",
@@ -1,3 +1,4 @@
+import hashlib
 import uuid
 
 import h5py
@@ -23,10 +24,10 @@ def _mock_ic_asset_response(asset_id, name):
         "is_directory": False,
         "label": AssetLabel.neuron_mechanisms,
         "content_type": ContentType.application_mod,
-        "size": 100,
+        "size": len(name),
         "status": "created",
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(name.encode()).hexdigest(),
         "storage_type": "aws_s3_internal",
     }
 
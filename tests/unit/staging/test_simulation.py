@@ -206,7 +206,7 @@ def _recording_array(array_id, asset_id):
                 label="electrode_locations",
                 path="electrodes.h5",
                 full_path="/electrodes.h5",
-                size=0,
+                size=len(b"array-1"),
                 is_directory=False,
                 storage_type=StorageType.aws_s3_internal,
                 status="created",
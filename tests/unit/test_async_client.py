@@ -0,0 +1,362 @@
+import asyncio
+import hashlib
+import re
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+
+from entitysdk.async_client import AsyncClient
+from entitysdk.exception import EntitiesNotFoundError, EntitySDKError
+from entitysdk.models.asset import Asset
+from entitysdk.models.entity import Entity
+from entitysdk.schemas.asset import MultipartUploadTransferConfig
+from entitysdk.types import AssetLabel, ContentType, FetchContentStrategy
+from entitysdk.utils.store import LocalAssetStore
+
+
+@pytest.fixture
+def async_client(project_context, api_url, auth_token):
+    return AsyncClient(api_url=api_url, project_context=project_context, token_manager=auth_token)
+
+
+def _mock_asset_response(asset_id, *, path="foo.txt", is_directory=False, content=b"file contents"):
+    return {
+        "id": str(asset_id),
+        "path": path,
+        "full_path": f"full/{path}",
+        "is_directory": is_directory,
+        "content_type": ContentType.text_plain,
+        "size": len(content),
+        "status": "created",
+        "meta": {},
+        "sha256_digest": hashlib.sha256(content).hexdigest(),
+        "label": AssetLabel.morphology,
+        "storage_type": "aws_s3_internal",
+    }
+
+
+def test_async_client_search(async_client, httpx_mock, api_url, request_headers):
+    ids = [uuid.uuid4() for _ in range(3)]
+    for page, page_ids in enumerate([ids[:2], ids[2:]], start=1):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{api_url}/entity?name=foo&page_size=2&page={page}",
+            match_headers=request_headers,
+            json={
+                "data": [{"id": str(i), "name": "foo", "type": "circuit"} for i in page_ids],
+                "pagination": {"page": page, "page_size": 2, "total_items": 3},
+            },
+        )
+
+    async def _run():
+        it = async_client.search_entity(entity_type=Entity, query={"name": "foo", "page_size": 2})
+        return await it.all()
+
+    res = asyncio.run(_run())
+    assert [r.id for r in res] == ids
+
+
+def test_async_client_get_entities(async_client, httpx_mock, api_url):
+    ids = [uuid.uuid4() for _ in range(5)]
+    missing_id = uuid.uuid4()
+
+    def _callback(request):
+        chunk = request.url.params["id__in"].split(",")
+        found = [i for i in chunk if uuid.UUID(i) in ids]
+        # paginate with a server default page size smaller than the chunks
+        page = int(request.url.params.get("page", 1))
+        page_size = int(request.url.params.get("page_size", 1))
+        page_ids = found[(page - 1) * page_size : page * page_size]
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"id": i, "name": "foo"} for i in page_ids],
+                "pagination": {"page": page, "page_size": page_size, "total_items": len(found)},
+            },
+        )
+
+    httpx_mock.add_callback(_callback, method="GET", is_reusable=True)
+
+    async def _run():
+        res = await async_client.get_entities(
+            [*reversed(ids), missing_id], entity_type=Entity, chunk_size=2, missing_ok=True
+        )
+        with pytest.raises(EntitiesNotFoundError):
+            await async_client.get_entities([missing_id], entity_type=Entity)
+        return res
+
+    res = asyncio.run(_run())
+    assert [r.id for r in res] == list(reversed(ids))
+    # one request per chunk
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 4
+    assert sorted(int(r.url.params["page_size"]) for r in requests) == [1, 2, 2, 2]
+
+
+def test_async_client_get_update_delete(async_client, httpx_mock, api_url, request_headers):
+    entity_id = uuid.uuid4()
+    url = f"{api_url}/entity/{entity_id}"
+    httpx_mock.add_response(
+        method="GET",
+        url=url,
+        match_headers=request_headers,
+        json={"id": str(entity_id), "name": "foo"},
+    )
+    httpx_mock.add_response(
+        method="PATCH",
+        url=url,
+        match_json={"name": "bar"},
+        json={"id": str(entity_id), "name": "bar"},
+    )
+    httpx_mock.add_response(method="DELETE", url=url)
+
+    async def _run():
+        entity = await async_client.get_entity(entity_id, entity_type=Entity)
+        updated = await async_client.update_entity(
+            entity_id=entity_id, entity_type=Entity, attrs_or_entity={"name": "bar"}
+        )
+        await async_client.delete_entity(entity_id=entity_id, entity_type=Entity)
+        return entity, updated
+
+    entity, updated = asyncio.run(_run())
+    assert entity.name == "foo"
+    assert updated.name == "bar"
+
+
+def test_async_client_get_entity__raises(async_client, httpx_mock):
+    httpx_mock.add_response(method="GET", status_code=404)
+
+    with pytest.raises(EntitySDKError, match="HTTP error 404"):
+        asyncio.run(async_client.get_entity(uuid.uuid4(), entity_type=Entity))
+
+
+def test_async_client_fetch_file_and_content(async_client, httpx_mock, api_url, tmp_path):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset_url = f"{api_url}/entity/{entity_id}/assets/{asset_id}"
+    httpx_mock.add_response(method="GET", url=asset_url, json=_mock_asset_response(asset_id))
+    httpx_mock.add_response(
+        method="GET", url=f"{asset_url}/download", content=b"file contents", is_reusable=True
+    )
+
+    async def _run():
+        path = await async_client.download_file(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_id=asset_id,
+            output_path=tmp_path,
+        )
+        content = await async_client.download_content(
+            entity_id=entity_id, entity_type=Entity, asset_id=asset_id
+        )
+        return path, content
+
+    path, content = asyncio.run(_run())
+    assert path == tmp_path / "foo.txt"
+    assert path.read_bytes() == b"file contents"
+    assert content == b"file contents"
+
+
+def test_async_client_open_content_and_fetch_content_into(async_client, httpx_mock, api_url):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset_url = f"{api_url}/entity/{entity_id}/assets/{asset_id}"
+    httpx_mock.add_response(
+        method="GET", url=f"{asset_url}/download", content=b"file contents", is_reusable=True
+    )
+    asset = Asset.model_validate(_mock_asset_response(asset_id))
+    buffer = bytearray(asset.size)
+
+    async def _run():
+        async with await async_client.open_content(
+            entity_id=entity_id, entity_type=Entity, asset_or_id=asset_id
+        ) as f:
+            head, tail = await f.read(4), await f.read()
+        size = await async_client.fetch_content_into(
+            memoryview(buffer), entity_id=entity_id, entity_type=Entity, asset_or_id=asset
+        )
+        with pytest.raises(EntitySDKError, match="buffer of 4 bytes is too small for the content"):
+            await async_client.fetch_content_into(
+                bytearray(4), entity_id=entity_id, entity_type=Entity, asset_or_id=asset_id
+            )
+        return head, tail, size
+
+    head, tail, size = asyncio.run(_run())
+    assert (head, tail) == (b"file", b" contents")
+    assert buffer[:size] == b"file contents"
+
+
+def test_async_client_open_content__local_store(project_context, api_url, httpx_mock, tmp_path):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset = Asset.model_validate(_mock_asset_response(asset_id))
+    path = tmp_path / asset.storage_type / asset.full_path
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"file contents")
+    async_client = AsyncClient(
+        api_url=api_url,
+        project_context=project_context,
+        token_manager="token",
+        local_store=LocalAssetStore(prefix=tmp_path),
+    )
+    buffer = bytearray(asset.size)
+
+    async def _run():
+        async with await async_client.open_content(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_or_id=asset,
+            strategy=FetchContentStrategy.local_only,
+        ) as f:
+            content = await f.read()
+        size = await async_client.fetch_content_into(
+            buffer,
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_or_id=asset,
+            strategy=FetchContentStrategy.local_only,
+        )
+        with pytest.raises(EntitySDKError, match="buffer is read-only"):
+            await async_client.fetch_content_into(
+                memoryview(bytes(20)), entity_id=entity_id, entity_type=Entity, asset_or_id=asset
+            )
+        return content, size
+
+    content, size = asyncio.run(_run())
+    assert content == b"file contents"
+    assert buffer[:size] == b"file contents"
+
+
+@pytest.mark.parametrize("max_concurrent", [1, 4])
+def test_async_client_download_directory(
+    async_client, httpx_mock, api_url, tmp_path, max_concurrent
+):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset_url = f"{api_url}/entity/{entity_id}/assets/{asset_id}"
+    names = [f"file{i}.txt" for i in range(5)]
+    date = "2025-01-01T00:00:00Z"
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{asset_url}/list",
+        json={"files": {n: {"name": n, "size": 1, "last_modified": date} for n in names}},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=asset_url,
+        json=_mock_asset_response(asset_id, path="dir", is_directory=True),
+    )
+    for name in names:
+        httpx_mock.add_response(
+            method="GET", url=f"{asset_url}/download?asset_path={name}", text=name
+        )
+
+    res = asyncio.run(
+        async_client.download_directory(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_id=asset_id,
+            output_path=tmp_path,
+            max_concurrent=max_concurrent,
+        )
+    )
+    assert res == [tmp_path / "dir" / name for name in names]
+    assert [p.read_text() for p in res] == names
+
+
+def test_async_client_iter_directory(async_client, httpx_mock, api_url, tmp_path):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset_url = f"{api_url}/entity/{entity_id}/assets/{asset_id}"
+    names = [f"file{i}.txt" for i in range(5)]
+    date = "2025-01-01T00:00:00Z"
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{asset_url}/list",
+        json={"files": {n: {"name": n, "size": 1, "last_modified": date} for n in names}},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=asset_url,
+        json=_mock_asset_response(asset_id, path="dir", is_directory=True),
+    )
+    running = max_running = 0
+
+    async def _download(request):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return httpx.Response(200, text=request.url.params["asset_path"])
+
+    httpx_mock.add_callback(_download, url=re.compile(f"{asset_url}/download.*"), is_reusable=True)
+
+    async def _run():
+        results = await async_client.iter_directory(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_id=asset_id,
+            output_path=tmp_path,
+            max_concurrent=2,
+        )
+        return [item async for item in results]
+
+    res = asyncio.run(_run())
+    assert sorted(res) == [(Path(name), tmp_path / "dir" / name) for name in names]
+    assert max_running == 2
+
+
+def test_async_client_upload_file_multipart(
+    async_client, httpx_mock, api_url, request_headers, tmp_path
+):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    path = tmp_path / "foo.txt"
+    path.write_bytes(b"0123456789")
+
+    base_url = f"{api_url}/entity/{entity_id}/assets"
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{base_url}/multipart-upload/initiate",
+        match_headers=request_headers,
+        json=_mock_asset_response(asset_id, content=b"0123456789")
+        | {
+            "status": "uploading",
+            "upload_meta": {
+                "part_size": 4,
+                "parts": [{"part_number": i, "url": f"http://upload/{i}"} for i in range(1, 4)],
+            },
+        },
+    )
+    for i, expected in enumerate([b"0123", b"4567", b"89"], start=1):
+        httpx_mock.add_response(method="PUT", url=f"http://upload/{i}", match_content=expected)
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{base_url}/{asset_id}/multipart-upload/complete",
+        match_headers=request_headers,
+        json=_mock_asset_response(asset_id, content=b"0123456789"),
+    )
+
+    res = asyncio.run(
+        async_client.upload_file(
+            entity_id=entity_id,
+            entity_type=Entity,
+            file_path=path,
+            file_content_type=ContentType.text_plain,
+            asset_label=AssetLabel.morphology,
+            transfer_config=MultipartUploadTransferConfig(threshold=1, max_concurrency=2),
+        )
+    )
+    assert res.id == asset_id
+
+
+def test_async_client_context_manager(api_url):
+    async def _run():
+        async with AsyncClient(api_url=api_url, token_manager="token") as client:
+            http_client = client._http_client
+        return http_client
+
+    assert asyncio.run(_run()).is_closed
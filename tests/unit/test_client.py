@@ -1,5 +1,7 @@
+import hashlib
 import io
 import re
+import threading
 import uuid
 from pathlib import Path
 from unittest.mock import patch
@@ -11,11 +13,13 @@ from pydantic import ValidationError
 from entitysdk.client import Client
 from entitysdk.common import ProjectContext
 from entitysdk.config import settings
-from entitysdk.exception import EntitySDKError
+from entitysdk.exception import EntitiesNotFoundError, EntitySDKError
 from entitysdk.models import Asset, Circuit, MTypeClass
 from entitysdk.models.asset import DetailedFile, DetailedFileList
 from entitysdk.models.core import Identifiable
 from entitysdk.models.entity import Entity
+from entitysdk.models.lazy import LazyModel
+from entitysdk.models.projection import Projection
 from entitysdk.schemas.asset import MultipartDirectoryUploadTransferConfig
 from entitysdk.types import (
     AssetLabel,
@@ -26,6 +30,8 @@ from entitysdk.types import (
     FetchFileStrategy,
     StorageType,
 )
+from entitysdk.utils.cache import ContentCache, DigestCache, EntityCache
+from entitysdk.utils.transfer import TransferStats
 from tests.unit.util import PROJECT_ID, VIRTUAL_LAB_ID
 
 
@@ -114,6 +120,75 @@ def test_client_search(client, httpx_mock):
     assert res[1].id == id2
 
 
+def test_client_search__fields(client, httpx_mock):
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    httpx_mock.add_response(
+        method="GET",
+        json={
+            "data": [
+                {"id": str(i), "name": "foo", "description": "bar", "extra": {"a": 1}} for i in ids
+            ],
+            "pagination": {"page": 1, "page_size": 10, "total_items": 2},
+        },
+    )
+    res = client.search_entity(entity_type=Entity, fields=["id", "name"]).all()
+
+    assert [r.id for r in res] == ids
+    assert all(isinstance(r, Projection) for r in res)
+    assert res[0].model_dump() == {"id": ids[0], "name": "foo"}
+
+
+def test_client_search__lazy(client, httpx_mock):
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    httpx_mock.add_response(
+        method="GET",
+        json={
+            "data": [
+                {"id": str(i), "name": name} for i, name in zip(ids, ["foo", "bar"], strict=True)
+            ],
+            "pagination": {"page": 1, "page_size": 10, "total_items": 2},
+        },
+    )
+    res = [r for r in client.search_entity(entity_type=Entity, lazy=True) if r.name == "bar"]
+
+    assert len(res) == 1
+    assert isinstance(res[0], LazyModel)
+    assert not res[0].is_materialized
+    assert res[0].materialize() == Entity(id=ids[1], name="bar")
+
+
+def test_client_search__to_columns(client, httpx_mock):
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    httpx_mock.add_response(
+        method="GET",
+        json={
+            "data": [
+                {"id": str(ids[0]), "name": "foo", "brain_region": {"acronym": "SSp"}},
+                {"id": str(ids[1]), "name": "bar", "brain_region": None},
+            ],
+            "pagination": {"page": 1, "page_size": 10, "total_items": 2},
+        },
+    )
+    res = client.search_entity(entity_type=Entity, lazy=True).to_columns(
+        ["id", "brain_region.acronym"]
+    )
+    assert res == {"id": ids, "brain_region.acronym": ["SSp", None]}
+
+
+def test_client_search__count(client, httpx_mock, api_url):
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity?name=foo&page=1&page_size=1",
+        json={
+            "data": [{"id": str(uuid.uuid4()), "name": "foo"}],
+            "pagination": {"page": 1, "page_size": 1, "total_items": 42},
+        },
+        is_reusable=True,
+    )
+    assert client.search_entity(entity_type=Entity, query={"name": "foo"}).count() == 42
+    assert client.search_entity(entity_type=Entity, query={"name": "foo"}, limit=10).count() == 10
+
+
 @patch("entitysdk.route.get_route_name")
 def test_client_update(mocked_route, client, httpx_mock):
     class Foo(Identifiable):
@@ -171,6 +246,7 @@ def _mock_asset_response(
     content_type: ContentType = ContentType.text_plain,
     status: AssetStatus = AssetStatus.created,
     label: AssetLabel = AssetLabel.morphology,
+    content: bytes = b"foo",
 ):
     return {
         "id": str(asset_id),
@@ -178,10 +254,10 @@ def _mock_asset_response(
         "full_path": "full/path_to_asset",
         "is_directory": False,
         "content_type": content_type,
-        "size": 100,
+        "size": len(content),
         "status": status,
         "meta": {},
-        "sha256_digest": "sha256_digest",
+        "sha256_digest": hashlib.sha256(content).hexdigest(),
         "label": label,
         "storage_type": "aws_s3_internal",
     }
@@ -327,6 +403,78 @@ def test_client_download_file__output_file(
     assert output_path.read_bytes() == b"foo"
 
 
+def test_client_download_file__skip_unchanged(
+    tmp_path, project_context, api_url, auth_token, httpx_mock
+):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset = _mock_asset_response(asset_id=asset_id, path="foo.h5") | {
+        "size": 3,
+        "sha256_digest": hashlib.sha256(b"foo").hexdigest(),
+    }
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}",
+        json=asset,
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/download",
+        content=b"foo",
+        is_reusable=True,
+    )
+    digest_cache = DigestCache(tmp_path / "digests.db")
+    client = Client(
+        api_url=api_url,
+        project_context=project_context,
+        token_manager=auth_token,
+        digest_cache=digest_cache,
+    )
+    output_path = tmp_path / "foo.h5"
+    stats = TransferStats()
+
+    for _ in range(2):
+        client.download_file(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_id=asset_id,
+            output_path=output_path,
+            skip_unchanged=True,
+            stats=stats,
+        )
+
+    assert output_path.read_bytes() == b"foo"
+    assert stats.to_dict() == {
+        "files_transferred": 1,
+        "bytes_transferred": 3,
+        "files_skipped": 1,
+        "bytes_skipped": 3,
+        "files_cached": 0,
+        "bytes_cached": 0,
+        "files_removed": 0,
+        "bytes_removed": 0,
+    }
+    # the digest of the downloaded file is recorded, so it's not hashed again
+    assert (digest_cache.hits, digest_cache.misses) == (1, 0)
+    assert (
+        len(httpx_mock.get_requests(url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/download"))
+        == 1
+    )
+
+    output_path.write_bytes(b"bar")
+    client.download_file(
+        entity_id=entity_id,
+        entity_type=Entity,
+        asset_id=asset_id,
+        output_path=output_path,
+        skip_unchanged=True,
+        stats=stats,
+    )
+    assert output_path.read_bytes() == b"foo"
+    assert stats.files_transferred == 2
+
+
 def test_client_download_file__output_file__inconsistent_ext(
     tmp_path,
     client,
@@ -467,7 +615,7 @@ def test_client_download_file__asset_subdirectory_paths(
         method="GET",
         url=f"{api_url}/entity/{entity_id}/assets/{asset2_id}",
         match_headers=request_headers,
-        json=_mock_asset_response(asset_id=asset2_id) | {"path": "foo/bar/bar.swc"},
+        json=_mock_asset_response(asset_id=asset2_id, content=b"bar") | {"path": "foo/bar/bar.swc"},
     )
     httpx_mock.add_response(
         method="GET",
@@ -554,6 +702,100 @@ def test_client_get(
     assert res.assets[1].id == asset_id2
 
 
+def test_client_get__entity_cache(httpx_mock, api_url, project_context, auth_token):
+    entity_cache = EntityCache()
+    client = Client(
+        api_url=api_url,
+        project_context=project_context,
+        token_manager=auth_token,
+        entity_cache=entity_cache,
+    )
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    entity_url = f"{api_url}/entity/{entity_id}"
+    for _ in range(2):
+        httpx_mock.add_response(
+            method="GET",
+            url=entity_url,
+            json=_mock_entity_response(entity_id=str(entity_id)),
+        )
+    httpx_mock.add_response(
+        method="DELETE",
+        url=f"{entity_url}/assets/{asset_id}",
+        json=_mock_asset_delete_response(asset_id),
+    )
+
+    res1 = client.get_entity(entity_id, entity_type=Entity)
+    res2 = client.get_entity(entity_id, entity_type=Entity)
+    assert res1 is res2
+    assert (entity_cache.hits, entity_cache.misses) == (1, 1)
+
+    client.delete_asset(entity_id=entity_id, entity_type=Entity, asset_id=asset_id)
+    assert len(entity_cache) == 0
+
+    res3 = client.get_entity(entity_id, entity_type=Entity)
+    assert res3 is not res1
+    assert (entity_cache.hits, entity_cache.misses) == (1, 2)
+
+
+def _mock_search_by_ids(httpx_mock, api_url, existing_ids, requests):
+    def _callback(request):
+        requests.append(request)
+        ids = request.url.params["id__in"].split(",")
+        found = [i for i in reversed(ids) if uuid.UUID(i) in existing_ids]
+        # paginate with a server default page size smaller than the chunks
+        page = int(request.url.params.get("page", 1))
+        page_size = int(request.url.params.get("page_size", 1))
+        page_ids = found[(page - 1) * page_size : page * page_size]
+        return httpx.Response(
+            200,
+            json={
+                "data": [_mock_entity_response(entity_id=i) for i in page_ids],
+                "pagination": {"page": page, "page_size": page_size, "total_items": len(found)},
+            },
+        )
+
+    httpx_mock.add_callback(
+        _callback, method="GET", url=re.compile(f"{api_url}/entity\\?.*"), is_reusable=True
+    )
+
+
+def test_client_get_entities(httpx_mock, api_url, project_context, auth_token):
+    entity_cache = EntityCache()
+    client = Client(
+        api_url=api_url,
+        project_context=project_context,
+        token_manager=auth_token,
+        entity_cache=entity_cache,
+    )
+    ids = [uuid.uuid4() for _ in range(5)]
+    requests = []
+    _mock_search_by_ids(httpx_mock, api_url, set(ids), requests)
+
+    res = client.get_entities([ids[3], *ids, ids[0]], entity_type=Entity, chunk_size=2)
+    assert [r.id for r in res] == [ids[3], *ids, ids[0]]
+    # one request per chunk
+    assert len(requests) == 3
+    assert [int(request.url.params["page_size"]) for request in requests] == [2, 2, 1]
+    assert all(
+        request.headers["project-id"] == str(project_context.project_id) for request in requests
+    )
+
+    # the entities are cached
+    requests.clear()
+    res = client.get_entities(ids[:2], entity_type=Entity)
+    assert [r.id for r in res] == ids[:2]
+    assert requests == []
+
+    missing_id = uuid.uuid4()
+    with pytest.raises(EntitiesNotFoundError, match=str(missing_id)) as e:
+        client.get_entities([ids[0], missing_id], entity_type=Entity)
+    assert e.value.missing_ids == [missing_id]
+
+    res = client.get_entities([missing_id, ids[1]], entity_type=Entity, missing_ok=True)
+    assert [r.id for r in res] == [ids[1]]
+
+
 @patch("entitysdk.route.get_route_name")
 def test_client_admin_get(
     mock_route,
@@ -708,6 +950,7 @@ def test_client_download_assets(
                     asset_id=asset2_id,
                     path="foo/bar/bar.swc",
                     content_type="application/swc",
+                    content=b"bar",
                 ),
             ],
         ),
@@ -720,6 +963,7 @@ def test_client_download_assets(
             asset_id=asset2_id,
             path="foo/bar/bar.swc",
             content_type="application/swc",
+            content=b"bar",
         ),
     )
     httpx_mock.add_response(
@@ -884,7 +1128,7 @@ def test_client_download_assets__entity(
         method="GET",
         url=f"{api_url}/entity/{entity_id}/assets/{asset_id}",
         match_headers=request_headers,
-        json=_mock_asset_response(asset_id=asset_id)
+        json=_mock_asset_response(asset_id=asset_id, content=b"bar")
         | {"path": "foo.json", "content_type": "application/json"},
     )
     httpx_mock.add_response(
@@ -1231,6 +1475,238 @@ def test_client_download_directory(
         )
 
 
+def test_client_download_directory__content_cache(
+    tmp_path, project_context, api_url, auth_token, httpx_mock
+):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/list",
+        json={
+            "files": {
+                "foo.txt": {"name": "foo.txt", "size": 3, "last_modified": "2025-01-01T00:00:00Z"},
+            }
+        },
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}",
+        json=_mock_asset_response(asset_id=asset_id) | {"is_directory": True},
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/download?asset_path=foo.txt",
+        text="foo",
+    )
+    content_cache = ContentCache(tmp_path / "cache")
+    client = Client(
+        api_url=api_url,
+        project_context=project_context,
+        token_manager=auth_token,
+        content_cache=content_cache,
+    )
+
+    for output_path in (tmp_path / "first", tmp_path / "second"):
+        res = client.download_directory(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_id=asset_id,
+            output_path=output_path,
+            ignore_directory_name=True,
+        )
+        assert res == [output_path / "foo.txt"]
+        assert res[0].read_text() == "foo"
+
+    # the second directory is materialized from the cache, without downloading the file
+    download_url = f"{api_url}/entity/{entity_id}/assets/{asset_id}/download?asset_path=foo.txt"
+    assert len(httpx_mock.get_requests(url=download_url)) == 1
+    assert content_cache.stats()["hits"] == 1
+
+
+@pytest.mark.parametrize("max_concurrent", [1, 4])
+def test_client_download_directory__sync(tmp_path, client, httpx_mock, api_url, max_concurrent):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    date = "2025-01-01T00:00:00Z"
+    listing = {
+        "foo.txt": {"name": "foo.txt", "size": 3, "last_modified": date},
+        "sub/bar.txt": {"name": "bar.txt", "size": 3, "last_modified": date},
+    }
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/list",
+        json={"files": listing},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/list",
+        json={"files": listing | {"foo.txt": listing["foo.txt"] | {"size": 4}}},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}",
+        json=_mock_asset_response(asset_id=asset_id) | {"is_directory": True},
+        is_reusable=True,
+    )
+    for path, content in [("foo.txt", "foo"), ("sub/bar.txt", "bar"), ("foo.txt", "food")]:
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/download?asset_path={path}",
+            text=content,
+        )
+    directory = tmp_path / "path_to_asset"
+    directory.mkdir()
+    (directory / "extra.txt").write_text("extra")
+    # the files outside of the directory are kept
+    (tmp_path / "unrelated.txt").write_text("unrelated")
+
+    stats = TransferStats()
+    for _ in range(2):
+        res = client.download_directory(
+            entity_id=entity_id,
+            entity_type=Entity,
+            asset_id=asset_id,
+            output_path=tmp_path,
+            max_concurrent=max_concurrent,
+            sync=True,
+            delete_extraneous=True,
+            stats=stats,
+        )
+        assert sorted(res) == [directory / "foo.txt", directory / "sub/bar.txt"]
+
+    # only the changed file is downloaded again
+    assert (directory / "foo.txt").read_text() == "food"
+    assert (directory / "sub/bar.txt").read_text() == "bar"
+    assert not (directory / "extra.txt").exists()
+    assert (tmp_path / "unrelated.txt").read_text() == "unrelated"
+    assert (stats.files_transferred, stats.bytes_transferred) == (3, 10)
+    assert (stats.files_skipped, stats.bytes_skipped) == (1, 3)
+    assert (stats.files_removed, stats.bytes_removed) == (1, 5)
+
+
+def test_client_download_directory__delete_extraneous_without_directory_name(tmp_path, client):
+    (tmp_path / "unrelated.txt").write_text("unrelated")
+
+    with pytest.raises(EntitySDKError, match="delete_extraneous can't be combined"):
+        client.download_directory(
+            entity_id=uuid.uuid4(),
+            entity_type=Entity,
+            asset_id=uuid.uuid4(),
+            output_path=tmp_path,
+            ignore_directory_name=True,
+            delete_extraneous=True,
+        )
+    assert (tmp_path / "unrelated.txt").exists()
+
+
+def test_client_download_directory__filtered(tmp_path, client, httpx_mock, api_url):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    date = "2025-01-01T00:00:00Z"
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/list",
+        json={
+            "files": {
+                "circuit_config.json": {
+                    "name": "circuit_config.json",
+                    "size": 2,
+                    "last_modified": date,
+                },
+                "nodes/nodes.h5": {"name": "nodes.h5", "size": 5, "last_modified": date},
+                "edges/edges.h5": {"name": "edges.h5", "size": 5000, "last_modified": date},
+                "nodes/nodes.bak": {"name": "nodes.bak", "size": 5, "last_modified": date},
+            }
+        },
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}",
+        json=_mock_asset_response(asset_id=asset_id) | {"is_directory": True},
+        is_reusable=True,
+    )
+    for path in ("circuit_config.json", "nodes/nodes.h5"):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/download?asset_path={path}",
+            text="data",
+        )
+
+    res = client.download_directory(
+        entity_id=entity_id,
+        entity_type=Entity,
+        asset_id=asset_id,
+        output_path=tmp_path,
+        ignore_directory_name=True,
+        exclude=["*.bak"],
+        max_file_size=1000,
+    )
+
+    # only the selected files are downloaded
+    assert res == [tmp_path / "circuit_config.json", tmp_path / "nodes/nodes.h5"]
+    assert sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("*.*")) == [
+        Path("circuit_config.json"),
+        Path("nodes/nodes.h5"),
+    ]
+
+
+def test_client_iter_directory(tmp_path, client, httpx_mock, api_url):
+    entity_id = uuid.uuid4()
+    asset_id = uuid.uuid4()
+    asset_url = f"{api_url}/entity/{entity_id}/assets/{asset_id}"
+    names = [f"file{i}.txt" for i in range(6)]
+    date = "2025-01-01T00:00:00Z"
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{asset_url}/list",
+        json={"files": {n: {"name": n, "size": 1, "last_modified": date} for n in names}},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=asset_url,
+        json=_mock_asset_response(asset_id=asset_id) | {"is_directory": True},
+        is_reusable=True,
+    )
+    lock = threading.Lock()
+    release = threading.Event()
+    running = max_running = 0
+
+    def _download(request):
+        nonlocal running, max_running
+        name = request.url.params["asset_path"]
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        if name == "file0.txt":
+            assert release.wait(5)
+        with lock:
+            running -= 1
+        return httpx.Response(200, text=name)
+
+    httpx_mock.add_callback(_download, url=re.compile(f"{asset_url}/download.*"), is_reusable=True)
+
+    results = client.iter_directory(
+        entity_id=entity_id,
+        entity_type=Entity,
+        asset_id=asset_id,
+        output_path=tmp_path,
+        ignore_directory_name=True,
+        max_concurrent=3,
+    )
+    # the other files are yielded while the first one is still being fetched
+    first = [next(results) for _ in range(4)]
+    assert Path("file0.txt") not in dict(first)
+    release.set()
+    pairs = first + results.all()
+
+    assert sorted(pairs) == [(Path(name), tmp_path / name) for name in names]
+    assert all(local.read_text() == str(relative) for relative, local in pairs)
+    assert max_running <= 3
+
+
 @pytest.mark.parametrize("max_concurrent", [1, 4])
 def test_client_download_directory__asset(
     tmp_path,
@@ -1,3 +1,4 @@
+import hashlib
 from pathlib import Path
 from uuid import UUID
 
@@ -54,8 +55,8 @@ def public_asset_file_metadata(virtual_lab_id, project_id, entity_id, public_ass
         "is_directory": False,
         "content_type": "application/swc",
         "label": "morphology",
-        "size": 18,
-        "sha256_digest": "123456",
+        "size": len(b"public"),
+        "sha256_digest": hashlib.sha256(b"public").hexdigest(),
         "meta": {},
         "status": "created",
         "storage_type": "aws_s3_internal",
@@ -1710,3 +1711,129 @@ def test_fetch_assets__wout_mount__link_or_download(
     assert not res.path.is_symlink()
     assert res.path.resolve().name == "my_cell.swc"
     assert res.path.read_bytes() == b"public"
+
+
+def test_fetch_content__with_mount__memory_map(
+    client_with_mount,
+    entity_id,
+    entity_type,
+    public_asset_directory_id,
+    public_asset_directory_httpx_mock,
+):
+    """The file in the store is mapped in memory instead of being copied."""
+    res = client_with_mount.fetch_content(
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=public_asset_directory_id,
+        asset_path="dir_cell.swc",
+        strategy=FetchContentStrategy.local_only,
+        memory_map=True,
+    )
+    assert isinstance(res, memoryview)
+    assert res == b"public_directory_file"
+
+
+def test_open_content__with_mount(
+    client_with_mount,
+    entity_id,
+    entity_type,
+    public_asset_directory_id,
+    public_asset_directory_httpx_mock,
+):
+    """The file in the store is opened directly."""
+    with client_with_mount.open_content(
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=public_asset_directory_id,
+        asset_path="dir_cell.swc",
+    ) as f:
+        assert f.read(6) == b"public"
+        assert f.read() == b"_directory_file"
+
+
+def test_open_content__wout_mount(
+    client_wout_mount,
+    entity_id,
+    entity_type,
+    public_asset_file_id,
+    public_asset_file_download_httpx_mock,
+):
+    """The content is streamed from the service."""
+    with client_wout_mount.open_content(
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=public_asset_file_id,
+    ) as f:
+        assert f.read(3) == b"pub"
+        assert f.read() == b"lic"
+
+    with pytest.raises(EntitySDKError, match="copy strategy failed"):
+        client_wout_mount.open_content(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=public_asset_file_id,
+            strategy=FetchContentStrategy.local_only,
+        )
+
+
+def test_fetch_content_into__with_mount(
+    client_with_mount, entity_id, entity_type, public_asset_file_metadata
+):
+    """The file in the store is read into the buffer."""
+    asset = Asset.model_validate(public_asset_file_metadata)
+    buffer = bytearray(asset.size)
+
+    size = client_with_mount.fetch_content_into(
+        buffer,
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=asset,
+        strategy=FetchContentStrategy.local_only,
+    )
+    assert buffer[:size] == b"public"
+
+    with pytest.raises(EntitySDKError, match="buffer of 3 bytes is too small for 6 bytes"):
+        client_with_mount.fetch_content_into(
+            memoryview(buffer)[:3], entity_id=entity_id, entity_type=entity_type, asset_or_id=asset
+        )
+    with pytest.raises(EntitySDKError, match="buffer is read-only"):
+        client_with_mount.fetch_content_into(
+            memoryview(bytes(20)), entity_id=entity_id, entity_type=entity_type, asset_or_id=asset
+        )
+
+
+def test_fetch_content_into__wout_mount(
+    client_wout_mount,
+    entity_id,
+    entity_type,
+    public_asset_file_metadata,
+    public_asset_file_download_httpx_mock,
+):
+    """The content is streamed into the buffer."""
+    asset = Asset.model_validate(public_asset_file_metadata)
+    buffer = bytearray(asset.size)
+
+    size = client_wout_mount.fetch_content_into(
+        memoryview(buffer),
+        entity_id=entity_id,
+        entity_type=entity_type,
+        asset_or_id=asset,
+    )
+    assert buffer[:size] == b"public"
+
+
+def test_fetch_content_into__too_small(
+    client_wout_mount,
+    entity_id,
+    entity_type,
+    public_asset_file_id,
+    public_asset_file_download_httpx_mock,
+):
+    """The size of the content is checked while streaming when the asset is not given."""
+    with pytest.raises(EntitySDKError, match="buffer of 4 bytes is too small for the content"):
+        client_wout_mount.fetch_content_into(
+            bytearray(4),
+            entity_id=entity_id,
+            entity_type=entity_type,
+            asset_or_id=public_asset_file_id,
+        )
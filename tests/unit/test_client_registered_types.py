@@ -105,7 +105,7 @@ def test_fetch_assets_accepts_registered_entity(
             "label": "morphology",
             "is_directory": False,
             "content_type": "application/json",
-            "size": 1,
+            "size": 4,
             "status": "created",
             "meta": {},
         },
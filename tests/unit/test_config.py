@@ -11,3 +11,11 @@ def test_settings_with_env(monkeypatch):
     monkeypatch.setenv("ENTITYSDK_PAGE_SIZE", "123")
     settings = test_module.Settings()
     assert settings.page_size == 123
+
+
+def test_settings_page_prefetch(monkeypatch):
+    monkeypatch.delenv("ENTITYSDK_PAGE_PREFETCH", raising=False)
+    assert test_module.Settings().page_prefetch == 0
+
+    monkeypatch.setenv("ENTITYSDK_PAGE_PREFETCH", "4")
+    assert test_module.Settings().page_prefetch == 4
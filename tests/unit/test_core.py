@@ -16,6 +16,7 @@ from entitysdk.types import (
     FetchFileStrategy,
     StorageType,
 )
+from entitysdk.utils.cache import MetadataCache
 
 
 @pytest.fixture
@@ -56,6 +57,69 @@ def test_get_api_version(httpx_mock, token_from_value_manager):
     assert result.commit_sha == "def456"
 
 
+def test_get_entity_and_asset_with_metadata_cache(
+    tmp_path, httpx_mock, token_from_value_manager, project_context
+):
+    api_url = "http://mock-host:8000"
+    entity_id = uuid4()
+    asset_id = uuid4()
+    metadata_cache = MetadataCache(tmp_path / "cache.db")
+    asset_json = {
+        "id": str(asset_id),
+        "path": "dir",
+        "full_path": "full/dir",
+        "is_directory": True,
+        "content_type": "application/vnd.directory",
+        "size": 0,
+        "sha256_digest": None,
+        "status": "created",
+        "meta": {},
+        "label": "sonata_circuit",
+        "storage_type": "aws_s3_internal",
+    }
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}",
+        json={"id": str(entity_id), "name": "foo", "update_date": "2025-01-01T00:00:00Z"},
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}?foo=bar",
+        json={"id": str(entity_id), "name": "bar"},
+    )
+    httpx_mock.add_response(
+        method="GET", url=f"{api_url}/entity/{entity_id}/assets/{asset_id}", json=asset_json
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{api_url}/entity/{entity_id}/assets/{asset_id}/list",
+        json={"files": {"a.txt": {"name": "a.txt", "size": 1, "last_modified": "2025-01-01"}}},
+    )
+
+    kwargs = {
+        "api_url": api_url,
+        "entity_id": entity_id,
+        "project_context": project_context,
+        "token_manager": token_from_value_manager,
+        "http_client": httpx.Client(),
+        "admin": False,
+        "metadata_cache": metadata_cache,
+    }
+    # the second calls are served by the cache
+    for _ in range(2):
+        entity = test_module.get_entity(entity_type=models.Entity, **kwargs)
+        asset = test_module.get_entity_asset(entity_type=models.Entity, asset_id=asset_id, **kwargs)
+        files = test_module.list_directory(entity_type=models.Entity, asset_id=asset_id, **kwargs)
+        assert entity.name == "foo"
+        assert asset.id == asset_id
+        assert list(files.files) == [Path("a.txt")]
+
+    # the options bypass the cache
+    entity = test_module.get_entity(entity_type=models.Entity, options={"foo": "bar"}, **kwargs)
+    assert entity.name == "bar"
+    assert (metadata_cache.hits, metadata_cache.misses) == (3, 3)
+
+
 def test_upload_asset_file(asset_file, token_manager):
 
     transfer_config = Mock()
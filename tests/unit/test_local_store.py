@@ -42,3 +42,17 @@ def test_link_path(local_store, tmp_path):
 def test_read_bytes(local_store):
     assert local_store.read_bytes("file1.txt") == b"file1"
     assert local_store.read_bytes("directory/file2.txt") == b"file2"
+
+
+def test_open(local_store):
+    with local_store.open("directory/file2.txt") as f:
+        assert f.read() == b"file2"
+
+
+def test_map_bytes(local_store):
+    view = local_store.map_bytes("file1.txt")
+    assert view == b"file1"
+    assert view.readonly
+
+    (local_store.prefix / "empty.txt").touch()
+    assert local_store.map_bytes("empty.txt") == b""
@@ -7,6 +7,7 @@ import pytest
 
 from entitysdk import ProjectContext, models
 from entitysdk import multipart_upload as test_module
+from entitysdk.config import settings
 from entitysdk.exception import EntitySDKError
 from entitysdk.models.asset import LocalAssetMetadata
 from entitysdk.schemas.asset import (
@@ -340,6 +341,29 @@ def test_complete_upload(httpx_mock, project_context, asset_payload, token_from_
     assert res.status == "created"
 
 
+def test_complete_upload_is_not_retried(
+    httpx_mock, monkeypatch, project_context, token_from_value_manager
+):
+    monkeypatch.setattr(settings, "max_retries", 1)
+    monkeypatch.setattr(settings, "retry_backoff_base", 0)
+    url = f"http://my-url/cell-morphology/{ENTITY_ID}/assets/{ASSET_ID}/multipart-upload/complete"
+    httpx_mock.add_response(method="POST", url=url, status_code=503)
+
+    # retrying could complete an upload twice
+    with pytest.raises(EntitySDKError, match="HTTP error 503"):
+        test_module._complete_upload(
+            api_url=API_URL,
+            entity_id=ENTITY_ID,
+            entity_type=ENTITY_TYPE,
+            asset_id=ASSET_ID,
+            project_context=project_context,
+            token_manager=token_from_value_manager,
+            http_client=httpx.Client(),
+            admin=False,
+        )
+    assert len(httpx_mock.get_requests()) == 1
+
+
 def test_upload_parts_sequential_calls_upload_part_in_order(parts):
     http_client = httpx.Client()
     with patch("entitysdk.multipart_upload._upload_part_with_retry") as mock_upload_part:
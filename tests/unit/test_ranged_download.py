@@ -0,0 +1,301 @@
+import asyncio
+import hashlib
+import re
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from entitysdk import async_ranged_download, core
+from entitysdk import ranged_download as test_module
+from entitysdk.config import settings
+from entitysdk.exception import EntitySDKError
+from entitysdk.models import Entity
+from entitysdk.schemas.asset import DownloadTransferConfig
+from entitysdk.utils.checkpoint import DownloadCheckpoint
+from entitysdk.utils.instrumentation import PART_EXTENSION
+
+API_URL = "http://entitycore/api"
+S3_URL = "http://s3/bucket/file.bin"
+CONTENT = bytes(range(256)) * 40 + b"tail"
+TRANSFER_CONFIG = DownloadTransferConfig(part_size=1000, max_concurrency=4)
+
+
+@pytest.fixture
+def token_manager():
+    class TokenManager:
+        def get_token(self):
+            return "my-token"
+
+    return TokenManager()
+
+
+class RangeServer:
+    """Redirect the downloads to a fake S3 url supporting range requests."""
+
+    def __init__(self, content=CONTENT, *, ranges=True, fail_once=None):
+        self.content = content
+        self.ranges = ranges
+        self.fail_once = set(fail_once or ())
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.url.host == "entitycore":
+            return httpx.Response(307, headers={"Location": S3_URL})
+        if not self.ranges or "Range" not in request.headers:
+            return httpx.Response(200, content=self.content)
+        start, end = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers["Range"]).groups()
+        start, end = int(start), int(end or len(self.content) - 1)
+        if start in self.fail_once:
+            self.fail_once.remove(start)
+            raise httpx.ReadError("interrupted")
+        end = min(end, len(self.content) - 1)
+        return httpx.Response(
+            206,
+            content=self.content[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(self.content)}"},
+        )
+
+
+def _checkpoint(tmp_path):
+    return DownloadCheckpoint(tmp_path / "file.bin", size=len(CONTENT), sha256_digest=None)
+
+
+def _download(tmp_path, server, checkpoint=None):
+    checkpoint = checkpoint or _checkpoint(tmp_path)
+    test_module.download_file_ranges(
+        url=f"{API_URL}/entity/1/assets/2/download",
+        checkpoint=checkpoint,
+        headers={"Authorization": "Bearer token"},
+        parameters={},
+        http_client=httpx.Client(transport=httpx.MockTransport(server)),
+        transfer_config=TRANSFER_CONFIG,
+    )
+    return checkpoint.commit()
+
+
+def test_parse_content_range():
+    request = httpx.Request("GET", S3_URL)
+    response = httpx.Response(206, headers={"Content-Range": "bytes 5-9/20"}, request=request)
+    assert test_module.parse_content_range(response) == (5, 9, 20)
+    assert test_module.parse_content_range(httpx.Response(200, request=request)) is None
+
+    response = httpx.Response(206, headers={"Content-Range": "bytes */20"}, request=request)
+    with pytest.raises(EntitySDKError, match="Invalid Content-Range header"):
+        test_module.parse_content_range(response)
+
+
+def test_download_file_ranges(tmp_path):
+    server = RangeServer(fail_once={3000})
+
+    path = _download(tmp_path, server)
+
+    assert path.read_bytes() == CONTENT
+    s3_requests = [r for r in server.requests if r.url.host == "s3"]
+    # the first range, 10 other ranges, and a retry
+    assert len(s3_requests) == 12
+    # the ranges are requested directly from S3, without the authorization header
+    assert all("Authorization" not in r.headers for r in s3_requests)
+    assert len([r for r in server.requests if r.url.host == "entitycore"]) == 1
+    # each range request is tagged with its part number, also when retried
+    part_numbers = [r.extensions[PART_EXTENSION] for r in s3_requests]
+    assert sorted(part_numbers) == sorted([1, *range(2, 12), 4])
+
+
+def test_download_file_ranges__resumed(tmp_path):
+    checkpoint = _checkpoint(tmp_path)
+    checkpoint.preallocate()
+    test_module.write_at(checkpoint.part_path, 1000, [CONTENT[1000:3000]])
+    test_module.write_at(checkpoint.part_path, 9000, [CONTENT[9000:]])
+    checkpoint.add(1000, 2999)
+    checkpoint.add(9000, len(CONTENT) - 1)
+    server = RangeServer()
+
+    path = _download(tmp_path, server, _checkpoint(tmp_path))
+
+    assert path.read_bytes() == CONTENT
+    ranges = [r.headers["Range"] for r in server.requests if r.url.host == "s3"]
+    assert sorted(ranges) == sorted(
+        ["bytes=0-999", *(f"bytes={start}-{start + 999}" for start in range(3000, 9000, 1000))]
+    )
+    assert not checkpoint.sidecar_path.exists()
+
+
+def test_download_file_ranges__not_supported(tmp_path):
+    server = RangeServer(ranges=False)
+
+    path = _download(tmp_path, server)
+
+    assert path.read_bytes() == CONTENT
+    assert len(server.requests) == 2
+
+
+def test_download_file_ranges__ignored_range(tmp_path):
+    def _handler(request):
+        if "bytes=0-" in request.headers["Range"]:
+            return RangeServer()(request)
+        return httpx.Response(200, content=CONTENT)
+
+    with pytest.raises(EntitySDKError, match="Unexpected response to the range request"):
+        _download(tmp_path, _handler)
+
+
+def test_download_file_ranges__http_error(tmp_path):
+    with pytest.raises(EntitySDKError, match="HTTP error 403"):
+        _download(tmp_path, lambda request: httpx.Response(403))
+
+
+def test_async_download_file_ranges(tmp_path):
+    server = RangeServer(fail_once={5000})
+
+    checkpoint = _checkpoint(tmp_path)
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as http_client:
+            await async_ranged_download.download_file_ranges(
+                url=f"{API_URL}/entity/1/assets/2/download",
+                checkpoint=checkpoint,
+                headers={},
+                parameters=None,
+                http_client=http_client,
+                transfer_config=DownloadTransferConfig(part_size=1000, max_concurrency=2),
+            )
+
+    asyncio.run(_run())
+    assert checkpoint.commit().read_bytes() == CONTENT
+    assert len(server.requests) == 13
+    part_numbers = [r.extensions[PART_EXTENSION] for r in server.requests if r.url.host == "s3"]
+    assert sorted(part_numbers) == sorted([1, *range(2, 12), 6])
+
+
+@pytest.mark.parametrize(
+    ("asset_size", "threshold", "expected_requests"),
+    [(len(CONTENT), 1000, 12), (len(CONTENT), len(CONTENT) + 1, 2), (None, 1000, 2)],
+)
+def test_download_asset_file__threshold(
+    tmp_path, token_manager, asset_size, threshold, expected_requests
+):
+    server = RangeServer()
+
+    path = core.download_asset_file(
+        api_url=API_URL,
+        entity_id=uuid4(),
+        entity_type=Entity,
+        asset_id=uuid4(),
+        target_path=tmp_path / "file.bin",
+        token_manager=token_manager,
+        http_client=httpx.Client(transport=httpx.MockTransport(server)),
+        admin=False,
+        asset_size=asset_size,
+        transfer_config=DownloadTransferConfig(threshold=threshold, part_size=1000),
+    )
+
+    assert path.read_bytes() == CONTENT
+    assert len(server.requests) == expected_requests
+
+
+@pytest.mark.parametrize("asset_size", [10, len(CONTENT) + 10])
+def test_download_asset_file__unexpected_size(tmp_path, token_manager, asset_size):
+    with pytest.raises(EntitySDKError, match=f"expected {asset_size} bytes"):
+        core.download_asset_file(
+            api_url=API_URL,
+            entity_id=uuid4(),
+            entity_type=Entity,
+            asset_id=uuid4(),
+            target_path=tmp_path / "file.bin",
+            token_manager=token_manager,
+            http_client=httpx.Client(transport=httpx.MockTransport(RangeServer())),
+            admin=False,
+            asset_size=asset_size,
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def _download_asset_file(tmp_path, token_manager, server, *, sha256_digest=None):
+    return core.download_asset_file(
+        api_url=API_URL,
+        entity_id=uuid4(),
+        entity_type=Entity,
+        asset_id=uuid4(),
+        target_path=tmp_path / "file.bin",
+        token_manager=token_manager,
+        http_client=httpx.Client(transport=httpx.MockTransport(server)),
+        admin=False,
+        asset_size=len(CONTENT),
+        sha256_digest=sha256_digest,
+    )
+
+
+def _interrupted(server, after):
+    def _handler(request):
+        response = server(request)
+        if response.status_code == 307:
+            return response
+
+        def _stream():
+            yield response.content[:after]
+            raise httpx.ReadError("interrupted")
+
+        return httpx.Response(response.status_code, headers=response.headers, content=_stream())
+
+    return _handler
+
+
+@pytest.fixture(autouse=True)
+def small_buffer(monkeypatch):
+    monkeypatch.setattr(settings, "download_stream_data_buffer_size", 1000)
+
+
+@pytest.mark.parametrize("ranges", [True, False])
+def test_download_asset_file__resumed(tmp_path, token_manager, ranges):
+    digest = hashlib.sha256(CONTENT).hexdigest()
+    server = RangeServer(ranges=ranges)
+    with pytest.raises(EntitySDKError, match="interrupted"):
+        _download_asset_file(
+            tmp_path, token_manager, _interrupted(server, 4000), sha256_digest=digest
+        )
+
+    target_path = tmp_path / "file.bin"
+    assert not target_path.exists()
+    assert target_path.with_name("file.bin.part").stat().st_size == 4000
+
+    server.requests.clear()
+    path = _download_asset_file(tmp_path, token_manager, server, sha256_digest=digest)
+
+    assert path.read_bytes() == CONTENT
+    assert not target_path.with_name("file.bin.part").exists()
+    assert not target_path.with_name("file.bin.part.json").exists()
+    assert server.requests[-1].headers["Range"] == "bytes=4000-"
+
+
+def test_download_asset_file__unexpected_digest(tmp_path, token_manager):
+    with pytest.raises(EntitySDKError, match="unexpected sha256 digest"):
+        _download_asset_file(tmp_path, token_manager, RangeServer(), sha256_digest="a")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_asset_file__resumed_unexpected_digest(tmp_path, token_manager):
+    server = RangeServer()
+    with pytest.raises(EntitySDKError, match="interrupted"):
+        _download_asset_file(tmp_path, token_manager, _interrupted(server, 4000), sha256_digest="a")
+
+    with pytest.raises(EntitySDKError, match="unexpected sha256 digest"):
+        _download_asset_file(tmp_path, token_manager, server, sha256_digest="a")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_asset_file__changed_asset(tmp_path, token_manager):
+    server = RangeServer()
+    with pytest.raises(EntitySDKError, match="interrupted"):
+        _download_asset_file(tmp_path, token_manager, _interrupted(server, 4000), sha256_digest="a")
+
+    server.requests.clear()
+    digest = hashlib.sha256(CONTENT).hexdigest()
+    path = _download_asset_file(tmp_path, token_manager, server, sha256_digest=digest)
+
+    assert path.read_bytes() == CONTENT
+    assert "Range" not in server.requests[-1].headers
@@ -1,3 +1,7 @@
+import asyncio
+import threading
+import time
+
 import pytest
 
 from entitysdk import result as test_module
@@ -38,3 +42,155 @@ def test_iterator_result():
         test_module.IteratorResult(data).one_or_none()
 
     assert test_module.IteratorResult(data).all() == [1, 2]
+
+
+async def _aiter(data):
+    for item in data:
+        yield item
+
+
+def test_async_iterator_result():
+    def _result(data):
+        return test_module.AsyncIteratorResult(_aiter(data))
+
+    async def _collect(result):
+        return [v async for v in result]
+
+    assert asyncio.run(_collect(_result([]))) == []
+    assert asyncio.run(_result([]).first()) is None
+    assert asyncio.run(_result([]).one_or_none()) is None
+    assert asyncio.run(_result([]).all()) == []
+    with pytest.raises(IteratorResultError, match="Iterable is empty."):
+        asyncio.run(_result([]).one())
+
+    assert asyncio.run(_collect(_result([1]))) == [1]
+    assert asyncio.run(_result([1]).first()) == 1
+    assert asyncio.run(_result([1]).one()) == 1
+    assert asyncio.run(_result([1]).one_or_none()) == 1
+
+    assert asyncio.run(_result([1, 2]).all()) == [1, 2]
+    assert asyncio.run(_result([1, 2]).first()) == 1
+    with pytest.raises(IteratorResultError, match="There are more than one items."):
+        asyncio.run(_result([1, 2]).one())
+    with pytest.raises(IteratorResultError, match="There are more than one items."):
+        asyncio.run(_result([1, 2]).one_or_none())
+
+
+def test_iterator_result_count():
+    result = test_module.IteratorResult(iter([1, 2, 3]), count=lambda: 3)
+    assert next(result) == 1
+    assert result.count() == 3
+    assert result.all() == [2, 3]
+
+    with pytest.raises(IteratorResultError, match="The total number of items is not available."):
+        test_module.IteratorResult([1]).count()
+
+
+def test_iterator_result_batched():
+    assert test_module.IteratorResult(range(5)).batched(2).all() == [[0, 1], [2, 3], [4]]
+    assert test_module.IteratorResult([]).batched(2).all() == []
+    with pytest.raises(IteratorResultError, match="n must be strictly positive."):
+        test_module.IteratorResult([]).batched(0)
+
+
+def test_iterator_result_map_concurrent():
+    lock = threading.Lock()
+    running = max_running = 0
+    consumed = []
+
+    def _items():
+        for i in range(20):
+            consumed.append(i)
+            yield i
+
+    def _square(value):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.001 * (value % 3))
+        with lock:
+            running -= 1
+        return value * value
+
+    result = test_module.IteratorResult(_items()).map_concurrent(_square, max_workers=4)
+    assert next(result) == 0
+    # the items are consumed only a few steps ahead of the results
+    assert len(consumed) == 4
+    assert result.all() == [i * i for i in range(1, 20)]
+    assert max_running <= 4
+
+    with pytest.raises(IteratorResultError, match="max_workers must be strictly positive."):
+        test_module.IteratorResult([]).map_concurrent(_square, max_workers=0)
+
+
+def test_iterator_result_map_concurrent__unordered():
+    consumed = []
+    release = threading.Event()
+
+    def _items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    def _wait_first(value):
+        if value == 0:
+            # slow item, not delaying the others
+            assert release.wait(5)
+        return value
+
+    result = test_module.IteratorResult(_items()).map_concurrent(
+        _wait_first, max_workers=3, ordered=False
+    )
+    first = [next(result) for _ in range(5)]
+    assert 0 not in first
+    assert len(consumed) <= 3 + len(first)
+    release.set()
+    assert sorted(first + result.all()) == list(range(10))
+
+
+def test_async_iterator_result_helpers():
+    async def _count():
+        return 3
+
+    async def _double(value):
+        await asyncio.sleep(0.001 * (value % 3))
+        return 2 * value
+
+    async def _sleep(value):
+        await asyncio.sleep(0.01 * value)
+        return value
+
+    async def _run():
+        result = test_module.AsyncIteratorResult(_aiter([1, 2, 3]), count=_count)
+        assert await result.count() == 3
+        assert await result.batched(2).all() == [[1, 2], [3]]
+
+        mapped = test_module.AsyncIteratorResult(_aiter(range(10))).map_concurrent(
+            _double, max_workers=3
+        )
+        assert await mapped.all() == [2 * i for i in range(10)]
+
+        unordered = test_module.AsyncIteratorResult(_aiter([5, 0, 1])).map_concurrent(
+            _sleep, max_workers=3, ordered=False
+        )
+        assert await unordered.all() == [0, 1, 5]
+
+        with pytest.raises(IteratorResultError, match="not available"):
+            await test_module.AsyncIteratorResult(_aiter([])).count()
+
+    asyncio.run(_run())
+
+
+def test_iterator_result__to_columns():
+    rows = [{"id": 1, "subject": {"name": "foo"}}, {"id": 2, "subject": None}]
+
+    res = test_module.IteratorResult(rows).to_columns(["id", "subject.name"])
+    assert res == {"id": [1, 2], "subject.name": ["foo", None]}
+
+    async def rows_async():
+        for row in rows:
+            yield row
+
+    res = asyncio.run(test_module.AsyncIteratorResult(rows_async()).to_columns(["subject.name"]))
+    assert res == {"subject.name": ["foo", None]}
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 import pytest
+from pydantic import ValidationError
 
 from entitysdk import serdes as test_module
 from entitysdk.models.activity import Activity
@@ -63,6 +64,33 @@ def test_deserialization():
     pass
 
 
+def test_deserialize_list_response_json():
+    json_data = (
+        b'{"data": [{"id": "%s", "a": "foo", "b": 1}], '
+        b'"pagination": {"page": 1, "page_size": 10, "total_items": 1}, '
+        b'"facets": {"a": []}}' % str(MOCK_UUID).encode()
+    )
+    result = test_module.deserialize_list_response_json(json_data, E2)
+
+    assert result.data == [E2(id=MOCK_UUID, a="foo", b=1)]
+    assert result.pagination.total_items == 1
+    assert result.facets == {"a": []}
+    assert test_module._list_response_adapter(E2) is test_module._list_response_adapter(E2)
+
+
+def test_deserialize_list_response_json__extra(monkeypatch):
+    json_data = (
+        '{"data": [{"a": "foo", "b": 1, "c": 2}], '
+        '"pagination": {"page": 1, "page_size": 10, "total_items": 1}}'
+    )
+    with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+        test_module.deserialize_list_response_json(json_data, E1)
+
+    monkeypatch.setattr(test_module.settings, "deserialize_model_extra", "ignore")
+    result = test_module.deserialize_list_response_json(json_data, E1)
+    assert result.data == [E1(a="foo", b=1)]
+
+
 def test_serialize_activity():
     e1 = Entity(
         id=uuid.uuid4(),
@@ -1,4 +1,9 @@
+import base64
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
@@ -28,3 +33,127 @@ def test_TokenFromValue():
 def test_TokenFromFunction():
     token_manager = test_module.TokenFromFunction(function=lambda: "foo")
     assert token_manager.get_token() == "foo"
+
+
+def _jwt(exp):
+    def _encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+    return f"{_encode({'alg': 'none'})}.{_encode({'exp': exp})}.signature"
+
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock(1000.0)
+    monkeypatch.setattr(test_module.time, "time", clock)
+    return clock
+
+
+def test_jwt_expiration():
+    assert test_module._jwt_expiration(_jwt(1234)) == 1234
+    assert test_module._jwt_expiration("not-a-jwt") is None
+    assert test_module._jwt_expiration("a.b.c") is None
+
+
+def test_caching_token_manager(clock):
+    tokens = iter([_jwt(1100), _jwt(2000)])
+    token_manager = test_module.CachingTokenManager(
+        test_module.TokenFromFunction(lambda: next(tokens)), refresh_margin=10
+    )
+
+    assert token_manager.get_token() == _jwt(1100)
+    clock.now = 1089
+    assert token_manager.get_token() == _jwt(1100)
+    assert token_manager.refreshes == 1
+
+    clock.now = 1090
+    assert token_manager.get_token() == _jwt(2000)
+    assert token_manager.refreshes == 2
+
+    token_manager.invalidate()
+    with pytest.raises(StopIteration):
+        token_manager.get_token()
+
+
+def test_caching_token_manager__without_expiration(clock):
+    token_manager = test_module.CachingTokenManager(
+        test_module.TokenFromValue("foo"), fallback_ttl=5
+    )
+    assert token_manager.get_token() == "foo"
+    clock.now += 4
+    assert token_manager.get_token() == "foo"
+    assert token_manager.refreshes == 1
+    clock.now += 1
+    assert token_manager.get_token() == "foo"
+    assert token_manager.refreshes == 2
+
+
+def test_caching_token_manager__single_refresh():
+    calls = []
+
+    def _get_token():
+        calls.append(1)
+        time.sleep(0.05)
+        return _jwt(time.time() + 3600)
+
+    token_manager = test_module.CachingTokenManager(test_module.TokenFromFunction(_get_token))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = set(executor.map(lambda _: token_manager.get_token(), range(8)))
+
+    assert len(tokens) == 1
+    assert len(calls) == 1
+
+
+def test_caching_token_manager__pre_refresh(clock):
+    refreshed = threading.Event()
+    tokens = iter([_jwt(1100), _jwt(2000)])
+
+    def _get_token():
+        token = next(tokens)
+        if token == _jwt(2000):
+            refreshed.set()
+        return token
+
+    token_manager = test_module.CachingTokenManager(
+        test_module.TokenFromFunction(_get_token), refresh_margin=10, pre_refresh=20
+    )
+    assert token_manager.get_token() == _jwt(1100)
+
+    # the cached token is returned while it's refreshed in the background
+    clock.now = 1075
+    assert token_manager.get_token() == _jwt(1100)
+    assert refreshed.wait(timeout=5)
+    while token_manager._background is not None:
+        time.sleep(0.01)
+    assert token_manager.get_token() == _jwt(2000)
+    assert token_manager.refreshes == 2
+
+
+def test_caching_token_manager__pre_refresh_error(clock):
+    def _get_token():
+        if clock.now > 1000:
+            raise RuntimeError("boom")
+        return _jwt(1100)
+
+    token_manager = test_module.CachingTokenManager(
+        test_module.TokenFromFunction(_get_token), refresh_margin=10, pre_refresh=20
+    )
+    token_manager.get_token()
+    clock.now = 1075
+    assert token_manager.get_token() == _jwt(1100)
+    while token_manager._background is not None:
+        time.sleep(0.01)
+    # the failed refresh isn't retried in the background
+    assert token_manager.get_token() == _jwt(1100)
+    assert token_manager._background is None
+    clock.now = 1090
+    with pytest.raises(RuntimeError, match="boom"):
+        token_manager.get_token()
@@ -1,9 +1,11 @@
 import uuid
+from pathlib import Path
 
 import pytest
 
 from entitysdk.exception import EntitySDKError
 from entitysdk.models import Asset
+from entitysdk.models.asset import DetailedFile
 from entitysdk.types import AssetLabel, ContentType, StorageType
 from entitysdk.utils import asset as test_module
 
@@ -95,3 +97,51 @@ def test_filter_assets__invalid_keys(assets):
         test_module.filter_assets(
             assets, selection={"content_type": ContentType.application_json, "foo": "bar"}
         )
+
+
+@pytest.fixture
+def directory_files():
+    sizes = {
+        "circuit_config.json": 10,
+        "nodes/nodes.h5": 1000,
+        "edges/local/edges.h5": 5000,
+        "edges/long_range/edges.h5": 8000,
+        "README": 1,
+    }
+    return {
+        Path(path): DetailedFile(name=Path(path).name, size=size, last_modified="2025-01-01T00:00Z")
+        for path, size in sizes.items()
+    }
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        (
+            {},
+            [
+                "circuit_config.json",
+                "nodes/nodes.h5",
+                "edges/local/edges.h5",
+                "edges/long_range/edges.h5",
+                "README",
+            ],
+        ),
+        (
+            {"include": ["*.json", "nodes/*", "edges/local/*"]},
+            ["circuit_config.json", "nodes/nodes.h5", "edges/local/edges.h5"],
+        ),
+        (
+            {"include": ["*.h5"], "exclude": ["edges/long_range/*"]},
+            ["nodes/nodes.h5", "edges/local/edges.h5"],
+        ),
+        ({"exclude": ["*.h5"]}, ["circuit_config.json", "README"]),
+        ({"max_file_size": 1000}, ["circuit_config.json", "nodes/nodes.h5", "README"]),
+        ({"include": ["*.h5"], "max_file_size": 5000}, ["nodes/nodes.h5", "edges/local/edges.h5"]),
+        ({"include": []}, []),
+    ],
+)
+def test_filter_directory_files(directory_files, kwargs, expected):
+    result = test_module.filter_directory_files(directory_files, **kwargs)
+    assert list(result) == [Path(path) for path in expected]
+    assert all(result[path] is directory_files[path] for path in result)
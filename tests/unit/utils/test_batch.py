@@ -0,0 +1,34 @@
+import uuid
+
+import pytest
+
+from entitysdk.exception import EntitiesNotFoundError
+from entitysdk.models.entity import Entity
+from entitysdk.utils import batch as test_module
+
+
+def test_chunked():
+    assert list(test_module.chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+    assert list(test_module.chunked([], 2)) == []
+    with pytest.raises(ValueError, match="size must be strictly positive"):
+        list(test_module.chunked([1], 0))
+
+
+def test_id_filter():
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    assert test_module.id_filter(ids) == {"id__in": f"{ids[0]},{ids[1]}"}
+
+
+def test_sort_by_ids():
+    ids = [uuid.uuid4() for _ in range(4)]
+    entities = [Entity(id=i, name="foo") for i in ids[:3]]
+
+    result = test_module.sort_by_ids([ids[2], ids[0], ids[2]], entities, missing_ok=False)
+    assert result == [entities[2], entities[0], entities[2]]
+
+    result = test_module.sort_by_ids([ids[3], ids[1]], entities, missing_ok=True)
+    assert result == [entities[1]]
+
+    with pytest.raises(EntitiesNotFoundError, match=f"1 entities not found: {ids[3]}") as e:
+        test_module.sort_by_ids([ids[3], ids[1], ids[3]], entities, missing_ok=False)
+    assert e.value.missing_ids == [ids[3]]
@@ -0,0 +1,317 @@
+import hashlib
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+
+from entitysdk.common import ProjectContext
+from entitysdk.models.asset import Asset, DetailedFile
+from entitysdk.models.cell_morphology import CellMorphology
+from entitysdk.models.entity import Entity
+from entitysdk.utils import cache as test_module
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(test_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _entity():
+    return Entity(id=uuid.uuid4(), name="foo", description="bar")
+
+
+def test_entity_cache(project_context):
+    cache = test_module.EntityCache()
+    entity = _entity()
+    kwargs = {"entity_type": Entity, "project_context": project_context, "admin": False}
+
+    assert cache.get(entity.id, **kwargs) is None
+    cache.put(entity, **kwargs)
+    assert cache.get(entity.id, **kwargs) is entity
+    assert len(cache) == 1
+
+    # the other keys are not shared
+    assert (
+        cache.get(entity.id, entity_type=CellMorphology, project_context=None, admin=False) is None
+    )
+    assert cache.get(entity.id, entity_type=Entity, project_context=None, admin=True) is None
+    other_context = ProjectContext(project_id=uuid.uuid4())
+    assert (
+        cache.get(entity.id, entity_type=Entity, project_context=other_context, admin=False) is None
+    )
+
+    assert cache.hits == 1
+    assert cache.misses == 4
+
+
+def test_entity_cache_ttl(clock):
+    cache = test_module.EntityCache(ttl=10)
+    entity = _entity()
+    kwargs = {"entity_type": Entity, "project_context": None, "admin": False}
+    cache.put(entity, **kwargs)
+
+    clock[0] = 9
+    assert cache.get(entity.id, **kwargs) is entity
+    clock[0] = 11
+    assert cache.get(entity.id, **kwargs) is None
+    assert len(cache) == 0
+
+
+def test_entity_cache_lru():
+    cache = test_module.EntityCache(max_size=2, ttl=None)
+    e1, e2, e3 = _entity(), _entity(), _entity()
+    kwargs = {"entity_type": Entity, "project_context": None, "admin": False}
+    cache.put(e1, **kwargs)
+    cache.put(e2, **kwargs)
+    # e1 becomes the most recently used
+    assert cache.get(e1.id, **kwargs) is e1
+    cache.put(e3, **kwargs)
+
+    assert cache.evictions == 1
+    assert cache.get(e2.id, **kwargs) is None
+    assert cache.get(e1.id, **kwargs) is e1
+    assert cache.get(e3.id, **kwargs) is e3
+
+
+def test_entity_cache_invalidate():
+    cache = test_module.EntityCache()
+    e1, e2 = _entity(), _entity()
+    cache.put(e1, entity_type=Entity, project_context=None, admin=False)
+    cache.put(e1, entity_type=Entity, project_context=None, admin=True)
+    cache.put(e2, entity_type=Entity, project_context=None, admin=False)
+
+    cache.invalidate(e1.id)
+    cache.invalidate(uuid.uuid4())
+    assert len(cache) == 1
+    assert cache.get(e1.id, entity_type=Entity, project_context=None, admin=True) is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_entity_cache_validation():
+    with pytest.raises(ValueError, match="max_size must be strictly positive"):
+        test_module.EntityCache(max_size=0)
+
+
+def test_metadata_cache(tmp_path, project_context):
+    cache = test_module.MetadataCache(tmp_path / "cache.db")
+    entity_id = uuid.uuid4()
+    url = f"http://entitycore/entity/{entity_id}"
+
+    assert cache.get(url, project_context=project_context) is None
+    cache.put(url, b'{"a": 1}', project_context=project_context, entity_id=entity_id)
+    assert cache.get(url, project_context=project_context) == b'{"a": 1}'
+    assert cache.get(url, project_context=None) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # the database is shared with other instances, possibly in other processes
+    other = test_module.MetadataCache(tmp_path / "cache.db")
+    assert other.get(url, project_context=project_context) == b'{"a": 1}'
+
+    other.invalidate(entity_id)
+    assert cache.get(url, project_context=project_context) is None
+    assert len(cache) == 0
+
+
+def test_metadata_cache_update_date(tmp_path):
+    cache = test_module.MetadataCache(tmp_path / "cache.db")
+    entity_id = uuid.uuid4()
+    url = "http://entitycore/entity"
+    kwargs = {"project_context": None, "entity_id": entity_id}
+
+    cache.put(url, b"v2", update_date="2025-01-02T00:00:00Z", **kwargs)
+    # an older version doesn't replace a more recent one
+    cache.put(url, b"v1", update_date="2025-01-01T00:00:00Z", **kwargs)
+    assert cache.get(url, project_context=None) == b"v2"
+    cache.put(url, b"v3", update_date="2025-01-03T00:00:00Z", **kwargs)
+    assert cache.get(url, project_context=None) == b"v3"
+
+
+def test_metadata_cache_put_response(tmp_path):
+    cache = test_module.MetadataCache(tmp_path / "cache.db")
+    entity_id = uuid.uuid4()
+    url = "http://entitycore/entity"
+    response = httpx.Response(200, json={"id": str(entity_id), "update_date": "2025-01-02"})
+
+    cache.put_response(url, response, response.json(), project_context=None, entity_id=entity_id)
+    assert cache.get(url, project_context=None) == response.content
+    # an older version doesn't replace the cached one
+    older = httpx.Response(200, json={"id": str(entity_id), "update_date": "2025-01-01"})
+    cache.put_response(url, older, older.json(), project_context=None, entity_id=entity_id)
+    assert cache.get(url, project_context=None) == response.content
+
+
+def test_metadata_cache_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(test_module.time, "time", lambda: now[0])
+    cache = test_module.MetadataCache(tmp_path / "cache.db", ttl=10)
+    cache.put("url", b"data", project_context=None, entity_id=uuid.uuid4())
+
+    now[0] += 9
+    assert cache.get("url", project_context=None) == b"data"
+    now[0] += 2
+    assert cache.get("url", project_context=None) is None
+
+
+@pytest.mark.parametrize(("max_entries", "max_bytes"), [(2, 1000), (1000, 8)])
+def test_metadata_cache_eviction(tmp_path, monkeypatch, max_entries, max_bytes):
+    now = [1000.0]
+    monkeypatch.setattr(test_module.time, "time", lambda: now[0])
+    cache = test_module.MetadataCache(
+        tmp_path / "cache.db", max_entries=max_entries, max_bytes=max_bytes
+    )
+    for url in ["url1", "url2"]:
+        now[0] += 1
+        cache.put(url, b"data", project_context=None, entity_id=uuid.uuid4())
+    # url1 becomes the most recently used
+    now[0] += 1
+    assert cache.get("url1", project_context=None) == b"data"
+    now[0] += 1
+    cache.put("url3", b"data", project_context=None, entity_id=uuid.uuid4())
+
+    assert len(cache) == 2
+    assert cache.get("url2", project_context=None) is None
+    assert cache.get("url1", project_context=None) == b"data"
+    assert cache.get("url3", project_context=None) == b"data"
+
+
+def test_metadata_cache_validation(tmp_path):
+    with pytest.raises(ValueError, match="must be strictly positive"):
+        test_module.MetadataCache(tmp_path / "cache.db", max_entries=0)
+
+
+def test_digest_cache(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"data")
+    digest = hashlib.sha256(b"data").hexdigest()
+    cache = test_module.DigestCache(tmp_path / "digests.db")
+
+    assert cache.get(path) is None
+    assert cache.digest(path) == digest
+    assert cache.digest(path) == digest
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # shared with other instances
+    other = test_module.DigestCache(tmp_path / "digests.db")
+    assert other.get(tmp_path / "." / "file.bin") == digest
+
+    # invalidated when the file is modified
+    path.write_bytes(b"other")
+    assert cache.get(path) is None
+    cache.put(path, "digest")
+    assert cache.get(path) == "digest"
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_content_cache(tmp_path, monkeypatch):
+    source = tmp_path / "file.bin"
+    source.write_bytes(b"data")
+    digest = hashlib.sha256(b"data").hexdigest()
+    cache = test_module.ContentCache(tmp_path / "cache")
+
+    assert cache.get(digest) is None
+    assert cache.materialize(digest, tmp_path / "target.bin") is None
+    cached = cache.put(digest, source, sha256_digest=digest)
+    assert cached == tmp_path / "cache" / "objects" / digest[:2] / digest
+    assert cached.read_bytes() == b"data"
+    # read-only, since it may be shared by hard link
+    assert not cached.stat().st_mode & 0o222
+    assert list((tmp_path / "cache" / "tmp").iterdir()) == []
+
+    # copied by default, and writable
+    target = cache.materialize(digest, tmp_path / "target.bin")
+    assert target.read_bytes() == b"data"
+    assert not target.samefile(cached)
+    target.write_bytes(b"modified")
+    assert cached.read_bytes() == b"data"
+
+    # shared with other instances, hard linked if enabled
+    other = test_module.ContentCache(tmp_path / "cache", hardlink=True)
+    target = other.materialize(digest, tmp_path / "link.bin")
+    assert target.read_bytes() == b"data"
+    assert target.samefile(cached)
+
+    # not cached if the digest is unexpected
+    assert cache.put("other", source, sha256_digest="a") is None
+    assert cache.stats() == {
+        "entries": 1,
+        "bytes": 4,
+        "max_bytes": 10 * 1024**3,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+    # dropped from the index if the file is removed
+    cached.unlink()
+    assert cache.get(digest) is None
+    assert len(cache) == 0
+
+    # not hashed again if already verified
+    def _unexpected(path):
+        raise AssertionError(f"{path} hashed again")
+
+    monkeypatch.setattr(test_module, "calculate_sha256_digest", _unexpected)
+    assert cache.put(digest, source, sha256_digest=digest, verified=True) == cached
+    assert cached.read_bytes() == b"data"
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get(digest) is None
+
+
+def test_content_cache_eviction(tmp_path, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(test_module.time, "time", lambda: now)
+    cache = test_module.ContentCache(tmp_path / "cache", max_bytes=10)
+    for key in "abc":
+        (tmp_path / key).write_bytes(b"1234")
+        cache.put(key, tmp_path / key)
+        now += 1
+        if key == "a":
+            # too large
+            (tmp_path / "large").write_bytes(b"0" * 11)
+            assert cache.put("large", tmp_path / "large") is None
+
+    # "a" is the least recently used
+    assert cache.get("a") is None
+    assert cache.evictions == 1
+    assert not (tmp_path / "cache" / "objects" / "a" / "a").exists()
+
+    now += 1
+    cache.get("b")
+    (tmp_path / "d").write_bytes(b"1234")
+    cache.put("d", tmp_path / "d")
+    assert cache.get("c") is None
+    assert cache.get("b") is not None
+    assert cache.size == 8
+
+
+def test_content_key(tmp_path):
+    asset = Asset(
+        id=uuid.uuid4(),
+        path="file.bin",
+        full_path="a/b/file.bin",
+        is_directory=False,
+        content_type="application/octet-stream",
+        size=4,
+        sha256_digest="digest",
+        label="morphology",
+        storage_type="aws_s3_internal",
+    )
+    assert test_module.content_key(asset) == "digest"
+
+    directory = asset.model_copy(update={"is_directory": True, "sha256_digest": None})
+    file_info = DetailedFile(name="file.txt", size=3, last_modified="2025-01-01T00:00:00Z")
+    assert test_module.content_key(directory, asset_path=Path("file.txt")) is None
+    key = test_module.content_key(directory, asset_path=Path("file.txt"), file_info=file_info)
+    assert len(key) == 64
+    changed = file_info.model_copy(update={"size": 4})
+    assert test_module.content_key(directory, asset_path=Path("file.txt"), file_info=changed) != key
@@ -0,0 +1,139 @@
+import hashlib
+
+import pytest
+
+from entitysdk.exception import EntitySDKError
+from entitysdk.utils import checkpoint as test_module
+
+
+def test_download_checkpoint(tmp_path):
+    target_path = tmp_path / "file.bin"
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=None)
+    assert checkpoint.part_path == tmp_path / "file.bin.part"
+    assert checkpoint.sidecar_path == tmp_path / "file.bin.part.json"
+    assert checkpoint.missing_ranges(4) == [(0, 3), (4, 7), (8, 9)]
+
+    checkpoint.preallocate()
+    checkpoint.add(4, 5)
+    checkpoint.add(2, 3)
+    assert checkpoint.completed == [(2, 5)]
+    assert checkpoint.fetched == 4
+    assert checkpoint.offset == 0
+    assert checkpoint.missing_ranges(4) == [(0, 1), (6, 9)]
+    assert not checkpoint.is_complete
+
+    resumed = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=None)
+    assert resumed.resumed
+    assert resumed.completed == [(2, 5)]
+
+    resumed.add(0, 1)
+    assert resumed.offset == 6
+    assert resumed.missing_ranges(3) == [(6, 8), (9, 9)]
+
+
+def test_download_checkpoint__open_stream(tmp_path, monkeypatch):
+    monkeypatch.setattr(test_module, "CHECKPOINT_INTERVAL", 4)
+    target_path = tmp_path / "file.bin"
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=None)
+
+    with pytest.raises(RuntimeError):
+        with checkpoint.open_stream() as writer:
+            writer.write(b"012")
+            writer.write(b"345")
+            raise RuntimeError("interrupted")
+    assert checkpoint.completed == [(0, 5)]
+
+    resumed = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=None)
+    assert resumed.offset == 6
+    with resumed.open_stream(4) as writer:
+        writer.write(b"456789")
+    assert resumed.is_complete
+    assert resumed.commit() == target_path
+    assert target_path.read_bytes() == b"0123456789"
+    assert list(tmp_path.iterdir()) == [target_path]
+
+
+def test_download_checkpoint__verify(tmp_path):
+    target_path = tmp_path / "file.bin"
+    digest = hashlib.sha256(b"0123456789").hexdigest()
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=digest)
+    with checkpoint.open_stream() as writer:
+        writer.write(b"01234")
+
+    resumed = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=digest)
+    with resumed.open_stream(resumed.offset) as writer:
+        writer.write(b"5678")
+    with pytest.raises(EntitySDKError, match="Downloaded 9 bytes"):
+        resumed.commit()
+    assert list(tmp_path.iterdir()) == []
+
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=digest)
+    with checkpoint.open_stream() as writer:
+        writer.write(b"01234")
+    resumed = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=digest)
+    with resumed.open_stream(resumed.offset) as writer:
+        writer.write(b"abcde")
+    with pytest.raises(EntitySDKError, match="unexpected sha256 digest"):
+        resumed.commit()
+
+
+def test_download_checkpoint__verify_fresh(tmp_path, monkeypatch):
+    target_path = tmp_path / "file.bin"
+    digest = hashlib.sha256(b"0123456789").hexdigest()
+
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=digest)
+    with checkpoint.open_stream() as writer:
+        writer.write(b"01234abcde")
+    with pytest.raises(EntitySDKError, match="unexpected sha256 digest"):
+        checkpoint.commit()
+    assert list(tmp_path.iterdir()) == []
+
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=11, sha256_digest=None)
+    with checkpoint.open_stream() as writer:
+        writer.write(b"0123456789")
+    with pytest.raises(EntitySDKError, match="Downloaded 10 bytes"):
+        checkpoint.commit()
+    assert list(tmp_path.iterdir()) == []
+
+    # the digest of a file streamed from the start is computed while writing it
+    monkeypatch.setattr(test_module, "calculate_sha256_digest", None)
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=digest)
+    with checkpoint.open_stream() as writer:
+        writer.write(b"01234")
+        writer.write(b"56789")
+    assert checkpoint.commit().read_bytes() == b"0123456789"
+    assert checkpoint.digest == digest
+
+    # without expected digest, the file written by ranges isn't hashed
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest=None)
+    checkpoint.preallocate()
+    checkpoint.add(0, 9)
+    checkpoint.commit()
+    assert checkpoint.digest is None
+
+
+def test_download_checkpoint__not_resumable(tmp_path):
+    target_path = tmp_path / "file.bin"
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest="a")
+    with checkpoint.open_stream() as writer:
+        writer.write(b"01234")
+
+    # different digest
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest="b")
+    assert not checkpoint.resumed
+    assert checkpoint.completed == []
+    assert not checkpoint.part_path.exists()
+
+    # unknown size
+    with checkpoint.open_stream() as writer:
+        writer.write(b"01234")
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=None, sha256_digest="b")
+    assert checkpoint.completed == []
+    with pytest.raises(EntitySDKError, match="expected size of .* is unknown"):
+        checkpoint.missing_ranges(4)
+
+    # invalid sidecar
+    checkpoint.sidecar_path.write_text("{}")
+    checkpoint = test_module.DownloadCheckpoint(target_path, size=10, sha256_digest="b")
+    assert checkpoint.completed == []
+    assert not checkpoint.sidecar_path.exists()
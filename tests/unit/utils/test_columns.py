@@ -0,0 +1,100 @@
+import asyncio
+import sys
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from entitysdk.exception import DependencyError
+from entitysdk.models.cell_morphology import CellMorphology
+from entitysdk.models.lazy import LazyModel
+from entitysdk.utils import columns as test_module
+
+ROWS = [
+    {
+        "id": "1",
+        "brain_region": {"acronym": "SSp"},
+        "subject": {"species": {"name": "Mus musculus"}},
+        "assets": [{"path": "a.swc"}, {"path": "b.h5"}],
+    },
+    {"id": "2", "brain_region": None},
+]
+
+
+def test_get_path():
+    assert test_module.get_path(ROWS[0], "id") == "1"
+    assert test_module.get_path(ROWS[0], "brain_region.acronym") == "SSp"
+    assert test_module.get_path(ROWS[0], "subject.species.name") == "Mus musculus"
+    assert test_module.get_path(ROWS[0], "assets.path") == ["a.swc", "b.h5"]
+    assert test_module.get_path(ROWS[0], "unknown.name") is None
+    assert test_module.get_path(ROWS[1], "brain_region.acronym") is None
+    assert test_module.get_path(ROWS[0], "id.name") is None
+
+
+def test_get_path__models():
+    entity_id = uuid.uuid4()
+    data = {"id": str(entity_id), "name": "foo", "brain_region": {"acronym": "SSp"}}
+
+    # the raw json of the lazy models is read, even if the full model would be invalid
+    proxy = LazyModel(CellMorphology, data)
+    assert test_module.get_path(proxy, "brain_region.acronym") == "SSp"
+    assert test_module.get_path(proxy, "name") == "foo"
+    assert not proxy.is_materialized
+
+    # the values found are validated like the fields of the model
+    data["creation_date"] = "2024-09-10T14:25:03Z"
+    data["contributions"] = [{"agent": {"id": str(entity_id), "type": "person"}}]
+    proxy = LazyModel(CellMorphology, data)
+    assert test_module.get_path(proxy, "id") == entity_id
+    assert test_module.get_path(proxy, "creation_date") == datetime(
+        2024, 9, 10, 14, 25, 3, tzinfo=timezone.utc
+    )
+    assert test_module.get_path(proxy, "contributions.agent.id") == [entity_id]
+    assert test_module.get_path(proxy, "brain_region.id") is None
+    assert not proxy.is_materialized
+
+    class Region:
+        acronym = "SSp"
+
+    assert test_module.get_path({"region": Region()}, "region.acronym") is None
+
+
+def test_to_columns():
+    res = test_module.to_columns(ROWS, ["id", "brain_region.acronym"])
+    assert res == {"id": ["1", "2"], "brain_region.acronym": ["SSp", None]}
+
+    assert test_module.to_columns([], ["id"]) == {"id": []}
+
+
+def test_async_to_columns():
+    async def rows():
+        for row in ROWS:
+            yield row
+
+    res = asyncio.run(test_module.async_to_columns(rows(), ["id", "brain_region.acronym"]))
+    assert res == {"id": ["1", "2"], "brain_region.acronym": ["SSp", None]}
+
+
+def test_to_arrow__missing_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(DependencyError, match="pyarrow is required"):
+        test_module.to_arrow(ROWS, ["id"])
+
+    with pytest.raises(DependencyError, match="pyarrow is required"):
+        test_module.columns_to_arrow({"id": ["1"]})
+
+
+def test_to_arrow(monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(test_module, "ARROW_BATCH_SIZE", 1)
+
+    # the second batch has only nulls, and its type is unified with the first one
+    res = test_module.to_arrow(ROWS, ["id", "brain_region.acronym"])
+    assert res.to_pydict() == {"id": ["1", "2"], "brain_region.acronym": ["SSp", None]}
+
+    res = test_module.to_arrow([], ["id"])
+    assert res.num_rows == 0
+    assert res.column_names == ["id"]
+
+    assert test_module.columns_to_arrow({"id": ["1"]}).to_pydict() == {"id": ["1"]}
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
@@ -57,3 +58,29 @@ def test_backoff_values_exact():
     actual_calls = sleep_mock.call_args_list[:2]
 
     assert [call.args for call in actual_calls] == expected_calls
+
+
+def test_async_execute_retries_then_succeeds():
+    fn = Mock(side_effect=[ValueError("fail"), "success"])
+
+    async def _fn():
+        result = fn()
+        return result
+
+    with patch("entitysdk.utils.execution.asyncio.sleep") as sleep_mock:
+        result = asyncio.run(test_module.async_execute_with_retry(_fn, backoff_base=1))
+
+    assert result == "success"
+    sleep_mock.assert_called_once_with(1)
+
+
+def test_async_execute_all_retries_fail():
+    async def _fn():
+        raise RuntimeError("boom")
+
+    with patch("entitysdk.utils.execution.asyncio.sleep"):
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(test_module.async_execute_with_retry(_fn, max_retries=2))
+
+    with pytest.raises(ValueError, match="max_retries must be >= 0"):
+        asyncio.run(test_module.async_execute_with_retry(_fn, max_retries=-1))
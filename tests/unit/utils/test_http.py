@@ -1,12 +1,24 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
 import pytest
 
 from entitysdk.common import ProjectContext
 from entitysdk.exception import EntitySDKError
+from entitysdk.models.base import BaseModel
+from entitysdk.models.response import ListResponse
+from entitysdk.schemas.retry import RetryPolicy
 from entitysdk.types import ID
 from entitysdk.utils import http as test_module
 
 
+class _Item(BaseModel):
+    id: int
+
+
 def test_stream_response_streams_bytes(httpx_mock):
     httpx_mock.add_response(
         method="GET",
@@ -233,6 +245,112 @@ def test_stream_paginated_request_validate_page_size(
         next(it)
 
 
+@pytest.mark.parametrize("prefetch", [-1, -10])
+def test_stream_paginated_request_validate_prefetch(
+    api_url, project_context, token_from_value_manager, prefetch
+):
+    url = f"{api_url}/api/v1/entity/person"
+    it = test_module.stream_paginated_request(
+        url=url,
+        method="GET",
+        prefetch=prefetch,
+        project_context=project_context,
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(),
+    )
+    with pytest.raises(EntitySDKError, match="prefetch must be either None or positive."):
+        next(it)
+
+
+def _add_paginated_responses(httpx_mock, url, request_headers, *, total_items, page_size, pages):
+    for page in range(1, pages + 1):
+        first = (page - 1) * page_size + 1
+        last = min(page * page_size, total_items)
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{url}?page_size={page_size}&page={page}",
+            match_headers=request_headers,
+            json={
+                "data": [{"id": i} for i in range(first, last + 1)],
+                "pagination": {"page": page, "page_size": page_size, "total_items": total_items},
+            },
+        )
+
+
+@pytest.mark.parametrize("prefetch", [1, 2, 10])
+def test_stream_paginated_request_prefetch(
+    httpx_mock, api_url, project_context, token_from_value_manager, request_headers, prefetch
+):
+    url = f"{api_url}/api/v1/entity/person"
+    _add_paginated_responses(httpx_mock, url, request_headers, total_items=7, page_size=2, pages=4)
+
+    it = test_module.stream_paginated_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_from_value_manager,
+        page_size=2,
+        prefetch=prefetch,
+        http_client=httpx.Client(),
+    )
+    assert [item["id"] for item in it] == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_stream_paginated_request_prefetch_with_limit(
+    httpx_mock, api_url, project_context, token_from_value_manager, request_headers
+):
+    url = f"{api_url}/api/v1/entity/person"
+    # only the pages needed to reach the limit must be requested
+    _add_paginated_responses(httpx_mock, url, request_headers, total_items=10, page_size=2, pages=2)
+
+    it = test_module.stream_paginated_request(
+        url=url,
+        method="GET",
+        limit=3,
+        project_context=project_context,
+        token_manager=token_from_value_manager,
+        page_size=2,
+        prefetch=4,
+        http_client=httpx.Client(),
+    )
+    assert [item["id"] for item in it] == [1, 2, 3]
+
+
+def test_stream_paginated_request_prefetch_from_settings(
+    httpx_mock, monkeypatch, api_url, project_context, token_from_value_manager, request_headers
+):
+    monkeypatch.setattr(test_module.settings, "page_prefetch", 2)
+    url = f"{api_url}/api/v1/entity/person"
+    _add_paginated_responses(httpx_mock, url, request_headers, total_items=5, page_size=2, pages=3)
+    it = test_module.stream_paginated_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_from_value_manager,
+        page_size=2,
+        http_client=httpx.Client(),
+    )
+    assert [item["id"] for item in it] == [1, 2, 3, 4, 5]
+
+
+def test_stream_paginated_request_item_type(
+    httpx_mock, api_url, project_context, token_from_value_manager, request_headers
+):
+    url = f"{api_url}/api/v1/entity/person"
+    _add_paginated_responses(httpx_mock, url, request_headers, total_items=3, page_size=2, pages=2)
+
+    it = test_module.stream_paginated_request(
+        url=url,
+        method="GET",
+        project_context=project_context,
+        token_manager=token_from_value_manager,
+        page_size=2,
+        item_type=_Item,
+        http_client=httpx.Client(),
+    )
+    assert list(it) == [_Item(id=1), _Item(id=2), _Item(id=3)]
+
+
 def test_stream_paginated_request_one_item(
     httpx_mock, api_url, project_context, token_from_value_manager, request_headers
 ):
@@ -529,3 +647,428 @@ def test_stream_paginated_request_with_unexpected_page_size(
         match="Unexpected response: payload.pagination.page_size=2 but it should be 123",
     ):
         next(it)
+
+
+def test_async_make_db_api_request(
+    httpx_mock, api_url, project_context, token_from_value_manager, request_headers
+):
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{url}?foo=bar",
+        match_headers=request_headers,
+        match_json={"name": "John Doe"},
+    )
+    httpx_mock.add_response(method="GET", url=url, status_code=404)
+    httpx_mock.add_exception(httpx.ConnectError("boom"), method="DELETE")
+
+    async def _run():
+        async with httpx.AsyncClient() as http_client:
+            res = await test_module.async_make_db_api_request(
+                url=url,
+                method="POST",
+                json={"name": "John Doe"},
+                parameters={"foo": "bar"},
+                token_manager=token_from_value_manager,
+                project_context=project_context,
+                http_client=http_client,
+            )
+            assert res.status_code == 200
+
+            with pytest.raises(EntitySDKError, match=f"HTTP error 404 for GET {url}"):
+                await test_module.async_make_db_api_request(
+                    url=url,
+                    method="GET",
+                    token_manager=token_from_value_manager,
+                    http_client=http_client,
+                )
+
+            with pytest.raises(EntitySDKError, match="Request error: boom"):
+                await test_module.async_make_db_api_request(
+                    url=url,
+                    method="DELETE",
+                    token_manager=token_from_value_manager,
+                    http_client=http_client,
+                )
+
+    asyncio.run(_run())
+
+
+def test_async_stream_paginated_request(
+    httpx_mock, api_url, project_context, token_from_value_manager, request_headers
+):
+    url = f"{api_url}/api/v1/entity/person"
+    for page, ids in enumerate([[1, 2], [3, 4]], start=1):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"{url}?page_size=2&page={page}",
+            match_headers=request_headers,
+            json={
+                "data": [{"id": i} for i in ids],
+                "pagination": {"page": page, "page_size": 2, "total_items": 4},
+            },
+        )
+
+    async def _run():
+        async with httpx.AsyncClient() as http_client:
+            return [
+                item["id"]
+                async for item in test_module.async_stream_paginated_request(
+                    url=url,
+                    method="GET",
+                    limit=3,
+                    page_size=2,
+                    project_context=project_context,
+                    token_manager=token_from_value_manager,
+                    http_client=http_client,
+                )
+            ]
+
+    assert asyncio.run(_run()) == [1, 2, 3]
+
+
+def test_async_stream_response(httpx_mock):
+    httpx_mock.add_response(method="GET", url="http://example.com/file", content=b"abcd")
+    httpx_mock.add_response(method="GET", url="http://example.com/missing", status_code=404)
+
+    async def _collect(url):
+        async with httpx.AsyncClient() as http_client:
+            return [
+                chunk
+                async for chunk in test_module.async_stream_response(
+                    url=url, method="GET", http_client=http_client
+                )
+            ]
+
+    assert b"".join(asyncio.run(_collect("http://example.com/file"))) == b"abcd"
+    with pytest.raises(EntitySDKError, match="HTTP error 404 for GET http://example.com/missing"):
+        asyncio.run(_collect("http://example.com/missing"))
+
+
+def test_async_stream_paginated_request_prefetch(
+    httpx_mock, api_url, project_context, token_from_value_manager, request_headers
+):
+    url = f"{api_url}/api/v1/entity/person"
+    _add_paginated_responses(httpx_mock, url, request_headers, total_items=7, page_size=2, pages=3)
+
+    async def _collect():
+        async with httpx.AsyncClient() as http_client:
+            it = test_module.async_stream_paginated_request(
+                url=url,
+                method="GET",
+                limit=5,
+                project_context=project_context,
+                token_manager=token_from_value_manager,
+                page_size=2,
+                prefetch=2,
+                http_client=http_client,
+            )
+            return [item["id"] async for item in it]
+
+    assert asyncio.run(_collect()) == [1, 2, 3, 4, 5]
+
+
+def test_async_prefetched_pages__early_exit():
+    tasks = []
+
+    async def fetch_page(page):
+        tasks.append(asyncio.current_task())
+        if page == 3:
+            raise EntitySDKError("failed")
+        if page > 3:
+            await asyncio.sleep(10)
+        return ListResponse(
+            data=[{"id": page}], pagination={"page": page, "page_size": 1, "total_items": 10}
+        )
+
+    async def _run():
+        pages = test_module._aiter_prefetched_pages(fetch_page, limit=10, prefetch=3)
+        assert [(await anext(pages)).data for _ in range(2)] == [[{"id": 1}], [{"id": 2}]]
+        await asyncio.sleep(0)
+        await pages.aclose()
+        # the prefetched pages are cancelled, and their tasks awaited
+        return [task.done() for task in tasks[1:]], [task.cancelled() for task in tasks[1:]]
+
+    done, cancelled = asyncio.run(_run())
+    # the pages 2 to 4 were requested, the page 3 failed and the page 4 was cancelled
+    assert done == [True, True, True]
+    assert cancelled == [False, False, True]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(test_module.time, "sleep", delays.append)
+    return delays
+
+
+def test_make_db_api_request__retries(httpx_mock, api_url, token_from_value_manager, sleeps):
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_exception(httpx.ReadTimeout("timeout"), method="GET", url=url)
+    httpx_mock.add_response(method="GET", url=url, status_code=503)
+    httpx_mock.add_response(method="GET", url=url, json={"id": 1})
+
+    res = test_module.make_db_api_request(
+        url=url,
+        method="GET",
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(),
+        retry_policy=RetryPolicy(max_retries=3, backoff_base=1, backoff_max=1.5),
+    )
+    assert res.json() == {"id": 1}
+    assert res.extensions["retries"] == 2
+    assert len(sleeps) == 2
+    assert all(0 <= delay <= 1.5 for delay in sleeps)
+
+
+def test_make_db_api_request__retries_exhausted(
+    httpx_mock, api_url, token_from_value_manager, sleeps
+):
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(method="DELETE", url=url, status_code=502, is_reusable=True)
+
+    with pytest.raises(EntitySDKError, match=f"HTTP error 502 for DELETE {url} after 2 retries"):
+        test_module.make_db_api_request(
+            url=url,
+            method="DELETE",
+            token_manager=token_from_value_manager,
+            http_client=httpx.Client(),
+            retry_policy=RetryPolicy(max_retries=2),
+        )
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [("2", 2), ("120", 10), ("Wed, 21 Oct 2015 07:28:00 GMT", 0)],
+)
+def test_make_db_api_request__retry_after(
+    httpx_mock, api_url, token_from_value_manager, sleeps, retry_after, expected
+):
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(
+        method="GET", url=url, status_code=429, headers={"Retry-After": retry_after}
+    )
+    httpx_mock.add_response(method="GET", url=url)
+
+    res = test_module.make_db_api_request(
+        url=url,
+        method="GET",
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(),
+        retry_policy=RetryPolicy(max_retries=1, backoff_max=10),
+    )
+    assert res.extensions["retries"] == 1
+    assert sleeps == [expected]
+
+
+def test_make_db_api_request__post_not_retried(
+    httpx_mock, api_url, token_from_value_manager, sleeps
+):
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(method="POST", url=url, status_code=503)
+    httpx_mock.add_exception(httpx.ReadTimeout("timeout"), method="POST", url=url)
+
+    for expected in ["HTTP error 503", "Request error: timeout"]:
+        with pytest.raises(EntitySDKError, match=expected):
+            test_module.make_db_api_request(
+                url=url,
+                method="POST",
+                json={"name": "foo"},
+                token_manager=token_from_value_manager,
+                http_client=httpx.Client(),
+                retry_policy=RetryPolicy(max_retries=3),
+            )
+    assert sleeps == []
+
+
+def test_make_db_api_request__post_retried(httpx_mock, api_url, token_from_value_manager, sleeps):
+    url = f"{api_url}/api/v1/entity/person"
+    # the request never reached the server, so it can be retried
+    httpx_mock.add_exception(httpx.ConnectError("refused"), method="POST", url=url)
+    # the request is explicitly idempotent
+    httpx_mock.add_response(method="POST", url=url, status_code=503)
+    httpx_mock.add_response(method="POST", url=url, json={"id": 1})
+
+    res = test_module.make_db_api_request(
+        url=url,
+        method="POST",
+        json={"name": "foo"},
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(),
+        retry_policy=RetryPolicy(max_retries=3),
+        idempotent=True,
+    )
+    assert res.extensions["retries"] == 2
+    assert len(sleeps) == 2
+
+
+def test_make_db_api_request__retries_from_settings(
+    httpx_mock, monkeypatch, api_url, token_from_value_manager, sleeps
+):
+    monkeypatch.setattr(test_module.settings, "max_retries", 1)
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(method="GET", url=url, status_code=504)
+    httpx_mock.add_response(method="GET", url=url)
+
+    res = test_module.make_db_api_request(
+        url=url,
+        method="GET",
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(),
+    )
+    assert res.extensions["retries"] == 1
+
+
+def test_async_make_db_api_request__retries(
+    httpx_mock, monkeypatch, api_url, token_from_value_manager
+):
+    delays = []
+
+    async def _sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(test_module.asyncio, "sleep", _sleep)
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(method="GET", url=url, status_code=503, headers={"Retry-After": "1"})
+    httpx_mock.add_exception(httpx.RemoteProtocolError("disconnected"), method="GET", url=url)
+    httpx_mock.add_response(method="GET", url=url, json={"id": 1})
+
+    async def _run():
+        async with httpx.AsyncClient() as http_client:
+            return await test_module.async_make_db_api_request(
+                url=url,
+                method="GET",
+                token_manager=token_from_value_manager,
+                http_client=http_client,
+                retry_policy=RetryPolicy(max_retries=2, backoff_base=0),
+            )
+
+    res = asyncio.run(_run())
+    assert res.extensions["retries"] == 2
+    assert delays == [1, 0]
+
+
+def test_make_db_api_request__coalesced(api_url, token_from_value_manager, project_context):
+    url = f"{api_url}/api/v1/entity/person"
+    barrier = threading.Barrier(4)
+    calls = []
+
+    def _handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"id": 1})
+
+    def _request(http_client, method="GET", parameters=None):
+        barrier.wait(timeout=5)
+        return test_module.make_db_api_request(
+            url=url,
+            method=method,
+            parameters=parameters,
+            project_context=project_context,
+            token_manager=token_from_value_manager,
+            http_client=http_client,
+        )
+
+    def _slow_handler(request):
+        time.sleep(0.1)
+        return _handler(request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(_slow_handler))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(lambda _: _request(http_client), range(4)))
+    assert len(calls) == 1
+    assert all(response is responses[0] for response in responses)
+
+    # different parameters, methods or clients are not coalesced
+    calls.clear()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                _request,
+                [
+                    http_client,
+                    http_client,
+                    http_client,
+                    httpx.Client(transport=http_client._transport),
+                ],
+                ["GET", "GET", "DELETE", "GET"],
+                [{"page": 1}, {"page": 2}, {"page": 1}, {"page": 1}],
+            )
+        )
+    assert len(calls) == 4
+
+
+def test_make_db_api_request__not_coalesced(monkeypatch, api_url, token_from_value_manager):
+    monkeypatch.setattr(test_module.settings, "coalesce_requests", False)
+    url = f"{api_url}/api/v1/entity/person"
+    barrier = threading.Barrier(2)
+    calls = []
+
+    def _handler(request):
+        calls.append(request)
+        time.sleep(0.05)
+        return httpx.Response(200, json={"id": 1})
+
+    http_client = httpx.Client(transport=httpx.MockTransport(_handler))
+
+    def _request(_):
+        barrier.wait(timeout=5)
+        return test_module.make_db_api_request(
+            url=url, method="GET", token_manager=token_from_value_manager, http_client=http_client
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_request, range(2)))
+    assert len(calls) == 2
+
+
+def test_async_make_db_api_request__coalesced(api_url, token_from_value_manager):
+    url = f"{api_url}/api/v1/entity/person"
+    calls = []
+
+    async def _handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": 1})
+
+    async def _run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as http_client:
+            return await asyncio.gather(
+                *(
+                    test_module.async_make_db_api_request(
+                        url=url,
+                        method="GET",
+                        token_manager=token_from_value_manager,
+                        http_client=http_client,
+                    )
+                    for _ in range(4)
+                )
+            )
+
+    responses = asyncio.run(_run())
+    assert len(calls) == 1
+    assert all(response.json() == {"id": 1} for response in responses)
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson"])
+def test_make_db_api_request__json_backend(
+    monkeypatch, httpx_mock, api_url, token_from_value_manager, backend
+):
+    monkeypatch.setattr(test_module.settings, "json_backend", backend)
+    url = f"{api_url}/api/v1/entity/person"
+    httpx_mock.add_response(
+        method="POST",
+        url=url,
+        match_json={"name": "é", "ids": [1, 2]},
+        match_headers={"Content-Type": "application/json"},
+        json={"id": 1},
+    )
+
+    response = test_module.make_db_api_request(
+        url=url,
+        method="POST",
+        json={"name": "é", "ids": [1, 2]},
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(),
+    )
+    assert response.json() == {"id": 1}
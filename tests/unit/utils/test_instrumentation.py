@@ -0,0 +1,277 @@
+import asyncio
+import json
+import uuid
+
+import httpx
+import pytest
+
+from entitysdk.client import Client
+from entitysdk.exception import EntitySDKError
+from entitysdk.models.entity import Entity
+from entitysdk.schemas.retry import RetryPolicy
+from entitysdk.utils import instrumentation as test_module
+from entitysdk.utils.cache import EntityCache
+from entitysdk.utils.http import make_db_api_request
+from entitysdk.utils.rate_limit import RateLimiter
+
+Event = test_module.InstrumentationEvent
+
+
+def _recorder(instrumentation, *events):
+    recorded = []
+    for event in events:
+        instrumentation.add_hook(
+            event, lambda payload, event=event: recorded.append((event, payload))
+        )
+    return recorded
+
+
+def test_route_of_url(api_url):
+    assert test_module.route_of_url(f"{api_url}/cell-morphology", api_url) == "cell-morphology"
+    assert test_module.route_of_url(f"{api_url}/cell-morphology/1/assets", api_url) == (
+        "cell-morphology"
+    )
+    assert test_module.route_of_url(f"{api_url}/admin/circuit/1?a=b", api_url) == "circuit"
+    assert test_module.route_of_url(f"{api_url}/version", api_url) == "other"
+    assert test_module.route_of_url(api_url, api_url) == "other"
+    assert test_module.route_of_url("http://s3/bucket/entity", api_url) == "transfer"
+
+
+def test_route_of_type():
+    assert test_module.route_of_type(Entity) == "entity"
+    assert test_module.route_of_type(int) == "other"
+
+
+def test_metrics_registry():
+    metrics = test_module.MetricsRegistry(buckets=(0.1, 1))
+    assert metrics.to_prometheus() == ""
+
+    metrics.inc("requests_total", route="entity", method="GET", status="200")
+    metrics.inc("requests_total", 2, route="entity", method="GET", status="200")
+    metrics.observe("request_duration_seconds", 0.05, route="entity", method="GET")
+    metrics.observe("request_duration_seconds", 0.5, route="entity", method="GET")
+    metrics.observe("request_duration_seconds", 5, route="entity", method="GET")
+    metrics.inc("custom", label='a "b"')
+
+    assert metrics.counter("requests_total", route="entity", method="GET", status="200") == 3
+    assert metrics.counter("requests_total", route="entity", method="GET", status="500") == 0
+
+    res = metrics.to_dict()
+    assert res["counters"]["requests_total"] == [
+        {"labels": {"method": "GET", "route": "entity", "status": "200"}, "value": 3}
+    ]
+    assert res["histograms"]["request_duration_seconds"] == [
+        {
+            "labels": {"method": "GET", "route": "entity"},
+            "count": 3,
+            "sum": 5.55,
+            "buckets": {"0.1": 1, "1.0": 2, "+Inf": 3},
+        }
+    ]
+    assert json.loads(metrics.to_json()) == res
+
+    text = metrics.to_prometheus()
+    assert "# HELP entitysdk_requests_total Number of HTTP requests.\n" in text
+    assert "# TYPE entitysdk_requests_total counter\n" in text
+    assert 'entitysdk_requests_total{method="GET",route="entity",status="200"} 3\n' in text
+    assert "# TYPE entitysdk_custom counter\n" in text
+    assert 'entitysdk_custom{label="a \\"b\\""} 1\n' in text
+    assert "# TYPE entitysdk_request_duration_seconds histogram\n" in text
+    assert (
+        'entitysdk_request_duration_seconds_bucket{method="GET",route="entity",le="1.0"} 2\n'
+        in text
+    )
+    assert (
+        'entitysdk_request_duration_seconds_bucket{method="GET",route="entity",le="+Inf"} 3\n'
+        in text
+    )
+    assert 'entitysdk_request_duration_seconds_count{method="GET",route="entity"} 3\n' in text
+
+    metrics.reset()
+    assert metrics.to_dict() == {"counters": {}, "histograms": {}}
+
+
+def test_instrumentation_hooks(caplog):
+    instrumentation = test_module.Instrumentation()
+    recorded = _recorder(instrumentation, Event.CACHE_HIT)
+    event = test_module.CacheEvent(route="entity", entity_id="1")
+
+    def _failing(payload):
+        raise RuntimeError("failing hook")
+
+    instrumentation.add_hook("cache_hit", _failing)
+    instrumentation.emit(Event.CACHE_HIT, event)
+    instrumentation.emit(Event.CACHE_MISS, event)
+
+    assert recorded == [(Event.CACHE_HIT, event)]
+    assert "Instrumentation hook failed for event cache_hit" in caplog.text
+
+    instrumentation.remove_hook(Event.CACHE_HIT, _failing)
+    caplog.clear()
+    instrumentation.emit(Event.CACHE_HIT, event)
+    assert len(recorded) == 2
+    assert "failing hook" not in caplog.text
+
+    with pytest.raises(ValueError):
+        instrumentation.add_hook("unknown", _failing)
+
+
+def test_instrumented_transport(api_url):
+    metrics = test_module.MetricsRegistry()
+    instrumentation = test_module.Instrumentation(metrics=metrics)
+    recorded = _recorder(instrumentation, Event.BEFORE_REQUEST, Event.AFTER_REQUEST)
+
+    def _handler(request):
+        if request.url.path.endswith("/stream"):
+            return httpx.Response(200, content=iter([b"da", b"ta"]))
+        return httpx.Response(201, content=b"data")
+
+    transport = test_module.InstrumentedTransport(
+        httpx.MockTransport(_handler), instrumentation=instrumentation, api_url=api_url
+    )
+    with httpx.Client(transport=transport) as http_client:
+        assert http_client.post(f"{api_url}/entity", content=b"body").status_code == 201
+        assert [event for event, _ in recorded] == [Event.BEFORE_REQUEST, Event.AFTER_REQUEST]
+
+        recorded.clear()
+        with http_client.stream("GET", "http://s3/stream") as response:
+            # the request is reported only when the body has been consumed
+            assert [event for event, _ in recorded] == [Event.BEFORE_REQUEST]
+            assert response.read() == b"data"
+        assert [event for event, _ in recorded] == [Event.BEFORE_REQUEST, Event.AFTER_REQUEST]
+
+    payload = recorded[-1][1]
+    assert payload.method == "GET"
+    assert payload.route == "transfer"
+    assert payload.status_code == 200
+    assert payload.bytes_received == 4
+    assert payload.elapsed >= 0
+    assert payload.error is None
+
+    assert metrics.counter("requests_total", route="entity", method="POST", status="201") == 1
+    assert metrics.counter("request_bytes_sent_total", route="entity") == 4
+    assert metrics.counter("request_bytes_received_total", route="transfer") == 4
+
+
+def test_instrumented_transport__error(api_url):
+    metrics = test_module.MetricsRegistry()
+    instrumentation = test_module.Instrumentation(metrics=metrics)
+    recorded = _recorder(instrumentation, Event.AFTER_REQUEST)
+
+    def _handler(request):
+        raise httpx.ConnectError("refused")
+
+    transport = test_module.InstrumentedTransport(
+        httpx.MockTransport(_handler), instrumentation=instrumentation, api_url=api_url
+    )
+    with httpx.Client(transport=transport) as http_client:
+        with pytest.raises(httpx.ConnectError):
+            http_client.get(f"{api_url}/entity")
+
+    assert isinstance(recorded[0][1].error, httpx.ConnectError)
+    assert recorded[0][1].status_code is None
+    assert metrics.counter("requests_total", route="entity", method="GET", status="error") == 1
+
+
+def test_instrumented_transport__retries(api_url, token_from_value_manager, monkeypatch):
+    monkeypatch.setattr("entitysdk.utils.http.time.sleep", lambda delay: None)
+    metrics = test_module.MetricsRegistry()
+    instrumentation = test_module.Instrumentation(metrics=metrics)
+    recorded = _recorder(instrumentation, Event.RETRY)
+    responses = iter([httpx.Response(503), httpx.Response(200, json={"id": 1})])
+
+    transport = test_module.InstrumentedTransport(
+        httpx.MockTransport(lambda request: next(responses)),
+        instrumentation=instrumentation,
+        api_url=api_url,
+    )
+    res = make_db_api_request(
+        url=f"{api_url}/entity",
+        method="GET",
+        token_manager=token_from_value_manager,
+        http_client=httpx.Client(transport=transport),
+        retry_policy=RetryPolicy(max_retries=1),
+    )
+    assert res.json() == {"id": 1}
+    assert [payload.retry for _, payload in recorded] == [1]
+    assert metrics.counter("retries_total", route="entity", method="GET") == 1
+    assert metrics.counter("requests_total", route="entity", method="GET", status="503") == 1
+
+
+def test_instrumented_transport__parts(tmp_path, api_url):
+    from entitysdk.multipart_upload import _upload_part
+
+    metrics = test_module.MetricsRegistry()
+    instrumentation = test_module.Instrumentation(metrics=metrics)
+    recorded = _recorder(instrumentation, Event.PART_TRANSFER)
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"0123456789")
+
+    transport = test_module.InstrumentedTransport(
+        httpx.MockTransport(lambda request: httpx.Response(200)),
+        instrumentation=instrumentation,
+        api_url=api_url,
+    )
+    _upload_part(
+        file_path=path,
+        offset=2,
+        size=4,
+        url="http://s3/part",
+        http_client=httpx.Client(transport=transport),
+        part_number=3,
+    )
+    assert len(recorded) == 1
+    assert recorded[0][1].part_number == 3
+    assert recorded[0][1].bytes_sent == 4
+    assert recorded[0][1].method == "PUT"
+    assert metrics.to_dict()["histograms"]["part_duration_seconds"][0]["count"] == 1
+
+
+def test_async_instrumented_transport(api_url):
+    metrics = test_module.MetricsRegistry()
+    instrumentation = test_module.Instrumentation(metrics=metrics)
+
+    def _handler(request):
+        return httpx.Response(200, content=b"data")
+
+    async def _run():
+        transport = test_module.AsyncInstrumentedTransport(
+            httpx.MockTransport(_handler), instrumentation=instrumentation, api_url=api_url
+        )
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            await asyncio.gather(*(http_client.get(f"{api_url}/circuit") for _ in range(3)))
+
+    asyncio.run(_run())
+    assert metrics.counter("requests_total", route="circuit", method="GET", status="200") == 3
+    assert metrics.counter("request_bytes_received_total", route="circuit") == 12
+
+
+def test_client_with_instrumentation(httpx_mock, api_url):
+    metrics = test_module.MetricsRegistry()
+    instrumentation = test_module.Instrumentation(metrics=metrics)
+    entity_id = uuid.uuid4()
+    client = Client(
+        api_url=api_url,
+        token_manager="token",
+        instrumentation=instrumentation,
+        rate_limiter=RateLimiter(),
+        entity_cache=EntityCache(),
+    )
+    httpx_mock.add_response(
+        method="GET", url=f"{api_url}/entity/{entity_id}", json={"id": str(entity_id)}
+    )
+
+    assert client.get_entity(entity_id, entity_type=Entity).id == entity_id
+    assert client.get_entity(entity_id, entity_type=Entity).id == entity_id
+
+    assert metrics.counter("requests_total", route="entity", method="GET", status="200") == 1
+    assert metrics.counter("cache_misses_total", route="entity") == 1
+    assert metrics.counter("cache_hits_total", route="entity") == 1
+
+    with pytest.raises(EntitySDKError, match="Either http_client or instrumentation"):
+        Client(
+            api_url=api_url,
+            token_manager="token",
+            http_client=httpx.Client(),
+            instrumentation=instrumentation,
+        )
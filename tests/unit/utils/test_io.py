@@ -1,3 +1,5 @@
+import asyncio
+import json
 from pathlib import Path
 
 from entitysdk.utils import io as test_module
@@ -80,3 +82,113 @@ def test_iter_bytes_chunk_offset__offset_plus_size_exceeds_eof(tmp_path):
     content = b"".join(chunks)
 
     assert content == file_content[7:10]
+
+
+def test_write_and_load_json(tmp_path):
+    data = {"a": [1, 2], "b": {"c": "é"}}
+    path = tmp_path / "data.json"
+
+    test_module.write_json(data, path)
+    assert path.read_text() == json.dumps(data)
+    assert test_module.load_json(path) == data
+
+    test_module.write_json(data, path, indent=2)
+    assert path.read_text().startswith('{\n  "a": [')
+    assert test_module.load_json(path) == data
+
+    test_module.write_json(data, path, sort_keys=True, ensure_ascii=True)
+    assert "\\u00e9" in path.read_text()
+    assert test_module.load_json(path) == data
+
+
+def test_chunk_reader():
+    consumed = []
+    closed = False
+
+    def _chunks():
+        nonlocal closed
+        try:
+            for chunk in (b"abc", b"", b"defg", b"h"):
+                consumed.append(chunk)
+                yield chunk
+        finally:
+            closed = True
+
+    reader = test_module.ChunkReader(_chunks())
+    # the first chunk is read eagerly
+    assert consumed == [b"abc"]
+    assert reader.readable()
+
+    buffer = bytearray(2)
+    assert reader.readinto(buffer) == 2
+    assert buffer == b"ab"
+    assert reader.read(3) == b"c"
+    assert reader.read() == b"defgh"
+    assert reader.read() == b""
+    reader.close()
+    assert closed
+
+    closed = False
+    reader = test_module.ChunkReader(_chunks())
+    reader.close()
+    assert closed
+    assert consumed[-1] == b"abc"
+
+
+def test_async_chunk_reader():
+    consumed = []
+    closed = False
+
+    async def _chunks():
+        nonlocal closed
+        try:
+            for chunk in (b"abc", b"", b"defg", b"h"):
+                consumed.append(chunk)
+                yield chunk
+        finally:
+            closed = True
+
+    async def _run():
+        nonlocal closed
+        reader = await test_module.AsyncChunkReader.create(_chunks())
+        # the first chunk is read eagerly
+        assert consumed == [b"abc"]
+
+        buffer = bytearray(2)
+        assert await reader.readinto(buffer) == 2
+        assert buffer == b"ab"
+        assert await reader.read(3) == b"c"
+        assert await reader.read(2) == b"de"
+        assert await reader.read() == b"fgh"
+        assert await reader.read() == b""
+        await reader.aclose()
+        assert reader.closed
+        assert closed
+
+        closed = False
+        async with await test_module.AsyncChunkReader.create(_chunks()):
+            pass
+
+    asyncio.run(_run())
+    assert closed
+    assert consumed[-1] == b"abc"
+
+
+def test_aiter_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abcdefg")
+
+    async def _run():
+        with path.open("rb") as f:
+            chunks = [chunk async for chunk in test_module.aiter_file(f, chunk_size=3)]
+            return chunks, f.closed
+
+    assert asyncio.run(_run()) == ([b"abc", b"def", b"g"], True)
+
+    async def _run_limited():
+        with path.open("rb") as f:
+            f.seek(1)
+            chunks = [chunk async for chunk in test_module.aiter_file(f, chunk_size=3, size=4)]
+            return chunks, f.closed
+
+    assert asyncio.run(_run_limited()) == ([b"bcd", b"e"], True)
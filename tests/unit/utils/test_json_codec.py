@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from entitysdk.exception import DependencyError
+from entitysdk.utils import json_codec as test_module
+
+DATA = {"name": "é", "values": [1, 2.5, None, True], "nested": {"a": {}}}
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson", "msgspec"])
+def test_codec(backend):
+    try:
+        codec = test_module.get_codec(backend)
+    except DependencyError:
+        pytest.skip(f"{backend} is not installed")
+
+    assert codec.name == backend
+    encoded = codec.dumps(DATA)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == DATA
+    assert codec.loads(encoded) == DATA
+    assert codec.loads(encoded.decode()) == DATA
+
+    indented = codec.dumps(DATA, indent=2)
+    assert indented.decode() == json.dumps(DATA, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "orjson", "msgspec"])
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_codec__non_finite(backend, value):
+    try:
+        codec = test_module.get_codec(backend)
+    except DependencyError:
+        pytest.skip(f"{backend} is not installed")
+
+    with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+        codec.dumps({"values": [1.0, None, {"a": value}]})
+    with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+        codec.dumps({"values": (value,)}, indent=2)
+
+    encoded = json.dumps({"value": value, "other": None})
+    decoded = codec.loads(encoded)
+    assert decoded["other"] is None
+    assert repr(decoded["value"]) == repr(value)
+    assert codec.loads(encoded.encode())["other"] is None
+
+    with pytest.raises(ValueError):
+        codec.loads(b"{invalid")
+
+
+def test_stdlib_codec_matches_httpx():
+    # the request bodies encoded by the stdlib backend are identical to the ones of httpx
+    codec = test_module.get_codec("stdlib")
+    assert (
+        codec.dumps(DATA)
+        == json.dumps(DATA, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+    )
+
+
+def test_get_codec_from_settings(monkeypatch):
+    monkeypatch.setattr(test_module.settings, "json_backend", "stdlib")
+    assert test_module.get_codec().name == "stdlib"
+    assert test_module.loads(test_module.dumps(DATA)) == DATA
+
+    monkeypatch.setattr(test_module.settings, "json_backend", "auto")
+    assert test_module.get_codec().name in test_module.AUTO_BACKENDS
+
+
+def test_get_codec_errors(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown JSON backend: foo"):
+        test_module.get_codec("foo")
+
+    def _missing():
+        raise ImportError("missing")
+
+    monkeypatch.setitem(test_module._FACTORIES, "orjson", _missing)
+    test_module._load_codec.cache_clear()
+    try:
+        with pytest.raises(DependencyError, match="The JSON backend orjson is not installed"):
+            test_module.get_codec("orjson")
+    finally:
+        test_module._load_codec.cache_clear()
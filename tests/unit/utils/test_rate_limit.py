@@ -0,0 +1,215 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from entitysdk.client import Client
+from entitysdk.exception import EntitySDKError
+from entitysdk.utils import rate_limit as test_module
+
+
+def test_adaptive_limiter_validation():
+    with pytest.raises(ValueError, match="Invalid concurrency limits"):
+        test_module.AdaptiveLimiter(max_concurrency=0)
+    with pytest.raises(ValueError, match="Invalid rate limits"):
+        test_module.AdaptiveLimiter(max_concurrency=1, max_rate=1, min_rate=2)
+    with pytest.raises(ValueError, match="decrease_factor must be between 0 and 1"):
+        test_module.AdaptiveLimiter(max_concurrency=1, decrease_factor=1)
+
+
+def test_adaptive_limiter_aimd():
+    limiter = test_module.AdaptiveLimiter(max_concurrency=8, max_rate=40, cooldown=60)
+
+    limiter.record(429)
+    assert limiter.concurrency == 4
+    assert limiter.rate == 20
+    assert limiter.throttled == 1
+
+    # decreased only once during the cooldown
+    limiter.record(503)
+    assert limiter.concurrency == 4
+    assert limiter.rate == 20
+    assert limiter.throttled == 2
+
+    for _ in range(1000):
+        limiter.record(200)
+    assert limiter.concurrency == 8
+    assert limiter.rate == 40
+
+
+def test_adaptive_limiter_min_limits():
+    limiter = test_module.AdaptiveLimiter(max_concurrency=2, max_rate=4, min_rate=3, cooldown=0)
+    for _ in range(5):
+        limiter.record(429)
+    assert limiter.concurrency == 1
+    assert limiter.rate == 3
+
+
+def test_adaptive_limiter_token_bucket():
+    limiter = test_module.AdaptiveLimiter(max_concurrency=10, max_rate=2)
+    with limiter._condition:
+        assert limiter._try_acquire() == 0
+        assert limiter._try_acquire() == 0
+        # the burst has been consumed
+        assert limiter._try_acquire() == pytest.approx(0.5, abs=0.01)
+    assert limiter.in_flight == 2
+
+
+def test_adaptive_limiter_concurrency():
+    limiter = test_module.AdaptiveLimiter(max_concurrency=2)
+    lock = threading.Lock()
+    in_flight = max_in_flight = 0
+
+    def _task():
+        nonlocal in_flight, max_in_flight
+        limiter.acquire()
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        limiter.release()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: _task(), range(16)))
+
+    assert max_in_flight == 2
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_limiter_async_acquire():
+    limiter = test_module.AdaptiveLimiter(max_concurrency=1)
+
+    async def _run():
+        await limiter.async_acquire()
+        waiter = asyncio.ensure_future(limiter.async_acquire())
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+        limiter.release()
+        await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(_run())
+    assert limiter.in_flight == 1
+    assert not limiter._async_waiters
+
+
+def test_adaptive_limiter_async_acquire__no_polling(monkeypatch):
+    limiter = test_module.AdaptiveLimiter(max_concurrency=1)
+    limiter.acquire()
+    try_acquire = limiter._try_acquire
+    calls = 0
+
+    def _try_acquire():
+        nonlocal calls
+        calls += 1
+        return try_acquire()
+
+    monkeypatch.setattr(limiter, "_try_acquire", _try_acquire)
+
+    async def _run():
+        waiter = asyncio.ensure_future(limiter.async_acquire())
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+        # released from another thread, like a synchronous client sharing the limiter
+        threading.Thread(target=limiter.release).start()
+        await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(_run())
+    assert calls == 2
+    assert limiter.in_flight == 1
+
+
+def test_rate_limiter_select(api_url):
+    rate_limiter = test_module.RateLimiter()
+    assert rate_limiter.select(httpx.URL(f"{api_url}/entity"), api_url) is rate_limiter.api
+    assert rate_limiter.select(httpx.URL("http://s3/bucket/key"), api_url) is rate_limiter.transfer
+
+
+def test_rate_limited_transport(api_url):
+    rate_limiter = test_module.RateLimiter(
+        api=test_module.AdaptiveLimiter(max_concurrency=4, cooldown=60),
+        transfer=test_module.AdaptiveLimiter(max_concurrency=4, cooldown=60),
+    )
+
+    def _handler(request):
+        status_code = 429 if request.url.host == "s3" else 200
+        if request.url.path == "/stream":
+            return httpx.Response(status_code, content=iter([b"da", b"ta"]))
+        return httpx.Response(status_code, content=b"data")
+
+    transport = test_module.RateLimitedTransport(
+        httpx.MockTransport(_handler), rate_limiter=rate_limiter, api_url=api_url
+    )
+    with httpx.Client(transport=transport) as http_client:
+        assert http_client.get(f"{api_url}/entity").content == b"data"
+        assert http_client.get("http://s3/bucket/key").status_code == 429
+
+        with http_client.stream("GET", f"{api_url}/stream") as response:
+            assert rate_limiter.api.in_flight == 1
+            response.read()
+        assert rate_limiter.api.in_flight == 0
+
+    assert rate_limiter.api.throttled == 0
+    assert rate_limiter.transfer.throttled == 1
+    assert rate_limiter.transfer.concurrency == 2
+    assert rate_limiter.transfer.in_flight == 0
+
+
+def test_rate_limited_transport__error(api_url):
+    rate_limiter = test_module.RateLimiter()
+
+    def _handler(request):
+        raise httpx.ConnectError("refused")
+
+    transport = test_module.RateLimitedTransport(
+        httpx.MockTransport(_handler), rate_limiter=rate_limiter, api_url=api_url
+    )
+    with httpx.Client(transport=transport) as http_client:
+        with pytest.raises(httpx.ConnectError):
+            http_client.get(f"{api_url}/entity")
+
+    assert rate_limiter.api.in_flight == 0
+
+
+def test_async_rate_limited_transport(api_url):
+    rate_limiter = test_module.RateLimiter(api=test_module.AdaptiveLimiter(max_concurrency=2))
+    max_in_flight = 0
+
+    async def _handler(request):
+        nonlocal max_in_flight
+        max_in_flight = max(max_in_flight, rate_limiter.api.in_flight)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={})
+
+    async def _run():
+        transport = test_module.AsyncRateLimitedTransport(
+            httpx.MockTransport(_handler), rate_limiter=rate_limiter, api_url=api_url
+        )
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            await asyncio.gather(*(http_client.get(f"{api_url}/entity") for _ in range(8)))
+
+    asyncio.run(_run())
+    assert max_in_flight == 2
+    assert rate_limiter.api.in_flight == 0
+
+
+def test_client_with_rate_limiter(httpx_mock, api_url):
+    rate_limiter = test_module.RateLimiter()
+    client = Client(api_url=api_url, token_manager="token", rate_limiter=rate_limiter)
+    httpx_mock.add_response(method="GET", url=f"{api_url}/version", status_code=429)
+
+    assert client._http_client.get(f"{api_url}/version").status_code == 429
+    assert rate_limiter.api.throttled == 1
+    assert rate_limiter.api.in_flight == 0
+
+    with pytest.raises(EntitySDKError, match="Either http_client or rate_limiter"):
+        Client(
+            api_url=api_url,
+            token_manager="token",
+            http_client=httpx.Client(),
+            rate_limiter=rate_limiter,
+        )
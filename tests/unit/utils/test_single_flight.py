@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from entitysdk.utils import single_flight as test_module
+
+
+def test_single_flight():
+    single_flight = test_module.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _func():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(single_flight.do, "key", _func)
+        started.wait(timeout=5)
+        followers = [executor.submit(single_flight.do, "key", _func) for _ in range(3)]
+        while single_flight.shared < 3:
+            pass
+        release.set()
+        results = [future.result() for future in [leader, *followers]]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(single_flight) == 0
+
+    # the call is executed again once the previous one is finished
+    single_flight.do("key", _func)
+    assert len(calls) == 2
+
+
+def test_single_flight__error():
+    single_flight = test_module.SingleFlight()
+
+    def _func():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        single_flight.do("key", _func)
+    assert len(single_flight) == 0
+
+
+def test_async_single_flight():
+    single_flight = test_module.AsyncSingleFlight()
+    calls = []
+
+    async def _func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def _run():
+        leader = asyncio.ensure_future(single_flight.do("key", _func))
+        followers = [asyncio.ensure_future(single_flight.do("key", _func)) for _ in range(2)]
+        await asyncio.sleep(0)
+        # cancelling a caller doesn't cancel the shared call
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        results.append(await single_flight.do("key", _func))
+        return leader, results
+
+    leader, results = asyncio.run(_run())
+    assert leader.cancelled()
+    assert len(calls) == 2
+    assert results[0] is results[1]
+    assert results[2] is not results[0]
+    assert single_flight.shared == 2
+    assert len(single_flight) == 0
@@ -0,0 +1,93 @@
+import datetime
+import hashlib
+from pathlib import Path
+
+from entitysdk.utils import transfer as test_module
+from entitysdk.utils.cache import DigestCache
+
+
+def test_transfer_stats():
+    stats = test_module.TransferStats()
+    stats.add_transferred(10)
+    stats.add_transferred(5)
+    stats.add_skipped(100)
+    stats.add_cached(7)
+    stats.add_removed(3)
+
+    assert stats.to_dict() == {
+        "files_transferred": 2,
+        "bytes_transferred": 15,
+        "files_skipped": 1,
+        "bytes_skipped": 100,
+        "files_cached": 1,
+        "bytes_cached": 7,
+        "files_removed": 1,
+        "bytes_removed": 3,
+    }
+    assert repr(stats) == (
+        "TransferStats(files_transferred=2, bytes_transferred=15, files_skipped=1, "
+        "bytes_skipped=100, files_cached=1, bytes_cached=7, files_removed=1, bytes_removed=3)"
+    )
+
+
+def test_is_unchanged(tmp_path, monkeypatch):
+    path = tmp_path / "file.bin"
+    digest = hashlib.sha256(b"data").hexdigest()
+
+    assert not test_module.is_unchanged(path, size=4, sha256_digest=digest)
+    path.write_bytes(b"data")
+    assert test_module.is_unchanged(path, size=4, sha256_digest=digest)
+    assert not test_module.is_unchanged(path, size=5, sha256_digest=digest)
+    assert not test_module.is_unchanged(path, size=4, sha256_digest="other")
+    assert not test_module.is_unchanged(path, size=4, sha256_digest=None)
+
+    cache = DigestCache(tmp_path / "digests.db")
+    assert test_module.is_unchanged(path, size=4, sha256_digest=digest, digest_cache=cache)
+
+    def _fail(path):
+        raise AssertionError("should not hash the file again")
+
+    monkeypatch.setattr("entitysdk.utils.cache.calculate_sha256_digest", _fail)
+    assert test_module.is_unchanged(path, size=4, sha256_digest=digest, digest_cache=cache)
+
+
+def test_is_synced(tmp_path):
+    path = tmp_path / "file.bin"
+    last_modified = datetime.datetime(2025, 1, 1, 12, 30, 15, 500000, tzinfo=datetime.timezone.utc)
+
+    assert not test_module.is_synced(path, size=4, last_modified=last_modified)
+    path.write_bytes(b"data")
+    assert not test_module.is_synced(path, size=4, last_modified=last_modified)
+    test_module.set_modified(path, last_modified)
+    assert test_module.is_synced(path, size=4, last_modified=last_modified)
+    assert not test_module.is_synced(path, size=5, last_modified=last_modified)
+    later = last_modified + datetime.timedelta(seconds=1)
+    assert not test_module.is_synced(path, size=4, last_modified=later)
+
+    # the linked file is left unchanged
+    link = tmp_path / "link.bin"
+    link.symlink_to(path)
+    test_module.set_modified(link, later)
+    assert test_module.is_synced(link, size=4, last_modified=later)
+    assert test_module.is_synced(path, size=4, last_modified=last_modified)
+
+
+def test_remove_extraneous(tmp_path):
+    for name in ("a.txt", "sub/b.txt", "sub/c.txt", "old/d.txt", "old/nested/e.txt"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(b"12345")
+    stats = test_module.TransferStats()
+
+    removed = test_module.remove_extraneous(
+        tmp_path, [Path("a.txt"), Path("sub/b.txt")], stats=stats
+    )
+
+    assert sorted(removed) == sorted(
+        tmp_path / name for name in ("sub/c.txt", "old/d.txt", "old/nested/e.txt")
+    )
+    assert sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("*")) == [
+        Path("a.txt"),
+        Path("sub"),
+        Path("sub/b.txt"),
+    ]
+    assert (stats.files_removed, stats.bytes_removed) == (3, 15)